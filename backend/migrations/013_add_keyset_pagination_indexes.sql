@@ -0,0 +1,55 @@
+-- ============================================================================
+-- Keyset pagination indexes for discovered_automations
+-- Version: 013
+-- Description: Composite indexes matching the ORDER BY / seek predicates used
+--              by cursor-paginated automation lists, so each page is an index
+--              range scan instead of an OFFSET scan over all earlier rows.
+-- Rollback: DROP the indexes listed at the end of this file
+-- ============================================================================
+
+-- DiscoveredAutomationRepository.findManyCustom:
+-- ORDER BY last_seen_at DESC, created_at DESC, id DESC with NULL timestamps as -infinity
+-- (both columns are nullable; a NULL in the seek's row comparison would end paging)
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_org_seen_keyset
+  ON discovered_automations(
+    organization_id,
+    (COALESCE(last_seen_at, '-infinity'::timestamptz)) DESC,
+    (COALESCE(created_at, '-infinity'::timestamptz)) DESC,
+    id DESC
+  );
+
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_conn_seen_keyset
+  ON discovered_automations(
+    platform_connection_id,
+    (COALESCE(last_seen_at, '-infinity'::timestamptz)) DESC,
+    (COALESCE(created_at, '-infinity'::timestamptz)) DESC,
+    id DESC
+  );
+
+-- GET /api/automations sort options (sort_by=name|type|createdAt|lastTriggered), tie-broken by id.
+-- Expression indexes match the NULL-safe keyset expressions used by the route.
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_org_name_keyset
+  ON discovered_automations(organization_id, name, id);
+
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_org_type_keyset
+  ON discovered_automations(organization_id, automation_type, id);
+
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_org_discovered_keyset
+  ON discovered_automations(organization_id, (COALESCE(first_discovered_at, '-infinity'::timestamptz)), id);
+
+CREATE INDEX IF NOT EXISTS idx_discovered_automations_org_triggered_keyset
+  ON discovered_automations(organization_id, (COALESCE(last_triggered_at, '-infinity'::timestamptz)), id);
+
+-- Refresh planner statistics used by approximate (EXPLAIN-based) counts
+ANALYZE discovered_automations;
+
+-- ============================================================================
+-- Rollback Strategy
+-- ============================================================================
+-- DROP INDEX IF EXISTS idx_discovered_automations_org_triggered_keyset;
+-- DROP INDEX IF EXISTS idx_discovered_automations_org_discovered_keyset;
+-- DROP INDEX IF EXISTS idx_discovered_automations_org_type_keyset;
+-- DROP INDEX IF EXISTS idx_discovered_automations_org_name_keyset;
+-- DROP INDEX IF EXISTS idx_discovered_automations_conn_seen_keyset;
+-- DROP INDEX IF EXISTS idx_discovered_automations_org_seen_keyset;
+-- ============================================================================
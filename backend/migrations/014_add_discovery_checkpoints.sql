@@ -0,0 +1,43 @@
+-- ============================================================================
+-- Incremental (delta) discovery checkpoints
+-- Version: 014
+-- Description: Per-connection high-water marks so scheduled discovery only
+--              fetches activity newer than the previous run, and content
+--              hashes so unchanged automations are not rewritten or re-assessed.
+-- Rollback: see the end of this file
+-- ============================================================================
+
+-- One row per platform connection, written after each successful discovery
+CREATE TABLE IF NOT EXISTS discovery_checkpoints (
+    platform_connection_id VARCHAR(255) PRIMARY KEY REFERENCES platform_connections(id) ON DELETE CASCADE,
+    organization_id VARCHAR(255) NOT NULL,
+    -- Connector position: audit log time, resume page token, Slack channel cursors
+    checkpoint JSONB NOT NULL DEFAULT '{}'::jsonb,
+    last_full_sync_at TIMESTAMPTZ,
+    last_delta_sync_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_discovery_checkpoints_organization
+  ON discovery_checkpoints(organization_id);
+
+COMMENT ON COLUMN discovery_checkpoints.checkpoint IS
+'Connector position for the next delta run. Structure:
+{
+  "auditLogCursor": "ISO 8601 time already processed",
+  "pageToken": "token to resume a listing that stopped before its last page",
+  "pendingCursor": "newest event time seen while a listing is still being paged",
+  "channelCursors": { "<slack channel id>": "<newest message ts>" }
+}';
+
+-- SHA-256 of the fields an upsert would write; NULL for rows stored before this migration
+ALTER TABLE discovered_automations
+ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+-- ============================================================================
+-- Rollback Strategy
+-- ============================================================================
+-- ALTER TABLE discovered_automations DROP COLUMN IF EXISTS content_hash;
+-- DROP TABLE IF EXISTS discovery_checkpoints;
+-- ============================================================================
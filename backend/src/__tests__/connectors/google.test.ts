@@ -163,6 +163,87 @@ describe('GoogleConnector', () => {
     });
   });
 
+  describe('getAuditLogsIncremental', () => {
+    const activity = (id: string, time: string) => ({
+      id: { uniqueQualifier: id, time, applicationName: 'admin' },
+      actor: { email: 'admin@baliluxurystays.com', callerType: 'USER' },
+      events: [{ name: 'CHANGE_APPLICATION_SETTING', type: 'APPLICATION_SETTINGS' }]
+    });
+
+    beforeEach(async () => {
+      await connector.authenticate(mockCredentials);
+    });
+
+    it('should page from the checkpoint and advance the cursor to the newest event', async () => {
+      mockAdmin.activities.list
+        .mockResolvedValueOnce({
+          data: { items: [activity('e3', '2025-01-03T00:00:00Z'), activity('e2', '2025-01-02T00:00:00Z')], nextPageToken: 'page-2' }
+        })
+        .mockResolvedValueOnce({ data: { items: [activity('e1', '2025-01-01T12:00:00Z')] } });
+
+      const result = await connector.getAuditLogsIncremental({ auditLogCursor: '2025-01-01T00:00:00.000Z' });
+
+      expect(result.entries.map(e => e.id)).toEqual(['e3', 'e2', 'e1']);
+      expect(result.checkpoint).toEqual({ auditLogCursor: '2025-01-03T00:00:00.000Z' });
+      expect(mockAdmin.activities.list).toHaveBeenNthCalledWith(2, expect.objectContaining({
+        startTime: '2025-01-01T00:00:00.001Z',
+        pageToken: 'page-2'
+      }));
+    });
+
+    it('should not fetch the event at the cursor again on the next run', async () => {
+      mockAdmin.activities.list
+        .mockResolvedValueOnce({ data: { items: [activity('e1', '2025-01-03T00:00:00Z')] } })
+        .mockResolvedValueOnce({ data: { items: [] } });
+
+      const first = await connector.getAuditLogsIncremental({ auditLogCursor: '2025-01-01T00:00:00.000Z' });
+      const second = await connector.getAuditLogsIncremental(first.checkpoint);
+
+      expect(mockAdmin.activities.list).toHaveBeenLastCalledWith(expect.objectContaining({
+        startTime: '2025-01-03T00:00:00.001Z'
+      }));
+      expect(second.entries).toEqual([]);
+      expect(second.checkpoint).toEqual({ auditLogCursor: '2025-01-03T00:00:00.000Z' });
+    });
+
+    it('should save the page token when it stops before the last page', async () => {
+      mockAdmin.activities.list.mockResolvedValue({
+        data: { items: [activity('e', '2025-01-05T00:00:00Z')], nextPageToken: 'more' }
+      });
+
+      const result = await connector.getAuditLogsIncremental({ auditLogCursor: '2025-01-01T00:00:00.000Z' });
+
+      expect(mockAdmin.activities.list).toHaveBeenCalledTimes(10);
+      expect(result.checkpoint).toEqual({
+        auditLogCursor: '2025-01-01T00:00:00.000Z',
+        pageToken: 'more',
+        pendingCursor: '2025-01-05T00:00:00.000Z'
+      });
+    });
+
+    it('should resume a saved page token and then advance to the pending cursor', async () => {
+      mockAdmin.activities.list.mockResolvedValueOnce({ data: { items: [activity('old', '2025-01-02T00:00:00Z')] } });
+
+      const result = await connector.getAuditLogsIncremental({
+        auditLogCursor: '2025-01-01T00:00:00.000Z',
+        pageToken: 'more',
+        pendingCursor: '2025-01-05T00:00:00.000Z'
+      });
+
+      expect(mockAdmin.activities.list).toHaveBeenCalledWith(expect.objectContaining({ pageToken: 'more' }));
+      expect(result.checkpoint).toEqual({ auditLogCursor: '2025-01-05T00:00:00.000Z' });
+    });
+
+    it('should keep the previous checkpoint when the API fails', async () => {
+      mockAdmin.activities.list.mockRejectedValueOnce(new Error('Insufficient permissions'));
+      const checkpoint = { auditLogCursor: '2025-01-01T00:00:00.000Z' };
+
+      const result = await connector.getAuditLogsIncremental(checkpoint);
+
+      expect(result).toEqual({ entries: [], checkpoint });
+    });
+  });
+
   describe('detectAIPlatformInScript', () => {
     it('should detect OpenAI API usage with high confidence', () => {
       const scriptContent = {
@@ -0,0 +1,215 @@
+/**
+ * Unit Tests for keyset pagination
+ * Tests cursor encoding, seek predicates and BaseRepository.findManyByCursor
+ */
+
+import {
+  buildKeysetCondition,
+  buildNullableKeysetCondition,
+  decodeCursor,
+  encodeCursor,
+  estimateRowCount,
+  selectCursorKeys,
+  takeCursorKeys
+} from '../../database/pagination';
+import { BaseRepository } from '../../database/repositories/base';
+import { db } from '../../database/pool';
+
+// Mock the database pool
+jest.mock('../../database/pool', () => ({
+  db: {
+    query: jest.fn()
+  }
+}));
+
+interface TestEntity {
+  id: string;
+  name: string;
+}
+
+class TestRepository extends BaseRepository<TestEntity, Record<string, unknown>, Record<string, unknown>> {
+  constructor() {
+    super('discovered_automations', 'id');
+  }
+}
+
+describe('pagination helpers', () => {
+  describe('encodeCursor / decodeCursor', () => {
+    it('should round-trip keyset values', () => {
+      const cursor = encodeCursor('name:ASC', ['Zapier', 'a1b2']);
+
+      expect(cursor).not.toContain('Zapier');
+      expect(decodeCursor(cursor, 'name:ASC', 2)).toEqual(['Zapier', 'a1b2']);
+    });
+
+    it('should treat an empty cursor as the first page', () => {
+      expect(decodeCursor(undefined, 'name:ASC', 2)).toBeUndefined();
+      expect(decodeCursor('', 'name:ASC', 2)).toBeUndefined();
+    });
+
+    it('should reject cursors issued for a different sort', () => {
+      const cursor = encodeCursor('name:ASC', ['Zapier', 'a1b2']);
+
+      expect(() => decodeCursor(cursor, 'name:DESC', 2)).toThrow('Invalid pagination cursor');
+      expect(() => decodeCursor(cursor, 'name:ASC', 3)).toThrow('Invalid pagination cursor');
+    });
+
+    it('should reject malformed cursors', () => {
+      expect(() => decodeCursor('not-a-cursor', 'name:ASC', 2)).toThrow('Invalid pagination cursor');
+    });
+  });
+
+  describe('buildKeysetCondition', () => {
+    it('should seek forward for ASC and backward for DESC', () => {
+      expect(buildKeysetCondition(['da.name', 'da.id'], 'ASC', 3)).toBe('(da.name, da.id) > ($3, $4)');
+      expect(buildKeysetCondition(['da.name', 'da.id'], 'DESC', 1)).toBe('(da.name, da.id) < ($1, $2)');
+    });
+  });
+
+  describe('buildNullableKeysetCondition', () => {
+    it('should keep the NULL rows ahead of an ASC seek and drop them behind a DESC one', () => {
+      expect(buildNullableKeysetCondition('name', 'id', 'ASC', ['B', '2'], 3)).toEqual({
+        condition: '((name, id) > ($3, $4) OR name IS NULL)',
+        params: ['B', '2']
+      });
+      expect(buildNullableKeysetCondition('name', 'id', 'DESC', ['B', '2'], 1)).toEqual({
+        condition: '(name, id) < ($1, $2)',
+        params: ['B', '2']
+      });
+    });
+
+    it('should seek on the tie-breaker alone when the last sort key was NULL', () => {
+      expect(buildNullableKeysetCondition('name', 'id', 'ASC', [null, '2'], 1)).toEqual({
+        condition: '(name IS NULL AND id > $1)',
+        params: ['2']
+      });
+      expect(buildNullableKeysetCondition('name', 'id', 'DESC', [null, '2'], 1)).toEqual({
+        condition: '(name IS NOT NULL OR id < $1)',
+        params: ['2']
+      });
+    });
+  });
+
+  describe('selectCursorKeys / takeCursorKeys', () => {
+    it('should select keys as text and strip them from rows', () => {
+      expect(selectCursorKeys(['da.last_seen_at', 'da.id']))
+        .toBe('(da.last_seen_at)::text AS cursor_key_0, (da.id)::text AS cursor_key_1');
+
+      const rows = [
+        { id: 'a', cursor_key_0: '2025-01-01 00:00:00.000123+00', cursor_key_1: 'a' },
+        { id: 'b', cursor_key_0: '2025-01-01 00:00:00.000456+00', cursor_key_1: 'b' },
+        { id: 'c', cursor_key_0: '2025-01-01 00:00:00.000789+00', cursor_key_1: 'c' }
+      ];
+
+      // Third row is the look-ahead row; the cursor comes from the last row on the page
+      expect(takeCursorKeys(rows, 2, 2)).toEqual(['2025-01-01 00:00:00.000456+00', 'b']);
+      expect(rows).toEqual([{ id: 'a' }, { id: 'b' }, { id: 'c' }]);
+    });
+  });
+
+  describe('estimateRowCount', () => {
+    it('should read the planner row estimate', async () => {
+      (db.query as jest.Mock).mockResolvedValueOnce({
+        rows: [{ 'QUERY PLAN': [{ Plan: { 'Plan Rows': 12345 } }] }]
+      });
+
+      await expect(estimateRowCount('SELECT 1 FROM discovered_automations')).resolves.toBe(12345);
+      expect((db.query as jest.Mock).mock.calls[0][0]).toBe('EXPLAIN (FORMAT JSON) SELECT 1 FROM discovered_automations');
+    });
+  });
+});
+
+describe('BaseRepository.findManyByCursor', () => {
+  let repository: TestRepository;
+  const mockQuery = db.query as jest.MockedFunction<typeof db.query>;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    repository = new TestRepository();
+  });
+
+  it('should fetch one extra row and return a cursor for the next page', async () => {
+    mockQuery.mockResolvedValueOnce({
+      rows: [
+        { id: '1', name: 'A', cursor_key_0: 'A', cursor_key_1: '1' },
+        { id: '2', name: 'B', cursor_key_0: 'B', cursor_key_1: '2' },
+        { id: '3', name: 'C', cursor_key_0: 'C', cursor_key_1: '3' }
+      ],
+      rowCount: 3
+    } as any);
+
+    const result = await repository.findManyByCursor(undefined, {
+      limit: 2,
+      sort_by: 'name',
+      sort_order: 'ASC',
+      columns: ['name']
+    });
+
+    const [query, params] = mockQuery.mock.calls[0]!;
+    expect(query).toBe(
+      'SELECT name, (name)::text AS cursor_key_0, (id)::text AS cursor_key_1 FROM discovered_automations ORDER BY name ASC, id ASC LIMIT $1'
+    );
+    expect(params).toEqual([3]);
+
+    expect(result.data).toEqual([{ id: '1', name: 'A' }, { id: '2', name: 'B' }]);
+    expect(result.pagination.has_next).toBe(true);
+    expect(decodeCursor(result.pagination.next_cursor!, 'name:ASC', 2)).toEqual(['B', '2']);
+    expect(result.pagination.total).toBeUndefined();
+    expect(mockQuery).toHaveBeenCalledTimes(1);
+  });
+
+  it('should seek past the cursor and combine it with filters', async () => {
+    mockQuery.mockResolvedValueOnce({ rows: [], rowCount: 0 } as any);
+
+    const cursor = encodeCursor('name:ASC', ['B', '2']);
+    const result = await repository.findManyByCursor(
+      { organization_id: 'org-1' } as any,
+      { limit: 2, sort_by: 'name', sort_order: 'ASC', cursor }
+    );
+
+    const [query, params] = mockQuery.mock.calls[0]!;
+    expect(query).toContain('WHERE organization_id = $1 AND ((name, id) > ($2, $3) OR name IS NULL)');
+    expect(params).toEqual(['org-1', 'B', '2', 3]);
+    expect(result.pagination).toEqual({ limit: 2, next_cursor: null, has_next: false });
+  });
+
+  it('should keep paging after a row with a NULL sort key', async () => {
+    mockQuery.mockResolvedValueOnce({
+      rows: [
+        { id: '3', name: null, cursor_key_0: null, cursor_key_1: '3' },
+        { id: '4', name: null, cursor_key_0: null, cursor_key_1: '4' }
+      ],
+      rowCount: 2
+    } as any);
+
+    const first = await repository.findManyByCursor(undefined, { limit: 1, sort_by: 'name', sort_order: 'ASC' });
+    expect(decodeCursor(first.pagination.next_cursor!, 'name:ASC', 2)).toEqual([null, '3']);
+
+    mockQuery.mockResolvedValueOnce({ rows: [{ id: '4', name: null, cursor_key_0: null, cursor_key_1: '4' }], rowCount: 1 } as any);
+    const second = await repository.findManyByCursor(undefined, {
+      limit: 1, sort_by: 'name', sort_order: 'ASC', cursor: first.pagination.next_cursor!
+    });
+
+    const [query, params] = mockQuery.mock.calls[1]!;
+    expect(query).toContain('WHERE (name IS NULL AND id > $1) ORDER BY name ASC, id ASC');
+    expect(params).toEqual(['3', 2]);
+    expect(second.data).toEqual([{ id: '4', name: null }]);
+  });
+
+  it('should return an approximate total when requested', async () => {
+    mockQuery
+      .mockResolvedValueOnce({ rows: [], rowCount: 0 } as any)
+      .mockResolvedValueOnce({ rows: [{ 'QUERY PLAN': [{ Plan: { 'Plan Rows': 500000 } }] }] } as any);
+
+    const result = await repository.findManyByCursor(undefined, { count: 'approximate' });
+
+    expect(result.pagination.total).toBe(500000);
+    expect(result.pagination.total_is_estimate).toBe(true);
+  });
+
+  it('should reject unsafe sort columns', async () => {
+    await expect(
+      repository.findManyByCursor(undefined, { sort_by: 'name; DROP TABLE users' })
+    ).rejects.toThrow('Invalid column name format');
+  });
+});
@@ -0,0 +1,159 @@
+/**
+ * Unit Tests for BaseRepository.bulkUpsert
+ * Tests multi-row upsert batching, savepoint isolation and per-row failures
+ */
+
+import { BaseRepository } from '../../../database/repositories/base';
+import { db } from '../../../database/pool';
+
+// Mock the database pool
+jest.mock('../../../database/pool', () => ({
+  db: {
+    query: jest.fn(),
+    transaction: jest.fn()
+  }
+}));
+
+interface TestEntity {
+  id: string;
+  platform_connection_id: string;
+  external_id: string;
+  name: string;
+}
+
+interface TestCreateInput extends Record<string, unknown> {
+  platform_connection_id: string;
+  external_id: string;
+  name: string;
+  platform_metadata?: Record<string, any>;
+}
+
+class TestRepository extends BaseRepository<TestEntity, TestCreateInput, Record<string, unknown>> {
+  constructor() {
+    super('discovered_automations', 'id');
+  }
+}
+
+describe('BaseRepository.bulkUpsert', () => {
+  let repository: TestRepository;
+  let clientQuery: jest.Mock;
+  const mockTransaction = db.transaction as jest.MockedFunction<typeof db.transaction>;
+
+  const upsertOptions = {
+    conflictColumns: ['platform_connection_id', 'external_id'],
+    updateColumns: ['name'],
+    updateExpressions: { updated_at: 'NOW()' }
+  };
+
+  const row = (externalId: string, name = `Automation ${externalId}`): TestCreateInput => ({
+    platform_connection_id: 'conn-1',
+    external_id: externalId,
+    name
+  });
+
+  // Echo inserted rows back as RETURNING * would, in reverse to exercise key matching
+  const echoInsert = (text: string, params?: unknown[]) => {
+    if (!text.includes('INSERT INTO')) {
+      return Promise.resolve({ rows: [], rowCount: 0 });
+    }
+    const values = params || [];
+    const rows: TestEntity[] = [];
+    for (let i = 0; i < values.length; i += 3) {
+      rows.push({
+        id: `id-${values[i + 1]}`,
+        platform_connection_id: values[i] as string,
+        external_id: values[i + 1] as string,
+        name: values[i + 2] as string
+      });
+    }
+    return Promise.resolve({ rows: rows.reverse(), rowCount: rows.length });
+  };
+
+  const insertCalls = () => clientQuery.mock.calls.filter(([text]) => String(text).includes('INSERT INTO'));
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    repository = new TestRepository();
+    clientQuery = jest.fn(echoInsert);
+    mockTransaction.mockImplementation((async (callback: any) =>
+      callback({ query: clientQuery, release: jest.fn() })
+    ) as any);
+  });
+
+  it('should return an empty result without opening a transaction', async () => {
+    const result = await repository.bulkUpsert([], upsertOptions);
+
+    expect(result).toEqual({ rows: [], failures: [] });
+    expect(mockTransaction).not.toHaveBeenCalled();
+  });
+
+  it('should write rows with multi-row VALUES in batches', async () => {
+    const rows = Array.from({ length: 5 }, (_, i) => row(`ext-${i}`));
+
+    const result = await repository.bulkUpsert(rows, { ...upsertOptions, batchSize: 2 });
+
+    expect(mockTransaction).toHaveBeenCalledTimes(1);
+    expect(insertCalls()).toHaveLength(3);
+
+    const [firstQuery, firstParams] = insertCalls()[0]!;
+    expect(firstQuery).toContain('INSERT INTO discovered_automations (platform_connection_id, external_id, name)');
+    expect(firstQuery).toContain('VALUES ($1, $2, $3), ($4, $5, $6)');
+    expect(firstQuery).toContain(
+      'ON CONFLICT (platform_connection_id, external_id) DO UPDATE SET name = EXCLUDED.name, updated_at = NOW()'
+    );
+    expect(firstParams).toEqual(['conn-1', 'ext-0', 'Automation ext-0', 'conn-1', 'ext-1', 'Automation ext-1']);
+
+    expect(result.failures).toEqual([]);
+    expect(result.rows.map(r => r.external_id)).toEqual(['ext-0', 'ext-1', 'ext-2', 'ext-3', 'ext-4']);
+  });
+
+  it('should serialize objects for JSONB columns and use DEFAULT for missing values', async () => {
+    await repository.bulkUpsert(
+      [{ ...row('ext-0'), platform_metadata: { scopes: ['drive'] } }, row('ext-1')],
+      upsertOptions
+    );
+
+    const [query, params] = insertCalls()[0]!;
+    expect(query).toContain('VALUES ($1, $2, $3, $4), ($5, $6, $7, DEFAULT)');
+    expect(params![3]).toBe(JSON.stringify({ scopes: ['drive'] }));
+  });
+
+  it('should start a new batch when a conflict key repeats', async () => {
+    const result = await repository.bulkUpsert(
+      [row('ext-0', 'first'), row('ext-1'), row('ext-0', 'second')],
+      upsertOptions
+    );
+
+    expect(insertCalls()).toHaveLength(2);
+    expect(result.rows.map(r => r.name)).toEqual(['first', 'Automation ext-1', 'second']);
+  });
+
+  it('should retry a failed batch row by row and report the failing rows', async () => {
+    clientQuery.mockImplementation((text: string, params?: unknown[]) => {
+      if (String(text).includes('INSERT INTO') && (params || []).includes('bad')) {
+        return Promise.reject(new Error('invalid input value for enum automation_type'));
+      }
+      return echoInsert(text, params);
+    });
+
+    const result = await repository.bulkUpsert(
+      [row('ext-0'), row('ext-1', 'bad'), row('ext-2')],
+      upsertOptions
+    );
+
+    expect(result.rows.map(r => r.external_id)).toEqual(['ext-0', 'ext-2']);
+    expect(result.failures).toHaveLength(1);
+    expect(result.failures[0]!.index).toBe(1);
+    expect(result.failures[0]!.error.message).toContain('invalid input value');
+
+    const statements = clientQuery.mock.calls.map(([text]) => String(text).trim().split(/\s+/).slice(0, 2).join(' '));
+    expect(statements).toContain('ROLLBACK TO');
+    expect(statements.filter(s => s === 'SAVEPOINT bulk_upsert_row')).toHaveLength(3);
+  });
+
+  it('should reject unsafe column names', async () => {
+    await expect(
+      repository.bulkUpsert([{ ...row('ext-0'), 'name; DROP TABLE users': 'x' }], upsertOptions)
+    ).rejects.toThrow('Invalid column name format');
+  });
+});
@@ -302,8 +302,8 @@ describe('DiscoveredAutomationRepository - Platform JOIN Tests', () => {
 
       // Verify ordering
       expect(queryCall).toContain('ORDER BY');
-      expect(queryCall).toContain('last_seen_at DESC');
-      expect(queryCall).toContain('created_at DESC');
+      expect(queryCall).toContain("COALESCE(da.last_seen_at, '-infinity'::timestamptz) DESC");
+      expect(queryCall).toContain("COALESCE(da.created_at, '-infinity'::timestamptz) DESC");
     });
   });
 
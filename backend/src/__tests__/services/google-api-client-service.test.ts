@@ -4,9 +4,11 @@
  * Coverage Target: 90%+
  */
 
-import { GoogleAPIClientService } from '../../services/google-api-client-service';
+import { GOOGLE_API_LIMITS, GoogleAPIClientService } from '../../services/google-api-client-service';
+import { ApiRequestScheduler } from '../../utils/api-request-scheduler';
 import { google } from 'googleapis';
 import { GoogleOAuthCredentials } from '@singura/shared-types';
+import { GoogleMockOAuthServer } from '../../../tests/mocks/oauth-servers/google-mock-server';
 
 // Mock the googleapis library
 jest.mock('googleapis');
@@ -641,6 +643,145 @@ describe('GoogleAPIClientService', () => {
     });
   });
 
+  describe('request scheduling and pagination', () => {
+    const serviceAccountEvent = (email: string) => ({
+      id: { time: '2025-01-15T10:00:00Z', uniqueQualifier: email },
+      actor: { email },
+      events: [{ name: 'authorize' }]
+    });
+
+    const rateLimitError = () => Object.assign(new Error('Rate Limit Exceeded'), {
+      code: 429,
+      response: { status: 429, headers: { 'retry-after': '0' } }
+    });
+
+    beforeEach(async () => {
+      // Private scheduler with fast backoff, so tests don't share quota state
+      service = new GoogleAPIClientService({
+        scheduler: new ApiRequestScheduler(GOOGLE_API_LIMITS, { baseDelayMs: 1 })
+      });
+      await service.initialize(mockCredentials);
+    });
+
+    it('should give every client its own per-user request lanes', async () => {
+      const first = new GoogleAPIClientService();
+      const second = new GoogleAPIClientService();
+
+      expect((first as any).scheduler).toBeInstanceOf(ApiRequestScheduler);
+      expect((first as any).scheduler).not.toBe((second as any).scheduler);
+    });
+
+    it('should follow nextPageToken when discovering service accounts', async () => {
+      mockAdminReports.activities.list
+        .mockResolvedValueOnce({
+          data: { items: [serviceAccountEvent('a@project-1.iam.gserviceaccount.com')], nextPageToken: 'page-2' }
+        })
+        .mockResolvedValueOnce({
+          data: { items: [serviceAccountEvent('b@project-2.iam.gserviceaccount.com')] }
+        });
+
+      const accounts = await service.getServiceAccounts();
+
+      expect(accounts.map(a => a.email)).toEqual([
+        'a@project-1.iam.gserviceaccount.com',
+        'b@project-2.iam.gserviceaccount.com'
+      ]);
+      expect(mockAdminReports.activities.list).toHaveBeenCalledTimes(2);
+      expect(mockAdminReports.activities.list.mock.calls[0][0].pageToken).toBeUndefined();
+      expect(mockAdminReports.activities.list.mock.calls[1][0]).toEqual(
+        expect.objectContaining({ applicationName: 'token', maxResults: 1000, pageToken: 'page-2' })
+      );
+    });
+
+    it('should cap discovery audit log scans and log the truncation', async () => {
+      const warn = jest.spyOn(console, 'warn').mockImplementation(() => undefined);
+      mockAdminReports.activities.list.mockImplementation(async (params: any) => ({
+        data: {
+          items: [serviceAccountEvent(`sa-${params.pageToken ?? 0}@project.iam.gserviceaccount.com`)],
+          nextPageToken: String(Number(params.pageToken ?? 0) + 1)
+        }
+      }));
+
+      const accounts = await service.getServiceAccounts();
+
+      expect(mockAdminReports.activities.list).toHaveBeenCalledTimes(10);
+      expect(accounts).toHaveLength(10);
+      expect(warn).toHaveBeenCalledWith(expect.stringContaining('token audit log scan after 10 pages'));
+    });
+
+    it('should retry audit log requests that hit the rate limit', async () => {
+      mockAdminReports.activities.list
+        .mockRejectedValueOnce(rateLimitError())
+        .mockResolvedValueOnce({ data: { items: [], etag: 'etag-1' } });
+
+      const response = await service.getAuditLogs({
+        startTime: new Date('2025-01-01T00:00:00Z'),
+        endTime: new Date('2025-01-02T00:00:00Z')
+      });
+
+      expect(response.etag).toBe('etag-1');
+      expect(mockAdminReports.activities.list).toHaveBeenCalledTimes(2);
+    });
+
+    it('should iterate every audit log page', async () => {
+      mockAdminReports.activities.list
+        .mockResolvedValueOnce({ data: { items: [{ id: { uniqueQualifier: '1' } }], nextPageToken: 'next' } })
+        .mockResolvedValueOnce({ data: { items: [{ id: { uniqueQualifier: '2' } }] } });
+
+      const pages = [];
+      for await (const page of service.iterateAuditLogs({
+        startTime: new Date('2025-01-01T00:00:00Z'),
+        endTime: new Date('2025-01-02T00:00:00Z')
+      })) {
+        pages.push(page);
+      }
+
+      expect(pages.map(p => p.totalResults)).toEqual([1, 1]);
+      expect(pages[0]!.nextPageToken).toBe('next');
+      expect(pages[1]!.nextPageToken).toBeUndefined();
+    });
+
+    it('should read Apps Script content concurrently within the script API limit', async () => {
+      const files = Array.from({ length: 8 }, (_, i) => ({ id: `script-${i}`, name: `Script ${i}` }));
+      mockDrive.files.list
+        .mockResolvedValueOnce({ data: { files: files.slice(0, 4), nextPageToken: 'page-2' } })
+        .mockResolvedValueOnce({ data: { files: files.slice(4) } });
+
+      let active = 0;
+      let peak = 0;
+      mockScript.projects.getContent.mockImplementation(async () => {
+        active++;
+        peak = Math.max(peak, active);
+        await new Promise(resolve => setTimeout(resolve, 5));
+        active--;
+        return { data: { files: [] } };
+      });
+
+      const projects = await service.getAppsScriptProjects();
+
+      expect(projects.map(p => p.scriptId)).toEqual(files.map(f => f.id));
+      expect(mockDrive.files.list.mock.calls[1][0].pageToken).toBe('page-2');
+      expect(peak).toBeGreaterThan(1);
+      expect(peak).toBeLessThanOrEqual(GOOGLE_API_LIMITS.script.concurrency);
+    });
+
+    it('should run discovery stages in parallel', async () => {
+      let releaseDrive!: (value: unknown) => void;
+      mockDrive.files.list.mockReturnValueOnce(new Promise(resolve => { releaseDrive = resolve; }));
+      mockAdminReports.activities.list.mockResolvedValue({ data: { items: [] } });
+
+      const discovery = service.discoverAutomations();
+      await new Promise(resolve => setImmediate(resolve));
+
+      // Audit log stages are running while the Apps Script listing is still pending
+      expect(mockDrive.files.list).toHaveBeenCalledTimes(1);
+      expect(mockAdminReports.activities.list).toHaveBeenCalledTimes(3);
+
+      releaseDrive({ data: { files: [] } });
+      await expect(discovery).resolves.toEqual([]);
+    });
+  });
+
   describe('ensureAuthenticated', () => {
     it('should throw error if not authenticated', async () => {
       await expect(
@@ -667,6 +808,19 @@ describe('GoogleAPIClientService', () => {
 
       expect(mockAuth.refreshAccessToken).toHaveBeenCalled();
     });
+
+    it('should share one token refresh between concurrent callers', async () => {
+      await service.initialize({ ...mockCredentials, expiresAt: new Date(Date.now() - 1000) });
+
+      mockAuth.refreshAccessToken.mockImplementation(async () => {
+        await new Promise(resolve => setTimeout(resolve, 5));
+        return { credentials: { access_token: 'new-access-token', expiry_date: Date.now() + 3600000 } };
+      });
+
+      await Promise.all(Array.from({ length: 4 }, () => (service as any).ensureAuthenticated()));
+
+      expect(mockAuth.refreshAccessToken).toHaveBeenCalledTimes(1);
+    });
   });
 
   describe('getAuthenticationStatus', () => {
@@ -691,3 +845,83 @@ describe('GoogleAPIClientService', () => {
     });
   });
 });
+
+describe('GoogleAPIClientService against the Google mock server', () => {
+  const actualGoogle = jest.requireActual<typeof import('googleapis')>('googleapis').google;
+  const startTime = new Date('2025-01-01T00:00:00Z');
+  const endTime = new Date('2025-01-02T00:00:00Z');
+  let mockServer: GoogleMockOAuthServer;
+  let service: GoogleAPIClientService;
+
+  const activities = (count: number) => Array.from({ length: count }, (_, i) => ({
+    kind: 'admin#reports#activity',
+    id: {
+      time: new Date(startTime.getTime() + i * 60000).toISOString(),
+      uniqueQualifier: `event-${i + 1}`,
+      applicationName: 'drive',
+      customerId: 'C0123'
+    },
+    actor: { email: 'user@example.com', callerType: 'USER' },
+    events: [{ type: 'access', name: 'edit' }]
+  }));
+
+  beforeAll(async () => {
+    mockServer = new GoogleMockOAuthServer({ port: 4012 });
+    await mockServer.start();
+  });
+
+  afterAll(async () => {
+    await mockServer.stop();
+  });
+
+  beforeEach(async () => {
+    mockServer.reset();
+
+    // Real googleapis clients, sent to the mock server through rootUrl
+    (google.auth.OAuth2 as any) = actualGoogle.auth.OAuth2;
+    (google.oauth2 as any) = actualGoogle.oauth2.bind(actualGoogle);
+    (google.admin as any) = actualGoogle.admin.bind(actualGoogle);
+    (google.drive as any) = actualGoogle.drive.bind(actualGoogle);
+    (google.gmail as any) = actualGoogle.gmail.bind(actualGoogle);
+
+    const tokens = mockServer.issueTokens(['https://www.googleapis.com/auth/admin.reports.audit.readonly']);
+    service = new GoogleAPIClientService({
+      rootUrl: mockServer.getBaseUrl(),
+      scheduler: new ApiRequestScheduler(GOOGLE_API_LIMITS, { baseDelayMs: 1 })
+    });
+
+    await expect(service.initialize({
+      accessToken: tokens.accessToken,
+      refreshToken: tokens.refreshToken,
+      tokenType: 'Bearer',
+      expiresAt: tokens.expiresAt,
+      scope: tokens.scope,
+      domain: 'example.com'
+    })).resolves.toBe(true);
+  });
+
+  it('should follow nextPageToken across pages', async () => {
+    mockServer.setAuditActivities('drive', activities(5));
+
+    const pages: string[][] = [];
+    for await (const page of service.iterateAuditLogs({ applicationName: 'drive', startTime, endTime, maxResults: 2 })) {
+      pages.push(page.items.map(item => item.id.uniqueQualifier));
+    }
+
+    expect(pages).toEqual([['event-1', 'event-2'], ['event-3', 'event-4'], ['event-5']]);
+    expect(mockServer.getReportsRequests().map(request => request.pageToken)).toEqual([undefined, '2', '4']);
+  });
+
+  it('should back off on 429 for as long as Retry-After asks', async () => {
+    mockServer.setAuditActivities('login', activities(1));
+    mockServer.rateLimitReportsRequests(2, 1);
+
+    const startedAt = Date.now();
+    const response = await service.getAuditLogs({ applicationName: 'login', startTime, endTime });
+
+    expect(response.items).toHaveLength(1);
+    expect(mockServer.getReportsRequests().map(request => request.status)).toEqual([429, 429, 200]);
+    // Two one-second Retry-After waits, not the 1ms base backoff
+    expect(Date.now() - startedAt).toBeGreaterThanOrEqual(1900);
+  });
+});
@@ -4,7 +4,8 @@
  */
 
 import { google, Auth } from 'googleapis';
-import { PlatformConnector, OAuthCredentials, ConnectionResult, AutomationEvent, AuditLogEntry, PermissionCheck } from './types';
+import { PlatformConnector, OAuthCredentials, ConnectionResult, AutomationEvent, AuditLogEntry, PermissionCheck, IncrementalAuditLogs } from './types';
+import { DiscoveryCheckpoint } from '../types/database';
 import { AIAuditLogQuery, AIAuditLogResult, AIplatformAuditLog, AIPlatform } from '@singura/shared-types';
 import { encryptedCredentialRepository } from '../database/repositories/encrypted-credential';
 import { googleOAuthAIDetector } from '../services/detection/google-oauth-ai-detector.service';
@@ -30,6 +31,31 @@ function mapGoogleActorType(googleActorType: string | undefined): 'user' | 'syst
   }
 }
 
+/**
+ * Map an Admin Reports activity to an AuditLogEntry
+ */
+function mapGoogleActivity(activity: any): AuditLogEntry {
+  return {
+    id: activity.id?.uniqueQualifier || 'unknown',
+    timestamp: new Date(activity.id?.time || Date.now()),
+    actorId: activity.actor?.email || 'system',
+    actorType: mapGoogleActorType(activity.actor?.callerType),
+    actionType: activity.events?.[0]?.name || 'unknown',
+    resourceType: activity.events?.[0]?.type || 'unknown',
+    resourceId: activity.id?.applicationName || '',
+    details: {
+      ipAddress: activity.ipAddress || undefined,
+      events: activity.events,
+      ownerDomain: activity.ownerDomain || undefined
+    },
+    ipAddress: activity.ipAddress || undefined,
+    userAgent: undefined // Not available in Google Admin reports
+  };
+}
+
+// Audit log pages fetched per delta run; a longer backlog resumes from the saved page token
+const MAX_AUDIT_LOG_PAGES_PER_RUN = 10;
+
 export interface GoogleAppsScriptProject {
   scriptId: string;
   title: string;
@@ -247,22 +273,7 @@ export class GoogleConnector implements PlatformConnector {
         return [];
       }
 
-      return response.data.items.map(activity => ({
-        id: activity.id?.uniqueQualifier || 'unknown',
-        timestamp: new Date(activity.id?.time || Date.now()),
-        actorId: activity.actor?.email || 'system',
-        actorType: mapGoogleActorType(activity.actor?.callerType),
-        actionType: activity.events?.[0]?.name || 'unknown',
-        resourceType: activity.events?.[0]?.type || 'unknown',
-        resourceId: activity.id?.applicationName || '',
-        details: {
-          ipAddress: activity.ipAddress || undefined,
-          events: activity.events,
-          ownerDomain: activity.ownerDomain || undefined
-        },
-        ipAddress: activity.ipAddress || undefined,
-        userAgent: undefined // Not available in Google Admin reports
-      }));
+      return response.data.items.map(mapGoogleActivity);
     } catch (error) {
       console.error('Error fetching Google Workspace audit logs:', error);
       // Return empty array if audit logs aren't available
@@ -270,6 +281,58 @@ export class GoogleConnector implements PlatformConnector {
     }
   }
 
+  /**
+   * Get audit logs newer than a checkpoint, following nextPageToken
+   * Reports are listed newest first, so the cursor only advances once a window
+   * is fully paged; until then the page token is saved and the next run resumes it
+   */
+  async getAuditLogsIncremental(checkpoint: DiscoveryCheckpoint): Promise<IncrementalAuditLogs> {
+    if (!this.client) {
+      throw new Error('Google client not authenticated');
+    }
+
+    const admin = google.admin({ version: 'reports_v1', auth: this.client });
+    const entries: AuditLogEntry[] = [];
+    let newest = checkpoint.pendingCursor || checkpoint.auditLogCursor;
+    let pageToken = checkpoint.pageToken;
+    // startTime is inclusive and the cursor is the newest event already returned
+    const startTime = new Date(new Date(checkpoint.auditLogCursor).getTime() + 1).toISOString();
+
+    try {
+      for (let page = 0; page < MAX_AUDIT_LOG_PAGES_PER_RUN; page++) {
+        const response = await admin.activities.list({
+          userKey: 'all',
+          applicationName: 'admin',
+          startTime,
+          maxResults: 1000,
+          ...(pageToken ? { pageToken } : {})
+        });
+
+        for (const activity of response.data.items || []) {
+          const entry = mapGoogleActivity(activity);
+          entries.push(entry);
+          if (activity.id?.time && new Date(activity.id.time) > new Date(newest)) {
+            newest = new Date(activity.id.time).toISOString();
+          }
+        }
+
+        pageToken = response.data.nextPageToken || undefined;
+        if (!pageToken) {
+          return { entries, checkpoint: { auditLogCursor: newest } };
+        }
+      }
+
+      return {
+        entries,
+        checkpoint: { auditLogCursor: checkpoint.auditLogCursor, pageToken, pendingCursor: newest }
+      };
+    } catch (error) {
+      console.error('Error fetching Google Workspace audit logs:', error);
+      // Keep the previous checkpoint so the next run retries the same window
+      return { entries: [], checkpoint };
+    }
+  }
+
   /**
    * Get AI platform audit logs (OAuth-based detection)
    */
@@ -3,9 +3,12 @@
  * Implements the PlatformConnector interface for Slack OAuth and API integration
  */
 
-import { WebClient } from '@slack/web-api';
-import { PlatformConnector, OAuthCredentials, ConnectionResult, AutomationEvent, AuditLogEntry, PermissionCheck } from './types';
+import { ConversationsHistoryResponse, WebClient } from '@slack/web-api';
+import { PlatformConnector, OAuthCredentials, ConnectionResult, AutomationEvent, AuditLogEntry, PermissionCheck, IncrementalAuditLogs } from './types';
+import { DiscoveryCheckpoint, DiscoveryMode } from '../types/database';
 import { encryptedCredentialRepository } from '../database/repositories/encrypted-credential';
+import { ApiRateLimit, ApiRequestScheduler } from '../utils/api-request-scheduler';
+import { MinHasher, summarizeNearDuplicates } from '../utils/minhash-lsh';
 
 export interface SlackTeamInfo {
   id: string;
@@ -92,12 +95,40 @@ export interface SlackWorkflow {
   };
 }
 
+/**
+ * Slack Web API rate-limit tiers for the calls made during message scanning
+ * (Tier 2: 20+ per minute, Tier 3: 50+ per minute). Limits are per workspace,
+ * so each scan gets its own scheduler. WebClient still retries any 429 itself;
+ * the lanes keep a full channel scan from provoking them.
+ */
+export const SLACK_API_LIMITS: Record<'conversationsList' | 'conversationsHistory', ApiRateLimit> = {
+  conversationsList: { concurrency: 1, requestsPerSecond: 20 / 60, burst: 5 },
+  conversationsHistory: { concurrency: 4, requestsPerSecond: 50 / 60, burst: 20 }
+};
+
+// Channels listed per conversations.list page
+const CHANNEL_PAGE_SIZE = 200;
+
+// History pages read per channel: a full run samples the newest page, a delta run pages back
+// to the channel cursor up to the cap and leaves the cursor in place when the cap is hit
+const FULL_SCAN_HISTORY_PAGES = 1;
+const MAX_HISTORY_PAGES_PER_RUN = 10;
+
+/**
+ * Per-run channel history state; cursors (newest message ts scanned per channel) are read and advanced in place
+ */
+interface ChannelHistoryScan {
+  mode: DiscoveryMode;
+  cursors: Record<string, string>;
+}
+
 /**
  * Slack connector implementing secure OAuth flow and automation discovery
  */
 export class SlackConnector implements PlatformConnector {
   platform: 'slack' = 'slack';
   private client: WebClient | null = null;
+  private readonly minHasher = new MinHasher();
 
   /**
    * Authenticate with Slack using OAuth credentials
@@ -195,6 +226,33 @@ export class SlackConnector implements PlatformConnector {
       throw new Error('Slack client not authenticated');
     }
 
+    return this.collectAuditLogs(since);
+  }
+
+  /**
+   * Get audit logs newer than a checkpoint
+   * Channel history resumes from the newest message ts scanned per channel (the Slack cursor),
+   * other collectors from the checkpoint time
+   */
+  async getAuditLogsIncremental(checkpoint: DiscoveryCheckpoint, mode: DiscoveryMode = 'delta'): Promise<IncrementalAuditLogs> {
+    if (!this.client) {
+      throw new Error('Slack client not authenticated');
+    }
+
+    const startedAt = new Date();
+    const channelCursors = { ...(checkpoint.channelCursors || {}) };
+    const entries = await this.collectAuditLogs(new Date(checkpoint.auditLogCursor), { mode, cursors: channelCursors });
+
+    return {
+      entries,
+      checkpoint: { auditLogCursor: startedAt.toISOString(), channelCursors }
+    };
+  }
+
+  /**
+   * Run every event collector; channel history follows channelScan when given
+   */
+  private async collectAuditLogs(since: Date, channelScan?: ChannelHistoryScan): Promise<AuditLogEntry[]> {
     try {
       const auditLogs: AuditLogEntry[] = [];
       
@@ -203,7 +261,7 @@ export class SlackConnector implements PlatformConnector {
         () => this.collectAppInstallationEvents(since),
         () => this.collectBotEvents(since),
         () => this.collectWebhookEvents(since),
-        () => this.collectMessageEvents(since),
+        () => this.collectMessageEvents(since, channelScan),
         () => this.collectFileEvents(since),
         () => this.collectPermissionEvents(since)
       ];
@@ -393,7 +451,7 @@ export class SlackConnector implements PlatformConnector {
   /**
    * Collect message patterns for shadow AI detection
    */
-  private async collectMessageEvents(since: Date): Promise<AuditLogEntry[]> {
+  private async collectMessageEvents(since: Date, channelScan?: ChannelHistoryScan): Promise<AuditLogEntry[]> {
     const events: AuditLogEntry[] = [];
     
     if (!this.client) {
@@ -402,27 +460,37 @@ export class SlackConnector implements PlatformConnector {
     }
     
     try {
-      // Get recent conversations to analyze message patterns
-      const conversations = await this.client.conversations.list({
-        types: 'public_channel,private_channel',
-        limit: 100
-      });
-      
-      if (conversations.ok && conversations.channels) {
-        for (const channel of conversations.channels.slice(0, 10)) { // Limit for performance
+      // Scan every channel; history requests run concurrently within Slack's rate-limit tier
+      const client = this.client;
+      const scheduler = new ApiRequestScheduler(SLACK_API_LIMITS);
+      const pages = scheduler.paginate(
+        'conversationsList',
+        cursor => client.conversations.list({
+          types: 'public_channel,private_channel',
+          limit: CHANNEL_PAGE_SIZE,
+          ...(cursor ? { cursor } : {})
+        }),
+        page => page.response_metadata?.next_cursor
+      );
+
+      const channelScans: Array<Promise<AuditLogEntry[]>> = [];
+      for await (const conversations of pages) {
+        if (!conversations.ok || !conversations.channels) {
+          break;
+        }
+        for (const channel of conversations.channels) {
           if (channel?.id) {
-            const messagePatterns = await this.analyzeChannelForShadowAI(channel.id, since);
-          
-            if (messagePatterns.length > 0) {
-              messagePatterns.forEach(pattern => {
-                events.push({
+            const channelId = channel.id;
+            channelScans.push(
+              this.analyzeChannelForShadowAI(scheduler, channelId, since, channelScan)
+                .then(messagePatterns => messagePatterns.map(pattern => ({
                   id: `shadow-ai-${pattern.id}`,
                   timestamp: pattern.detectedAt,
                   actorId: pattern.actorId,
-                  actorType: 'bot',
+                  actorType: 'bot' as const,
                   actionType: 'shadow_ai_detected',
                   resourceType: 'channel',
-                  resourceId: channel.id || 'unknown',
+                  resourceId: channelId,
                   details: {
                     platform: 'slack',
                     description: `Potential shadow AI activity detected`,
@@ -436,12 +504,16 @@ export class SlackConnector implements PlatformConnector {
                     nonHumanTiming: pattern.nonHumanTiming,
                     aiKeywords: pattern.aiKeywords
                   }
-                });
-              });
-            }
+                })))
+            );
           }
         }
       }
+
+      // Keep events in channel listing order
+      for (const channelEvents of await Promise.all(channelScans)) {
+        events.push(...channelEvents);
+      }
     } catch (error) {
       console.warn('Could not collect message events for shadow AI detection:', error);
     }
@@ -673,7 +745,12 @@ export class SlackConnector implements PlatformConnector {
   /**
    * Analyze channel for shadow AI activity patterns
    */
-  private async analyzeChannelForShadowAI(channelId: string, since: Date): Promise<Array<{
+  private async analyzeChannelForShadowAI(
+    scheduler: ApiRequestScheduler,
+    channelId: string,
+    since: Date,
+    channelScan?: ChannelHistoryScan
+  ): Promise<Array<{
     id: string;
     detectedAt: Date;
     actorId: string;
@@ -692,17 +769,52 @@ export class SlackConnector implements PlatformConnector {
     }
     
     try {
-      // Get recent messages from the channel
-      const history = await this.client.conversations.history({
-        channel: channelId,
-        oldest: Math.floor(since.getTime() / 1000).toString(),
-        limit: 100
-      });
-      
+      // Get recent messages from the channel (oldest is exclusive, so a cursor skips messages already scanned)
+      const client = this.client;
+      const oldest = channelScan?.cursors[channelId] || Math.floor(since.getTime() / 1000).toString();
+      const maxPages = channelScan?.mode === 'delta' ? MAX_HISTORY_PAGES_PER_RUN : FULL_SCAN_HISTORY_PAGES;
+      if (channelScan?.mode === 'delta') {
+        // Held at the starting point until history is read back to it, so a run that stops short
+        // (page cap or failed page) leaves the window for the next run instead of skipping it
+        channelScan.cursors[channelId] = oldest;
+      }
+      const pages = scheduler.paginate(
+        'conversationsHistory',
+        cursor => client.conversations.history({
+          channel: channelId,
+          oldest,
+          limit: 100,
+          ...(cursor ? { cursor } : {})
+        }),
+        page => page.has_more ? page.response_metadata?.next_cursor : undefined,
+        maxPages
+      );
+
+      const messages: NonNullable<ConversationsHistoryResponse['messages']> = [];
+      let reachedOldest = true;
+      let pageCount = 0;
+      for await (const page of pages) {
+        if (!page.ok || !page.messages) {
+          reachedOldest = false;
+          break;
+        }
+        messages.push(...page.messages);
+        if (++pageCount === maxPages && page.has_more && page.response_metadata?.next_cursor) {
+          reachedOldest = false;
+          if (channelScan?.mode === 'delta') {
+            console.warn(`Stopped channel ${channelId} history scan after ${maxPages} pages; the cursor stays at ${oldest}`);
+          }
+        }
+      }
+
       const patterns: any[] = [];
       
-      if (history.ok && history.messages) {
-        const messages = history.messages;
+      if (messages.length > 0) {
+        // History is newest first
+        const newestTs = messages[0]?.ts;
+        if (channelScan && newestTs && reachedOldest) {
+          channelScan.cursors[channelId] = newestTs;
+        }
         
         // Analyze message timing patterns
         const timingAnalysis = this.analyzeMessageTiming(messages);
@@ -833,12 +945,25 @@ export class SlackConnector implements PlatformConnector {
     const textMessages = messages.filter(msg => msg.text && !msg.subtype);
     if (textMessages.length < 3) return { repetitive, aiKeywords, confidence, evidence };
     
-    // Check for repetitive patterns
-    const messageTexts = textMessages.map(msg => msg.text);
-    const similarities = this.calculateMessageSimilarities(messageTexts);
+    // Check for repetitive patterns (each message is MinHash-signed once)
+    const messageTexts: string[] = textMessages.map(msg => msg.text);
+    const similarities = summarizeNearDuplicates(messageTexts, this.minHasher);
     if (similarities.averageSimilarity > 0.7) {
       repetitive = true;
       evidence.push(`High message similarity detected: ${(similarities.averageSimilarity * 100).toFixed(1)}%`);
+    }
+
+    // Check for templated bursts that a channel-wide average would dilute
+    if (similarities.nearDuplicateRatio >= 0.5) {
+      repetitive = true;
+      const largestGroup = Math.max(...similarities.groups.map(group => group.length));
+      evidence.push(
+        `${Math.round(similarities.nearDuplicateRatio * textMessages.length)} near-duplicate messages in ` +
+        `${similarities.groups.length} template group(s), largest ${largestGroup}`
+      );
+    }
+
+    if (repetitive) {
       confidence += 0.3;
     }
     
@@ -895,39 +1020,6 @@ export class SlackConnector implements PlatformConnector {
     return { detected: false, interval: 0 };
   }
 
-  /**
-   * Calculate message similarity scores
-   */
-  private calculateMessageSimilarities(messages: string[]): { averageSimilarity: number } {
-    let totalSimilarity = 0;
-    let comparisons = 0;
-    
-    for (let i = 0; i < messages.length - 1; i++) {
-      for (let j = i + 1; j < messages.length; j++) {
-        const similarity = this.calculateTextSimilarity(messages[i] || '', messages[j] || '');
-        totalSimilarity += similarity;
-        comparisons++;
-      }
-    }
-    
-    return {
-      averageSimilarity: comparisons > 0 ? totalSimilarity / comparisons : 0
-    };
-  }
-
-  /**
-   * Calculate similarity between two text strings using Jaccard similarity
-   */
-  private calculateTextSimilarity(text1: string, text2: string): number {
-    const words1 = new Set(text1.toLowerCase().split(/\s+/));
-    const words2 = new Set(text2.toLowerCase().split(/\s+/));
-    
-    const intersection = new Set([...words1].filter(word => words2.has(word)));
-    const union = new Set([...words1, ...words2]);
-    
-    return union.size > 0 ? intersection.size / union.size : 0;
-  }
-
   /**
    * Analyze file sharing patterns for suspicious activity
    */
@@ -3,6 +3,8 @@
  * Defines the contract for all SaaS platform connectors
  */
 
+import { DiscoveryCheckpoint, DiscoveryMode } from '../types/database';
+
 export interface OAuthCredentials {
   accessToken: string;
   refreshToken?: string;
@@ -90,12 +92,27 @@ export interface PlatformConnector {
    */
   getAuditLogs(_since: Date): Promise<AuditLogEntry[]>;
 
+  /**
+   * Get audit logs newer than a saved checkpoint, with the checkpoint to save next (optional)
+   * Connectors without it are called through getAuditLogs(checkpoint.auditLogCursor);
+   * mode is the run's discovery mode, for connectors that budget full and delta scans differently
+   */
+  getAuditLogsIncremental?(_checkpoint: DiscoveryCheckpoint, _mode?: DiscoveryMode): Promise<IncrementalAuditLogs>;
+
   /**
    * Validate current permissions and connection health
    */
   validatePermissions(): Promise<PermissionCheck>;
 }
 
+/**
+ * Audit logs fetched from a checkpoint
+ */
+export interface IncrementalAuditLogs {
+  entries: AuditLogEntry[];
+  checkpoint: DiscoveryCheckpoint;
+}
+
 /**
  * Platform Discovery Result
  * Results from platform automation discovery
@@ -115,6 +132,11 @@ export interface DiscoveryResult {
     auditLogsFound: number;
     riskScore: number;
     complianceStatus: 'compliant' | 'non_compliant' | 'unknown';
+    syncMode?: DiscoveryMode;
+    newAutomations?: number;
+    updatedAutomations?: number;
+    unchangedAutomations?: number; // Skipped by delta discovery: content hash matched
+    changedAutomationIds?: string[]; // Stored ids of new/updated automations, for risk re-assessment
   };
 }
 
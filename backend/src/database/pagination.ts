@@ -0,0 +1,160 @@
+/**
+ * Keyset pagination helpers
+ * Opaque cursors and planner-estimated counts shared by repositories and list routes
+ */
+
+import { db } from './pool';
+
+type QueryParameters = (string | number | boolean | Date | null | undefined)[];
+
+interface CursorPayload {
+  s: string; // sort signature the cursor was issued for, e.g. "name:ASC"
+  k: (string | number | boolean | null)[]; // keyset values of the last row on the page
+}
+
+function isCursorPayload(value: unknown): value is CursorPayload {
+  return typeof value === 'object' && value !== null &&
+    typeof (value as CursorPayload).s === 'string' &&
+    Array.isArray((value as CursorPayload).k);
+}
+
+/**
+ * Encode the keyset values of the last row on a page as an opaque cursor
+ */
+export function encodeCursor(sortSignature: string, values: unknown[]): string {
+  const payload: CursorPayload = {
+    s: sortSignature,
+    k: values.map(value => {
+      if (value instanceof Date) return value.toISOString();
+      if (value === undefined) return null;
+      return value as string | number | boolean | null;
+    })
+  };
+  return Buffer.from(JSON.stringify(payload), 'utf8').toString('base64url');
+}
+
+/**
+ * Decode a cursor issued by encodeCursor
+ * Returns undefined for an empty cursor (first page); throws if the cursor is
+ * malformed or was issued for a different sort order
+ */
+export function decodeCursor(
+  cursor: string | undefined,
+  sortSignature: string,
+  keyLength: number
+): (string | number | boolean | null)[] | undefined {
+  if (!cursor) {
+    return undefined;
+  }
+
+  let payload: unknown;
+  try {
+    payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+  } catch {
+    throw new Error('Invalid pagination cursor');
+  }
+
+  if (!isCursorPayload(payload) || payload.s !== sortSignature || payload.k.length !== keyLength) {
+    throw new Error('Invalid pagination cursor');
+  }
+
+  return payload.k;
+}
+
+/**
+ * Build the seek predicate for keyset pagination, e.g. "(da.name, da.id) > ($3, $4)"
+ * All key expressions must be ordered in the same direction
+ */
+export function buildKeysetCondition(
+  keyExpressions: string[],
+  sortOrder: 'ASC' | 'DESC',
+  firstParamIndex: number
+): string {
+  const placeholders = keyExpressions.map((_, index) => `$${firstParamIndex + index}`);
+  const operator = sortOrder === 'ASC' ? '>' : '<';
+  return `(${keyExpressions.join(', ')}) ${operator} (${placeholders.join(', ')})`;
+}
+
+/**
+ * Build the seek predicate for a nullable sort key followed by a unique, non-null tie-breaker
+ * A row-value comparison against a NULL key matches nothing, so NULLs are handled explicitly,
+ * following PostgreSQL's default placement (NULLS LAST for ASC, NULLS FIRST for DESC)
+ */
+export function buildNullableKeysetCondition(
+  sortExpression: string,
+  tieBreaker: string,
+  sortOrder: 'ASC' | 'DESC',
+  after: (string | number | boolean | null)[],
+  firstParamIndex: number
+): { condition: string; params: (string | number | boolean | null)[] } {
+  const [sortValue, tieValue] = after;
+  const operator = sortOrder === 'ASC' ? '>' : '<';
+
+  if (sortValue === null || sortValue === undefined) {
+    const tieCondition = `${tieBreaker} ${operator} $${firstParamIndex}`;
+    return {
+      // Past a NULL key: ASC only has the remaining NULL rows left, DESC has those plus every non-NULL row
+      condition: sortOrder === 'ASC'
+        ? `(${sortExpression} IS NULL AND ${tieCondition})`
+        : `(${sortExpression} IS NOT NULL OR ${tieCondition})`,
+      params: [tieValue ?? null]
+    };
+  }
+
+  const seek = buildKeysetCondition([sortExpression, tieBreaker], sortOrder, firstParamIndex);
+  return {
+    // ASC still has the NULL rows ahead; for DESC they were already returned
+    condition: sortOrder === 'ASC' ? `(${seek} OR ${sortExpression} IS NULL)` : seek,
+    params: [sortValue, tieValue ?? null]
+  };
+}
+
+const CURSOR_KEY_ALIAS = 'cursor_key_';
+
+/**
+ * SELECT-list entries exposing the keyset values as text
+ * Text keeps full precision (e.g. timestamptz microseconds that a JS Date would drop),
+ * and PostgreSQL casts it back to the column type when the cursor is applied
+ */
+export function selectCursorKeys(keyExpressions: string[]): string {
+  return keyExpressions
+    .map((expression, index) => `(${expression})::text AS ${CURSOR_KEY_ALIAS}${index}`)
+    .join(', ');
+}
+
+/**
+ * Remove the cursor key columns from every row and return the keys of the
+ * last row that is part of the page (rows may include one look-ahead row)
+ */
+export function takeCursorKeys(rows: object[], keyLength: number, pageSize: number): (string | null)[] | undefined {
+  const lastIndex = Math.min(pageSize, rows.length) - 1;
+  let lastKeys: (string | null)[] | undefined;
+
+  rows.forEach((row, rowIndex) => {
+    const record = row as Record<string, unknown>;
+    const keys: (string | null)[] = [];
+    for (let index = 0; index < keyLength; index++) {
+      const value = record[`${CURSOR_KEY_ALIAS}${index}`];
+      keys.push(typeof value === 'string' ? value : null);
+      delete record[`${CURSOR_KEY_ALIAS}${index}`];
+    }
+    if (rowIndex === lastIndex) {
+      lastKeys = keys;
+    }
+  });
+
+  return lastKeys;
+}
+
+/**
+ * Estimate the number of rows a query returns from the planner's statistics
+ * Much cheaper than COUNT(*) on large tables; accuracy depends on ANALYZE freshness
+ */
+export async function estimateRowCount(query: string, params: QueryParameters = []): Promise<number> {
+  const result = await db.query<{ 'QUERY PLAN': Array<{ Plan?: { 'Plan Rows'?: number } }> }>(
+    `EXPLAIN (FORMAT JSON) ${query}`,
+    params
+  );
+  const planRows = result.rows[0]?.['QUERY PLAN']?.[0]?.Plan?.['Plan Rows'];
+  return typeof planRows === 'number' ? Math.round(planRows) : 0;
+}
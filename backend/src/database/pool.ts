@@ -200,6 +200,41 @@ class DatabasePool {
     }
   }
 
+  /**
+   * Stream the rows of a query through a server-side cursor
+   * Rows are fetched batchSize at a time inside a read-only transaction, so memory
+   * stays bounded regardless of result size. Stopping iteration early closes the cursor.
+   */
+  async *cursor<T>(text: string, params?: QueryParameters, batchSize: number = 1000): AsyncGenerator<T> {
+    const fetchSize = Math.max(1, Math.floor(batchSize));
+    const client = await this.getClient();
+    let inTransaction = false;
+
+    try {
+      await client.query('BEGIN READ ONLY');
+      inTransaction = true;
+      await client.query(`DECLARE stream_cursor NO SCROLL CURSOR FOR ${text}`, params);
+
+      while (true) {
+        const result = await client.query<T>(`FETCH ${fetchSize} FROM stream_cursor`);
+        for (const row of result.rows) {
+          yield row;
+        }
+        if (result.rows.length < fetchSize) {
+          break;
+        }
+      }
+
+      await client.query('COMMIT');
+      inTransaction = false;
+    } finally {
+      if (inTransaction) {
+        await client.query('ROLLBACK').catch(() => undefined);
+      }
+      client.release();
+    }
+  }
+
   /**
    * Health check for the database pool
    */
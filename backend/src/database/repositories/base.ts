@@ -4,7 +4,18 @@
  */
 
 import { db } from '../pool';
+import {
+  buildKeysetCondition,
+  buildNullableKeysetCondition,
+  decodeCursor,
+  encodeCursor,
+  estimateRowCount,
+  selectCursorKeys,
+  takeCursorKeys
+} from '../pagination';
 import { 
+  CursorPaginatedResult,
+  CursorPaginationOptions,
   DatabaseQueryResult, 
   PaginatedResult, 
   PaginationOptions,
@@ -48,6 +59,28 @@ export interface PaginationClause {
   orderBy: string;
 }
 
+export interface BulkUpsertOptions {
+  conflictColumns: string[]; // Unique constraint used for ON CONFLICT
+  updateColumns?: string[]; // Set from the incoming row on conflict (col = EXCLUDED.col)
+  updateExpressions?: Record<string, string>; // Trusted SQL set on conflict, e.g. { updated_at: 'NOW()' }
+  batchSize?: number; // Rows per INSERT statement
+}
+
+export interface BulkUpsertFailure {
+  index: number; // Position of the failed row in the input array
+  error: Error;
+}
+
+export interface BulkUpsertResult<T> {
+  rows: T[]; // Stored rows in input order, failed rows omitted
+  failures: BulkUpsertFailure[];
+}
+
+export const DEFAULT_BULK_BATCH_SIZE = 500;
+// PostgreSQL bind parameter limit per statement
+const MAX_QUERY_PARAMETERS = 65535;
+const IDENTIFIER_PATTERN = /^[a-zA-Z_][a-zA-Z0-9_]*$/;
+
 // Type guard utilities
 export function isObject(value: unknown): value is Record<string, unknown> {
   return typeof value === 'object' && value !== null && !Array.isArray(value);
@@ -128,18 +161,16 @@ export abstract class BaseRepository<T, CreateInput extends Record<string, unkno
   ): Promise<PaginatedResult<T>> {
     const { whereClause, params } = this.buildWhereClause(filters);
     const { limit, offset, orderBy } = this.buildPaginationClause(pagination);
+    const selectList = this.buildSelectList(pagination?.columns);
+    const totalIsEstimate = pagination?.count === 'approximate';
 
     // Get total count
-    const countQuery = `SELECT COUNT(*) as count FROM ${this.tableName}${whereClause}`;
-    const countResult = await db.query<{ count: string }>(countQuery, params);
-    const countRow = countResult.rows[0];
-    if (!countRow) {
-      throw new Error('Failed to get count from database');
-    }
-    const total = parseInt(countRow.count, 10);
+    const total = totalIsEstimate
+      ? await estimateRowCount(`SELECT 1 FROM ${this.tableName}${whereClause}`, params)
+      : await this.count(filters);
 
     // Get paginated data
-    const dataQuery = `SELECT * FROM ${this.tableName}${whereClause}${orderBy} LIMIT $${params.length + 1} OFFSET $${params.length + 2}`;
+    const dataQuery = `SELECT ${selectList} FROM ${this.tableName}${whereClause}${orderBy} LIMIT $${params.length + 1} OFFSET $${params.length + 2}`;
     const dataResult = await db.query<T>(dataQuery, [...params, limit, offset]);
 
     const page = Math.floor(offset / limit) + 1;
@@ -153,7 +184,71 @@ export abstract class BaseRepository<T, CreateInput extends Record<string, unkno
         total,
         total_pages: totalPages,
         has_next: page < totalPages,
-        has_previous: page > 1
+        has_previous: page > 1,
+        ...(totalIsEstimate && { total_is_estimate: true })
+      }
+    };
+  }
+
+  /**
+   * Find records with keyset (seek) pagination
+   *
+   * Pages are addressed by an opaque cursor holding the sort key and primary key
+   * of the previous page's last row, so deep pages cost the same as the first.
+   * The total is only computed when requested via `count`.
+   */
+  async findManyByCursor(
+    filters?: Filters,
+    options: CursorPaginationOptions = {}
+  ): Promise<CursorPaginatedResult<T>> {
+    const { whereClause, params } = this.buildWhereClause(filters);
+    const limit = Math.min(Math.max(options.limit || 20, 1), 100); // Max 100 items per page
+    const sortBy = options.sort_by || this.primaryKey;
+    const sortOrder = options.sort_order === 'ASC' ? 'ASC' : 'DESC';
+    this.assertIdentifiers([sortBy]);
+
+    // Primary key breaks ties so the key is unique
+    const keyColumns = sortBy === this.primaryKey ? [this.primaryKey] : [sortBy, this.primaryKey];
+    const sortSignature = `${sortBy}:${sortOrder}`;
+    const after = decodeCursor(options.cursor, sortSignature, keyColumns.length);
+
+    let dataWhere = whereClause;
+    const dataParams = [...params];
+    if (after) {
+      // The sort column may be nullable; the primary key never is
+      const seek = keyColumns.length === 1
+        ? { condition: buildKeysetCondition(keyColumns, sortOrder, params.length + 1), params: after }
+        : buildNullableKeysetCondition(sortBy, this.primaryKey, sortOrder, after, params.length + 1);
+      dataWhere = whereClause ? `${whereClause} AND ${seek.condition}` : ` WHERE ${seek.condition}`;
+      dataParams.push(...seek.params);
+    }
+
+    const orderBy = keyColumns.map(column => `${column} ${sortOrder}`).join(', ');
+    const selectList = `${this.buildSelectList(options.columns)}, ${selectCursorKeys(keyColumns)}`;
+    const dataQuery = `SELECT ${selectList} FROM ${this.tableName}${dataWhere} ORDER BY ${orderBy} LIMIT $${dataParams.length + 1}`;
+    // Fetch one extra row to know whether another page exists
+    const dataResult = await db.query<T>(dataQuery, [...dataParams, limit + 1]);
+
+    const hasNext = dataResult.rows.length > limit;
+    const data = hasNext ? dataResult.rows.slice(0, limit) : dataResult.rows;
+    const lastKeys = takeCursorKeys(dataResult.rows as object[], keyColumns.length, limit);
+
+    const countMode = options.count || 'none';
+    let total: number | undefined;
+    if (countMode === 'exact') {
+      total = await this.count(filters);
+    } else if (countMode === 'approximate') {
+      total = await estimateRowCount(`SELECT 1 FROM ${this.tableName}${whereClause}`, params);
+    }
+
+    return {
+      data,
+      pagination: {
+        limit,
+        next_cursor: hasNext && lastKeys ? encodeCursor(sortSignature, lastKeys) : null,
+        has_next: hasNext,
+        ...(total !== undefined && { total }),
+        ...(countMode === 'approximate' && { total_is_estimate: true })
       }
     };
   }
@@ -243,6 +338,79 @@ export abstract class BaseRepository<T, CreateInput extends Record<string, unkno
     return parseInt(row.count, 10);
   }
 
+  /**
+   * Insert or update many records in one transaction
+   *
+   * Rows are written with multi-row INSERT ... VALUES statements of up to
+   * batchSize rows. Each batch runs under a savepoint; if a batch fails it is
+   * retried row by row so one bad row is reported in `failures` instead of
+   * dropping the rest of the batch. A conflict key repeated in the input
+   * starts a new batch, so later rows still win as with sequential upserts.
+   */
+  async bulkUpsert(rows: CreateInput[], options: BulkUpsertOptions): Promise<BulkUpsertResult<T>> {
+    if (rows.length === 0) {
+      return { rows: [], failures: [] };
+    }
+
+    const columns = this.collectBulkColumns(rows);
+    this.assertIdentifiers([
+      ...columns,
+      ...options.conflictColumns,
+      ...(options.updateColumns || []),
+      ...Object.keys(options.updateExpressions || {})
+    ]);
+
+    const maxRowsPerStatement = Math.max(Math.floor(MAX_QUERY_PARAMETERS / columns.length), 1);
+    const batchSize = Math.min(Math.max(options.batchSize || DEFAULT_BULK_BATCH_SIZE, 1), maxRowsPerStatement);
+    const conflictClause = this.buildConflictClause(options);
+    const batches = this.partitionBulkRows(rows, batchSize, options.conflictColumns);
+
+    return db.transaction(async (client) => {
+      const stored = new Array<T | undefined>(rows.length);
+      const failures: BulkUpsertFailure[] = [];
+
+      const upsert = async (indices: number[]): Promise<void> => {
+        const { placeholders, values } = this.buildBulkValuesClause(rows, indices, columns);
+        const query = `
+          INSERT INTO ${this.tableName} (${columns.join(', ')})
+          VALUES ${placeholders}
+          ${conflictClause}
+          RETURNING *
+        `;
+        const result = await client.query<T>(query, values);
+        this.assignReturnedRows(rows, indices, result.rows, options.conflictColumns, stored);
+      };
+
+      for (const batch of batches) {
+        await client.query('SAVEPOINT bulk_upsert_batch');
+        try {
+          await upsert(batch);
+          await client.query('RELEASE SAVEPOINT bulk_upsert_batch');
+          continue;
+        } catch {
+          await client.query('ROLLBACK TO SAVEPOINT bulk_upsert_batch');
+        }
+
+        // Isolate the failing row(s)
+        for (const index of batch) {
+          await client.query('SAVEPOINT bulk_upsert_row');
+          try {
+            await upsert([index]);
+            await client.query('RELEASE SAVEPOINT bulk_upsert_row');
+          } catch (error) {
+            await client.query('ROLLBACK TO SAVEPOINT bulk_upsert_row');
+            failures.push({ index, error: error instanceof Error ? error : new Error(String(error)) });
+          }
+        }
+      }
+
+      return {
+        rows: stored.filter((row): row is T => row !== undefined),
+        failures
+      };
+    });
+  }
+
   /**
    * Execute a raw query
    */
@@ -355,6 +523,19 @@ export abstract class BaseRepository<T, CreateInput extends Record<string, unkno
     return { limit, offset, orderBy };
   }
 
+  /**
+   * Build the SELECT list for a projection, always including the given key columns
+   */
+  protected buildSelectList(columns?: string[], requiredColumns: string[] = []): string {
+    if (!columns || columns.length === 0) {
+      return '*';
+    }
+
+    const selected = Array.from(new Set([...columns, ...requiredColumns]));
+    this.assertIdentifiers(selected);
+    return selected.join(', ');
+  }
+
   /**
    * Build INSERT clause from data
    * CRITICAL: pg library requires JSON.stringify for JSONB columns (objects/arrays)
@@ -409,6 +590,122 @@ export abstract class BaseRepository<T, CreateInput extends Record<string, unkno
     return { setClause, params };
   }
 
+  /**
+   * Columns present (not undefined) in any row, in order of first appearance
+   */
+  protected collectBulkColumns(rows: CreateInput[]): string[] {
+    const columns = new Set<string>();
+    for (const row of rows) {
+      for (const [key, value] of Object.entries(row as Record<string, unknown>)) {
+        if (value !== undefined) {
+          columns.add(key);
+        }
+      }
+    }
+    return Array.from(columns);
+  }
+
+  /**
+   * Build the VALUES tuples for a bulk insert
+   * Missing (undefined) values use the column DEFAULT; objects/arrays are JSON-encoded for JSONB
+   */
+  protected buildBulkValuesClause(
+    rows: CreateInput[],
+    indices: number[],
+    columns: string[]
+  ): { placeholders: string; values: QueryParameters } {
+    const values: QueryParameters = [];
+    const tuples = indices.map(index => {
+      const row = rows[index] as Record<string, unknown>;
+      const placeholders = columns.map(column => {
+        const value = row[column];
+        if (value === undefined) {
+          return 'DEFAULT';
+        }
+        values.push(
+          value !== null && typeof value === 'object' && !(value instanceof Date)
+            ? JSON.stringify(value)
+            : value
+        );
+        return `$${values.length}`;
+      });
+      return `(${placeholders.join(', ')})`;
+    });
+
+    return { placeholders: tuples.join(', '), values };
+  }
+
+  /**
+   * Build the ON CONFLICT clause for a bulk upsert
+   */
+  protected buildConflictClause(options: BulkUpsertOptions): string {
+    const assignments = [
+      ...(options.updateColumns || []).map(column => `${column} = EXCLUDED.${column}`),
+      ...Object.entries(options.updateExpressions || {}).map(([column, expression]) => `${column} = ${expression}`)
+    ];
+    const target = `ON CONFLICT (${options.conflictColumns.join(', ')})`;
+
+    return assignments.length > 0
+      ? `${target} DO UPDATE SET ${assignments.join(', ')}`
+      : `${target} DO NOTHING`;
+  }
+
+  /**
+   * Split row indices into batches, starting a new batch when a conflict key repeats
+   * (a single INSERT ... ON CONFLICT DO UPDATE cannot touch the same row twice)
+   */
+  protected partitionBulkRows(rows: CreateInput[], batchSize: number, conflictColumns: string[]): number[][] {
+    const batches: number[][] = [];
+    let batch: number[] = [];
+    let keys = new Set<string>();
+
+    rows.forEach((row, index) => {
+      const key = this.conflictKey(row as Record<string, unknown>, conflictColumns);
+      if (batch.length >= batchSize || keys.has(key)) {
+        batches.push(batch);
+        batch = [];
+        keys = new Set<string>();
+      }
+      batch.push(index);
+      keys.add(key);
+    });
+
+    if (batch.length > 0) {
+      batches.push(batch);
+    }
+    return batches;
+  }
+
+  private assignReturnedRows(
+    rows: CreateInput[],
+    indices: number[],
+    returned: T[],
+    conflictColumns: string[],
+    stored: Array<T | undefined>
+  ): void {
+    const byKey = new Map<string, T>();
+    for (const row of returned) {
+      byKey.set(this.conflictKey(row as Record<string, unknown>, conflictColumns), row);
+    }
+    for (const index of indices) {
+      stored[index] = byKey.get(this.conflictKey(rows[index] as Record<string, unknown>, conflictColumns));
+    }
+  }
+
+  private conflictKey(row: Record<string, unknown>, conflictColumns: string[]): string {
+    return conflictColumns.map(column => String(row[column])).join('\u0000');
+  }
+
+  private assertIdentifiers(identifiers: string[]): void {
+    for (const identifier of identifiers) {
+      if (!IDENTIFIER_PATTERN.test(identifier)) {
+        throw new Error(
+          `Invalid column name format: ${identifier}. Only alphanumeric characters and underscores allowed.`
+        );
+      }
+    }
+  }
+
   /**
    * Validate required fields
    */
@@ -4,8 +4,16 @@
  */
 
 import { BaseRepository } from './base';
-import { DiscoveredAutomation } from '../../types/database';
+import { CountMode, DiscoveredAutomation } from '../../types/database';
 import { db } from '../pool';
+import {
+  buildKeysetCondition,
+  decodeCursor,
+  encodeCursor,
+  estimateRowCount,
+  selectCursorKeys,
+  takeCursorKeys
+} from '../pagination';
 
 export interface CreateDiscoveredAutomationInput extends Record<string, unknown> {
   organization_id: string;
@@ -13,7 +21,7 @@ export interface CreateDiscoveredAutomationInput extends Record<string, unknown>
   discovery_run_id: string;
   external_id: string;
   name: string;
-  description?: string;
+  description?: string | null;
   automation_type: string;
   status?: string;
   trigger_type?: string;
@@ -21,11 +29,16 @@ export interface CreateDiscoveredAutomationInput extends Record<string, unknown>
   permissions_required?: string[];
   data_access_patterns?: any[];
   owner_info?: any;
-  last_modified_at?: Date;
-  last_triggered_at?: Date;
-  execution_frequency?: string;
+  last_modified_at?: Date | null;
+  last_triggered_at?: Date | null;
+  execution_frequency?: string | null;
   platform_metadata?: any;
+  first_discovered_at?: Date;
+  last_seen_at?: Date;
   is_active?: boolean;
+  vendor_name?: string | null;
+  vendor_group?: string | null;
+  content_hash?: string | null;
 }
 
 export interface UpdateDiscoveredAutomationInput extends Record<string, unknown> {
@@ -45,6 +58,54 @@ export interface DiscoveredAutomationFilters {
   is_active?: boolean;
 }
 
+export interface DiscoveredAutomationListOptions {
+  limit?: number; // Enables keyset pagination when set
+  cursor?: string; // nextCursor from the previous page
+  projection?: 'full' | 'summary'; // 'summary' skips the platform_metadata/detection_metadata JSONB
+  count?: CountMode; // Defaults to 'exact'
+}
+
+/**
+ * List-view columns: everything except the large JSONB metadata blobs
+ */
+export const DISCOVERED_AUTOMATION_SUMMARY_COLUMNS = [
+  'id',
+  'organization_id',
+  'platform_connection_id',
+  'discovery_run_id',
+  'external_id',
+  'name',
+  'description',
+  'automation_type',
+  'status',
+  'trigger_type',
+  'actions',
+  'permissions_required',
+  'data_access_patterns',
+  'owner_info',
+  'last_modified_at',
+  'last_triggered_at',
+  'execution_frequency',
+  'first_discovered_at',
+  'last_seen_at',
+  'is_active',
+  'created_at',
+  'updated_at',
+  'vendor_name',
+  'vendor_group'
+];
+
+// Sort key for findManyCustom; id breaks ties for keyset pagination. The timestamps are
+// nullable, and a NULL in the seek's row comparison would end paging, so NULLs sort as -infinity
+// (matching the migration 013 expression indexes)
+const LIST_KEY_COLUMNS = [
+  "COALESCE(da.last_seen_at, '-infinity'::timestamptz)",
+  "COALESCE(da.created_at, '-infinity'::timestamptz)",
+  'da.id'
+];
+const LIST_ORDER_BY = LIST_KEY_COLUMNS.map(column => `${column} DESC`).join(', ');
+const LIST_SORT_SIGNATURE = 'last_seen_at,created_at,id:DESC';
+
 export class DiscoveredAutomationRepository extends BaseRepository<
   DiscoveredAutomation,
   CreateDiscoveredAutomationInput,
@@ -60,11 +121,21 @@ export class DiscoveredAutomationRepository extends BaseRepository<
   /**
    * Find automations with filters (custom implementation)
    * Includes platform_type via LEFT JOIN with platform_connections
+   *
+   * Without options every matching row is returned. Passing `limit` switches to
+   * keyset pagination ordered by (last_seen_at, created_at, id) DESC; use the
+   * returned nextCursor to fetch the following page.
    */
-  async findManyCustom(filters: DiscoveredAutomationFilters = {}): Promise<{
+  async findManyCustom(
+    filters: DiscoveredAutomationFilters = {},
+    options: DiscoveredAutomationListOptions = {}
+  ): Promise<{
     success: boolean;
     data: (DiscoveredAutomation & { platform_type?: string | null })[];
     total: number;
+    totalIsEstimate?: boolean;
+    nextCursor?: string | null;
+    hasMore?: boolean;
   }> {
     const conditions: string[] = [];
     const values: any[] = [];
@@ -96,22 +167,81 @@ export class DiscoveredAutomationRepository extends BaseRepository<
     }
 
     const whereClause = conditions.length > 0 ? `WHERE ${conditions.join(' AND ')}` : '';
+    const selectList = options.projection === 'summary'
+      ? DISCOVERED_AUTOMATION_SUMMARY_COLUMNS.map(column => `da.${column}`).join(', ')
+      : 'da.*';
+    const paginated = options.limit !== undefined || options.cursor !== undefined;
+
+    if (!paginated) {
+      const query = `
+        SELECT
+          ${selectList},
+          pc.platform_type
+        FROM ${this.tableName} da
+        LEFT JOIN platform_connections pc ON pc.id = da.platform_connection_id
+        ${whereClause}
+        ORDER BY ${LIST_ORDER_BY}
+      `;
+
+      const result = await db.query<DiscoveredAutomation & { platform_type?: string | null }>(query, values);
+      return {
+        success: true,
+        data: result.rows,
+        total: result.rows.length
+      };
+    }
+
+    const limit = Math.min(Math.max(options.limit || 20, 1), 100);
+    const after = decodeCursor(options.cursor, LIST_SORT_SIGNATURE, LIST_KEY_COLUMNS.length);
+    const pageConditions = [...conditions];
+    const pageValues = [...values];
+    if (after) {
+      pageConditions.push(buildKeysetCondition(LIST_KEY_COLUMNS, 'DESC', paramIndex));
+      pageValues.push(...after);
+      paramIndex += after.length;
+    }
+    const pageWhereClause = pageConditions.length > 0 ? `WHERE ${pageConditions.join(' AND ')}` : '';
 
     const query = `
       SELECT
-        da.*,
-        pc.platform_type
+        ${selectList},
+        pc.platform_type,
+        ${selectCursorKeys(LIST_KEY_COLUMNS)}
       FROM ${this.tableName} da
       LEFT JOIN platform_connections pc ON pc.id = da.platform_connection_id
-      ${whereClause}
-      ORDER BY da.last_seen_at DESC, da.created_at DESC
+      ${pageWhereClause}
+      ORDER BY ${LIST_ORDER_BY}
+      LIMIT $${paramIndex}
     `;
 
-    const result = await db.query<DiscoveredAutomation & { platform_type?: string | null }>(query, values);
+    // Fetch one extra row to know whether another page exists
+    const result = await db.query<DiscoveredAutomation & { platform_type?: string | null }>(
+      query,
+      [...pageValues, limit + 1]
+    );
+    const hasMore = result.rows.length > limit;
+    const data = hasMore ? result.rows.slice(0, limit) : result.rows;
+    const lastKeys = takeCursorKeys(result.rows, LIST_KEY_COLUMNS.length, limit);
+
+    const countMode = options.count || 'exact';
+    let total = data.length; // count 'none': rows on this page only
+    if (countMode === 'exact') {
+      const countResult = await db.query<{ count: string }>(
+        `SELECT COUNT(*) as count FROM ${this.tableName} da ${whereClause}`,
+        values
+      );
+      total = parseInt(countResult.rows[0]?.count || '0', 10);
+    } else if (countMode === 'approximate') {
+      total = await estimateRowCount(`SELECT 1 FROM ${this.tableName} da ${whereClause}`, values);
+    }
+
     return {
       success: true,
-      data: result.rows,
-      total: result.rows.length
+      data,
+      total,
+      ...(countMode === 'approximate' && { totalIsEstimate: true }),
+      nextCursor: hasMore && lastKeys ? encodeCursor(LIST_SORT_SIGNATURE, lastKeys) : null,
+      hasMore
     };
   }
 
@@ -194,6 +324,34 @@ export class DiscoveredAutomationRepository extends BaseRepository<
     return result.rows;
   }
 
+  /**
+   * Stored id and content hash of every automation on a connection, keyed by external_id
+   */
+  async findContentHashes(platformConnectionId: string): Promise<Map<string, { id: string; content_hash: string | null }>> {
+    const result = await db.query<{ id: string; external_id: string; content_hash: string | null }>(
+      `SELECT id, external_id, content_hash FROM ${this.tableName} WHERE platform_connection_id = $1`,
+      [platformConnectionId]
+    );
+
+    return new Map(result.rows.map(row => [row.external_id, { id: row.id, content_hash: row.content_hash }]));
+  }
+
+  /**
+   * Set last_seen_at to now for automations found again without changes
+   */
+  async markSeen(ids: string[]): Promise<number> {
+    if (ids.length === 0) {
+      return 0;
+    }
+
+    const result = await db.query(
+      `UPDATE ${this.tableName} SET last_seen_at = NOW() WHERE id = ANY($1::uuid[])`,
+      [ids]
+    );
+
+    return result.rowCount || 0;
+  }
+
   /**
    * Update detection metadata for an automation
    * Uses helper function from migration 006
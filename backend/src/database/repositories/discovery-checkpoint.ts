@@ -0,0 +1,63 @@
+/**
+ * Discovery Checkpoint Repository
+ * Per-connection high-water marks for incremental (delta) discovery
+ */
+
+import { db } from '../pool';
+import { DiscoveryCheckpoint, DiscoveryCheckpointRecord, DiscoveryMode } from '../../types/database';
+
+export class DiscoveryCheckpointRepository {
+  /**
+   * Get the saved checkpoint for a platform connection
+   */
+  async findByConnectionId(platformConnectionId: string): Promise<DiscoveryCheckpointRecord | null> {
+    const result = await db.query<DiscoveryCheckpointRecord>(
+      'SELECT * FROM discovery_checkpoints WHERE platform_connection_id = $1',
+      [platformConnectionId]
+    );
+    return result.rows[0] || null;
+  }
+
+  /**
+   * Save the checkpoint reached by a successful discovery run
+   * A full run also records the resync time that later delta runs are measured against
+   */
+  async save(
+    platformConnectionId: string,
+    organizationId: string,
+    checkpoint: DiscoveryCheckpoint,
+    mode: DiscoveryMode
+  ): Promise<DiscoveryCheckpointRecord> {
+    const syncColumn = mode === 'full' ? 'last_full_sync_at' : 'last_delta_sync_at';
+    const query = `
+      INSERT INTO discovery_checkpoints (platform_connection_id, organization_id, checkpoint, ${syncColumn})
+      VALUES ($1, $2, $3, NOW())
+      ON CONFLICT (platform_connection_id) DO UPDATE SET
+        checkpoint = EXCLUDED.checkpoint,
+        ${syncColumn} = EXCLUDED.${syncColumn},
+        updated_at = NOW()
+      RETURNING *
+    `;
+
+    const result = await db.query<DiscoveryCheckpointRecord>(query, [
+      platformConnectionId,
+      organizationId,
+      JSON.stringify(checkpoint)
+    ]);
+
+    const record = result.rows[0];
+    if (!record) {
+      throw new Error('Failed to save discovery checkpoint');
+    }
+    return record;
+  }
+
+  /**
+   * Forget a connection's checkpoint; its next discovery runs in full
+   */
+  async reset(platformConnectionId: string): Promise<void> {
+    await db.query('DELETE FROM discovery_checkpoints WHERE platform_connection_id = $1', [platformConnectionId]);
+  }
+}
+
+export const discoveryCheckpointRepository = new DiscoveryCheckpointRepository();
@@ -10,6 +10,7 @@ import { encryptedCredentialRepository } from './encrypted-credential';
 import { auditLogRepository } from './audit-log';
 import { discoveredAutomationRepository } from './discovered-automation';
 import { oauthScopeLibraryRepository } from './oauth-scope-library';
+import { discoveryCheckpointRepository } from './discovery-checkpoint';
 
 export { BaseRepository } from './base';
 export { OrganizationRepository, organizationRepository } from './organization';
@@ -19,6 +20,7 @@ export { AuditLogRepository, auditLogRepository } from './audit-log';
 export { DiscoveredAutomationRepository, discoveredAutomationRepository } from './discovered-automation';
 export { OAuthScopeLibraryRepository, oauthScopeLibraryRepository } from './oauth-scope-library';
 export type { OAuthScopeLibrary } from './oauth-scope-library';
+export { DiscoveryCheckpointRepository, discoveryCheckpointRepository } from './discovery-checkpoint';
 
 // Legacy exports for backward compatibility
 export { discoveredAutomationRepository as discoveredAutomationsRepository } from './discovered-automation';
@@ -30,7 +32,8 @@ export const repositories = {
   encryptedCredential: encryptedCredentialRepository,
   auditLog: auditLogRepository,
   discoveredAutomation: discoveredAutomationRepository,
-  oauthScopeLibrary: oauthScopeLibraryRepository
+  oauthScopeLibrary: oauthScopeLibraryRepository,
+  discoveryCheckpoint: discoveryCheckpointRepository
 } as const;
 
 export type Repositories = typeof repositories;
\ No newline at end of file
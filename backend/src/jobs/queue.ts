@@ -7,6 +7,7 @@ import Bull from 'bull';
 import Redis from 'ioredis';
 import { discoveryService } from '../services/discovery-service';
 import { riskService } from '../services/risk-service';
+import { exportService, ExportJobData, ExportFileResult } from '../services/export.service';
 import { DiscoveredAutomation } from '../types/database';
 import {
   DiscoveryJobData,
@@ -86,6 +87,7 @@ const queueConfig = {
 export const discoveryQueue = new Bull('automation-discovery', queueConfig);
 export const riskAssessmentQueue = new Bull('risk-assessment', queueConfig);
 export const notificationQueue = new Bull('notifications', queueConfig);
+export const exportQueue = new Bull('automation-export', queueConfig);
 
 // Re-export job data types from shared-types
 export {
@@ -118,7 +120,7 @@ export class JobQueueManager {
   private setupJobProcessors() {
     // Discovery job processor
     discoveryQueue.process('run-discovery', 2, async (job) => {
-      const { jobId, ...config } = job.data as DiscoveryJobData;
+      const { jobId, forceFullScan, ...config } = job.data as DiscoveryJobData;
       
       console.log(`Starting discovery job ${jobId} for organization ${config.organizationId}`);
       
@@ -126,16 +128,21 @@ export class JobQueueManager {
         // Update job progress
         await job.progress(10);
 
-        // Run discovery
-        const result = await discoveryService.runDiscovery(config);
+        // Queued runs are incremental unless a full scan is requested;
+        // the discovery service still falls back to a full resync periodically
+        const result = await discoveryService.runDiscovery({
+          ...config,
+          mode: forceFullScan ? 'full' : 'delta'
+        });
         
         await job.progress(80);
 
-        // Schedule risk assessment if enabled
-        if (config.riskAssessment) {
+        // Schedule risk assessment if enabled, for new or changed automations only
+        if (config.riskAssessment && result.changedAutomationIds.length > 0) {
           await this.scheduleRiskAssessment({
             jobId: `risk-${jobId}`,
             organizationId: config.organizationId,
+            automationIds: result.changedAutomationIds,
             discoveryRunId: result.jobId,
             scheduledBy: 'discovery-job'
           });
@@ -332,6 +339,32 @@ export class JobQueueManager {
         throw error;
       }
     });
+
+    // Export job processor - streams from a database cursor into a local file
+    exportQueue.process('generate-export', 1, async (job): Promise<ExportFileResult> => {
+      const { jobId, organizationId, format, automationIds } = job.data as ExportJobData;
+
+      console.log(`Starting ${format.toUpperCase()} export job ${jobId} for organization ${organizationId}`);
+
+      try {
+        await job.progress(10);
+
+        const result = await exportService.writeExportFile(
+          format,
+          exportService.streamAutomations(organizationId, automationIds),
+          `${jobId}.${format}`
+        );
+
+        await job.progress(100);
+
+        console.log(`Export job ${jobId} completed: ${result.rowCount} automations, ${result.bytes} bytes`);
+        return result;
+
+      } catch (error) {
+        console.error(`Export job ${jobId} failed:`, error);
+        throw error;
+      }
+    });
   }
 
   /**
@@ -369,13 +402,23 @@ export class JobQueueManager {
       console.error(`Notification job ${job.id} failed:`, err.message);
     });
 
+    // Export queue events
+    exportQueue.on('completed', (job) => {
+      console.log(`Export job ${job.id} completed successfully`);
+    });
+
+    exportQueue.on('failed', (job, err) => {
+      console.error(`Export job ${job.id} failed:`, err.message);
+    });
+
     // Global error handling
     process.on('SIGTERM', () => {
       console.log('Gracefully shutting down job queues...');
       Promise.all([
         discoveryQueue.close(),
         riskAssessmentQueue.close(),
-        notificationQueue.close()
+        notificationQueue.close(),
+        exportQueue.close()
       ]).then(() => {
         console.log('All job queues closed');
         process.exit(0);
@@ -423,6 +466,27 @@ export class JobQueueManager {
     return notificationQueue.add('send-notification', data, jobOptions);
   }
 
+  /**
+   * Schedule a background export; the Bull job id is the export job id
+   */
+  async scheduleExport(data: ExportJobData): Promise<Bull.Job<ExportJobData>> {
+    const jobOptions: Bull.JobOptions = {
+      jobId: data.jobId,
+      attempts: 2,
+      // Completed jobs hold the file location, so keep enough of them for downloads
+      removeOnComplete: 500,
+    };
+
+    return exportQueue.add('generate-export', data, jobOptions);
+  }
+
+  /**
+   * Look up a background export by its job id
+   */
+  async getExportJob(jobId: string): Promise<Bull.Job<ExportJobData> | null> {
+    return exportQueue.getJob(jobId);
+  }
+
   /**
    * Schedule periodic discovery for an organization
    */
@@ -435,11 +499,12 @@ export class JobQueueManager {
       jobId
     });
 
-    // Add new periodic job
+    // Add new periodic job (delta discovery; full resyncs happen on the service's resync interval)
     await discoveryQueue.add('run-discovery', {
       jobId,
       organizationId,
       riskAssessment: true,
+      forceFullScan: false,
       scheduledBy: 'periodic-scheduler'
     }, {
       repeat: {
@@ -455,16 +520,18 @@ export class JobQueueManager {
    * Get queue statistics
    */
   async getQueueStats(): Promise<QueueStats[]> {
-    const [discoveryStats, riskStats, notificationStats] = await Promise.all([
+    const [discoveryStats, riskStats, notificationStats, exportStats] = await Promise.all([
       this.getQueueStatistics(discoveryQueue),
       this.getQueueStatistics(riskAssessmentQueue),  
-      this.getQueueStatistics(notificationQueue)
+      this.getQueueStatistics(notificationQueue),
+      this.getQueueStatistics(exportQueue)
     ]);
 
     return [
       { name: 'discovery', ...discoveryStats },
       { name: 'riskAssessment', ...riskStats },
-      { name: 'notifications', ...notificationStats }
+      { name: 'notifications', ...notificationStats },
+      { name: 'export', ...exportStats }
     ];
   }
 
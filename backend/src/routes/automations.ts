@@ -3,19 +3,33 @@
  * Handles automation discovery, retrieval, and management
  */
 
+import { randomUUID } from 'crypto';
 import { Router, Response } from 'express';
 import { z } from 'zod';
 import { ClerkAuthRequest } from '../middleware/clerk-auth';
 import { validateRequest } from '../middleware/validation';
 import { riskService } from '../services/risk-service';
-import { exportService } from '../services/export.service';
+import {
+  exportService,
+  ExportFormat,
+  ExportFileResult,
+  EXPORT_CONTENT_TYPES
+} from '../services/export.service';
 import { db } from '../database/pool';
+import {
+  buildKeysetCondition,
+  decodeCursor,
+  encodeCursor,
+  estimateRowCount,
+  selectCursorKeys,
+  takeCursorKeys
+} from '../database/pagination';
 import {
   DiscoveredAutomation,
   AutomationType,
   AutomationStatus
 } from '../types/database';
-import { ExportRequest, Automation } from '@singura/shared-types';
+import { ExportRequest } from '@singura/shared-types';
 import {
   extractOAuthContext,
   extractDetectionEvidence,
@@ -246,8 +260,31 @@ const automationFiltersSchema = z.object({
   sort_by: z.enum(['name', 'type', 'riskLevel', 'lastTriggered', 'createdAt']).default('name'),
   sort_order: z.enum(['ASC', 'DESC']).default('ASC'),
   groupBy: z.enum(['vendor']).optional(),
+  // Keyset pagination: pass an empty cursor for the first page, then nextCursor
+  cursor: z.string().max(1024).optional(),
+  // 'summary' only reads the risk fields of platform_metadata instead of the whole JSONB
+  fields: z.enum(['full', 'summary']).default('full'),
+  // Defaults to 'exact' for page-based and 'none' for cursor-based requests
+  count: z.enum(['exact', 'approximate', 'none']).optional(),
 });
 
+// Sort keys for GET /automations, shared by page- and cursor-based requests so both return the same order.
+// Expressions are NULL-safe so the seek predicate never drops rows; NULLs sort as the lowest value.
+const AUTOMATION_SORT_KEYS: Record<z.infer<typeof automationFiltersSchema>['sort_by'], string> = {
+  name: 'da.name',
+  type: 'da.automation_type',
+  // risk_level_enum order (low < medium < high < critical), not alphabetical
+  riskLevel: "CASE ra.risk_level WHEN 'low' THEN 1 WHEN 'medium' THEN 2 WHEN 'high' THEN 3 WHEN 'critical' THEN 4 ELSE 0 END",
+  lastTriggered: "COALESCE(da.last_triggered_at, '-infinity'::timestamptz)",
+  createdAt: "COALESCE(da.first_discovered_at, '-infinity'::timestamptz)",
+};
+
+// List views only need the fields calculateRiskLevel/calculateRiskScore read
+const SUMMARY_PLATFORM_METADATA = `jsonb_strip_nulls(jsonb_build_object(
+        'isAIPlatform', da.platform_metadata->'isAIPlatform',
+        'riskFactors', da.platform_metadata->'riskFactors'
+      ))`;
+
 /**
  * GET /automations
  * Get discovered automations with filtering and pagination
@@ -274,10 +311,72 @@ router.get('/', validateRequest({ query: automationFiltersSchema }), async (req:
       limit,
       sort_by,
       sort_order,
-      groupBy
+      groupBy,
+      cursor,
+      fields,
+      count
     } = req.query as unknown as z.infer<typeof automationFiltersSchema>;
 
-    // Build base query
+    const useCursor = cursor !== undefined;
+    const countMode = count ?? (useCursor ? 'none' : 'exact');
+    const sortSignature = `${sort_by}:${sort_order}`;
+
+    let after: ReturnType<typeof decodeCursor>;
+    try {
+      after = decodeCursor(cursor, sortSignature, 2);
+    } catch {
+      res.status(400).json({
+        success: false,
+        error: 'INVALID_CURSOR',
+        message: 'Pagination cursor is invalid or does not match the requested sort'
+      });
+      return;
+    }
+
+    // Shared FROM/WHERE for the data and count queries
+    let fromWhere = `
+      FROM discovered_automations da
+      LEFT JOIN platform_connections pc ON da.platform_connection_id = pc.id
+      LEFT JOIN risk_assessments ra ON da.id = ra.automation_id
+      WHERE da.organization_id = $1
+    `;
+
+    const filterParams: QueryParameters = [organizationId];
+    let paramIndex = 2;
+
+    // Add filters
+    if (platform) {
+      fromWhere += ` AND pc.platform_type = $${paramIndex}`;
+      filterParams.push(platform);
+      paramIndex++;
+    }
+
+    if (status) {
+      fromWhere += ` AND da.status = $${paramIndex}`;
+      filterParams.push(status);
+      paramIndex++;
+    }
+
+    if (type) {
+      fromWhere += ` AND da.automation_type = $${paramIndex}`;
+      filterParams.push(type);
+      paramIndex++;
+    }
+
+    if (riskLevel) {
+      fromWhere += ` AND ra.risk_level = $${paramIndex}`;
+      filterParams.push(riskLevel);
+      paramIndex++;
+    }
+
+    if (search) {
+      fromWhere += ` AND (da.name ILIKE $${paramIndex} OR da.description ILIKE $${paramIndex})`;
+      filterParams.push(`%${search}%`);
+      paramIndex++;
+    }
+
+    // Build data query
+    const keysetColumns = [AUTOMATION_SORT_KEYS[sort_by], 'da.id'];
     let query = `
       SELECT
         da.id,
@@ -294,7 +393,7 @@ router.get('/', validateRequest({ query: automationFiltersSchema }), async (req:
         da.last_modified_at,
         da.last_triggered_at,
         da.execution_frequency,
-        da.platform_metadata,
+        ${fields === 'summary' ? `${SUMMARY_PLATFORM_METADATA} AS platform_metadata` : 'da.platform_metadata'},
         da.first_discovered_at,
         da.last_seen_at,
         da.is_active,
@@ -307,107 +406,66 @@ router.get('/', validateRequest({ query: automationFiltersSchema }), async (req:
         ra.risk_level,
         ra.risk_score,
         ra.risk_factors,
-        ra.recommendations
-      FROM discovered_automations da
-      LEFT JOIN platform_connections pc ON da.platform_connection_id = pc.id
-      LEFT JOIN risk_assessments ra ON da.id = ra.automation_id
-      WHERE da.organization_id = $1
+        ra.recommendations${useCursor ? `,
+        ${selectCursorKeys(keysetColumns)}` : ''}
+      ${fromWhere}
     `;
+    const queryParams: QueryParameters = [...filterParams];
 
-    const queryParams: QueryParameters = [organizationId];
-    let paramIndex = 2;
-
-    // Add filters
-    if (platform) {
-      query += ` AND pc.platform_type = $${paramIndex}`;
-      queryParams.push(platform);
-      paramIndex++;
-    }
-
-    if (status) {
-      query += ` AND da.status = $${paramIndex}`;
-      queryParams.push(status);
-      paramIndex++;
-    }
-
-    if (type) {
-      query += ` AND da.automation_type = $${paramIndex}`;
-      queryParams.push(type);
-      paramIndex++;
+    // Keyset pagination: seek past the previous page's last row
+    if (after) {
+      query += ` AND ${buildKeysetCondition(keysetColumns, sort_order, paramIndex)}`;
+      queryParams.push(...after);
+      paramIndex += after.length;
     }
-
-    if (riskLevel) {
-      query += ` AND ra.risk_level = $${paramIndex}`;
-      queryParams.push(riskLevel);
-      paramIndex++;
-    }
-
-    if (search) {
-      query += ` AND (da.name ILIKE $${paramIndex} OR da.description ILIKE $${paramIndex})`;
-      queryParams.push(`%${search}%`);
-      paramIndex++;
+    query += ` ORDER BY ${keysetColumns.map(column => `${column} ${sort_order}`).join(', ')}`;
+    if (useCursor) {
+      query += ` LIMIT $${paramIndex}`;
+      queryParams.push(limit + 1); // One extra row tells us whether another page exists
+    } else {
+      const offset = (page - 1) * limit;
+      query += ` LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`;
+      queryParams.push(limit, offset);
     }
 
-    // Add sorting
-    const sortField = sort_by === 'riskLevel' ? 'ra.risk_level' : `da.${sort_by}`;
-    query += ` ORDER BY ${sortField} ${sort_order}`;
-
-    // Add pagination
-    const offset = (page - 1) * limit;
-    query += ` LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`;
-    queryParams.push(limit, offset);
-
     // Execute query
     const result = await db.query(query, queryParams);
 
-    // Get total count for pagination
-    let countQuery = `
-      SELECT COUNT(DISTINCT da.id) as total
-      FROM discovered_automations da
-      LEFT JOIN platform_connections pc ON da.platform_connection_id = pc.id
-      LEFT JOIN risk_assessments ra ON da.id = ra.automation_id
-      WHERE da.organization_id = $1
-    `;
-    const countParams: QueryParameters = [organizationId];
-    let countParamIndex = 2;
-
-    // Apply same filters for count
-    if (platform) {
-      countQuery += ` AND pc.platform_type = $${countParamIndex}`;
-      countParams.push(platform);
-      countParamIndex++;
-    }
-
-    if (status) {
-      countQuery += ` AND da.status = $${countParamIndex}`;
-      countParams.push(status);
-      countParamIndex++;
-    }
-
-    if (type) {
-      countQuery += ` AND da.automation_type = $${countParamIndex}`;
-      countParams.push(type);
-      countParamIndex++;
-    }
-
-    if (riskLevel) {
-      countQuery += ` AND ra.risk_level = $${countParamIndex}`;
-      countParams.push(riskLevel);
-      countParamIndex++;
+    let pageRows = result.rows;
+    let nextCursor: string | null = null;
+    let hasNextPage = false;
+    if (useCursor) {
+      const lastKeys = takeCursorKeys(result.rows as object[], keysetColumns.length, limit);
+      hasNextPage = result.rows.length > limit;
+      if (hasNextPage) {
+        pageRows = result.rows.slice(0, limit);
+        nextCursor = lastKeys ? encodeCursor(sortSignature, lastKeys) : null;
+      }
     }
 
-    if (search) {
-      countQuery += ` AND (da.name ILIKE $${countParamIndex} OR da.description ILIKE $${countParamIndex})`;
-      countParams.push(`%${search}%`);
-      countParamIndex++;
+    // Get total count for pagination
+    let total: number | undefined;
+    if (countMode === 'approximate') {
+      total = await estimateRowCount(`SELECT da.id ${fromWhere}`, filterParams);
+    } else if (countMode === 'exact' || !useCursor) {
+      const countResult = await db.query(
+        `SELECT COUNT(DISTINCT da.id) as total ${fromWhere}`,
+        filterParams
+      ) as { rows: CountQueryResult[] };
+      total = parseInt(countResult.rows[0]?.total || '0');
     }
+    const totalPages = Math.ceil((total ?? 0) / limit);
 
-    const countResult = await db.query(countQuery, countParams) as { rows: CountQueryResult[] };
-    const total = parseInt(countResult.rows[0]?.total || '0');
-    const totalPages = Math.ceil(total / limit);
+    const cursorPagination = {
+      limit,
+      nextCursor,
+      hasNext: hasNextPage,
+      ...(total !== undefined && { total }),
+      ...(countMode === 'approximate' && { totalIsEstimate: true }),
+    };
 
     // Transform results to match frontend expectations
-    const typedResult = result as { rows: AutomationQueryResult[] };
+    const typedResult = { rows: pageRows as AutomationQueryResult[] };
 
     // Check if groupBy=vendor was requested
     if (groupBy === 'vendor') {
@@ -419,7 +477,7 @@ router.get('/', validateRequest({ query: automationFiltersSchema }), async (req:
         success: true,
         vendorGroups,
         grouped: true,
-        pagination: {
+        pagination: useCursor ? cursorPagination : {
           page,
           limit,
           total: vendorGroups.length,
@@ -463,13 +521,14 @@ router.get('/', validateRequest({ query: automationFiltersSchema }), async (req:
       res.json({
         success: true,
         automations,
-        pagination: {
+        pagination: useCursor ? cursorPagination : {
           page,
           limit,
           total,
           totalPages,
           hasNext: page < totalPages,
           hasPrevious: page > 1,
+          ...(countMode === 'approximate' && { totalIsEstimate: true }),
         }
       });
     }
@@ -1013,14 +1072,26 @@ router.post('/:id/assess-risk', async (req: ClerkAuthRequest, res: Response): Pr
   }
 });
 
+interface AutomationExportBody extends Partial<Pick<ExportRequest, 'automationIds'>> {
+  // Export the organization's whole inventory instead of a selection
+  allAutomations?: boolean;
+  // Queue the export and download the generated file later
+  background?: boolean;
+}
+
+const exportFileName = (format: ExportFormat): string =>
+  `automations-export-${new Date().toISOString().split('T')[0]}.${format}`;
+
 /**
- * POST /automations/export/csv
- * Export automations to CSV format
+ * Stream an export straight from a database cursor into the response,
+ * or queue it as a background job that writes a downloadable file
  */
-router.post('/export/csv', async (req: ClerkAuthRequest, res: Response): Promise<void> => {
+async function handleExport(format: ExportFormat, req: ClerkAuthRequest, res: Response): Promise<void> {
+  const label = format.toUpperCase();
+
   try {
     const organizationId = req.user?.organizationId;
-    const { automationIds } = req.body as ExportRequest;
+    const { automationIds, allAutomations, background } = (req.body || {}) as AutomationExportBody;
 
     if (!organizationId) {
       res.status(401).json({
@@ -1032,7 +1103,7 @@ router.post('/export/csv', async (req: ClerkAuthRequest, res: Response): Promise
     }
 
     // Validate request body
-    if (!automationIds || !Array.isArray(automationIds) || automationIds.length === 0) {
+    if (!allAutomations && (!automationIds || !Array.isArray(automationIds) || automationIds.length === 0)) {
       res.status(400).json({
         success: false,
         error: 'INVALID_REQUEST',
@@ -1041,90 +1112,76 @@ router.post('/export/csv', async (req: ClerkAuthRequest, res: Response): Promise
       return;
     }
 
-    // Fetch automations from database
-    const query = `
-      SELECT
-        da.id,
-        da.name,
-        da.description,
-        da.automation_type as type,
-        da.status,
-        pc.platform_type as platform,
-        ra.risk_level,
-        ra.risk_score,
-        da.first_discovered_at,
-        da.last_triggered_at,
-        da.owner_info,
-        da.platform_metadata
-      FROM discovered_automations da
-      LEFT JOIN platform_connections pc ON da.platform_connection_id = pc.id
-      LEFT JOIN risk_assessments ra ON da.id = ra.automation_id
-      WHERE da.id = ANY($1::uuid[]) AND da.organization_id = $2
-    `;
+    const selectedIds = allAutomations ? undefined : automationIds;
 
-    const result = await db.query(query, [automationIds as any, organizationId]) as {
-      rows: Array<{
-        id: string;
-        name: string;
-        description: string | null;
-        type: string;
-        status: string;
-        platform: string;
-        risk_level: string | null;
-        risk_score: number | null;
-        first_discovered_at: Date;
-        last_triggered_at: Date | null;
-        owner_info: any;
-        platform_metadata: any;
-      }>
-    };
+    if (background) {
+      // Loaded lazily so API processes don't open queue connections until needed
+      const { jobQueue } = await import('../jobs/queue');
+      const jobId = randomUUID();
 
-    // Transform to Automation type for export service
-    const automations: Automation[] = result.rows.map(row => ({
-      id: row.id,
-      name: row.name,
-      description: row.description || '',
-      type: row.type as any,
-      status: row.status as any,
-      platform: row.platform || 'unknown',
-      platformId: row.id,
-      organizationId,
-      connectionId: '',
-      risk: {
-        level: (row.risk_level || 'medium') as any,
-        score: row.risk_score || 0,
-        factors: []
-      },
-      permissions: {
-        scopes: [],
-        roles: []
-      },
-      metadata: {
-        discoveredAt: row.first_discovered_at.toISOString(),
-        lastActiveAt: row.last_triggered_at?.toISOString() || row.first_discovered_at.toISOString(),
-        ...row.platform_metadata
-      },
-      affectedUsers: row.owner_info?.email ? [row.owner_info.email] : []
-    } as any));
+      await jobQueue.scheduleExport({
+        jobId,
+        organizationId,
+        format,
+        automationIds: selectedIds,
+        requestedBy: req.user?.userId
+      });
+
+      res.status(202).json({
+        success: true,
+        jobId,
+        status: 'queued',
+        statusUrl: `/api/automations/export/jobs/${jobId}`,
+        downloadUrl: `/api/automations/export/jobs/${jobId}/download`
+      });
+      return;
+    }
 
-    // Generate CSV
-    const csvBuffer = await exportService.exportToCSV(automations);
+    const exportStream = exportService.createExportStream(
+      format,
+      exportService.streamAutomations(organizationId, selectedIds)
+    );
 
-    // Set response headers for file download
-    res.setHeader('Content-Type', 'text/csv');
-    res.setHeader('Content-Disposition', `attachment; filename="automations-export-${new Date().toISOString().split('T')[0]}.csv"`);
-    res.setHeader('Content-Length', csvBuffer.length.toString());
+    // Set response headers for file download; the length is unknown, so the body is chunked
+    res.setHeader('Content-Type', EXPORT_CONTENT_TYPES[format]);
+    res.setHeader('Content-Disposition', `attachment; filename="${exportFileName(format)}"`);
+
+    // Stop reading from the database cursor if the client goes away
+    res.on('close', () => exportStream.destroy());
+
+    exportStream.on('error', (error) => {
+      console.error(`Failed to stream automations ${label} export:`, error);
+      if (res.headersSent) {
+        res.destroy(error);
+        return;
+      }
+      res.removeHeader('Content-Disposition');
+      res.status(500).json({
+        success: false,
+        error: 'EXPORT_FAILED',
+        message: `Failed to export automations to ${label}`
+      });
+    });
 
-    res.send(csvBuffer);
+    // pipe() pauses the cursor whenever the socket buffer is full
+    exportStream.pipe(res);
 
   } catch (error) {
-    console.error('Failed to export automations to CSV:', error);
+    console.error(`Failed to export automations to ${label}:`, error);
     res.status(500).json({
       success: false,
       error: 'EXPORT_FAILED',
-      message: 'Failed to export automations to CSV'
+      message: `Failed to export automations to ${label}`
     });
   }
+}
+
+/**
+ * POST /automations/export/csv
+ * Export automations to CSV format
+ */
+router.post('/export/csv', async (req: ClerkAuthRequest, res: Response): Promise<void> => {
+  await handleExport('csv', req, res);
 });
 
 /**
@@ -1132,10 +1189,16 @@ router.post('/export/csv', async (req: ClerkAuthRequest, res: Response): Promise
  * Export automations to PDF format
  */
 router.post('/export/pdf', async (req: ClerkAuthRequest, res: Response): Promise<void> => {
+  await handleExport('pdf', req, res);
+});
+
+/**
+ * GET /automations/export/jobs/:jobId
+ * Get the status of a background export
+ */
+router.get('/export/jobs/:jobId', async (req: ClerkAuthRequest, res: Response): Promise<void> => {
   try {
     const organizationId = req.user?.organizationId;
-    const { automationIds } = req.body as ExportRequest;
-
     if (!organizationId) {
       res.status(401).json({
         success: false,
@@ -1145,98 +1208,102 @@ router.post('/export/pdf', async (req: ClerkAuthRequest, res: Response): Promise
       return;
     }
 
-    // Validate request body
-    if (!automationIds || !Array.isArray(automationIds) || automationIds.length === 0) {
-      res.status(400).json({
+    const { jobQueue } = await import('../jobs/queue');
+    const job = await jobQueue.getExportJob(req.params.jobId!);
+
+    if (!job || job.data.organizationId !== organizationId) {
+      res.status(404).json({
         success: false,
-        error: 'INVALID_REQUEST',
-        message: 'automationIds array is required'
+        error: 'EXPORT_JOB_NOT_FOUND',
+        message: 'Export job not found'
       });
       return;
     }
 
-    // Fetch automations from database
-    const query = `
-      SELECT
-        da.id,
-        da.name,
-        da.description,
-        da.automation_type as type,
-        da.status,
-        pc.platform_type as platform,
-        ra.risk_level,
-        ra.risk_score,
-        da.first_discovered_at,
-        da.last_triggered_at,
-        da.owner_info,
-        da.platform_metadata
-      FROM discovered_automations da
-      LEFT JOIN platform_connections pc ON da.platform_connection_id = pc.id
-      LEFT JOIN risk_assessments ra ON da.id = ra.automation_id
-      WHERE da.id = ANY($1::uuid[]) AND da.organization_id = $2
-    `;
+    const status = await job.getState();
+    const result = job.returnvalue as ExportFileResult | null;
 
-    const result = await db.query(query, [automationIds as any, organizationId]) as {
-      rows: Array<{
-        id: string;
-        name: string;
-        description: string | null;
-        type: string;
-        status: string;
-        platform: string;
-        risk_level: string | null;
-        risk_score: number | null;
-        first_discovered_at: Date;
-        last_triggered_at: Date | null;
-        owner_info: any;
-        platform_metadata: any;
-      }>
-    };
+    res.json({
+      success: true,
+      job: {
+        jobId: job.data.jobId,
+        format: job.data.format,
+        status,
+        progress: job.progress(),
+        rowCount: result?.rowCount,
+        bytes: result?.bytes,
+        error: status === 'failed' ? job.failedReason : undefined,
+        downloadUrl: status === 'completed' ? `/api/automations/export/jobs/${job.data.jobId}/download` : undefined
+      }
+    });
 
-    // Transform to Automation type for export service
-    const automations: Automation[] = result.rows.map(row => ({
-      id: row.id,
-      name: row.name,
-      description: row.description || '',
-      type: row.type as any,
-      status: row.status as any,
-      platform: row.platform || 'unknown',
-      platformId: row.id,
-      organizationId,
-      connectionId: '',
-      risk: {
-        level: (row.risk_level || 'medium') as any,
-        score: row.risk_score || 0,
-        factors: []
-      },
-      permissions: {
-        scopes: [],
-        roles: []
-      },
-      metadata: {
-        discoveredAt: row.first_discovered_at.toISOString(),
-        lastActiveAt: row.last_triggered_at?.toISOString() || row.first_discovered_at.toISOString(),
-        ...row.platform_metadata
-      },
-      affectedUsers: row.owner_info?.email ? [row.owner_info.email] : []
-    } as any));
+  } catch (error) {
+    console.error('Failed to get export job status:', error);
+    res.status(500).json({
+      success: false,
+      error: 'EXPORT_JOB_STATUS_FAILED',
+      message: 'Failed to get export job status'
+    });
+  }
+});
+
+/**
+ * GET /automations/export/jobs/:jobId/download
+ * Download the file produced by a completed background export
+ */
+router.get('/export/jobs/:jobId/download', async (req: ClerkAuthRequest, res: Response): Promise<void> => {
+  try {
+    const organizationId = req.user?.organizationId;
+    if (!organizationId) {
+      res.status(401).json({
+        success: false,
+        error: 'ORGANIZATION_NOT_FOUND',
+        message: 'Organization ID not found in token'
+      });
+      return;
+    }
 
-    // Generate PDF
-    const pdfBuffer = await exportService.exportToPDF(automations);
+    const { jobQueue } = await import('../jobs/queue');
+    const job = await jobQueue.getExportJob(req.params.jobId!);
 
-    // Set response headers for file download
-    res.setHeader('Content-Type', 'application/pdf');
-    res.setHeader('Content-Disposition', `attachment; filename="automations-export-${new Date().toISOString().split('T')[0]}.pdf"`);
-    res.setHeader('Content-Length', pdfBuffer.length.toString());
+    if (!job || job.data.organizationId !== organizationId) {
+      res.status(404).json({
+        success: false,
+        error: 'EXPORT_JOB_NOT_FOUND',
+        message: 'Export job not found'
+      });
+      return;
+    }
+
+    const result = job.returnvalue as ExportFileResult | null;
+    if ((await job.getState()) !== 'completed' || !result) {
+      res.status(409).json({
+        success: false,
+        error: 'EXPORT_NOT_READY',
+        message: 'Export has not completed yet'
+      });
+      return;
+    }
 
-    res.send(pdfBuffer);
+    res.setHeader('Content-Type', EXPORT_CONTENT_TYPES[job.data.format]);
+    res.download(result.filePath, exportFileName(job.data.format), (error) => {
+      if (!error) return;
+      console.error('Failed to send export file:', error);
+      if (!res.headersSent) {
+        res.status(404).json({
+          success: false,
+          error: 'EXPORT_FILE_NOT_FOUND',
+          message: 'Export file is no longer available'
+        });
+      }
+    });
 
   } catch (error) {
-    console.error('Failed to export automations to PDF:', error);
+    console.error('Failed to download export:', error);
     res.status(500).json({
       success: false,
-      error: 'EXPORT_FAILED',
-      message: 'Failed to export automations to PDF'
+      error: 'EXPORT_DOWNLOAD_FAILED',
+      message: 'Failed to download export'
     });
   }
 });
@@ -535,7 +535,7 @@ router.post(
       const orchestrator = await initializeCorrelationServices();
 
       // Start real-time monitoring
-      orchestrator.startRealTimeMonitoring();
+      orchestrator.startRealTimeMonitoring(organizationId!);
 
       const processingTime = Date.now() - startTime;
 
@@ -589,7 +589,7 @@ router.post(
       const orchestrator = await initializeCorrelationServices();
 
       // Stop real-time monitoring
-      orchestrator.stopRealTimeMonitoring();
+      orchestrator.stopRealTimeMonitoring(organizationId);
 
       const processingTime = Date.now() - startTime;
 
@@ -0,0 +1,300 @@
+/**
+ * Discovery Service Unit Tests
+ * Tests delta discovery: checkpoint resolution, content-hash skipping and periodic full resync
+ */
+
+import { DiscoveryService } from '../discovery-service';
+import { AutomationEvent } from '../../connectors/types';
+import { slackConnector } from '../../connectors/slack';
+import { googleConnector } from '../../connectors/google';
+import { discoveredAutomationRepository } from '../../database/repositories/discovered-automation';
+import { discoveryCheckpointRepository } from '../../database/repositories/discovery-checkpoint';
+import { encryptedCredentialRepository } from '../../database/repositories/encrypted-credential';
+import { db } from '../../database/pool';
+import { PlatformConnection } from '../../types/database';
+
+jest.mock('../../connectors/slack', () => ({
+  slackConnector: {
+    platform: 'slack',
+    authenticate: jest.fn(),
+    discoverAutomations: jest.fn(),
+    getAuditLogs: jest.fn(),
+    getAuditLogsIncremental: jest.fn(),
+    validatePermissions: jest.fn()
+  }
+}));
+
+jest.mock('../../connectors/google', () => ({
+  googleConnector: {
+    platform: 'google',
+    authenticate: jest.fn(),
+    discoverAutomations: jest.fn(),
+    getAuditLogs: jest.fn(),
+    validatePermissions: jest.fn()
+  }
+}));
+
+jest.mock('../../connectors/microsoft', () => ({ microsoftConnector: {} }));
+
+jest.mock('../../database/repositories/platform-connection', () => ({
+  platformConnectionRepository: { findById: jest.fn(), findMany: jest.fn() }
+}));
+
+jest.mock('../../database/repositories/encrypted-credential', () => ({
+  encryptedCredentialRepository: { getDecryptedValue: jest.fn() }
+}));
+
+jest.mock('../../database/repositories/discovered-automation', () => ({
+  discoveredAutomationRepository: { findContentHashes: jest.fn(), bulkUpsert: jest.fn(), markSeen: jest.fn() }
+}));
+
+jest.mock('../../database/repositories/discovery-checkpoint', () => ({
+  discoveryCheckpointRepository: { findByConnectionId: jest.fn(), save: jest.fn() }
+}));
+
+jest.mock('../../database/pool', () => ({
+  db: { query: jest.fn() }
+}));
+
+const HOUR = 60 * 60 * 1000;
+
+const connection = (platform: 'slack' | 'google'): PlatformConnection => ({
+  id: `conn-${platform}`,
+  organization_id: 'org-1',
+  platform_type: platform
+} as PlatformConnection);
+
+const automation = (id: string, name: string): AutomationEvent => ({
+  id,
+  name,
+  type: 'bot',
+  platform: 'slack',
+  status: 'active',
+  trigger: 'event',
+  actions: ['post_message'],
+  metadata: { scopes: ['chat:write'] },
+  createdAt: new Date('2025-01-01T00:00:00Z'),
+  lastTriggered: null
+});
+
+describe('DiscoveryService', () => {
+  let service: DiscoveryService;
+  const slack = slackConnector as jest.Mocked<typeof slackConnector>;
+  const google = googleConnector as jest.Mocked<typeof googleConnector>;
+  const repository = discoveredAutomationRepository as jest.Mocked<typeof discoveredAutomationRepository>;
+  const checkpoints = discoveryCheckpointRepository as jest.Mocked<typeof discoveryCheckpointRepository>;
+
+  // Upserted rows echo back with an id derived from the external id
+  const echoUpsert = () => repository.bulkUpsert.mockImplementation(async (rows: any[]) => ({
+    rows: rows.map(row => ({ ...row, id: `db-${row.external_id}` })),
+    failures: []
+  }) as any);
+
+  beforeEach(() => {
+    service = new DiscoveryService();
+
+    (db.query as jest.Mock).mockResolvedValue({ rows: [{ id: 'run-1' }], rowCount: 1 });
+    (encryptedCredentialRepository.getDecryptedValue as jest.Mock).mockResolvedValue('token');
+
+    for (const connector of [slack, google]) {
+      connector.authenticate.mockResolvedValue({ success: true });
+      connector.validatePermissions.mockResolvedValue({
+        isValid: true, permissions: [], missingPermissions: [], errors: [], lastChecked: new Date()
+      });
+      connector.getAuditLogs.mockResolvedValue([]);
+    }
+    slack.getAuditLogsIncremental!.mockImplementation(async () => ({
+      entries: [],
+      checkpoint: { auditLogCursor: '2025-02-01T00:00:00.000Z', channelCursors: { C1: '1738368000.000100' } }
+    }));
+
+    repository.findContentHashes.mockResolvedValue(new Map());
+    repository.markSeen.mockImplementation(async (ids: string[]) => ids.length);
+    checkpoints.save.mockResolvedValue({} as any);
+    echoUpsert();
+  });
+
+  it('should run in full by default, hash every row and save a fresh checkpoint', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1'), automation('B2', 'Bot 2')]);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+
+    expect(checkpoints.findByConnectionId).not.toHaveBeenCalled();
+    const [startCheckpoint, mode] = slack.getAuditLogsIncremental!.mock.calls[0]!;
+    expect(mode).toBe('full');
+    expect(Date.now() - new Date(startCheckpoint.auditLogCursor).getTime()).toBeGreaterThanOrEqual(30 * 24 * HOUR - 1000);
+
+    const [rows, options] = repository.bulkUpsert.mock.calls[0]!;
+    expect(rows).toHaveLength(2);
+    expect(rows[0]!.content_hash).toMatch(/^[0-9a-f]{64}$/);
+    expect(options.updateColumns).toContain('content_hash');
+    expect(repository.markSeen).toHaveBeenCalledWith([]);
+
+    expect(checkpoints.save).toHaveBeenCalledWith(
+      'conn-slack',
+      'org-1',
+      { auditLogCursor: '2025-02-01T00:00:00.000Z', channelCursors: { C1: '1738368000.000100' } },
+      'full'
+    );
+    expect(result.metadata).toEqual(expect.objectContaining({
+      syncMode: 'full',
+      newAutomations: 2,
+      updatedAutomations: 0,
+      unchangedAutomations: 0,
+      changedAutomationIds: ['db-B1', 'db-B2']
+    }));
+  });
+
+  it('should resume from the checkpoint and skip unchanged automations in delta mode', async () => {
+    // A full run records the stored hashes
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1'), automation('B2', 'Bot 2')]);
+    await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+    const storedRows = repository.bulkUpsert.mock.calls[0]![0];
+    repository.findContentHashes.mockResolvedValue(new Map(storedRows.map(row => [
+      row.external_id,
+      { id: `db-${row.external_id}`, content_hash: row.content_hash as string }
+    ])));
+    repository.bulkUpsert.mockClear();
+
+    const savedCheckpoint = { auditLogCursor: '2025-02-01T00:00:00.000Z', channelCursors: { C1: '1738368000.000100' } };
+    checkpoints.findByConnectionId.mockResolvedValue({
+      checkpoint: savedCheckpoint,
+      last_full_sync_at: new Date(Date.now() - HOUR)
+    } as any);
+
+    // B1 is unchanged, B2 was renamed, B3 is new
+    slack.discoverAutomations.mockResolvedValue([
+      automation('B1', 'Bot 1'),
+      automation('B2', 'Bot 2 (renamed)'),
+      automation('B3', 'Bot 3')
+    ]);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(slack.getAuditLogsIncremental).toHaveBeenLastCalledWith(savedCheckpoint, 'delta');
+    expect(repository.bulkUpsert.mock.calls[0]![0].map(row => row.external_id)).toEqual(['B2', 'B3']);
+    expect(repository.markSeen).toHaveBeenLastCalledWith(['db-B1']);
+    expect(checkpoints.save).toHaveBeenLastCalledWith('conn-slack', 'org-1', expect.any(Object), 'delta');
+    expect(result.metadata).toEqual(expect.objectContaining({
+      syncMode: 'delta',
+      automationsFound: 3,
+      newAutomations: 1,
+      updatedAutomations: 1,
+      unchangedAutomations: 1,
+      changedAutomationIds: ['db-B2', 'db-B3']
+    }));
+  });
+
+  it('should not write anything when nothing changed', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1')]);
+    await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+    const [row] = repository.bulkUpsert.mock.calls[0]![0];
+    repository.findContentHashes.mockResolvedValue(new Map([['B1', { id: 'db-B1', content_hash: row!.content_hash as string }]]));
+    repository.bulkUpsert.mockClear();
+    checkpoints.findByConnectionId.mockResolvedValue({
+      checkpoint: { auditLogCursor: '2025-02-01T00:00:00.000Z' },
+      last_full_sync_at: new Date(Date.now() - HOUR)
+    } as any);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(repository.bulkUpsert).not.toHaveBeenCalled();
+    expect(repository.markSeen).toHaveBeenLastCalledWith(['db-B1']);
+    expect(result.metadata.unchangedAutomations).toBe(1);
+    expect(result.metadata.changedAutomationIds).toEqual([]);
+  });
+
+  it('should not advance the checkpoint when refreshing unchanged automations fails', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1')]);
+    await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+    const [row] = repository.bulkUpsert.mock.calls[0]![0];
+    repository.findContentHashes.mockResolvedValue(new Map([['B1', { id: 'db-B1', content_hash: row!.content_hash as string }]]));
+    repository.markSeen.mockRejectedValue(new Error('connection terminated'));
+    checkpoints.save.mockClear();
+    checkpoints.findByConnectionId.mockResolvedValue({
+      checkpoint: { auditLogCursor: '2025-02-01T00:00:00.000Z' },
+      last_full_sync_at: new Date(Date.now() - HOUR)
+    } as any);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(result.errors).toEqual(['Failed to store 1 of 1 automations; checkpoint not advanced']);
+    expect(checkpoints.save).not.toHaveBeenCalled();
+  });
+
+  it('should fall back to a full resync when the last one is older than the interval', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1')]);
+    repository.findContentHashes.mockResolvedValue(new Map([['B1', { id: 'db-B1', content_hash: 'stale' }]]));
+    checkpoints.findByConnectionId.mockResolvedValue({
+      checkpoint: { auditLogCursor: '2025-02-01T00:00:00.000Z' },
+      last_full_sync_at: new Date(Date.now() - 25 * HOUR)
+    } as any);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), {
+      organizationId: 'org-1',
+      mode: 'delta',
+      fullResyncIntervalHours: 24
+    });
+
+    expect(result.metadata.syncMode).toBe('full');
+    expect(slack.getAuditLogsIncremental!.mock.calls[0]![0].auditLogCursor).not.toBe('2025-02-01T00:00:00.000Z');
+    expect(slack.getAuditLogsIncremental!.mock.calls[0]![1]).toBe('full');
+    expect(checkpoints.save).toHaveBeenCalledWith('conn-slack', 'org-1', expect.any(Object), 'full');
+  });
+
+  it('should run in full when a connection has no checkpoint yet', async () => {
+    slack.discoverAutomations.mockResolvedValue([]);
+    checkpoints.findByConnectionId.mockResolvedValue(null);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(result.metadata.syncMode).toBe('full');
+  });
+
+  it('should use getAuditLogs from the cursor for connectors without checkpoint support', async () => {
+    google.discoverAutomations.mockResolvedValue([]);
+    checkpoints.findByConnectionId.mockResolvedValue({
+      checkpoint: { auditLogCursor: '2025-02-01T00:00:00.000Z' },
+      last_full_sync_at: new Date(Date.now() - HOUR)
+    } as any);
+
+    const before = Date.now();
+    await service.discoverPlatformAutomations(connection('google'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(google.getAuditLogs).toHaveBeenCalledWith(new Date('2025-02-01T00:00:00.000Z'));
+    const savedCheckpoint = checkpoints.save.mock.calls[0]![2];
+    expect(new Date(savedCheckpoint.auditLogCursor).getTime()).toBeGreaterThanOrEqual(before);
+  });
+
+  it('should not advance the checkpoint when discovery fails', async () => {
+    slack.discoverAutomations.mockRejectedValue(new Error('Slack API unavailable'));
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+
+    expect(result.errors).toEqual(['Slack API unavailable']);
+    expect(checkpoints.save).not.toHaveBeenCalled();
+  });
+
+  it('should not advance the checkpoint when storing automations fails', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1'), automation('B2', 'Bot 2')]);
+    repository.bulkUpsert.mockRejectedValue(new Error('connection terminated'));
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1' });
+
+    expect(result.errors).toEqual(['Failed to store 2 of 2 automations; checkpoint not advanced']);
+    expect(checkpoints.save).not.toHaveBeenCalled();
+  });
+
+  it('should not advance the checkpoint when some rows fail to store', async () => {
+    slack.discoverAutomations.mockResolvedValue([automation('B1', 'Bot 1'), automation('B2', 'Bot 2')]);
+    repository.bulkUpsert.mockImplementation(async (rows: any[]) => ({
+      rows: [{ ...rows[0], id: 'db-B1' }],
+      failures: [{ index: 1, error: new Error('value too long') }]
+    }) as any);
+
+    const result = await service.discoverPlatformAutomations(connection('slack'), { organizationId: 'org-1', mode: 'delta' });
+
+    expect(result.errors).toEqual(['Failed to store 1 of 2 automations; checkpoint not advanced']);
+    expect(checkpoints.save).not.toHaveBeenCalled();
+  });
+});
@@ -2,8 +2,60 @@
  * Export Service Unit Tests
  */
 
+import { promises as fs } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { Readable, Writable } from 'stream';
 import { ExportService } from '../export.service';
 import { Automation } from '@singura/shared-types';
+import { db } from '../../database/pool';
+
+// Mock the database pool
+jest.mock('../../database/pool', () => ({
+  db: {
+    cursor: jest.fn()
+  }
+}));
+
+const readAll = async (stream: Readable): Promise<Buffer> => {
+  const chunks: Buffer[] = [];
+  for await (const chunk of stream) {
+    chunks.push(Buffer.from(chunk));
+  }
+  return Buffer.concat(chunks);
+};
+
+const makeAutomation = (i: number): Automation => ({
+  id: `auto-${i}`,
+  name: `Automation ${i}`,
+  description: i % 2 === 0 ? 'Plain description' : 'Description, with "quotes"',
+  type: 'bot',
+  status: i % 3 === 0 ? 'inactive' : 'active',
+  platform: i % 2 === 0 ? 'slack' : 'google',
+  platformId: `platform-${i}`,
+  organizationId: 'org-1',
+  connectionId: 'conn-1',
+  risk: {
+    level: 'medium',
+    score: 50,
+    factors: []
+  },
+  permissions: {
+    scopes: [],
+    roles: []
+  },
+  metadata: {
+    discoveredAt: '2024-01-01T00:00:00Z'
+  }
+});
+
+// Yields automations lazily and records how many the consumer has pulled
+function* trackedSource(count: number, pulled: { count: number }): Generator<Automation> {
+  for (let i = 0; i < count; i++) {
+    pulled.count++;
+    yield makeAutomation(i);
+  }
+}
 
 describe('ExportService', () => {
   let exportService: ExportService;
@@ -244,4 +296,190 @@ describe('ExportService', () => {
       expect(pdfBuffer).toBeInstanceOf(Buffer);
     });
   });
-});
\ No newline at end of file
+
+  describe('createCSVStream', () => {
+    it('should produce the same bytes as exportToCSV', async () => {
+      const automations = Array.from({ length: 50 }, (_, i) => makeAutomation(i));
+
+      const buffered = await exportService.exportToCSV(automations);
+      const streamed = await readAll(exportService.createCSVStream(automations));
+
+      expect(streamed.toString('utf-8')).toBe(buffered.toString('utf-8'));
+    });
+
+    it('should write the header row for an empty source', async () => {
+      const streamed = await readAll(exportService.createCSVStream([]));
+
+      expect(streamed.toString('utf-8')).toBe(
+        'ID,Name,Platform,Type,Risk Level,Risk Score,Status,Detected At,Last Active,Affected Users,Description,AI Provider,Organization ID'
+      );
+    });
+
+    it('should accept async sources', async () => {
+      async function* source() {
+        yield makeAutomation(1);
+        yield makeAutomation(2);
+      }
+
+      const csvString = (await readAll(exportService.createCSVStream(source()))).toString('utf-8');
+
+      expect(csvString.split('\n')).toHaveLength(3);
+      expect(csvString).toContain('"Description, with ""quotes"""');
+    });
+
+    it('should only pull rows as the consumer reads', async () => {
+      const pulled = { count: 0 };
+      const stream = exportService.createCSVStream(trackedSource(100000, pulled));
+
+      // Read a single chunk and stop
+      const iterator = stream[Symbol.asyncIterator]();
+      const first = await iterator.next();
+      await iterator.return?.();
+
+      expect(first.done).toBe(false);
+      expect(pulled.count).toBeGreaterThan(0);
+      expect(pulled.count).toBeLessThan(100000);
+    });
+  });
+
+  describe('createPDFStream', () => {
+    it('should generate a complete PDF from a streamed source', async () => {
+      const pulled = { count: 0 };
+      const buffer = await readAll(exportService.createPDFStream(trackedSource(500, pulled)));
+
+      expect(pulled.count).toBe(500);
+      expect(buffer.toString('utf-8', 0, 4)).toBe('%PDF');
+      expect(buffer.toString('utf-8').trimEnd().endsWith('%%EOF')).toBe(true);
+    });
+
+    it('should generate a valid PDF for an empty source', async () => {
+      const buffer = await readAll(exportService.createPDFStream([]));
+
+      expect(buffer.toString('utf-8', 0, 4)).toBe('%PDF');
+    });
+
+    it('should stop pulling rows while the consumer is stalled', async () => {
+      const pulled = { count: 0 };
+      let writes = 0;
+
+      // A sink that never acknowledges a write, like a stalled client socket
+      const stalled = new Writable({
+        highWaterMark: 1024,
+        write: () => {
+          writes++;
+        }
+      });
+
+      exportService.createPDFStream(trackedSource(100000, pulled)).pipe(stalled);
+      await new Promise(resolve => setTimeout(resolve, 200));
+
+      expect(writes).toBe(1);
+      expect(pulled.count).toBeLessThan(100000);
+      stalled.destroy();
+    });
+  });
+
+  describe('streamAutomations', () => {
+    const mockCursor = db.cursor as jest.Mock;
+
+    const row = (id: string) => ({
+      id,
+      name: `Automation ${id}`,
+      description: null,
+      type: 'bot',
+      status: 'active',
+      platform: 'slack',
+      risk_level: 'high',
+      risk_score: 80,
+      first_discovered_at: new Date('2024-01-01T00:00:00Z'),
+      last_triggered_at: null,
+      owner_info: { email: 'owner@example.com' },
+      platform_metadata: { isAIPlatform: true }
+    });
+
+    it('should read the whole inventory through a database cursor', async () => {
+      mockCursor.mockImplementation(async function* () {
+        yield row('a');
+        yield row('b');
+      });
+
+      const automations: Automation[] = [];
+      for await (const automation of exportService.streamAutomations('org-1', undefined, 250)) {
+        automations.push(automation);
+      }
+
+      const [query, params, batchSize] = mockCursor.mock.calls[0]!;
+      expect(query).toContain('WHERE da.organization_id = $1');
+      expect(query).not.toContain('ANY($2::uuid[])');
+      expect(params).toEqual(['org-1']);
+      expect(batchSize).toBe(250);
+
+      expect(automations.map(a => a.id)).toEqual(['a', 'b']);
+      expect(automations[0]).toMatchObject({
+        organizationId: 'org-1',
+        description: '',
+        risk: { level: 'high', score: 80 },
+        affectedUsers: ['owner@example.com'],
+        metadata: {
+          discoveredAt: '2024-01-01T00:00:00.000Z',
+          lastActiveAt: '2024-01-01T00:00:00.000Z',
+          isAIPlatform: true
+        }
+      });
+    });
+
+    it('should restrict the cursor to selected automations', async () => {
+      mockCursor.mockImplementation(async function* () {
+        yield row('a');
+      });
+
+      const ids: string[] = [];
+      for await (const automation of exportService.streamAutomations('org-1', ['a'])) {
+        ids.push(automation.id);
+      }
+
+      const [query, params] = mockCursor.mock.calls[0]!;
+      expect(query).toContain('AND da.id = ANY($2::uuid[])');
+      expect(params).toEqual(['org-1', ['a']]);
+      expect(ids).toEqual(['a']);
+    });
+  });
+
+  describe('writeExportFile', () => {
+    it('should stream an export into a local file', async () => {
+      const result = await exportService.writeExportFile(
+        'csv',
+        Array.from({ length: 10 }, (_, i) => makeAutomation(i)),
+        'export-service-test.csv'
+      );
+
+      try {
+        expect(result.fileName).toBe('export-service-test.csv');
+        expect(result.rowCount).toBe(10);
+
+        const contents = await fs.readFile(result.filePath, 'utf-8');
+        expect(contents.split('\n')).toHaveLength(11);
+        expect(result.bytes).toBe(Buffer.byteLength(contents));
+      } finally {
+        await fs.rm(result.filePath, { force: true });
+      }
+    });
+
+    it('should remove a partial file when the source fails', async () => {
+      async function* failing() {
+        yield makeAutomation(1);
+        throw new Error('cursor closed');
+      }
+
+      // The file name is confined to the export directory
+      await expect(
+        exportService.writeExportFile('csv', failing(), '../export-service-failing.csv')
+      ).rejects.toThrow('cursor closed');
+
+      const exportDirectory = process.env.EXPORT_DIR || path.join(os.tmpdir(), 'singura-exports');
+      await expect(
+        fs.access(path.join(exportDirectory, 'export-service-failing.csv'))
+      ).rejects.toThrow();
+    });
+  });
+});
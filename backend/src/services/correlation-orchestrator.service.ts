@@ -39,8 +39,8 @@ export interface CorrelationEvents {
   correlationProgress: { progress: number; stage: string; chainsDetected: number };
   correlationCompleted: { result: CorrelationAnalysisResult; processingTime: number };
   correlationError: { error: string; organizationId: string };
-  chainDetected: { chain: AutomationWorkflowChain; riskLevel: string };
-  riskAssessmentUpdate: { assessment: MultiPlatformRiskAssessment };
+  chainDetected: { chain: AutomationWorkflowChain; riskLevel: string; organizationId?: string };
+  riskAssessmentUpdate: { assessment: MultiPlatformRiskAssessment; organizationId?: string };
 }
 
 /**
@@ -60,6 +60,7 @@ interface OrchestrationConfig {
   enableRealTimeProcessing: boolean;
   correlationIntervalMs: number; // How often to run correlation analysis
   maxEventsPerBatch: number;
+  realTimeBatchWindowMs: number; // How long real-time events are collected before an incremental correlation pass
   retentionDays: number;
   enableExecutiveReporting: boolean;
   performanceThresholds: {
@@ -69,6 +70,17 @@ interface OrchestrationConfig {
   };
 }
 
+/**
+ * Live event subscription for one organization
+ */
+interface RealTimeSubscription {
+  organizationId: string;
+  streams: AsyncGenerator<MultiPlatformEvent>[];
+  pendingEvents: MultiPlatformEvent[];
+  flushTimer?: ReturnType<typeof setTimeout>;
+  ingestion: Promise<void>; // Incremental passes run one at a time, in arrival order
+}
+
 /**
  * Cross-Platform Correlation Orchestrator
  *
@@ -85,6 +97,8 @@ export class CorrelationOrchestratorService extends EventEmitter {
   private config: OrchestrationConfig;
   private isProcessing: boolean = false;
   private lastAnalysisResult: CorrelationAnalysisResult | null = null;
+  private realTimeSubscriptions: Map<string, RealTimeSubscription> = new Map();
+  private scheduledAnalysisInterval?: ReturnType<typeof setInterval>;
 
   constructor(
     correlationEngine: CrossPlatformCorrelationService,
@@ -99,6 +113,7 @@ export class CorrelationOrchestratorService extends EventEmitter {
       enableRealTimeProcessing: true,
       correlationIntervalMs: 300000, // 5 minutes
       maxEventsPerBatch: 10000,
+      realTimeBatchWindowMs: 1000, // 1 second
       retentionDays: 90,
       enableExecutiveReporting: true,
       performanceThresholds: {
@@ -220,6 +235,40 @@ export class CorrelationOrchestratorService extends EventEmitter {
     }
   }
 
+  /**
+   * Incrementally correlate newly arrived events for an organization
+   * Only the time windows touched by these events are re-scored; the
+   * organization's earlier events stay buffered in the correlation engine.
+   */
+  async ingestRealTimeEvents(
+    organizationId: string,
+    events: MultiPlatformEvent[]
+  ): Promise<AutomationWorkflowChain[]> {
+    const startTime = Date.now();
+    const result = await this.correlationEngine.ingestEvents(organizationId, events);
+
+    for (const chain of result.chains) {
+      this.emit('chainDetected', {
+        organizationId,
+        chain,
+        riskLevel: chain.riskLevel
+      });
+    }
+
+    if (result.chains.length > 0) {
+      const activeChains = this.correlationEngine.getActiveChains(organizationId);
+      const riskAssessment = await this.correlationEngine.calculateCrossPlatformRisk(activeChains);
+      this.emit('riskAssessmentUpdate', { organizationId, assessment: riskAssessment });
+    }
+
+    const processingTime = Date.now() - startTime;
+    if (processingTime > this.config.performanceThresholds.maxLatencyMs) {
+      console.warn(`Incremental correlation exceeded latency threshold: ${processingTime}ms > ${this.config.performanceThresholds.maxLatencyMs}ms`);
+    }
+
+    return result.chains;
+  }
+
   /**
    * Generate executive-ready correlation report
    * Provides C-level insights for business decision-making
@@ -265,24 +314,53 @@ export class CorrelationOrchestratorService extends EventEmitter {
 
   /**
    * Start real-time correlation monitoring
-   * Enables continuous correlation processing for enterprise customers
+   * Enables continuous correlation processing for enterprise customers:
+   * live events from every registered connector are collected for
+   * realTimeBatchWindowMs and fed to ingestRealTimeEvents.
    */
-  startRealTimeMonitoring(): void {
+  startRealTimeMonitoring(organizationId: string): void {
     if (!this.config.enableRealTimeProcessing) {
       console.warn('Real-time processing is disabled in configuration');
       return;
     }
 
-    console.log('Starting real-time correlation monitoring...');
-    this.setupRealTimeEventSubscription();
+    if (this.realTimeSubscriptions.has(organizationId)) {
+      return;
+    }
+
+    console.log(`Starting real-time correlation monitoring for organization ${organizationId}...`);
+    this.setupRealTimeEventSubscription(organizationId);
   }
 
   /**
-   * Stop real-time correlation monitoring
+   * Stop real-time correlation monitoring for one organization, or for all
+   * Events already received are still correlated.
    */
-  stopRealTimeMonitoring(): void {
+  stopRealTimeMonitoring(organizationId?: string): void {
     console.log('Stopping real-time correlation monitoring...');
-    // Implementation for stopping real-time subscriptions
+
+    const organizationIds = organizationId ? [organizationId] : Array.from(this.realTimeSubscriptions.keys());
+    for (const id of organizationIds) {
+      const subscription = this.realTimeSubscriptions.get(id);
+      if (!subscription) continue;
+
+      this.realTimeSubscriptions.delete(id);
+      this.flushRealTimeEvents(subscription);
+      for (const stream of subscription.streams) {
+        void stream.return(undefined);
+      }
+    }
+  }
+
+  /**
+   * Stop real-time monitoring and scheduled analysis
+   */
+  shutdown(): void {
+    this.stopRealTimeMonitoring();
+    if (this.scheduledAnalysisInterval) {
+      clearInterval(this.scheduledAnalysisInterval);
+      this.scheduledAnalysisInterval = undefined;
+    }
   }
 
   // Private helper methods
@@ -466,7 +544,7 @@ export class CorrelationOrchestratorService extends EventEmitter {
     if (!this.config.enableRealTimeProcessing) return;
 
     // Set up periodic correlation analysis
-    setInterval(async () => {
+    this.scheduledAnalysisInterval = setInterval(async () => {
       if (!this.isProcessing && this.platformConnectors.size > 0) {
         try {
           console.log('Running scheduled correlation analysis...');
@@ -478,10 +556,71 @@ export class CorrelationOrchestratorService extends EventEmitter {
     }, this.config.correlationIntervalMs);
   }
 
-  private setupRealTimeEventSubscription(): void {
-    // Implementation for real-time event subscription from platforms
-    // This would integrate with platform webhooks and real-time APIs
+  private setupRealTimeEventSubscription(organizationId: string): void {
     console.log('Setting up real-time event subscriptions for correlation monitoring');
+
+    const subscription: RealTimeSubscription = {
+      organizationId,
+      streams: [],
+      pendingEvents: [],
+      ingestion: Promise.resolve()
+    };
+    this.realTimeSubscriptions.set(organizationId, subscription);
+
+    for (const connector of this.platformConnectors.values()) {
+      const stream = connector.subscribeToRealTimeEvents();
+      subscription.streams.push(stream);
+      void this.consumeRealTimeEvents(subscription, connector.platform, stream);
+    }
+  }
+
+  private async consumeRealTimeEvents(
+    subscription: RealTimeSubscription,
+    platform: PlatformConnector['platform'],
+    stream: AsyncGenerator<MultiPlatformEvent>
+  ): Promise<void> {
+    try {
+      for await (const event of stream) {
+        if (this.realTimeSubscriptions.get(subscription.organizationId) !== subscription) break;
+
+        subscription.pendingEvents.push(event);
+        if (subscription.pendingEvents.length >= this.config.maxEventsPerBatch) {
+          this.flushRealTimeEvents(subscription);
+        } else if (!subscription.flushTimer) {
+          subscription.flushTimer = setTimeout(() => this.flushRealTimeEvents(subscription), this.config.realTimeBatchWindowMs);
+        }
+      }
+    } catch (error) {
+      console.error(`Real-time ${platform} event subscription failed:`, error);
+      this.emit('correlationError', {
+        error: error instanceof Error ? error.message : `Real-time ${platform} event subscription failed`,
+        organizationId: subscription.organizationId
+      });
+    }
+  }
+
+  private flushRealTimeEvents(subscription: RealTimeSubscription): void {
+    if (subscription.flushTimer) {
+      clearTimeout(subscription.flushTimer);
+      subscription.flushTimer = undefined;
+    }
+    if (subscription.pendingEvents.length === 0) return;
+
+    const events = subscription.pendingEvents;
+    subscription.pendingEvents = [];
+
+    subscription.ingestion = subscription.ingestion
+      .then(() => this.ingestRealTimeEvents(subscription.organizationId, events))
+      .then(
+        () => undefined,
+        (error) => {
+          console.error('Incremental correlation failed:', error);
+          this.emit('correlationError', {
+            error: error instanceof Error ? error.message : 'Incremental correlation failed',
+            organizationId: subscription.organizationId
+          });
+        }
+      );
   }
 
   /**
@@ -418,6 +418,132 @@ describe('CrossPlatformCorrelationService', () => {
     });
   });
 
+  describe('Incremental Streaming Correlation', () => {
+    const WINDOW_MS = 300000;
+    const windowStart = (index: number) => new Date(Date.UTC(2025, 0, 15, 10, 0, 0) + index * WINDOW_MS);
+
+    /**
+     * Two platforms, same user, strong automation indicators: scores above the 0.8 threshold
+     */
+    function createStreamEvents(windowIndex: number, offsetsMs: number[]): MultiPlatformEvent[] {
+      return offsetsMs.map((offsetMs, i) => ({
+        ...createMockEvent(i % 2 === 0 ? 'slack' : 'google', windowStart(windowIndex).toISOString(), 'user1', i === 0),
+        eventId: `stream-${windowIndex}-${offsetMs}-${i}`,
+        timestamp: new Date(windowStart(windowIndex).getTime() + offsetMs),
+        correlationMetadata: {
+          potentialTrigger: i === 0,
+          potentialAction: i !== 0,
+          externalDataAccess: true,
+          automationIndicators: ['api_call', 'webhook_trigger']
+        }
+      }));
+    }
+
+    it('should detect the same windows as the batch path when fed in chunks', async () => {
+      const events = [
+        ...createStreamEvents(0, [1000, 2000, 3000]),
+        ...createStreamEvents(1, [1000, 5000]),
+        ...createStreamEvents(3, [0, 1000, 2000, 4000])
+      ];
+
+      const batchChains = await correlationService.detectAutomationChains([...events]);
+
+      // Latest version of each chain; finalized windows leave the active set but were already reported
+      const streamingService = new CrossPlatformCorrelationService({ timeWindowMs: WINDOW_MS, confidenceThreshold: 0.8 });
+      const streamedChains = new Map<string, AutomationWorkflowChain>();
+      for (let i = 0; i < events.length; i += 3) {
+        const result = await streamingService.ingestEvents('org-1', events.slice(i, i + 3));
+        result.chains.forEach(chain => streamedChains.set(chain.chainId, chain));
+      }
+      const streamedTriggers = Array.from(streamedChains.values()).map(chain => chain.triggerEvent.eventId);
+
+      expect(batchChains.length).toBeGreaterThan(0);
+      expect(streamedTriggers.sort()).toEqual(batchChains.map(chain => chain.triggerEvent.eventId).sort());
+    });
+
+    it('should re-score only touched windows and keep a stable chain id', async () => {
+      const first = await correlationService.ingestEvents('org-1', createStreamEvents(0, [1000, 2000]));
+      expect(first.windowsRescored).toBe(1);
+      expect(first.chains).toHaveLength(1);
+
+      // Second half of the same window arrives in a later batch
+      const second = await correlationService.ingestEvents('org-1', createStreamEvents(0, [3000, 4000]));
+      expect(second.windowsRescored).toBe(1);
+      expect(second.chains).toHaveLength(1);
+      expect(second.chains[0]!.chainId).toBe(first.chains[0]!.chainId);
+      expect(second.chains[0]!.actionEvents).toHaveLength(3);
+    });
+
+    it('should report a chain crossing a window boundary once, with its real trigger', async () => {
+      // Trigger two seconds before the end of window 0, actions just after window 1 starts
+      const [trigger] = createStreamEvents(0, [WINDOW_MS - 2000]);
+      const actions = createStreamEvents(1, [1000, 3000, 5000]).slice(1);
+
+      const first = await correlationService.ingestEvents('org-1', [trigger!]);
+      expect(first.chains).toHaveLength(0);
+
+      const second = await correlationService.ingestEvents('org-1', actions);
+      expect(second.windowsRescored).toBe(1);
+      expect(second.chains).toHaveLength(1);
+      expect(second.chains[0]!.triggerEvent.eventId).toBe(trigger!.eventId);
+      expect(second.chains[0]!.actionEvents.map(event => event.eventId)).toEqual(actions.map(event => event.eventId));
+
+      // A later action extends the same chain rather than starting one in window 1
+      const [lateAction] = createStreamEvents(1, [8000]);
+      const third = await correlationService.ingestEvents('org-1', [{ ...lateAction!, platform: 'google' }]);
+      expect(third.chains).toHaveLength(1);
+      expect(third.chains[0]!.chainId).toBe(second.chains[0]!.chainId);
+      expect(third.chains[0]!.actionEvents).toHaveLength(3);
+      expect(correlationService.getActiveChains('org-1')).toHaveLength(1);
+
+      // The fixed-window batch path splits the same events
+      const batchChains = await correlationService.detectAutomationChains([trigger!, ...actions, lateAction!]);
+      expect(batchChains.every(chain => chain.triggerEvent.eventId !== trigger!.eventId)).toBe(true);
+    });
+
+    it('should accept late events until the watermark passes their window', async () => {
+      await correlationService.ingestEvents('org-1', createStreamEvents(1, [1000, 2000]));
+
+      // Window 0 is still within allowed lateness (one window)
+      const late = await correlationService.ingestEvents('org-1', createStreamEvents(0, [1000, 2000]));
+      expect(late.eventsAccepted).toBe(2);
+
+      // Advancing three windows finalizes windows 0 and 1
+      await correlationService.ingestEvents('org-1', createStreamEvents(4, [1000, 2000]));
+      const tooLate = await correlationService.ingestEvents('org-1', createStreamEvents(0, [9000, 9500]));
+
+      expect(tooLate.eventsAccepted).toBe(0);
+      expect(tooLate.lateEventsDropped).toBe(2);
+      expect(correlationService.getStreamStatistics('org-1').openWindows).toBe(1);
+    });
+
+    it('should ignore events already buffered', async () => {
+      const events = createStreamEvents(0, [1000, 2000]);
+      await correlationService.ingestEvents('org-1', events);
+      const replay = await correlationService.ingestEvents('org-1', events);
+
+      expect(replay.eventsAccepted).toBe(0);
+      expect(replay.windowsRescored).toBe(0);
+    });
+
+    it('should keep streams isolated', async () => {
+      await correlationService.ingestEvents('org-1', createStreamEvents(0, [1000, 2000]));
+
+      expect(correlationService.getActiveChains('org-1')).toHaveLength(1);
+      expect(correlationService.getActiveChains('org-2')).toHaveLength(0);
+    });
+
+    it('should finalize whole windows when the buffer cap is exceeded', async () => {
+      const cappedService = new CrossPlatformCorrelationService({ timeWindowMs: WINDOW_MS, maxBufferedEvents: 4 });
+      await cappedService.ingestEvents('org-1', createStreamEvents(0, [1000, 2000, 3000]));
+      await cappedService.ingestEvents('org-1', createStreamEvents(1, [1000, 2000, 3000]));
+
+      const stats = cappedService.getStreamStatistics('org-1');
+      expect(stats.bufferedEvents).toBe(3);
+      expect(stats.openWindows).toBe(1);
+    });
+  });
+
   // Helper functions for test data creation
 
   function createMockEvent(
@@ -16,10 +16,39 @@ import {
   detectAIProvider,
   extractModelName
 } from '@singura/shared-types';
+import { DetectionEventIndex } from './detection-event-index';
 
 // Type alias for AIProviderDetection (matches automation.ts internal type)
 type AIProviderDetection = AIProviderDetectionResult;
 
+/**
+ * Detection-relevant data extracted from a single event
+ */
+interface ExtractedEventData {
+  apiEndpoint?: string;
+  userAgent?: string;
+  scopes?: string[];
+  ipAddress?: string;
+  webhookUrl?: string;
+  content?: string;
+}
+
+// Common API endpoint patterns (match URLs with proper protocol)
+const API_ENDPOINT_PATTERNS = [
+  /https?:\/\/[a-z0-9.-]+\.(?:openai|anthropic|cohere|huggingface|replicate|mistral|together|googleapis)\.(?:com|ai|co|xyz)(?:\/[a-z0-9/._-]*)?/gi,
+  /(?:https?:\/\/)?api\.[a-z0-9.-]+\.(?:com|ai|co|xyz)(?:\/[a-z0-9/._-]*)?/gi
+];
+
+const WEBHOOK_URL_PATTERNS = [
+  /webhook[s]?:?\s*["']?(https?:\/\/[^"'\s]+)["']?/gi,
+  /callback[s]?:?\s*["']?(https?:\/\/[^"'\s]+)["']?/gi,
+  /https?:\/\/[a-z0-9.-]+\.(?:openai|anthropic|cohere|huggingface|replicate|mistral|together|googleapis)\.(?:com|ai|co|xyz)\/(?:webhook|callback)[^\s"]*/gi
+];
+
+// Text that every endpoint / webhook pattern above requires; most events carry neither
+const ENDPOINT_HINT = /https?:\/\/|api\./i;
+const WEBHOOK_HINT = /webhook|callback/i;
+
 /**
  * Enhanced AI Provider Detector Service
  *
@@ -34,6 +63,8 @@ type AIProviderDetection = AIProviderDetectionResult;
  */
 export class AIProviderDetectorService {
   private eventEmitter: EventEmitter;
+  // Per-event extraction results, shared by detection and signature generation
+  private eventDataCache = new WeakMap<GoogleWorkspaceEvent, { data: ExtractedEventData; searchText: string }>();
 
   constructor() {
     this.eventEmitter = new EventEmitter();
@@ -43,11 +74,13 @@ export class AIProviderDetectorService {
    * Returns automation signatures (legacy format) for backward compatibility
    *
    * @param events - Array of Google Workspace audit log events
+   * @param index - Optional shared event index; events are then scanned in chronological order
    * @returns Array of automation signatures
    */
-  detectAIProviders(events: GoogleWorkspaceEvent[]): AutomationSignature[] {
-    const detections = this.detectAIProvidersInternal(events);
-    const signatures = this.generateAutomationSignatures(detections, events);
+  detectAIProviders(events: GoogleWorkspaceEvent[], index?: DetectionEventIndex): AutomationSignature[] {
+    const orderedEvents = index ? index.sortedEvents : events;
+    const detections = this.detectAIProvidersInternal(orderedEvents);
+    const signatures = this.generateAutomationSignatures(detections, orderedEvents);
 
     // Emit detection events for metrics tracking
     for (const signature of signatures) {
@@ -127,14 +160,25 @@ export class AIProviderDetectorService {
    * @param event - Google Workspace event
    * @returns Event data structured for AI provider detection
    */
-  private extractEventData(event: GoogleWorkspaceEvent): {
-    apiEndpoint?: string;
-    userAgent?: string;
-    scopes?: string[];
-    ipAddress?: string;
-    webhookUrl?: string;
-    content?: string;
-  } {
+  private extractEventData(event: GoogleWorkspaceEvent): ExtractedEventData {
+    return this.getCachedEventData(event).data;
+  }
+
+  /**
+   * Extract event data once per event object and keep the lowercase
+   * serialized form used by isEventRelatedToDetection
+   */
+  private getCachedEventData(event: GoogleWorkspaceEvent): { data: ExtractedEventData; searchText: string } {
+    let cached = this.eventDataCache.get(event);
+    if (!cached) {
+      const data = this.extractEventDataUncached(event);
+      cached = { data, searchText: JSON.stringify(data).toLowerCase() };
+      this.eventDataCache.set(event, cached);
+    }
+    return cached;
+  }
+
+  private extractEventDataUncached(event: GoogleWorkspaceEvent): ExtractedEventData {
     const actionDetails = event.actionDetails;
     const actionDetailsStr = JSON.stringify(actionDetails);
 
@@ -163,25 +207,21 @@ export class AIProviderDetectorService {
    * Extract API endpoint from event details
    */
   private extractApiEndpoint(actionDetails: string, resourceId: string): string | undefined {
-    // Common API endpoint patterns (match URLs with proper protocol)
-    const endpointPatterns = [
-      /https?:\/\/[a-z0-9.-]+\.(?:openai|anthropic|cohere|huggingface|replicate|mistral|together|googleapis)\.(?:com|ai|co|xyz)(?:\/[a-z0-9/._-]*)?/gi,
-      /(?:https?:\/\/)?api\.[a-z0-9.-]+\.(?:com|ai|co|xyz)(?:\/[a-z0-9/._-]*)?/gi
-    ];
+    if (ENDPOINT_HINT.test(actionDetails)) {
+      for (const pattern of API_ENDPOINT_PATTERNS) {
+        const matches = actionDetails.match(pattern);
+        if (matches && matches.length > 0) {
+          // Return the first match, removing any escape backslashes
+          let endpoint = matches[0];
 
-    for (const pattern of endpointPatterns) {
-      const matches = actionDetails.match(pattern);
-      if (matches && matches.length > 0) {
-        // Return the first match, removing any escape backslashes
-        let endpoint = matches[0];
+          // Remove escape backslashes (\" becomes ")
+          endpoint = endpoint.replace(/\\/g, '');
 
-        // Remove escape backslashes (\" becomes ")
-        endpoint = endpoint.replace(/\\/g, '');
+          // Remove trailing quotes or commas
+          endpoint = endpoint.replace(/[",]+$/, '');
 
-        // Remove trailing quotes or commas
-        endpoint = endpoint.replace(/[",]+$/, '');
-
-        return endpoint;
+          return endpoint;
+        }
       }
     }
 
@@ -230,13 +270,11 @@ export class AIProviderDetectorService {
    * Extract webhook URL from action details
    */
   private extractWebhookUrl(actionDetails: string): string | undefined {
-    const webhookPatterns = [
-      /webhook[s]?:?\s*["']?(https?:\/\/[^"'\s]+)["']?/gi,
-      /callback[s]?:?\s*["']?(https?:\/\/[^"'\s]+)["']?/gi,
-      /https?:\/\/[a-z0-9.-]+\.(?:openai|anthropic|cohere|huggingface|replicate|mistral|together|googleapis)\.(?:com|ai|co|xyz)\/(?:webhook|callback)[^\s"]*/gi
-    ];
+    if (!WEBHOOK_HINT.test(actionDetails)) {
+      return undefined;
+    }
 
-    for (const pattern of webhookPatterns) {
+    for (const pattern of WEBHOOK_URL_PATTERNS) {
       const matches = actionDetails.match(pattern);
       if (matches && matches.length > 0) {
         // Extract just the URL from the match
@@ -303,8 +341,7 @@ export class AIProviderDetectorService {
     event: GoogleWorkspaceEvent,
     detection: AIProviderDetection
   ): boolean {
-    const eventData = this.extractEventData(event);
-    const eventDataStr = JSON.stringify(eventData).toLowerCase();
+    const eventDataStr = this.getCachedEventData(event).searchText;
 
     // Check if any evidence from detection appears in event
     const allEvidence = [
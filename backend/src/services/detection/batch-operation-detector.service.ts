@@ -5,6 +5,7 @@ import {
   GoogleActivityPattern,
   BatchOperationGroup
 } from '@singura/shared-types';
+import { DetectionEventIndex, buildDetectionEventIndex } from './detection-event-index';
 
 export class BatchOperationDetectorService implements BatchOperationDetector {
   private eventEmitter: EventEmitter;
@@ -13,8 +14,11 @@ export class BatchOperationDetectorService implements BatchOperationDetector {
     this.eventEmitter = new EventEmitter();
   }
 
-  detectBatchOperations(events: GoogleWorkspaceEvent[]): GoogleActivityPattern[] {
-    const batchGroups = this.identifySimilarActions(events);
+  detectBatchOperations(
+    events: GoogleWorkspaceEvent[],
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
+  ): GoogleActivityPattern[] {
+    const batchGroups = this.identifySimilarActions(events, index);
 
     const patterns = batchGroups
       .filter(group => this.calculateBatchLikelihood(group) > 0.7) // High confidence batch
@@ -34,9 +38,13 @@ export class BatchOperationDetectorService implements BatchOperationDetector {
     return patterns;
   }
 
-  identifySimilarActions(events: GoogleWorkspaceEvent[]): BatchOperationGroup[] {
+  identifySimilarActions(
+    events: GoogleWorkspaceEvent[],
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
+  ): BatchOperationGroup[] {
     const thresholds = this.getBatchThresholds();
-    const sortedEvents = events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+    const sortedEvents = index.sortedEvents;
+    const sortedTimestamps = index.sortedTimestamps;
     const batchGroups: BatchOperationGroup[] = [];
 
     // Sliding window batch detection
@@ -52,7 +60,7 @@ export class BatchOperationDetectorService implements BatchOperationDetector {
         if (!candidateEvent) continue;
         
         // Check time window constraint
-        if (candidateEvent.timestamp.getTime() - currentEvent.timestamp.getTime() > thresholds.maxTimeWindowMs) {
+        if (sortedTimestamps[j]! - sortedTimestamps[i]! > thresholds.maxTimeWindowMs) {
           break;
         }
 
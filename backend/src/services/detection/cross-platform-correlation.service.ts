@@ -37,6 +37,7 @@ import {
   isValidMultiPlatformRiskAssessment,
   isValidCorrelationAnalysisResult
 } from '@singura/shared-types';
+import { TimeOrderedRingBuffer } from '../../utils/time-ordered-ring-buffer';
 
 /**
  * Advanced correlation configuration for enterprise requirements
@@ -47,6 +48,34 @@ interface CorrelationConfig {
   maxEventsPerCorrelation: number; // Default: 10000
   enableRealTimeProcessing: boolean; // Default: true
   platformPriority: ('slack' | 'google' | 'microsoft' | 'jira')[]; // Correlation priority order
+  allowedLatenessMs: number; // Default: timeWindowMs - how long a window stays open for late events
+  maxBufferedEvents: number; // Default: 500000 - per-stream cap before oldest windows are force-finalized
+}
+
+/**
+ * Per-stream state for incremental (streaming) correlation
+ * A stream is usually one organization's live event feed.
+ */
+interface CorrelationStreamState {
+  buffer: TimeOrderedRingBuffer<MultiPlatformEvent>;
+  bufferedEventIds: Set<string>;
+  spanChains: Map<number, AutomationWorkflowChain>; // spanKey -> chain scored over that half-window-aligned span
+  activeChains: Map<string, AutomationWorkflowChain>; // chainId -> merged chain for the open windows
+  watermarkMs: number; // newest event time seen minus allowed lateness
+  finalizedBeforeMs: number; // windows ending at or before this boundary are evicted and final
+  lateEventsDropped: number;
+}
+
+/**
+ * Result of an incremental correlation pass
+ */
+export interface IncrementalCorrelationResult {
+  chains: AutomationWorkflowChain[]; // Chains (re)scored by this pass
+  windowsRescored: number;
+  eventsAccepted: number;
+  lateEventsDropped: number;
+  bufferedEvents: number;
+  watermark: Date | null;
 }
 
 /**
@@ -74,6 +103,7 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
   private eventEmitter: EventEmitter;
   private config: CorrelationConfig;
   private performanceMetrics: CorrelationPerformanceMetrics;
+  private streams: Map<string, CorrelationStreamState> = new Map();
 
   constructor(config?: Partial<CorrelationConfig>) {
     this.eventEmitter = new EventEmitter();
@@ -83,6 +113,8 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
       maxEventsPerCorrelation: 10000,
       enableRealTimeProcessing: true,
       platformPriority: ['slack', 'google', 'microsoft', 'jira'],
+      allowedLatenessMs: config?.timeWindowMs ?? 300000, // Keep one extra window open for late events
+      maxBufferedEvents: 500000,
       ...config
     };
 
@@ -134,15 +166,7 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
       const validatedChains = enrichedChains.filter(isValidAutomationWorkflowChain);
 
       // Emit detection events for metrics tracking
-      for (const chain of validatedChains) {
-        this.eventEmitter.emit('detection', {
-          automationId: chain.chainId,
-          predicted: chain.overallRiskScore > 75 ? 'malicious' : 'legitimate',
-          confidence: chain.confidence,
-          detectorName: 'CrossPlatformCorrelation',
-          timestamp: new Date()
-        });
-      }
+      this.emitDetectionEvents(validatedChains);
 
       return validatedChains;
     } catch (error) {
@@ -151,6 +175,140 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
     }
   }
 
+  /**
+   * Incremental automation chain detection for live event streams
+   * New events are merged into a time-ordered ring buffer and only the
+   * spans they touch are re-scored, so cost follows new events rather than
+   * total history.
+   *
+   * Spans are timeWindowMs long and start every half window, so the fixed
+   * windows of detectAutomationChains are scored together with spans that
+   * straddle their boundaries. Qualifying spans that share events are merged
+   * into one chain, so a trigger at the end of one window and its actions at
+   * the start of the next form a single chain. A chain keeps its chainId while
+   * its trigger stays in the merged span, including when the rest of it
+   * arrives in later batches.
+   *
+   * A window stays open until the watermark (newest event time minus
+   * allowedLatenessMs) passes its end; windows are only ever evicted whole, and
+   * spans starting before the finalized boundary are no longer re-scored.
+   */
+  async ingestEvents(streamId: string, events: MultiPlatformEvent[]): Promise<IncrementalCorrelationResult> {
+    const startTime = Date.now();
+    this.performanceMetrics.processingStartTime = new Date();
+
+    try {
+      const state = this.getStreamState(streamId);
+      const windowMs = this.config.timeWindowMs;
+      const spanStepMs = windowMs / 2;
+
+      // Phase 1: Admission - drop duplicates and events for already finalized windows
+      const accepted: MultiPlatformEvent[] = [];
+      const touchedWindows = new Set<number>();
+      const touchedSpans = new Set<number>();
+      let lateEventsDropped = 0;
+
+      for (const event of events) {
+        const timestamp = event.timestamp.getTime();
+        if (timestamp < state.finalizedBeforeMs) {
+          lateEventsDropped++;
+          continue;
+        }
+        if (state.bufferedEventIds.has(event.eventId)) continue;
+
+        state.bufferedEventIds.add(event.eventId);
+        accepted.push(event);
+        touchedWindows.add(Math.floor(timestamp / windowMs));
+
+        // Every event lies in exactly two spans: the one starting in its half window and the one before
+        const spanKey = Math.floor(timestamp / spanStepMs);
+        touchedSpans.add(spanKey);
+        if ((spanKey - 1) * spanStepMs >= state.finalizedBeforeMs) {
+          touchedSpans.add(spanKey - 1);
+        }
+      }
+      state.lateEventsDropped += lateEventsDropped;
+
+      // Phase 2: Merge into the already-sorted buffer
+      state.buffer.insertMany(accepted, event => event.timestamp.getTime());
+
+      // Phase 3: Re-score only the spans touched by new events
+      for (const spanKey of touchedSpans) {
+        const spanStart = spanKey * spanStepMs;
+        const chain = await this.correlateWindow(state.buffer.range(spanStart, spanStart + windowMs));
+        if (chain) {
+          state.spanChains.set(spanKey, chain);
+        } else {
+          state.spanChains.delete(spanKey);
+        }
+      }
+
+      // Phase 4: Merge overlapping span chains into one chain per run of spans
+      const rescoredChains = await this.mergeSpanChains(state, touchedSpans);
+
+      // Phase 5: Advance watermark and evict finalized windows
+      this.advanceWatermark(state);
+
+      this.performanceMetrics.correlationLatency = Date.now() - startTime;
+      this.performanceMetrics.eventsProcessed = accepted.length;
+      this.performanceMetrics.chainsDetected = rescoredChains.length;
+      this.performanceMetrics.processingEndTime = new Date();
+      this.performanceMetrics.accuracyScore = this.calculateAccuracyScore(rescoredChains);
+
+      this.emitDetectionEvents(rescoredChains);
+
+      return {
+        chains: rescoredChains,
+        windowsRescored: touchedWindows.size,
+        eventsAccepted: accepted.length,
+        lateEventsDropped,
+        bufferedEvents: state.buffer.size,
+        watermark: Number.isFinite(state.watermarkMs) ? new Date(state.watermarkMs) : null
+      };
+    } catch (error) {
+      console.error('Incremental cross-platform correlation failed:', error);
+      throw new Error(`Correlation engine error: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    }
+  }
+
+  /**
+   * Chains for the open windows of a stream, oldest trigger first
+   */
+  getActiveChains(streamId: string): AutomationWorkflowChain[] {
+    const state = this.streams.get(streamId);
+    if (!state) return [];
+
+    return Array.from(state.activeChains.values())
+      .sort((a, b) => a.triggerEvent.timestamp.getTime() - b.triggerEvent.timestamp.getTime());
+  }
+
+  /**
+   * Buffer statistics for a stream, for monitoring
+   */
+  getStreamStatistics(streamId: string): {
+    bufferedEvents: number;
+    openWindows: number;
+    activeChains: number;
+    lateEventsDropped: number;
+    watermark: Date | null;
+  } {
+    const state = this.streams.get(streamId);
+    return {
+      bufferedEvents: state?.buffer.size ?? 0,
+      openWindows: state ? this.countBufferedWindows(state) : 0,
+      activeChains: state?.activeChains.size ?? 0,
+      lateEventsDropped: state?.lateEventsDropped ?? 0,
+      watermark: state && Number.isFinite(state.watermarkMs) ? new Date(state.watermarkMs) : null
+    };
+  }
+
+  /**
+   * Discard all buffered state for a stream
+   */
+  resetStream(streamId: string): void {
+    this.streams.delete(streamId);
+  }
+
   /**
    * Temporal correlation analysis for time-based automation detection
    * Analyzes event timing patterns to identify automated sequences
@@ -302,11 +460,188 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
   }
 
   updateConfiguration(config: Partial<CorrelationConfig>): void {
+    // Window boundaries change with timeWindowMs, so buffered stream state is no longer valid
+    if (config.timeWindowMs !== undefined && config.timeWindowMs !== this.config.timeWindowMs) {
+      this.streams.clear();
+    }
     this.config = { ...this.config, ...config };
   }
 
   // Private helper methods for core correlation logic
 
+  private getStreamState(streamId: string): CorrelationStreamState {
+    let state = this.streams.get(streamId);
+    if (!state) {
+      state = {
+        buffer: new TimeOrderedRingBuffer<MultiPlatformEvent>(),
+        bufferedEventIds: new Set(),
+        spanChains: new Map(),
+        activeChains: new Map(),
+        watermarkMs: Number.NEGATIVE_INFINITY,
+        finalizedBeforeMs: Number.NEGATIVE_INFINITY,
+        lateEventsDropped: 0
+      };
+      this.streams.set(streamId, state);
+    }
+    return state;
+  }
+
+  private advanceWatermark(state: CorrelationStreamState): void {
+    const windowMs = this.config.timeWindowMs;
+    const newest = state.buffer.newestTimestamp;
+    if (newest === undefined) return;
+
+    state.watermarkMs = Math.max(state.watermarkMs, newest - this.config.allowedLatenessMs);
+
+    // Windows that end at or before the watermark can no longer change
+    let finalizeBefore = Math.floor(state.watermarkMs / windowMs) * windowMs;
+
+    // Enforce the memory cap by finalizing whole windows, oldest first
+    let firstRetained = state.buffer.lowerBound(finalizeBefore);
+    while (state.buffer.size - firstRetained > this.config.maxBufferedEvents) {
+      const oldestRetained = state.buffer.timestampAt(firstRetained);
+      finalizeBefore = (Math.floor(oldestRetained / windowMs) + 1) * windowMs;
+      firstRetained = state.buffer.lowerBound(finalizeBefore);
+    }
+
+    if (finalizeBefore <= state.finalizedBeforeMs) return;
+
+    for (const evicted of state.buffer.evictBefore(finalizeBefore)) {
+      state.bufferedEventIds.delete(evicted.eventId);
+    }
+
+    // Spans reaching back into finalized windows can no longer be re-scored in full
+    const firstOpenSpan = finalizeBefore / (windowMs / 2);
+    for (const spanKey of Array.from(state.spanChains.keys())) {
+      if (spanKey < firstOpenSpan) {
+        state.spanChains.delete(spanKey);
+      }
+    }
+    for (const [chainId, chain] of Array.from(state.activeChains.entries())) {
+      if (chain.triggerEvent.timestamp.getTime() < finalizeBefore) {
+        state.activeChains.delete(chainId);
+      }
+    }
+
+    state.finalizedBeforeMs = finalizeBefore;
+  }
+
+  /**
+   * Group qualifying spans into runs of consecutive spans that share events and
+   * rebuild the chain of every run that overlaps a re-scored span
+   *
+   * A run is scored as one chain over the union of its spans. When the union
+   * falls below the confidence threshold (long runs lose temporal clustering),
+   * the run is reported through its highest-confidence span instead.
+   *
+   * @returns The rebuilt chains, oldest first
+   */
+  private async mergeSpanChains(
+    state: CorrelationStreamState,
+    touchedSpans: Set<number>
+  ): Promise<AutomationWorkflowChain[]> {
+    const windowMs = this.config.timeWindowMs;
+    const spanStepMs = windowMs / 2;
+
+    // Consecutive spans share events when their overlapping half window has any
+    const runs: number[][] = [];
+    let currentRun: number[] = [];
+    for (const spanKey of Array.from(state.spanChains.keys()).sort((a, b) => a - b)) {
+      const previousKey = currentRun[currentRun.length - 1];
+      const overlapStart = spanKey * spanStepMs;
+      const sharesEvents = previousKey === spanKey - 1 &&
+        state.buffer.lowerBound(overlapStart) < state.buffer.lowerBound(overlapStart + spanStepMs);
+
+      if (!sharesEvents && currentRun.length > 0) {
+        runs.push(currentRun);
+        currentRun = [];
+      }
+      currentRun.push(spanKey);
+    }
+    if (currentRun.length > 0) runs.push(currentRun);
+
+    const previousChains = Array.from(state.activeChains.values());
+    const activeChains = new Map<string, AutomationWorkflowChain>();
+    const rebuiltChains: AutomationWorkflowChain[] = [];
+
+    for (const run of runs) {
+      const runStart = run[0]! * spanStepMs;
+      const runEnd = run[run.length - 1]! * spanStepMs + windowMs;
+
+      // The chain this run previously produced, if any: the oldest trigger inside the run
+      const previous = previousChains
+        .filter(chain => {
+          const triggerTime = chain.triggerEvent.timestamp.getTime();
+          return triggerTime >= runStart && triggerTime < runEnd;
+        })
+        .sort((a, b) => a.triggerEvent.timestamp.getTime() - b.triggerEvent.timestamp.getTime())[0];
+
+      const touched = Array.from(touchedSpans).some(spanKey =>
+        spanKey * spanStepMs < runEnd && spanKey * spanStepMs + windowMs > runStart
+      );
+      if (!touched && previous) {
+        activeChains.set(previous.chainId, previous);
+        continue;
+      }
+
+      let chain = run.length > 1 ? await this.correlateWindow(state.buffer.range(runStart, runEnd)) : null;
+      if (!chain) {
+        chain = run
+          .map(spanKey => state.spanChains.get(spanKey)!)
+          .reduce((best, candidate) => candidate.correlationConfidence > best.correlationConfidence ? candidate : best);
+      }
+
+      const stableChain = previous ? { ...chain, chainId: previous.chainId } : chain;
+      activeChains.set(stableChain.chainId, stableChain);
+      rebuiltChains.push(stableChain);
+    }
+
+    state.activeChains = activeChains;
+    return rebuiltChains;
+  }
+
+  /**
+   * Number of timeWindowMs windows holding buffered events
+   */
+  private countBufferedWindows(state: CorrelationStreamState): number {
+    const windowMs = this.config.timeWindowMs;
+    let windows = 0;
+    let index = 0;
+    while (index < state.buffer.size) {
+      windows++;
+      index = state.buffer.lowerBound((Math.floor(state.buffer.timestampAt(index) / windowMs) + 1) * windowMs);
+    }
+    return windows;
+  }
+
+  /**
+   * Score a single chronologically sorted time window and build its chain
+   */
+  private async correlateWindow(windowEvents: MultiPlatformEvent[]): Promise<AutomationWorkflowChain | null> {
+    if (this.groupEventsByPlatform(windowEvents).size < 2) return null;
+
+    const correlationScore = this.calculateCorrelationScore(windowEvents);
+    if (correlationScore <= this.config.confidenceThreshold) return null;
+
+    const chain = await this.buildWorkflowChain(windowEvents, true);
+    if (!chain) return null;
+
+    const [enrichedChain] = await this.enrichChainsWithRiskAssessment(this.filterByConfidence([chain]));
+    return enrichedChain && isValidAutomationWorkflowChain(enrichedChain) ? enrichedChain : null;
+  }
+
+  private emitDetectionEvents(chains: AutomationWorkflowChain[]): void {
+    for (const chain of chains) {
+      this.eventEmitter.emit('detection', {
+        automationId: chain.chainId,
+        predicted: chain.overallRiskScore > 75 ? 'malicious' : 'legitimate',
+        confidence: chain.confidence,
+        detectorName: 'CrossPlatformCorrelation',
+        timestamp: new Date()
+      });
+    }
+  }
+
   private groupEventsByTimeWindow(events: MultiPlatformEvent[], windowMs: number): Map<number, MultiPlatformEvent[]> {
     const groups = new Map<number, MultiPlatformEvent[]>();
 
@@ -447,11 +782,16 @@ export class CrossPlatformCorrelationService implements CrossPlatformCorrelation
     return chains;
   }
 
-  private async buildWorkflowChain(events: MultiPlatformEvent[]): Promise<AutomationWorkflowChain | null> {
+  private async buildWorkflowChain(
+    events: MultiPlatformEvent[],
+    alreadySorted: boolean = false
+  ): Promise<AutomationWorkflowChain | null> {
     if (events.length < 2) return null;
 
-    // Sort events chronologically
-    const sortedEvents = events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+    // Sort events chronologically (windows sliced from the stream buffer already are)
+    const sortedEvents = alreadySorted
+      ? events
+      : events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
     const triggerEvent = sortedEvents[0];
 
     if (!triggerEvent) return null;
@@ -4,6 +4,9 @@ import {
   GoogleActivityPattern,
   ActionType
 } from '@singura/shared-types';
+import { DetectionEventIndex, buildDetectionEventIndex } from './detection-event-index';
+
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
 
 interface VolumeStatistics {
   totalBytes: number;
@@ -54,17 +57,17 @@ export class DataVolumeDetectorService {
 
   async detectExfiltration(
     events: GoogleWorkspaceEvent[],
-    organizationId: string
+    organizationId: string,
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
   ): Promise<GoogleActivityPattern[]> {
     const patterns: GoogleActivityPattern[] = [];
     const thresholds = this.getVolumeThresholds();
 
-    const downloadEvents = this.filterDownloadEvents(events);
-    if (downloadEvents.length === 0) {
+    const dailyVolumes = this.groupDownloadsByUserAndDate(index);
+    if (dailyVolumes.length === 0) {
       return patterns;
     }
 
-    const dailyVolumes = this.groupByUserAndDate(downloadEvents);
     const userBaselines = this.calculateUserBaselines(dailyVolumes);
 
     for (const dailyVolume of dailyVolumes) {
@@ -93,34 +96,31 @@ export class DataVolumeDetectorService {
     return patterns;
   }
 
-  private filterDownloadEvents(events: GoogleWorkspaceEvent[]): GoogleWorkspaceEvent[] {
-    return events.filter(event =>
-      this.DOWNLOAD_EVENT_TYPES.includes(event.eventType)
-    );
-  }
-
-  private groupByUserAndDate(events: GoogleWorkspaceEvent[]): UserDailyVolume[] {
+  /**
+   * Download events per user and UTC day, in order of each day's first download
+   */
+  private groupDownloadsByUserAndDate(index: DetectionEventIndex): UserDailyVolume[] {
     const groups = new Map<string, UserDailyVolume>();
 
-    for (const event of events) {
-      const dateKey = this.getDateKey(event.timestamp);
-      const groupKey = `${event.userId}_${dateKey}`;
+    for (let i = 0; i < index.sortedEvents.length; i++) {
+      const event = index.sortedEvents[i]!;
+      if (!this.DOWNLOAD_EVENT_TYPES.includes(event.eventType)) continue;
 
-      if (!groups.has(groupKey)) {
-        groups.set(groupKey, {
+      const groupKey = `${event.userId}_${Math.floor(index.sortedTimestamps[i]! / MS_PER_DAY)}`;
+      let group = groups.get(groupKey);
+      if (!group) {
+        group = {
           userId: event.userId,
           userEmail: event.userEmail,
-          date: dateKey,
+          date: this.getDateKey(event.timestamp),
           totalBytes: 0,
           fileCount: 0,
           events: []
-        });
+        };
+        groups.set(groupKey, group);
       }
 
-      const group = groups.get(groupKey)!;
-      const fileSize = this.extractFileSize(event);
-
-      group.totalBytes += fileSize;
+      group.totalBytes += this.extractFileSize(event);
       group.fileCount++;
       group.events.push(event);
     }
@@ -20,7 +20,8 @@ import { AIProviderDetectorService } from './ai-provider-detector.service';
 import { TimingVarianceDetectorService } from './timing-variance-detector.service';
 import { PermissionEscalationDetectorService } from './permission-escalation-detector.service';
 import { DataVolumeDetectorService } from './data-volume-detector.service';
-import { MLBehavioralInferenceService } from '../ml-behavioral/ml-behavioral-inference.service';
+import { buildDetectionEventIndex } from './detection-event-index';
+import { MLBehavioralInferenceService, BehavioralAnalysisResult } from '../ml-behavioral/ml-behavioral-inference.service';
 import { BehavioralBaselineLearningService } from '../ml-behavioral/behavioral-baseline-learning.service';
 import { ReinforcementLearningService } from '../reinforcement-learning.service';
 
@@ -66,12 +67,17 @@ export class DetectionEngineService {
     riskIndicators: RiskIndicator[];
     detectionMetadata: DetectionMetadata;
   }> {
+    // Pre-index once: timestamps, chronological order and per-user/type groupings
+    // are shared by every detector instead of being rebuilt by each one
+    const eventIndex = buildDetectionEventIndex(events);
+    const sortedEvents = eventIndex.sortedEvents;
+
     // Velocity detection
-    const velocityTemporalPatterns = this.velocityDetector.detectVelocityAnomalies(events);
+    const velocityTemporalPatterns = this.velocityDetector.detectVelocityAnomalies(events, eventIndex);
     const velocityPatterns = velocityTemporalPatterns.map(pattern => this.convertTemporalToActivity(pattern));
 
     // Batch operation detection
-    const batchOperationPatterns = this.batchOperationDetector.detectBatchOperations(events);
+    const batchOperationPatterns = this.batchOperationDetector.detectBatchOperations(events, eventIndex);
 
     // Off-hours activity detection
     const activityTimeframe: ActivityTimeframe = {
@@ -86,13 +92,13 @@ export class DetectionEngineService {
       humanLikelihood: 50,
       automationIndicators: []
     };
-    const offHoursPatterns = this.offHoursDetector.detectOffHoursActivity(events, businessHours);
+    const offHoursPatterns = this.offHoursDetector.detectOffHoursActivity(events, businessHours, eventIndex);
 
     // AI Provider detection (using new comprehensive detection)
-    const aiProviderDetections = this.aiProviderDetector.detectAIProviders(events) as any;
+    const aiProviderDetections = this.aiProviderDetector.detectAIProviders(events, eventIndex) as any;
 
     // Generate legacy signatures for backward compatibility
-    const aiProviderSignatures = this.aiProviderDetector.generateAutomationSignatures(aiProviderDetections, events);
+    const aiProviderSignatures = this.aiProviderDetector.generateAutomationSignatures(aiProviderDetections, sortedEvents);
     const aiRiskIndicators = this.aiProviderDetector.generateAIIntegrationRiskIndicator(aiProviderSignatures as any);
 
     // Convert AI signatures to activity patterns
@@ -120,58 +126,52 @@ export class DetectionEngineService {
     }));
 
     // NEW: Timing variance detection (catches throttled bots)
-    const timingVariancePatterns = this.timingVarianceDetector.detectSuspiciousTimingPatterns(events);
+    const timingVariancePatterns = this.timingVarianceDetector.detectSuspiciousTimingPatterns(events, eventIndex);
 
     // NEW: Permission escalation detection (detects privilege creep)
-    const permissionEscalationPatterns = await this.permissionEscalationDetector.detectEscalation(events);
+    const permissionEscalationPatterns = await this.permissionEscalationDetector.detectEscalation(events, undefined, eventIndex);
 
     // NEW: Data volume detection (catches exfiltration)
     const dataVolumePatterns = await this.dataVolumeDetector.detectExfiltration(
       events,
-      this.organizationId || 'unknown'
+      this.organizationId || 'unknown',
+      eventIndex
     );
 
-    // ML Behavioral Analysis
-    const mlAnalysisResults = await Promise.allSettled(
-      events.map(async (event) => {
-        try {
-          return await this.mlInferenceService.analyzeBehavior(
-            event as any, // Convert GoogleWorkspaceEvent to AutomationEvent
-            {
-              organizationId: this.organizationId || 'unknown',
-              platform: 'google-workspace'
-            }
-          );
-        } catch (error) {
-          console.error('ML analysis failed for event:', error);
-          return null;
+    // ML Behavioral Analysis (batched: one feature matrix per chunk instead of one promise per event)
+    let mlAnalysisResults: BehavioralAnalysisResult[] = [];
+    try {
+      mlAnalysisResults = await this.mlInferenceService.analyzeBehaviorBatch(
+        sortedEvents as any[], // Convert GoogleWorkspaceEvent to AutomationEvent
+        {
+          organizationId: this.organizationId || 'unknown',
+          platform: 'google-workspace'
         }
-      })
-    );
+      );
+    } catch (error) {
+      console.error('ML analysis failed for events:', error);
+    }
 
-    // Extract successful ML patterns
+    // Convert ML results to patterns
     const mlPatterns: GoogleActivityPattern[] = mlAnalysisResults
-      .filter((result): result is PromiseFulfilledResult<any> =>
-        result.status === 'fulfilled' && result.value !== null
-      )
       .map(result => ({
-        patternId: result.value.automationId,
+        patternId: result.automationId,
         patternType: 'api_usage' as const, // Use existing type for now
-        detectedAt: result.value.timestamp,
-        confidence: result.value.behavioralRiskScore,
+        detectedAt: result.timestamp,
+        confidence: result.behavioralRiskScore,
         metadata: {
           userId: 'ml-inference',
           userEmail: 'ml@system',
           resourceType: 'script' as const,
           actionType: 'script_execution' as const,
-          timestamp: result.value.timestamp
+          timestamp: result.timestamp
         },
         evidence: {
-          description: result.value.explanation.executiveSummary,
+          description: result.explanation.executiveSummary,
           dataPoints: {
-            riskScore: result.value.behavioralRiskScore,
-            confidence: result.value.confidence,
-            factors: result.value.explanation.primaryFactors
+            riskScore: result.behavioralRiskScore,
+            confidence: result.confidence,
+            factors: result.explanation.primaryFactors
           },
           supportingEvents: []
         }
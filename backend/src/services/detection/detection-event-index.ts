@@ -0,0 +1,115 @@
+/**
+ * Detection Event Index
+ * Shared pre-indexing stage for the detector pipeline in DetectionEngineService
+ *
+ * Timestamps are parsed once into typed arrays and events are put in
+ * chronological order once. The per-user and per-event-type groupings are
+ * built on first access and then reused by every detector, instead of each
+ * detector re-sorting and regrouping the same events.
+ */
+
+import { GoogleWorkspaceEvent } from '@singura/shared-types';
+
+/**
+ * Chronologically ordered slice of the indexed events
+ */
+export interface EventGroup {
+  events: GoogleWorkspaceEvent[];
+  timestamps: Float64Array; // epoch ms, parallel to events
+}
+
+export class DetectionEventIndex {
+  /** Events in input order */
+  readonly events: GoogleWorkspaceEvent[];
+  /** Epoch ms per event, parallel to events */
+  readonly timestamps: Float64Array;
+  /** Stable permutation of input positions that sorts events chronologically */
+  readonly chronologicalOrder: Uint32Array;
+  /** Events in chronological order (ties keep input order) */
+  readonly sortedEvents: GoogleWorkspaceEvent[];
+  /** Epoch ms parallel to sortedEvents */
+  readonly sortedTimestamps: Float64Array;
+
+  private userGroups?: Map<string, EventGroup>;
+  private eventTypeGroups?: Map<string, EventGroup>;
+
+  constructor(events: GoogleWorkspaceEvent[]) {
+    const count = events.length;
+    this.events = events;
+
+    this.timestamps = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+      this.timestamps[i] = events[i]!.timestamp.getTime();
+    }
+
+    const timestamps = this.timestamps;
+    this.chronologicalOrder = new Uint32Array(count);
+    for (let i = 0; i < count; i++) {
+      this.chronologicalOrder[i] = i;
+    }
+    this.chronologicalOrder.sort((a, b) => timestamps[a]! - timestamps[b]! || a - b);
+
+    this.sortedEvents = new Array<GoogleWorkspaceEvent>(count);
+    this.sortedTimestamps = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+      const position = this.chronologicalOrder[i]!;
+      this.sortedEvents[i] = events[position]!;
+      this.sortedTimestamps[i] = timestamps[position]!;
+    }
+  }
+
+  get size(): number {
+    return this.events.length;
+  }
+
+  /**
+   * Events per userId, chronological, keyed in order of each user's first event
+   */
+  get byUser(): Map<string, EventGroup> {
+    this.userGroups ??= this.groupBy(event => event.userId);
+    return this.userGroups;
+  }
+
+  /**
+   * Events per eventType, chronological, keyed in order of each type's first event
+   */
+  get byEventType(): Map<string, EventGroup> {
+    this.eventTypeGroups ??= this.groupBy(event => event.eventType);
+    return this.eventTypeGroups;
+  }
+
+  private groupBy(keyOf: (event: GoogleWorkspaceEvent) => string): Map<string, EventGroup> {
+    const positions = new Map<string, number[]>();
+
+    for (let i = 0; i < this.sortedEvents.length; i++) {
+      const key = keyOf(this.sortedEvents[i]!);
+      const list = positions.get(key);
+      if (list) {
+        list.push(i);
+      } else {
+        positions.set(key, [i]);
+      }
+    }
+
+    const groups = new Map<string, EventGroup>();
+    for (const [key, list] of positions) {
+      const events = new Array<GoogleWorkspaceEvent>(list.length);
+      const timestamps = new Float64Array(list.length);
+      for (let i = 0; i < list.length; i++) {
+        const position = list[i]!;
+        events[i] = this.sortedEvents[position]!;
+        timestamps[i] = this.sortedTimestamps[position]!;
+      }
+      groups.set(key, { events, timestamps });
+    }
+
+    return groups;
+  }
+}
+
+/**
+ * Build the shared index for one detection pass
+ */
+export function buildDetectionEventIndex(events: GoogleWorkspaceEvent[]): DetectionEventIndex {
+  return new DetectionEventIndex(events);
+}
@@ -7,6 +7,7 @@ import {
 } from '@singura/shared-types';
 
 import { DateTime } from 'luxon';
+import { DetectionEventIndex, buildDetectionEventIndex } from './detection-event-index';
 
 export class OffHoursDetectorService implements OffHoursDetector {
   private eventEmitter: EventEmitter;
@@ -17,20 +18,39 @@ export class OffHoursDetectorService implements OffHoursDetector {
 
   detectOffHoursActivity(
     events: GoogleWorkspaceEvent[],
-    businessHours: ActivityTimeframe['businessHours']
+    businessHours: ActivityTimeframe['businessHours'],
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
   ): GoogleActivityPattern[] {
     if (events.length < this.getOffHoursThresholds().minimumEventsForAnalysis) {
       return [];
     }
 
-    const offHoursEvents = events.filter(event =>
-      !this.isBusinessHours(event.timestamp, 'UTC', businessHours)
-    );
+    // Off-hours events per user, keyed in order of each user's first off-hours event
+    const offHoursEventsByUser = new Map<string, GoogleWorkspaceEvent[]>();
+    const offHoursEvents: GoogleWorkspaceEvent[] = [];
+
+    for (let i = 0; i < index.sortedEvents.length; i++) {
+      if (this.isBusinessHoursUtc(index.sortedTimestamps[i]!, businessHours)) continue;
+
+      const event = index.sortedEvents[i]!;
+      offHoursEvents.push(event);
+
+      const userEvents = offHoursEventsByUser.get(event.userId);
+      if (userEvents) {
+        userEvents.push(event);
+      } else {
+        offHoursEventsByUser.set(event.userId, [event]);
+      }
+    }
 
     const totalActivityPercentage = this.calculateOffHoursRisk(offHoursEvents, events);
 
     if (totalActivityPercentage >= this.getOffHoursThresholds().suspiciousActivityThreshold) {
-      const patterns = this.generateOffHoursActivityPatterns(offHoursEvents, totalActivityPercentage);
+      const patterns = this.generateOffHoursActivityPatterns(
+        offHoursEventsByUser,
+        offHoursEvents.length,
+        totalActivityPercentage
+      );
 
       // Emit detection events for metrics tracking
       for (const pattern of patterns) {
@@ -74,6 +94,26 @@ export class OffHoursDetectorService implements OffHoursDetector {
     return isBusinessDay && isBusinessTime;
   }
 
+  /**
+   * UTC equivalent of isBusinessHours working directly on epoch ms,
+   * avoiding a Luxon DateTime per event
+   */
+  private isBusinessHoursUtc(
+    timestampMs: number,
+    businessConfig: ActivityTimeframe['businessHours']
+  ): boolean {
+    if (!businessConfig || !businessConfig.daysOfWeek || businessConfig.startHour === undefined || businessConfig.endHour === undefined) {
+      return false; // Treat as off-hours if config is missing
+    }
+
+    const date = new Date(timestampMs);
+    const hour = date.getUTCHours();
+
+    return businessConfig.daysOfWeek.includes(date.getUTCDay()) &&
+      hour >= businessConfig.startHour &&
+      hour < businessConfig.endHour;
+  }
+
   calculateOffHoursRisk(
     offHoursEvents: GoogleWorkspaceEvent[], 
     totalActivity: GoogleWorkspaceEvent[]
@@ -92,13 +132,11 @@ export class OffHoursDetectorService implements OffHoursDetector {
   }
 
   private generateOffHoursActivityPatterns(
-    offHoursEvents: GoogleWorkspaceEvent[], 
+    offHoursEventsByUser: Map<string, GoogleWorkspaceEvent[]>,
+    totalOffHoursEvents: number,
     offHoursPercentage: number
   ): GoogleActivityPattern[] {
-    // Group off-hours events by user and action type
-    const eventsByUser = this.groupEventsByUser(offHoursEvents);
-
-    return Object.entries(eventsByUser).map(([userId, userEvents]) => {
+    return Array.from(offHoursEventsByUser.entries()).map(([userId, userEvents]) => {
       if (userEvents.length === 0) {
         throw new Error(`No events found for user ${userId}`);
       }
@@ -123,7 +161,7 @@ export class OffHoursDetectorService implements OffHoursDetector {
         evidence: {
           description: `High off-hours activity detected: ${offHoursPercentage.toFixed(2)}% outside business hours`,
           dataPoints: {
-            totalEvents: offHoursEvents.length,
+            totalEvents: totalOffHoursEvents,
             offHoursPercentage,
             eventTypes: [...new Set(userEvents.map(e => e.eventType))]
           },
@@ -133,15 +171,6 @@ export class OffHoursDetectorService implements OffHoursDetector {
     });
   }
 
-  private groupEventsByUser(events: GoogleWorkspaceEvent[]): Record<string, GoogleWorkspaceEvent[]> {
-    return events.reduce((groups, event) => {
-      const key = event.userId;
-      if (!groups[key]) groups[key] = [];
-      groups[key].push(event);
-      return groups;
-    }, {} as Record<string, GoogleWorkspaceEvent[]>);
-  }
-
   private calculateConfidence(offHoursPercentage: number): number {
     const thresholds = this.getOffHoursThresholds();
     
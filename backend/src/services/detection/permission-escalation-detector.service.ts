@@ -3,6 +3,9 @@ import {
   GoogleWorkspaceEvent,
   GoogleActivityPattern
 } from '@singura/shared-types';
+import { DetectionEventIndex, buildDetectionEventIndex } from './detection-event-index';
+
+const PERMISSION_EVENT_TYPES = new Set(['permission_change', 'acl_change', 'sharing']);
 
 interface PermissionChange {
   timestamp: Date;
@@ -48,22 +51,27 @@ export class PermissionEscalationDetectorService {
    */
   async detectEscalation(
     events: GoogleWorkspaceEvent[],
-    timeWindowDays: number = 30
+    timeWindowDays: number = 30,
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
   ): Promise<GoogleActivityPattern[]> {
     const thresholds = this.getEscalationThresholds();
-
-    // Filter to permission change events
-    const permissionEvents = events.filter(event =>
-      event.eventType === 'permission_change' ||
-      event.eventType === 'acl_change' ||
-      event.eventType === 'sharing'
-    );
-
-    // Group by user (minimum events check is done per-user in analyzeUserEscalation)
-    const userGroups = this.groupEventsByUser(permissionEvents);
     const patterns: GoogleActivityPattern[] = [];
 
-    for (const [userId, userEvents] of userGroups.entries()) {
+    // Permission change events per user, keyed in order of each user's first change
+    // (minimum events check is done per-user in analyzeUserEscalation)
+    const userGroups = new Map<string, GoogleWorkspaceEvent[]>();
+    for (const event of index.sortedEvents) {
+      if (!PERMISSION_EVENT_TYPES.has(event.eventType)) continue;
+
+      const userEvents = userGroups.get(event.userId);
+      if (userEvents) {
+        userEvents.push(event);
+      } else {
+        userGroups.set(event.userId, [event]);
+      }
+    }
+
+    for (const userEvents of userGroups.values()) {
       const escalationPattern = this.analyzeUserEscalation(
         userEvents,
         timeWindowDays,
@@ -210,20 +218,6 @@ export class PermissionEscalationDetectorService {
     return 0; // Unknown/default to lowest level
   }
 
-  private groupEventsByUser(events: GoogleWorkspaceEvent[]): Map<string, GoogleWorkspaceEvent[]> {
-    const groups = new Map<string, GoogleWorkspaceEvent[]>();
-
-    for (const event of events) {
-      const userId = event.userId;
-      if (!groups.has(userId)) {
-        groups.set(userId, []);
-      }
-      groups.get(userId)!.push(event);
-    }
-
-    return groups;
-  }
-
   private convertToActivityPattern(escalationPattern: EscalationPattern): GoogleActivityPattern {
     const confidence = this.calculateConfidence(escalationPattern);
     const riskLevel = this.determineRiskLevel(escalationPattern);
@@ -4,6 +4,7 @@ import {
   GoogleActivityPattern,
   ActionType
 } from '@singura/shared-types';
+import { DetectionEventIndex, EventGroup, buildDetectionEventIndex } from './detection-event-index';
 
 /**
  * Timing Variance Detector Service
@@ -28,7 +29,10 @@ export class TimingVarianceDetectorService {
    * 3. Compute coefficient of variation (CV) = stdDev / mean
    * 4. Flag if CV < 0.15 (less than 15% variance = suspiciously consistent)
    */
-  detectSuspiciousTimingPatterns(events: GoogleWorkspaceEvent[]): GoogleActivityPattern[] {
+  detectSuspiciousTimingPatterns(
+    events: GoogleWorkspaceEvent[],
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
+  ): GoogleActivityPattern[] {
     const thresholds = this.getTimingThresholds();
 
     // Need minimum events for statistical analysis
@@ -36,22 +40,16 @@ export class TimingVarianceDetectorService {
       return [];
     }
 
-    // Sort events by timestamp
-    const sortedEvents = [...events].sort((a, b) =>
-      a.timestamp.getTime() - b.timestamp.getTime()
-    );
-
-    // Group events by user for per-user analysis
-    const userGroups = this.groupEventsByUser(sortedEvents);
+    // Per-user groups from the shared index are already chronological
     const patterns: GoogleActivityPattern[] = [];
 
-    for (const [userId, userEvents] of userGroups.entries()) {
-      if (userEvents.length < thresholds.minimumEventsForAnalysis) {
+    for (const userGroup of index.byUser.values()) {
+      if (userGroup.events.length < thresholds.minimumEventsForAnalysis) {
         continue;
       }
 
       // Analyze timing variance for this user
-      const pattern = this.analyzeUserTimingVariance(userEvents, thresholds);
+      const pattern = this.analyzeUserTimingVariance(userGroup, thresholds);
       if (pattern) {
         patterns.push(pattern);
 
@@ -81,38 +79,21 @@ export class TimingVarianceDetectorService {
     };
   }
 
-  /**
-   * Group events by user ID for per-user analysis
-   */
-  private groupEventsByUser(events: GoogleWorkspaceEvent[]): Map<string, GoogleWorkspaceEvent[]> {
-    const groups = new Map<string, GoogleWorkspaceEvent[]>();
-
-    for (const event of events) {
-      const existing = groups.get(event.userId) || [];
-      existing.push(event);
-      groups.set(event.userId, existing);
-    }
-
-    return groups;
-  }
-
   /**
    * Analyze timing variance for a single user's events
    */
   private analyzeUserTimingVariance(
-    events: GoogleWorkspaceEvent[],
+    userGroup: EventGroup,
     thresholds: ReturnType<typeof this.getTimingThresholds>
   ): GoogleActivityPattern | null {
+    const events = userGroup.events;
+    const timestamps = userGroup.timestamps;
+
     // Calculate intervals between consecutive events
     const intervals: number[] = [];
 
-    for (let i = 1; i < events.length; i++) {
-      const prevEvent = events[i - 1];
-      const currEvent = events[i];
-
-      if (!prevEvent || !currEvent) continue;
-
-      const intervalMs = currEvent.timestamp.getTime() - prevEvent.timestamp.getTime();
+    for (let i = 1; i < timestamps.length; i++) {
+      const intervalMs = timestamps[i]! - timestamps[i - 1]!;
 
       // Only include intervals within the max window (part of same sequence)
       if (intervalMs <= thresholds.maxIntervalMs) {
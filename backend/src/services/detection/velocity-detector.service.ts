@@ -5,6 +5,7 @@ import {
   TemporalPattern,
   isValidGoogleActivityPattern
 } from '@singura/shared-types';
+import { DetectionEventIndex, EventGroup, buildDetectionEventIndex } from './detection-event-index';
 
 export class VelocityDetectorService implements VelocityDetector {
   private eventEmitter: EventEmitter;
@@ -13,15 +14,17 @@ export class VelocityDetectorService implements VelocityDetector {
     this.eventEmitter = new EventEmitter();
   }
 
-  detectVelocityAnomalies(events: GoogleWorkspaceEvent[]): TemporalPattern[] {
+  detectVelocityAnomalies(
+    events: GoogleWorkspaceEvent[],
+    index: DetectionEventIndex = buildDetectionEventIndex(events)
+  ): TemporalPattern[] {
     const velocityPatterns: TemporalPattern[] = [];
     const thresholds = this.getVelocityThresholds();
 
-    // Group events by type
-    const eventsByType = this.groupEventsByType(events);
-
-    Object.entries(eventsByType).forEach(([type, typeEvents]) => {
-      const timeWindow = this.calculateTimeWindow(typeEvents);
+    // Events grouped by type, already in chronological order
+    index.byEventType.forEach((typeGroup, type) => {
+      const typeEvents = typeGroup.events;
+      const timeWindow = this.calculateTimeWindow(typeGroup);
       const velocity = this.calculateEventsPerSecond(typeEvents, timeWindow.durationMs);
 
       if (this.isInhumanVelocity(velocity, type)) {
@@ -60,17 +63,8 @@ export class VelocityDetectorService implements VelocityDetector {
     return velocityPatterns;
   }
 
-  private groupEventsByType(events: GoogleWorkspaceEvent[]): Record<string, GoogleWorkspaceEvent[]> {
-    return events.reduce((groups, event) => {
-      const key = event.eventType;
-      if (!groups[key]) groups[key] = [];
-      groups[key].push(event);
-      return groups;
-    }, {} as Record<string, GoogleWorkspaceEvent[]>);
-  }
-
-  private calculateTimeWindow(events: GoogleWorkspaceEvent[]): TemporalPattern['timeWindow'] {
-    if (events.length === 0) {
+  private calculateTimeWindow(group: EventGroup): TemporalPattern['timeWindow'] {
+    if (group.events.length === 0) {
       const now = new Date();
       return {
         startTime: now,
@@ -78,15 +72,12 @@ export class VelocityDetectorService implements VelocityDetector {
         durationMs: 0
       };
     }
-    
-    const sortedEvents = events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
-    const firstEvent = sortedEvents[0]!;
-    const lastEvent = sortedEvents[sortedEvents.length - 1]!;
-    
+
+    const lastIndex = group.events.length - 1;
     return {
-      startTime: firstEvent.timestamp,
-      endTime: lastEvent.timestamp,
-      durationMs: lastEvent.timestamp.getTime() - firstEvent.timestamp.getTime()
+      startTime: group.events[0]!.timestamp,
+      endTime: group.events[lastIndex]!.timestamp,
+      durationMs: group.timestamps[lastIndex]! - group.timestamps[0]!
     };
   }
 
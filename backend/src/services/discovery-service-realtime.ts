@@ -103,13 +103,17 @@ export class RealTimeDiscoveryService {
       const totalAutomations = results.reduce((sum, r) => sum + r.automations.length, 0);
       const duration = Date.now() - startTime;
 
+      const newAutomations = results.reduce((sum, r) => sum + (r.metadata.newAutomations ?? 0), 0);
+
       const finalResult: DiscoveryJobResult = {
         jobId,
         totalPlatforms: connections.length,
         successfulPlatforms: results.length,
         totalAutomations,
-        newAutomations: totalAutomations, // Would be calculated by comparing with existing
-        updatedAutomations: 0, // Would be calculated during the discovery process
+        newAutomations,
+        updatedAutomations: results.reduce((sum, r) => sum + (r.metadata.updatedAutomations ?? 0), 0),
+        unchangedAutomations: results.reduce((sum, r) => sum + (r.metadata.unchangedAutomations ?? 0), 0),
+        changedAutomationIds: results.flatMap(r => r.metadata.changedAutomationIds ?? []),
         errors,
         warnings: [],
         duration,
@@ -122,7 +126,7 @@ export class RealTimeDiscoveryService {
         connectionId: 'all',
         jobId,
         totalAutomations,
-        newAutomations: totalAutomations,
+        newAutomations,
         duration
       });
 
@@ -3,14 +3,28 @@
  * Coordinates platform connectors to discover automations across SaaS platforms
  */
 
-import { PlatformConnector, AutomationEvent, DiscoveryResult, OAuthCredentials } from '../connectors/types';
+import { PlatformConnector, AutomationEvent, AuditLogEntry, DiscoveryResult, OAuthCredentials } from '../connectors/types';
 import { slackConnector } from '../connectors/slack';
 import { googleConnector } from '../connectors/google';
 import { microsoftConnector } from '../connectors/microsoft';
 import { platformConnectionRepository } from '../database/repositories/platform-connection';
 import { encryptedCredentialRepository } from '../database/repositories/encrypted-credential';
-import { DiscoveryRun, DiscoveredAutomation, PlatformType, DiscoveryStatus, PlatformConnection } from '../types/database';
+import { discoveryCheckpointRepository } from '../database/repositories/discovery-checkpoint';
+import {
+  discoveredAutomationRepository,
+  CreateDiscoveredAutomationInput
+} from '../database/repositories/discovered-automation';
+import {
+  DiscoveryRun,
+  DiscoveredAutomation,
+  PlatformType,
+  DiscoveryStatus,
+  PlatformConnection,
+  DiscoveryCheckpoint,
+  DiscoveryMode
+} from '../types/database';
 import { db } from '../database/pool';
+import { contentHash } from '../utils/content-hash';
 import { ConnectionRecord } from '@singura/shared-types';
 
 export interface DiscoveryJobConfig {
@@ -19,6 +33,9 @@ export interface DiscoveryJobConfig {
   includeInactive?: boolean; // Whether to include inactive automations
   updateExisting?: boolean; // Whether to update existing automations or only add new ones
   riskAssessment?: boolean; // Whether to run risk assessment after discovery
+  storeBatchSize?: number; // Rows per bulk upsert when storing discovered automations
+  mode?: DiscoveryMode; // Defaults to 'full'; 'delta' resumes from each connection's checkpoint
+  fullResyncIntervalHours?: number; // Delta runs fall back to a full resync after this long
 }
 
 export interface DiscoveryJobResult {
@@ -28,6 +45,8 @@ export interface DiscoveryJobResult {
   totalAutomations: number;
   newAutomations: number;
   updatedAutomations: number;
+  unchangedAutomations: number;
+  changedAutomationIds: string[]; // New or updated automations, i.e. the ones needing risk re-assessment
   errors: string[];
   warnings: string[];
   duration: number;
@@ -49,6 +68,23 @@ interface OAuthCredentialsResult {
   tokenType: string;
 }
 
+interface StoreAutomationsResult {
+  stored: DiscoveredAutomation[];
+  newCount: number;
+  updatedCount: number;
+  unchangedCount: number;
+  failedCount: number;
+}
+
+// Lookback for the first (or a full) discovery of a connection
+const FULL_DISCOVERY_LOOKBACK_MS = 30 * 24 * 60 * 60 * 1000;
+
+// Delta discovery falls back to a full resync this often
+const DEFAULT_FULL_RESYNC_INTERVAL_HOURS = parseInt(process.env.DISCOVERY_FULL_RESYNC_HOURS || '24', 10);
+
+// Columns an upsert rewrites for an existing automation; their hash decides whether it changed
+const AUTOMATION_UPDATE_COLUMNS = ['name', 'description', 'status', 'platform_metadata', 'vendor_name', 'vendor_group'] as const;
+
 /**
  * Discovery Service - Orchestrates automation discovery across platforms
  */
@@ -105,12 +141,15 @@ export class DiscoveryService {
       
       // Count new vs updated automations
       let newAutomations = 0;
-      const updatedAutomations = 0;
-      
+      let updatedAutomations = 0;
+      let unchangedAutomations = 0;
+      const changedAutomationIds: string[] = [];
+
       for (const result of results) {
-        // This would be calculated during the actual discovery process
-        // For now, assume all are new (this would be refined in the actual implementation)
-        newAutomations += result.automations.length;
+        newAutomations += result.metadata.newAutomations ?? 0;
+        updatedAutomations += result.metadata.updatedAutomations ?? 0;
+        unchangedAutomations += result.metadata.unchangedAutomations ?? 0;
+        changedAutomationIds.push(...(result.metadata.changedAutomationIds ?? []));
       }
 
       const duration = Date.now() - startTime;
@@ -122,6 +161,8 @@ export class DiscoveryService {
         totalAutomations,
         newAutomations,
         updatedAutomations,
+        unchangedAutomations,
+        changedAutomationIds,
         errors,
         warnings,
         duration,
@@ -140,6 +181,8 @@ export class DiscoveryService {
         totalAutomations: 0,
         newAutomations: 0,
         updatedAutomations: 0,
+        unchangedAutomations: 0,
+        changedAutomationIds: [],
         errors,
         warnings,
         duration: Date.now() - startTime,
@@ -169,6 +212,9 @@ export class DiscoveryService {
       // Create discovery run record
       const discoveryRun = await this.createDiscoveryRun(connection.id, connection.organization_id);
 
+      // Delta runs resume from the connection's checkpoint; without one they run in full
+      const { mode, checkpoint } = await this.resolveDiscoveryMode(connection.id, config);
+
       // Get OAuth credentials
       const credentials = await this.getOAuthCredentials(connection.id);
 
@@ -184,23 +230,32 @@ export class DiscoveryService {
       }
 
       // Discover automations
-      console.log(`Discovering automations for ${connection.platform_type}...`);
+      console.log(`Discovering automations for ${connection.platform_type} (${mode})...`);
       const automations = await connector.discoverAutomations();
       
-      // Get audit logs (if available)
-      const auditLogs = await connector.getAuditLogs(new Date(Date.now() - 30 * 24 * 60 * 60 * 1000)); // Last 30 days
+      // Get audit logs (if available) newer than the checkpoint
+      const { entries: auditLogs, checkpoint: nextCheckpoint } = await this.fetchAuditLogs(connector, checkpoint, mode);
       
       // Validate permissions
       const permissionCheck = await connector.validatePermissions();
 
-      // Store discovered automations
-      const storedAutomations = await this.storeDiscoveredAutomations(
+      // Store discovered automations; delta runs skip rows whose content is unchanged
+      const storeResult = await this.storeDiscoveredAutomations(
         automations,
         discoveryRun.id,
         connection.id,
-        connection.organization_id
+        connection.organization_id,
+        config.storeBatchSize,
+        mode === 'delta'
       );
 
+      // Advance the checkpoint only after the run got this far; a failed run retries the same window
+      if (storeResult.failedCount > 0) {
+        errors.push(`Failed to store ${storeResult.failedCount} of ${automations.length} automations; checkpoint not advanced`);
+      } else {
+        await discoveryCheckpointRepository.save(connection.id, connection.organization_id, nextCheckpoint, mode);
+      }
+
       // Update discovery run with results
       await this.updateDiscoveryRun(discoveryRun.id, {
         status: 'completed' as DiscoveryStatus,
@@ -227,10 +282,15 @@ export class DiscoveryService {
         warnings,
         metadata: {
           executionTimeMs: executionTime,
-          automationsFound: storedAutomations.length,
+          automationsFound: storeResult.stored.length + storeResult.unchangedCount,
           auditLogsFound: auditLogs.length,
           riskScore,
-          complianceStatus: permissionCheck.isValid ? 'compliant' : 'non_compliant'
+          complianceStatus: permissionCheck.isValid ? 'compliant' : 'non_compliant',
+          syncMode: mode,
+          newAutomations: storeResult.newCount,
+          updatedAutomations: storeResult.updatedCount,
+          unchangedAutomations: storeResult.unchangedCount,
+          changedAutomationIds: storeResult.stored.map(automation => automation.id)
         }
       };
 
@@ -264,6 +324,52 @@ export class DiscoveryService {
     }
   }
 
+  /**
+   * Decide between delta and full discovery for a connection
+   * Delta needs a checkpoint and a full resync within fullResyncIntervalHours;
+   * a full run starts from a fresh checkpoint FULL_DISCOVERY_LOOKBACK_MS back
+   */
+  private async resolveDiscoveryMode(
+    platformConnectionId: string,
+    config: DiscoveryJobConfig
+  ): Promise<{ mode: DiscoveryMode; checkpoint: DiscoveryCheckpoint }> {
+    const fullCheckpoint: DiscoveryCheckpoint = {
+      auditLogCursor: new Date(Date.now() - FULL_DISCOVERY_LOOKBACK_MS).toISOString()
+    };
+
+    if (config.mode !== 'delta') {
+      return { mode: 'full', checkpoint: fullCheckpoint };
+    }
+
+    const record = await discoveryCheckpointRepository.findByConnectionId(platformConnectionId);
+    const resyncIntervalMs = (config.fullResyncIntervalHours ?? DEFAULT_FULL_RESYNC_INTERVAL_HOURS) * 60 * 60 * 1000;
+    const lastFullSync = record?.last_full_sync_at ? new Date(record.last_full_sync_at).getTime() : null;
+
+    if (!record || lastFullSync === null || Date.now() - lastFullSync >= resyncIntervalMs) {
+      return { mode: 'full', checkpoint: fullCheckpoint };
+    }
+
+    return { mode: 'delta', checkpoint: record.checkpoint };
+  }
+
+  /**
+   * Fetch audit logs newer than a checkpoint and the checkpoint to save afterwards
+   */
+  private async fetchAuditLogs(
+    connector: PlatformConnector,
+    checkpoint: DiscoveryCheckpoint,
+    mode: DiscoveryMode
+  ): Promise<{ entries: AuditLogEntry[]; checkpoint: DiscoveryCheckpoint }> {
+    if (connector.getAuditLogsIncremental) {
+      return connector.getAuditLogsIncremental(checkpoint, mode);
+    }
+
+    // Connectors without checkpoint support: everything since the cursor, then advance it to now
+    const fetchedAt = new Date();
+    const entries = await connector.getAuditLogs(new Date(checkpoint.auditLogCursor));
+    return { entries, checkpoint: { auditLogCursor: fetchedAt.toISOString() } };
+  }
+
   /**
    * Get platform connections for discovery
    */
@@ -372,93 +478,92 @@ export class DiscoveryService {
   /**
    * Store discovered automations in the database
    * Maps AutomationEvent objects from platform connectors to DiscoveredAutomation database records
+   * and writes them with batched upserts in a single transaction.
+   * With skipUnchanged, automations whose content hash matches the stored row are not written;
+   * only their last_seen_at is refreshed.
+   * Storage failures are reported in failedCount rather than thrown.
    */
   private async storeDiscoveredAutomations(
     automations: AutomationEvent[],
     discoveryRunId: string,
     platformConnectionId: string,
-    organizationId: string
-  ): Promise<DiscoveredAutomation[]> {
-    const storedAutomations: DiscoveredAutomation[] = [];
-
-    for (const automation of automations) {
-      try {
-        const query = `
-          INSERT INTO discovered_automations (
-            organization_id,
-            platform_connection_id,
-            discovery_run_id,
-            external_id,
-            name,
-            description,
-            automation_type,
-            status,
-            trigger_type,
-            actions,
-            permissions_required,
-            data_access_patterns,
-            owner_info,
-            last_modified_at,
-            last_triggered_at,
-            execution_frequency,
-            platform_metadata,
-            first_discovered_at,
-            last_seen_at,
-            is_active,
-            vendor_name,
-            vendor_group
-          ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22)
-          ON CONFLICT (platform_connection_id, external_id)
-          DO UPDATE SET
-            name = EXCLUDED.name,
-            description = EXCLUDED.description,
-            status = EXCLUDED.status,
-            last_seen_at = NOW(),
-            platform_metadata = EXCLUDED.platform_metadata,
-            vendor_name = EXCLUDED.vendor_name,
-            vendor_group = EXCLUDED.vendor_group,
-            updated_at = NOW()
-          RETURNING *
-        `;
-
-        const values: (string | number | boolean | Date | null)[] = [
-          organizationId,
-          platformConnectionId,
-          discoveryRunId,
-          automation.id,
-          automation.name,
-          automation.description || null,
-          this.mapAutomationType(automation.type),
-          this.mapAutomationStatus(automation.status),
-          automation.trigger,
-          JSON.stringify(automation.actions),
-          JSON.stringify(automation.permissions || []),
-          JSON.stringify([]), // data_access_patterns - would be derived from automation analysis
-          JSON.stringify(automation.owner || {}),
-          automation.lastModified || null,
-          automation.lastTriggered || null,
-          null, // execution_frequency - would be derived from activity analysis
-          JSON.stringify(automation.metadata),
-          automation.createdAt,
-          new Date(),
-          true,
-          automation.metadata?.vendorName || null,
-          automation.metadata?.vendorGroup || null
-        ];
-
-        const result = await db.query<DiscoveredAutomation>(query, values);
-        const storedAutomation = result.rows[0];
-        if (storedAutomation) {
-          storedAutomations.push(storedAutomation);
+    organizationId: string,
+    batchSize?: number,
+    skipUnchanged: boolean = false
+  ): Promise<StoreAutomationsResult> {
+    const seenAt = new Date();
+    const mapped: CreateDiscoveredAutomationInput[] = automations.map(automation => ({
+      organization_id: organizationId,
+      platform_connection_id: platformConnectionId,
+      discovery_run_id: discoveryRunId,
+      external_id: automation.id,
+      name: automation.name,
+      description: automation.description || null,
+      automation_type: this.mapAutomationType(automation.type),
+      status: this.mapAutomationStatus(automation.status),
+      trigger_type: automation.trigger,
+      actions: automation.actions,
+      permissions_required: automation.permissions || [],
+      data_access_patterns: [], // would be derived from automation analysis
+      owner_info: automation.owner || {},
+      last_modified_at: automation.lastModified || null,
+      last_triggered_at: automation.lastTriggered || null,
+      execution_frequency: null, // would be derived from activity analysis
+      platform_metadata: automation.metadata ?? null,
+      first_discovered_at: automation.createdAt,
+      last_seen_at: seenAt,
+      is_active: true,
+      vendor_name: automation.metadata?.vendorName || null,
+      vendor_group: automation.metadata?.vendorGroup || null
+    }));
+
+    for (const row of mapped) {
+      row.content_hash = contentHash(row, AUTOMATION_UPDATE_COLUMNS);
+    }
+
+    try {
+      const existing = await discoveredAutomationRepository.findContentHashes(platformConnectionId);
+      const rows: CreateDiscoveredAutomationInput[] = [];
+      const unchangedIds: string[] = [];
+      for (const row of mapped) {
+        const stored = existing.get(row.external_id);
+        if (skipUnchanged && stored && stored.content_hash === row.content_hash) {
+          unchangedIds.push(stored.id);
+        } else {
+          rows.push(row);
         }
+      }
+      const newCount = rows.filter(row => !existing.has(row.external_id)).length;
+
+      // Unchanged rows skip the upsert but were still seen in this run
+      await discoveredAutomationRepository.markSeen(unchangedIds);
 
-      } catch (error) {
-        console.error(`Failed to store automation ${automation.id}:`, error);
-        // Continue with other automations
+      if (rows.length === 0) {
+        return { stored: [], newCount: 0, updatedCount: 0, unchangedCount: mapped.length, failedCount: 0 };
       }
-    }
 
-    return storedAutomations;
+      const { rows: storedAutomations, failures } = await discoveredAutomationRepository.bulkUpsert(rows, {
+        conflictColumns: ['platform_connection_id', 'external_id'],
+        updateColumns: [...AUTOMATION_UPDATE_COLUMNS, 'content_hash'],
+        updateExpressions: { last_seen_at: 'NOW()', updated_at: 'NOW()' },
+        batchSize
+      });
+
+      for (const failure of failures) {
+        console.error(`Failed to store automation ${rows[failure.index]?.external_id}:`, failure.error);
+      }
+
+      return {
+        stored: storedAutomations,
+        newCount,
+        updatedCount: rows.length - newCount,
+        unchangedCount: mapped.length - rows.length,
+        failedCount: failures.length
+      };
+    } catch (error) {
+      console.error(`Failed to store ${automations.length} automations for connection ${platformConnectionId}:`, error);
+      return { stored: [], newCount: 0, updatedCount: 0, unchangedCount: 0, failedCount: automations.length };
+    }
   }
 
   /**
@@ -516,9 +621,9 @@ export class DiscoveryService {
    * Schedule periodic discovery for all active connections
    */
   async schedulePeriodicDiscovery(organizationId: string, intervalHours: number = 24): Promise<void> {
-    // This would integrate with a job queue system like Bull
-    // For now, this is a placeholder
-    console.log(`Scheduling periodic discovery for organization ${organizationId} every ${intervalHours} hours`);
+    // Imported lazily so API processes don't start the queues; scheduled runs are delta by default
+    const { jobQueue } = await import('../jobs/queue');
+    await jobQueue.schedulePeriodicDiscovery(organizationId, intervalHours);
   }
 
   /**
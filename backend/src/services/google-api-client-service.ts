@@ -7,6 +7,7 @@
 
 import { google, Auth } from 'googleapis';
 import { AutomationEvent } from '../connectors/types';
+import { ApiRateLimit, ApiRequestScheduler } from '../utils/api-request-scheduler';
 import {
   GoogleAPIClient,
   GoogleOAuthCredentials,
@@ -27,6 +28,50 @@ import {
   DateRange
 } from '@singura/shared-types';
 
+/**
+ * Request lanes used by the Google API client
+ */
+export type GoogleApiName = 'adminReports' | 'drive' | 'script';
+
+/**
+ * Per-user request limits, kept under Google's published per-user quotas.
+ * Every client instance (one per connected credential) gets its own lanes,
+ * so one tenant's rate limiting never stalls another's discovery.
+ */
+export const GOOGLE_API_LIMITS: Record<GoogleApiName, ApiRateLimit> = {
+  // Admin SDK Reports API: 2,400 queries per minute
+  adminReports: { concurrency: 4, requestsPerSecond: 40, burst: 40 },
+  // Drive API: 12,000 queries per minute
+  drive: { concurrency: 8, requestsPerSecond: 200, burst: 50 },
+  // Apps Script API: 60 project reads per minute
+  script: { concurrency: 4, requestsPerSecond: 1, burst: 10 }
+};
+
+/**
+ * Project-wide limits, shared by every client in the process as a layer above the
+ * per-user lanes; they only cap the combined load of all tenants on the OAuth project
+ */
+export const GOOGLE_PROJECT_API_LIMITS: Record<GoogleApiName, ApiRateLimit> = {
+  adminReports: { concurrency: 32, requestsPerSecond: 200, burst: 200 },
+  drive: { concurrency: 64, requestsPerSecond: 1000, burst: 500 },
+  script: { concurrency: 16, requestsPerSecond: 10, burst: 50 }
+};
+
+export const googleProjectScheduler = new ApiRequestScheduler(GOOGLE_PROJECT_API_LIMITS);
+
+export interface GoogleAPIClientOptions {
+  /** Override the request scheduler (e.g. tighter limits or faster backoff in tests) */
+  scheduler?: ApiRequestScheduler;
+  /** Send API requests to another host, e.g. a local mock server */
+  rootUrl?: string;
+}
+
+// Audit log page size (Admin SDK Reports API maximum)
+const AUDIT_LOG_PAGE_SIZE = 1000;
+
+// Audit log pages read per application by discovery scans (newest first)
+const MAX_DISCOVERY_AUDIT_LOG_PAGES = 10;
+
 export class GoogleAPIClientService implements GoogleAPIClient {
   private auth: Auth.OAuth2Client;
   private adminReports: any; // Google Admin SDK client
@@ -34,8 +79,18 @@ export class GoogleAPIClientService implements GoogleAPIClient {
   private gmail: any; // Gmail API client
   private credentials: GoogleOAuthCredentials | null = null;
   private isAuthenticated = false;
+  private scheduler: ApiRequestScheduler;
+  private apiOptions: { rootUrl?: string };
+  private scheduledApiOptions: { rootUrl?: string; retry: false };
+  private tokenRefresh: Promise<boolean> | null = null;
+
+  constructor(options: GoogleAPIClientOptions = {}) {
+    const rootUrl = options.rootUrl || process.env.GOOGLE_API_ROOT_URL;
+    this.scheduler = options.scheduler || new ApiRequestScheduler(GOOGLE_API_LIMITS, { parent: googleProjectScheduler });
+    this.apiOptions = rootUrl ? { rootUrl } : {};
+    // Clients used through the scheduler leave retries to it, so 429s get its backoff and Retry-After handling
+    this.scheduledApiOptions = { ...this.apiOptions, retry: false };
 
-  constructor() {
     // Initialize Google API clients with OAuth credentials for token refresh
     // CRITICAL: Client credentials are required for refreshAccessToken() to work
     this.auth = new google.auth.OAuth2(
@@ -43,9 +98,9 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       process.env.GOOGLE_CLIENT_SECRET,
       process.env.GOOGLE_REDIRECT_URI
     );
-    this.adminReports = google.admin({ version: 'reports_v1', auth: this.auth });
-    this.drive = google.drive({ version: 'v3', auth: this.auth });
-    this.gmail = google.gmail({ version: 'v1', auth: this.auth });
+    this.adminReports = google.admin({ version: 'reports_v1', auth: this.auth, ...this.scheduledApiOptions });
+    this.drive = google.drive({ version: 'v3', auth: this.auth, ...this.scheduledApiOptions });
+    this.gmail = google.gmail({ version: 'v1', auth: this.auth, ...this.apiOptions });
 
     console.log('GoogleAPIClientService initialized for production Google Workspace integration');
   }
@@ -108,7 +163,7 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       }
 
       // Test credentials with OAuth2 userinfo call
-      const oauth2 = google.oauth2({ version: 'v2', auth: this.auth });
+      const oauth2 = google.oauth2({ version: 'v2', auth: this.auth, ...this.apiOptions });
       const response = await oauth2.userinfo.get();
       
       if (response.data.id && response.data.email) {
@@ -129,8 +184,19 @@ export class GoogleAPIClientService implements GoogleAPIClient {
 
   /**
    * Refresh OAuth tokens if needed
+   * Concurrent callers (e.g. parallel discovery stages) share one in-flight refresh,
+   * so the refresh token is only exchanged once
    */
   async refreshTokensIfNeeded(): Promise<boolean> {
+    if (!this.tokenRefresh) {
+      this.tokenRefresh = this.refreshTokens().finally(() => {
+        this.tokenRefresh = null;
+      });
+    }
+    return this.tokenRefresh;
+  }
+
+  private async refreshTokens(): Promise<boolean> {
     try {
       if (!this.credentials || !this.credentials.refreshToken) {
         console.warn('Cannot refresh tokens: No refresh token available');
@@ -195,7 +261,7 @@ export class GoogleAPIClientService implements GoogleAPIClient {
         maxResults: params.maxResults
       });
 
-      const response = await this.adminReports.activities.list(params);
+      const response = await this.scheduler.schedule('adminReports', () => this.adminReports.activities.list(params));
       
       const auditResponse: GoogleAuditLogResponse = {
         items: response.data.items || [],
@@ -212,6 +278,33 @@ export class GoogleAPIClientService implements GoogleAPIClient {
     }
   }
 
+  /**
+   * Iterate over every page of Google Workspace audit logs
+   * The next page downloads while the caller processes the current one
+   */
+  async *iterateAuditLogs(options: Omit<GoogleAuditLogOptions, 'pageToken'>): AsyncGenerator<GoogleAuditLogResponse> {
+    await this.ensureAuthenticated();
+
+    const params = {
+      userKey: 'all',
+      applicationName: options.applicationName || 'admin',
+      startTime: options.startTime.toISOString(),
+      endTime: options.endTime.toISOString(),
+      maxResults: options.maxResults || AUDIT_LOG_PAGE_SIZE,
+      eventName: options.eventName,
+      actorEmail: options.actorEmail
+    };
+
+    for await (const response of this.activityPages(params)) {
+      yield {
+        items: response.data.items || [],
+        nextPageToken: response.data.nextPageToken,
+        totalResults: response.data.items?.length || 0,
+        etag: response.data.etag || ''
+      };
+    }
+  }
+
   /**
    * Get user activity analysis for automation detection
    */
@@ -292,11 +385,11 @@ export class GoogleAPIClientService implements GoogleAPIClient {
 
       // Note: Drive Activity API requires additional scope setup
       // For now, implement basic file listing as placeholder
-      const response = await this.drive.files.list({
+      const response = await this.scheduler.schedule('drive', () => this.drive.files.list({
         q: `modifiedTime >= '${options.timeRange.startDate.toISOString()}'`,
         fields: 'files(id,name,mimeType,modifiedTime,lastModifyingUser)',
         pageSize: options.maxResults || 100
-      });
+      }));
 
       const driveEvents: GoogleDriveEvent[] = (response.data.files || []).map((file: any) => ({
         timestamp: new Date(file.modifiedTime || Date.now()),
@@ -364,85 +457,109 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       console.log('📜 Searching Drive for Apps Script projects...');
 
       // Find Apps Script projects via Drive API
-      const response = await this.drive.files.list({
-        q: "mimeType='application/vnd.google-apps.script'",
-        pageSize: 100,
-        fields: 'nextPageToken,files(id,name,mimeType,createdTime,modifiedTime,owners,shared,description)',
-        orderBy: 'modifiedTime desc',
-        spaces: 'drive'
-      });
+      const script = google.script({ version: 'v1', auth: this.auth, ...this.scheduledApiOptions });
+      const projectRequests: Promise<GoogleAppsScriptProject | null>[] = [];
+      let fileCount = 0;
+
+      const pages = this.scheduler.paginate(
+        'drive',
+        (pageToken) => this.drive.files.list({
+          q: "mimeType='application/vnd.google-apps.script'",
+          pageSize: 100,
+          fields: 'nextPageToken,files(id,name,mimeType,createdTime,modifiedTime,owners,shared,description)',
+          orderBy: 'modifiedTime desc',
+          spaces: 'drive',
+          ...(pageToken ? { pageToken } : {})
+        }),
+        (response: any) => response.data.nextPageToken
+      );
+
+      for await (const response of pages) {
+        const files = response.data.files || [];
+        fileCount += files.length;
+
+        // Content reads start while later pages are still being listed
+        for (const file of files) {
+          projectRequests.push(this.analyzeAppsScriptFile(script, file));
+        }
+      }
 
-      if (!response.data.files || response.data.files.length === 0) {
+      if (fileCount === 0) {
         console.log('  No Apps Script projects found in Drive');
         return [];
       }
 
-      console.log(`  Found ${response.data.files.length} Apps Script files`);
+      console.log(`  Found ${fileCount} Apps Script files`);
 
-      const projects: GoogleAppsScriptProject[] = [];
-      const script = google.script({ version: 'v1', auth: this.auth });
+      const projects = (await Promise.all(projectRequests))
+        .filter((project): project is GoogleAppsScriptProject => project !== null);
 
-      for (const file of response.data.files) {
-        try {
-          // Try to get script content for AI detection
-          const functions: string[] = [];
-          let hasAIIntegration = false;
+      console.log(`✅ Apps Script discovery: ${projects.length} projects analyzed`);
+      return projects;
 
-          try {
-            const content = await script.projects.getContent({ scriptId: file.id! });
+    } catch (error) {
+      console.error('Failed to get Apps Script projects:', error);
+      return [];
+    }
+  }
 
-            // Extract function names from script files
-            if (content.data.files) {
-              for (const scriptFile of content.data.files) {
-                if (scriptFile.functionSet?.values) {
-                  functions.push(...scriptFile.functionSet.values.map((f: any) => f.name || 'unknown'));
-                }
+  /**
+   * Read one Apps Script file's content and build its project record
+   * Returns null if the file can't be processed
+   */
+  private async analyzeAppsScriptFile(script: any, file: any): Promise<GoogleAppsScriptProject | null> {
+    try {
+      // Try to get script content for AI detection
+      const functions: string[] = [];
+      let hasAIIntegration = false;
 
-                // Check for AI platform API calls in source
-                if (scriptFile.source) {
-                  const source = scriptFile.source.toLowerCase();
-                  hasAIIntegration = source.includes('openai.com') ||
-                                    source.includes('anthropic.com') ||
-                                    source.includes('chatgpt') ||
-                                    source.includes('claude');
-                }
-              }
+      try {
+        const content = await this.scheduler.schedule('script', () => script.projects.getContent({ scriptId: file.id! })) as any;
+
+        // Extract function names from script files
+        if (content.data.files) {
+          for (const scriptFile of content.data.files) {
+            if (scriptFile.functionSet?.values) {
+              functions.push(...scriptFile.functionSet.values.map((f: any) => f.name || 'unknown'));
             }
 
-            console.log(`    ✓ ${file.name}: ${functions.length} functions${hasAIIntegration ? ' (AI DETECTED)' : ''}`);
-          } catch (contentError) {
-            console.log(`    ⚠ Cannot read ${file.name} content (permission denied)`);
+            // Check for AI platform API calls in source
+            if (scriptFile.source) {
+              const source = scriptFile.source.toLowerCase();
+              hasAIIntegration = source.includes('openai.com') ||
+                                source.includes('anthropic.com') ||
+                                source.includes('chatgpt') ||
+                                source.includes('claude');
+            }
           }
-
-          projects.push({
-            scriptId: file.id!,
-            title: file.name || 'Untitled Script',
-            description: file.description,
-            parentId: undefined,
-            createTime: file.createdTime ? new Date(file.createdTime) : new Date(),
-            updateTime: file.modifiedTime ? new Date(file.modifiedTime) : new Date(),
-            owner: file.owners?.[0]?.emailAddress || 'unknown',
-            functions: functions.map(name => ({
-              name,
-              description: '',
-              externalApiCalls: [],
-              riskIndicators: []
-            })),
-            triggers: [], // Would need Apps Script API to get triggers
-            permissions: [] // Would need Apps Script manifest to get permissions
-          });
-
-        } catch (projectError) {
-          console.warn(`  Error processing script ${file.id}:`, projectError);
         }
+
+        console.log(`    ✓ ${file.name}: ${functions.length} functions${hasAIIntegration ? ' (AI DETECTED)' : ''}`);
+      } catch (contentError) {
+        console.log(`    ⚠ Cannot read ${file.name} content (permission denied)`);
       }
 
-      console.log(`✅ Apps Script discovery: ${projects.length} projects analyzed`);
-      return projects;
+      return {
+        scriptId: file.id!,
+        title: file.name || 'Untitled Script',
+        description: file.description,
+        parentId: undefined,
+        createTime: file.createdTime ? new Date(file.createdTime) : new Date(),
+        updateTime: file.modifiedTime ? new Date(file.modifiedTime) : new Date(),
+        owner: file.owners?.[0]?.emailAddress || 'unknown',
+        functions: functions.map(name => ({
+          name,
+          description: '',
+          externalApiCalls: [],
+          riskIndicators: []
+        })),
+        triggers: [], // Would need Apps Script API to get triggers
+        permissions: [] // Would need Apps Script manifest to get permissions
+      };
 
-    } catch (error) {
-      console.error('Failed to get Apps Script projects:', error);
-      return [];
+    } catch (projectError) {
+      console.warn(`  Error processing script ${file.id}:`, projectError);
+      return null;
     }
   }
 
@@ -507,19 +624,19 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       const serviceAccounts: GoogleServiceAccountInfo[] = [];
 
       try {
-        // Query audit logs for service account activity
-        const response = await this.adminReports.activities.list({
+        // Query audit logs for service account activity, across all pages
+        const pages = this.activityPages({
           userKey: 'all',
           applicationName: 'token',
           startTime: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString(),
-          maxResults: 1000,
+          maxResults: AUDIT_LOG_PAGE_SIZE,
           eventName: 'authorize'
-        });
+        }, MAX_DISCOVERY_AUDIT_LOG_PAGES);
 
         const serviceAccountEmails = new Set<string>();
 
-        if (response.data.items) {
-          for (const activity of response.data.items) {
+        for await (const response of pages) {
+          for (const activity of response.data.items || []) {
             const email = activity.actor?.email;
             if (email && (email.includes('.iam.gserviceaccount.com') || email.includes('.apps.googleusercontent.com'))) {
               serviceAccountEmails.add(email);
@@ -597,34 +714,8 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       // Use Admin Reports API to find OAuth authorization events
       // This works for non-admin users with admin.reports.audit.readonly scope
       // NOTE: eventName parameter doesn't accept comma-separated values - get all login events
-      const loginResponse = await this.adminReports.activities.list({
-        userKey: 'all',
-        applicationName: 'login',
-        startTime: new Date(Date.now() - 180 * 24 * 60 * 60 * 1000).toISOString(), // Last 180 days (Google's max retention)
-        maxResults: 1000
-        // Filter for oauth events in code below
-      });
-
-      const tokenResponse = await this.adminReports.activities.list({
-        userKey: 'all',
-        applicationName: 'token',
-        startTime: new Date(Date.now() - 180 * 24 * 60 * 60 * 1000).toISOString(), // Last 180 days (Google's max retention)
-        maxResults: 1000
-        // Get all token events and filter
-      });
-
-      // Combine all events
-      const allEvents = [
-        ...(loginResponse.data.items || []),
-        ...(tokenResponse.data.items || [])
-      ];
-
-      if (allEvents.length === 0) {
-        console.log('  No audit log events found');
-        return [];
-      }
-
-      console.log(`  Found ${allEvents.length} total audit events, filtering for OAuth...`);
+      // and all token events, then filter for oauth events in code below
+      const startTime = new Date(Date.now() - 180 * 24 * 60 * 60 * 1000).toISOString(); // Last 180 days (Google's max retention)
 
       // Extract unique OAuth apps from events
       const oauthAppsMap = new Map<string, {
@@ -635,64 +726,90 @@ export class GoogleAPIClientService implements GoogleAPIClient {
         lastSeen: Date;
         authorizedBy: string;
       }>();
+      let eventCount = 0;
 
-      for (const event of allEvents) {
-        if (!event.events) continue;
+      // Login and token logs are paged in parallel; each page is folded into the map as it arrives
+      const collectEvents = async (applicationName: 'login' | 'token'): Promise<void> => {
+        const pages = this.activityPages({
+          userKey: 'all',
+          applicationName,
+          startTime,
+          maxResults: AUDIT_LOG_PAGE_SIZE
+        }, MAX_DISCOVERY_AUDIT_LOG_PAGES);
 
-        // Capture actor email (who authorized the app)
-        const actorEmail = event.actor?.email || 'unknown';
+        for await (const response of pages) {
+          const items = response.data.items || [];
+          eventCount += items.length;
 
-        for (const ev of event.events) {
-          // Filter for OAuth-related events only
-          const eventName = ev.name?.toLowerCase() || '';
-          const isOAuthEvent = eventName.includes('oauth') ||
-                              eventName.includes('authorize') ||
-                              eventName.includes('token');
+          for (const event of items) {
+            if (!event.events) continue;
 
-          if (!isOAuthEvent || !ev.parameters) continue;
+            // Capture actor email (who authorized the app)
+            const actorEmail = event.actor?.email || 'unknown';
 
-          let clientId: string | undefined;
-          let appName: string | undefined;
-          const scopes: string[] = [];
+            for (const ev of event.events) {
+              // Filter for OAuth-related events only
+              const eventName = ev.name?.toLowerCase() || '';
+              const isOAuthEvent = eventName.includes('oauth') ||
+                                  eventName.includes('authorize') ||
+                                  eventName.includes('token');
 
-          for (const param of ev.parameters) {
-            if (param.name === 'client_id' || param.name === 'oauth_client_id') {
-              clientId = param.value;
-            }
-            if (param.name === 'app_name' || param.name === 'product_name') {
-              appName = param.value;
-            }
-            if (param.name === 'scope' || param.name === 'oauth_scopes') {
-              const scopeValues = param.multiValue || [param.value];
-              scopes.push(...scopeValues);
-            }
-          }
+              if (!isOAuthEvent || !ev.parameters) continue;
+
+              let clientId: string | undefined;
+              let appName: string | undefined;
+              const scopes: string[] = [];
 
-          if (clientId) {
-            const eventTime = event.id?.time ? new Date(event.id.time) : new Date();
-
-            if (!oauthAppsMap.has(clientId)) {
-              oauthAppsMap.set(clientId, {
-                clientId,
-                displayText: appName || clientId,
-                scopes: new Set(scopes),
-                firstSeen: eventTime,
-                lastSeen: eventTime,
-                authorizedBy: actorEmail
-              });
-            } else {
-              const app = oauthAppsMap.get(clientId)!;
-              scopes.forEach(s => app.scopes.add(s));
-              const eventTime = event.id?.time ? new Date(event.id.time) : new Date();
-              if (eventTime > app.lastSeen) app.lastSeen = eventTime;
-              if (eventTime < app.firstSeen) app.firstSeen = eventTime;
-              if (appName && !app.displayText) app.displayText = appName;
-              // Keep first authorizer (don't override)
+              for (const param of ev.parameters) {
+                if (param.name === 'client_id' || param.name === 'oauth_client_id') {
+                  clientId = param.value;
+                }
+                if (param.name === 'app_name' || param.name === 'product_name') {
+                  appName = param.value;
+                }
+                if (param.name === 'scope' || param.name === 'oauth_scopes') {
+                  const scopeValues = param.multiValue || [param.value];
+                  scopes.push(...scopeValues);
+                }
+              }
+
+              if (clientId) {
+                const eventTime = event.id?.time ? new Date(event.id.time) : new Date();
+
+                if (!oauthAppsMap.has(clientId)) {
+                  oauthAppsMap.set(clientId, {
+                    clientId,
+                    displayText: appName || clientId,
+                    scopes: new Set(scopes),
+                    firstSeen: eventTime,
+                    lastSeen: eventTime,
+                    authorizedBy: actorEmail
+                  });
+                } else {
+                  const app = oauthAppsMap.get(clientId)!;
+                  scopes.forEach(s => app.scopes.add(s));
+                  if (eventTime > app.lastSeen) app.lastSeen = eventTime;
+                  // Attribute the app to whoever authorized it first, whichever log page arrives first
+                  if (eventTime < app.firstSeen) {
+                    app.firstSeen = eventTime;
+                    app.authorizedBy = actorEmail;
+                  }
+                  if (appName && !app.displayText) app.displayText = appName;
+                }
+              }
             }
           }
         }
+      };
+
+      await Promise.all([collectEvents('login'), collectEvents('token')]);
+
+      if (eventCount === 0) {
+        console.log('  No audit log events found');
+        return [];
       }
 
+      console.log(`  Found ${eventCount} total audit events, filtering for OAuth...`);
       console.log(`  Discovered ${oauthAppsMap.size} unique OAuth applications`);
 
       // Debug: Show date range of captured events
@@ -811,6 +928,27 @@ export class GoogleAPIClientService implements GoogleAPIClient {
     }
   }
 
+  /**
+   * Page through Admin Reports activities.list, following nextPageToken for up to maxPages pages
+   * Activities come newest first, so a capped scan keeps the most recent events
+   */
+  private async *activityPages(params: Record<string, unknown>, maxPages: number = Infinity): AsyncGenerator<any> {
+    let pageCount = 0;
+
+    for await (const response of this.scheduler.paginate(
+      'adminReports',
+      (pageToken) => this.adminReports.activities.list(pageToken ? { ...params, pageToken } : params),
+      (response: any) => response.data?.nextPageToken,
+      maxPages
+    )) {
+      pageCount++;
+      if (pageCount >= maxPages && response.data?.nextPageToken) {
+        console.warn(`Stopped ${params.applicationName} audit log scan after ${maxPages} pages; older events were not read`);
+      }
+      yield response;
+    }
+  }
+
   /**
    * Map Google audit event names to our event types
    */
@@ -868,7 +1006,6 @@ export class GoogleAPIClientService implements GoogleAPIClient {
       console.log('🚀 Starting comprehensive Google Workspace automation discovery...');
 
       const startTime = Date.now();
-      const automations: AutomationEvent[] = [];
 
       // Default to last 30 days for automation discovery
       const defaultRange: DateRange = {
@@ -892,188 +1029,224 @@ export class GoogleAPIClientService implements GoogleAPIClient {
         ...config
       });
 
-      // 1. Discover Apps Script automations (highest AI/automation risk)
-      if (config.includeAppsScript) {
-        try {
-          console.log('📜 Discovering Apps Script projects...');
-          const appsScriptProjects = await this.getAppsScriptProjects();
-
-          for (const project of appsScriptProjects) {
-            const automation: AutomationEvent = {
-              id: `apps-script-${project.scriptId}`,
-              name: project.title || `Apps Script Project ${project.scriptId.substring(0, 8)}`,
-              type: 'workflow',
-              platform: 'google',
-              status: 'active',
-              trigger: project.triggers.length > 0 ? 'event' : 'manual',
-              actions: project.functions.map(f => f.name) || ['script_execution'],
-              createdAt: project.createTime,
-              lastTriggered: project.updateTime,
-              lastModified: project.updateTime,
-              riskLevel: this.calculateAppsScriptRisk(project),
-              metadata: {
-                scriptId: project.scriptId,
-                description: project.description || `Apps Script: ${project.title}`,
-                parentType: project.parentId ? 'BOUND' : 'STANDALONE',
-                triggers: project.triggers.map(t => t.eventType || 'UNKNOWN'),
-                functions: project.functions.map(f => f.name),
-                permissions: project.permissions.map(p => this.mapScopeToPermission(p.scope)),
-                aiEndpoints: this.detectAIEndpoints(project.functions.map(f => f.name)),
-                riskFactors: this.generateAppsScriptRiskFactors(project)
-              }
-            };
+      // Discovery stages run concurrently; the request scheduler keeps each API within its quota.
+      // Results keep the stage order: Apps Script, Service Accounts, OAuth apps, Email
+      const stageResults = await Promise.all([
+        config.includeAppsScript ? this.discoverAppsScriptAutomations() : [],
+        config.includeServiceAccounts ? this.discoverServiceAccountAutomations() : [],
+        this.discoverOAuthAppAutomations(),
+        config.includeEmailAutomation ? this.discoverEmailAutomations(timeRange) : []
+      ]);
+      const automations = stageResults.flat();
 
-            automations.push(automation);
-          }
+      const executionTimeMs = Date.now() - startTime;
 
-          console.log(`📜 Found ${appsScriptProjects.length} Apps Script projects`);
-        } catch (error) {
-          console.warn('Apps Script discovery failed:', error instanceof Error ? error.message : 'Unknown error');
+      console.log('✅ Google Workspace automation discovery completed:', {
+        totalAutomations: automations.length,
+        executionTimeMs,
+        breakdown: {
+          appsScript: automations.filter(a => a.id.startsWith('apps-script')).length,
+          serviceAccounts: automations.filter(a => a.id.startsWith('service-account')).length,
+          oauthApps: automations.filter(a => a.id.startsWith('oauth-app')).length,
+          aiPlatforms: automations.filter(a => a.metadata?.isAIPlatform === true).length,
+          emailAutomations: automations.filter(a => a.id.startsWith('email-automation')).length
         }
-      }
+      });
 
-      // 2. Discover Service Account automations
-      if (config.includeServiceAccounts) {
-        try {
-          console.log('🤖 Discovering Service Accounts...');
-          const serviceAccounts = await this.getServiceAccounts();
-
-          for (const sa of serviceAccounts) {
-            const automation: AutomationEvent = {
-              id: `service-account-${sa.uniqueId}`,
-              name: sa.displayName || sa.email.split('@')[0] || 'Unknown Service Account',
-              type: 'integration',
-              platform: 'google',
-              status: sa.disabledTime ? 'inactive' : 'active',
-              trigger: 'api_key',
-              actions: ['api_calls', 'data_access'],
-              createdAt: sa.createTime,
-              lastTriggered: new Date(), // Service accounts don't have last activity in basic info
-              riskLevel: this.calculateServiceAccountRisk(sa),
-              metadata: {
-                email: sa.email,
-                description: sa.description || `Service Account: ${sa.displayName}`,
-                projectId: sa.projectId,
-                keyCount: sa.keys.length,
-                roles: sa.roles,
-                hasAdminAccess: sa.riskAssessment.hasAdminAccess,
-                riskFactors: this.generateServiceAccountRiskFactors(sa)
-              }
-            };
+      return automations;
+
+    } catch (error) {
+      console.error('Google Workspace automation discovery failed:', error);
+      throw new Error(`Automation discovery failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    }
+  }
+
+  /**
+   * Discover Apps Script automations (highest AI/automation risk)
+   */
+  private async discoverAppsScriptAutomations(): Promise<AutomationEvent[]> {
+    const automations: AutomationEvent[] = [];
 
-            automations.push(automation);
+    try {
+      console.log('📜 Discovering Apps Script projects...');
+      const appsScriptProjects = await this.getAppsScriptProjects();
+
+      for (const project of appsScriptProjects) {
+        const automation: AutomationEvent = {
+          id: `apps-script-${project.scriptId}`,
+          name: project.title || `Apps Script Project ${project.scriptId.substring(0, 8)}`,
+          type: 'workflow',
+          platform: 'google',
+          status: 'active',
+          trigger: project.triggers.length > 0 ? 'event' : 'manual',
+          actions: project.functions.map(f => f.name) || ['script_execution'],
+          createdAt: project.createTime,
+          lastTriggered: project.updateTime,
+          lastModified: project.updateTime,
+          riskLevel: this.calculateAppsScriptRisk(project),
+          metadata: {
+            scriptId: project.scriptId,
+            description: project.description || `Apps Script: ${project.title}`,
+            parentType: project.parentId ? 'BOUND' : 'STANDALONE',
+            triggers: project.triggers.map(t => t.eventType || 'UNKNOWN'),
+            functions: project.functions.map(f => f.name),
+            permissions: project.permissions.map(p => this.mapScopeToPermission(p.scope)),
+            aiEndpoints: this.detectAIEndpoints(project.functions.map(f => f.name)),
+            riskFactors: this.generateAppsScriptRiskFactors(project)
           }
+        };
 
-          console.log(`🤖 Found ${serviceAccounts.length} Service Accounts`);
-        } catch (error) {
-          console.warn('Service Account discovery failed:', error instanceof Error ? error.message : 'Unknown error');
-        }
+        automations.push(automation);
       }
 
-      // 2.5. Discover OAuth Applications (CRITICAL for ChatGPT/OpenAI detection)
-      try {
-        console.log('🔐 Discovering OAuth applications...');
-        const oauthApps = await this.getOAuthApplications();
-
-        for (const app of oauthApps) {
-          const automation: AutomationEvent = {
-            id: `oauth-app-${app.clientId}`,
-            name: app.displayText,
-            type: 'integration',
-            platform: 'google',
-            status: 'active',
-            trigger: 'oauth',
-            actions: ['api_access', 'data_read'],
-            permissions: app.scopes,
-            createdAt: app.firstSeen,
-            lastTriggered: app.lastSeen,
-            riskLevel: app.isAIPlatform ? 'high' : 'medium',
-            metadata: {
-              clientId: app.clientId,
-              scopes: app.scopes,
-              scopeCount: app.scopes.length,
-              isAIPlatform: app.isAIPlatform,
-              platformName: app.platformName,
-              authorizedBy: app.authorizedBy,
-              firstAuthorization: app.firstSeen?.toISOString() || new Date().toISOString(),
-              lastActivity: app.lastSeen?.toISOString() || new Date().toISOString(),
-              authorizationAge: app.firstSeen ? Math.floor((Date.now() - app.firstSeen.getTime()) / (24 * 60 * 60 * 1000)) : 0,
-              description: app.isAIPlatform
-                ? `AI Platform Integration: ${app.platformName}`
-                : 'Third-party OAuth application',
-              detectionMethod: 'oauth_tokens_api',
-              riskFactors: [
-                ...(app.isAIPlatform ? [`AI platform integration: ${app.platformName}`] : []),
-                `${app.scopes.length} OAuth scopes granted`,
-                ...(app.scopes.some(s => s.includes('drive')) ? ['Google Drive access'] : []),
-                ...(app.scopes.some(s => s.includes('gmail')) ? ['Gmail access'] : [])
-              ]
-            }
-          };
+      console.log(`📜 Found ${appsScriptProjects.length} Apps Script projects`);
+    } catch (error) {
+      console.warn('Apps Script discovery failed:', error instanceof Error ? error.message : 'Unknown error');
+    }
 
-          automations.push(automation);
-        }
+    return automations;
+  }
 
-        console.log(`🔐 Found ${oauthApps.length} OAuth applications (${oauthApps.filter(a => a.isAIPlatform).length} AI platforms)`);
-      } catch (error) {
-        console.warn('OAuth app discovery failed:', error instanceof Error ? error.message : 'Unknown error');
+  /**
+   * Discover Service Account automations
+   */
+  private async discoverServiceAccountAutomations(): Promise<AutomationEvent[]> {
+    const automations: AutomationEvent[] = [];
+
+    try {
+      console.log('🤖 Discovering Service Accounts...');
+      const serviceAccounts = await this.getServiceAccounts();
+
+      for (const sa of serviceAccounts) {
+        const automation: AutomationEvent = {
+          id: `service-account-${sa.uniqueId}`,
+          name: sa.displayName || sa.email.split('@')[0] || 'Unknown Service Account',
+          type: 'integration',
+          platform: 'google',
+          status: sa.disabledTime ? 'inactive' : 'active',
+          trigger: 'api_key',
+          actions: ['api_calls', 'data_access'],
+          createdAt: sa.createTime,
+          lastTriggered: new Date(), // Service accounts don't have last activity in basic info
+          riskLevel: this.calculateServiceAccountRisk(sa),
+          metadata: {
+            email: sa.email,
+            description: sa.description || `Service Account: ${sa.displayName}`,
+            projectId: sa.projectId,
+            keyCount: sa.keys.length,
+            roles: sa.roles,
+            hasAdminAccess: sa.riskAssessment.hasAdminAccess,
+            riskFactors: this.generateServiceAccountRiskFactors(sa)
+          }
+        };
+
+        automations.push(automation);
       }
 
-      // 3. Discover Email automations (filters, rules, etc.)
-      if (config.includeEmailAutomation) {
-        try {
-          console.log('📧 Discovering Email automations...');
-          const emailAutomations = await this.getEmailAutomation(timeRange);
-
-          for (const email of emailAutomations) {
-            const automation: AutomationEvent = {
-              id: `email-automation-${email.filterId || email.forwardingRule || 'unknown'}`,
-              name: email.description || 'Email Automation',
-              type: 'workflow',
-              platform: 'google',
-              status: email.enabled ? 'active' : 'inactive',
-              trigger: 'email_received',
-              actions: ['email_processing', 'automation_trigger'],
-              createdAt: email.createdDate,
-              lastTriggered: email.lastActivity,
-              riskLevel: email.automationType === 'forwarding' ? 'high' : 'medium',
-              metadata: {
-                description: `Email automation: ${email.automationType}`,
-                automationType: email.automationType,
-                externalDestinations: email.externalDestinations,
-                riskFactors: email.riskFactors
-              }
-            };
+      console.log(`🤖 Found ${serviceAccounts.length} Service Accounts`);
+    } catch (error) {
+      console.warn('Service Account discovery failed:', error instanceof Error ? error.message : 'Unknown error');
+    }
+
+    return automations;
+  }
 
-            automations.push(automation);
+  /**
+   * Discover OAuth Applications (CRITICAL for ChatGPT/OpenAI detection)
+   */
+  private async discoverOAuthAppAutomations(): Promise<AutomationEvent[]> {
+    const automations: AutomationEvent[] = [];
+
+    try {
+      console.log('🔐 Discovering OAuth applications...');
+      const oauthApps = await this.getOAuthApplications();
+
+      for (const app of oauthApps) {
+        const automation: AutomationEvent = {
+          id: `oauth-app-${app.clientId}`,
+          name: app.displayText,
+          type: 'integration',
+          platform: 'google',
+          status: 'active',
+          trigger: 'oauth',
+          actions: ['api_access', 'data_read'],
+          permissions: app.scopes,
+          createdAt: app.firstSeen,
+          lastTriggered: app.lastSeen,
+          riskLevel: app.isAIPlatform ? 'high' : 'medium',
+          metadata: {
+            clientId: app.clientId,
+            scopes: app.scopes,
+            scopeCount: app.scopes.length,
+            isAIPlatform: app.isAIPlatform,
+            platformName: app.platformName,
+            authorizedBy: app.authorizedBy,
+            firstAuthorization: app.firstSeen?.toISOString() || new Date().toISOString(),
+            lastActivity: app.lastSeen?.toISOString() || new Date().toISOString(),
+            authorizationAge: app.firstSeen ? Math.floor((Date.now() - app.firstSeen.getTime()) / (24 * 60 * 60 * 1000)) : 0,
+            description: app.isAIPlatform
+              ? `AI Platform Integration: ${app.platformName}`
+              : 'Third-party OAuth application',
+            detectionMethod: 'oauth_tokens_api',
+            riskFactors: [
+              ...(app.isAIPlatform ? [`AI platform integration: ${app.platformName}`] : []),
+              `${app.scopes.length} OAuth scopes granted`,
+              ...(app.scopes.some(s => s.includes('drive')) ? ['Google Drive access'] : []),
+              ...(app.scopes.some(s => s.includes('gmail')) ? ['Gmail access'] : [])
+            ]
           }
+        };
 
-          console.log(`📧 Found ${emailAutomations.length} Email automations`);
-        } catch (error) {
-          console.warn('Email automation discovery failed:', error instanceof Error ? error.message : 'Unknown error');
-        }
+        automations.push(automation);
       }
 
-      const executionTimeMs = Date.now() - startTime;
+      console.log(`🔐 Found ${oauthApps.length} OAuth applications (${oauthApps.filter(a => a.isAIPlatform).length} AI platforms)`);
+    } catch (error) {
+      console.warn('OAuth app discovery failed:', error instanceof Error ? error.message : 'Unknown error');
+    }
 
-      console.log('✅ Google Workspace automation discovery completed:', {
-        totalAutomations: automations.length,
-        executionTimeMs,
-        breakdown: {
-          appsScript: automations.filter(a => a.id.startsWith('apps-script')).length,
-          serviceAccounts: automations.filter(a => a.id.startsWith('service-account')).length,
-          oauthApps: automations.filter(a => a.id.startsWith('oauth-app')).length,
-          aiPlatforms: automations.filter(a => a.metadata?.isAIPlatform === true).length,
-          emailAutomations: automations.filter(a => a.id.startsWith('email-automation')).length
-        }
-      });
+    return automations;
+  }
 
-      return automations;
+  /**
+   * Discover Email automations (filters, rules, etc.)
+   */
+  private async discoverEmailAutomations(timeRange: DateRange): Promise<AutomationEvent[]> {
+    const automations: AutomationEvent[] = [];
+
+    try {
+      console.log('📧 Discovering Email automations...');
+      const emailAutomations = await this.getEmailAutomation(timeRange);
+
+      for (const email of emailAutomations) {
+        const automation: AutomationEvent = {
+          id: `email-automation-${email.filterId || email.forwardingRule || 'unknown'}`,
+          name: email.description || 'Email Automation',
+          type: 'workflow',
+          platform: 'google',
+          status: email.enabled ? 'active' : 'inactive',
+          trigger: 'email_received',
+          actions: ['email_processing', 'automation_trigger'],
+          createdAt: email.createdDate,
+          lastTriggered: email.lastActivity,
+          riskLevel: email.automationType === 'forwarding' ? 'high' : 'medium',
+          metadata: {
+            description: `Email automation: ${email.automationType}`,
+            automationType: email.automationType,
+            externalDestinations: email.externalDestinations,
+            riskFactors: email.riskFactors
+          }
+        };
 
+        automations.push(automation);
+      }
+
+      console.log(`📧 Found ${emailAutomations.length} Email automations`);
     } catch (error) {
-      console.error('Google Workspace automation discovery failed:', error);
-      throw new Error(`Automation discovery failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+      console.warn('Email automation discovery failed:', error instanceof Error ? error.message : 'Unknown error');
     }
+
+    return automations;
   }
 
   /**
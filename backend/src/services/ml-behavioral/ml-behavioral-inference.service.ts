@@ -79,6 +79,43 @@ export interface BehavioralFeatures {
   };
 }
 
+// Batch inference options
+export interface BatchInferenceOptions {
+  chunkSize?: number; // Rows scored before yielding to the event loop
+  explanationThreshold?: number; // Explanations are only generated above this risk score (0-100)
+}
+
+type BehavioralExplanation = BehavioralAnalysisResult['explanation'];
+
+const DEFAULT_BATCH_CHUNK_SIZE = 1000;
+const DEFAULT_EXPLANATION_THRESHOLD = 70;
+const NORMAL_PATTERN_SUMMARY = 'Normal behavioral pattern within organizational baseline';
+
+/**
+ * Column layout of the dense feature matrix used by analyzeBehaviorBatch.
+ * Structured (XGBoost) columns come first so they can be summed as one run,
+ * followed by the non-padding head of the LSTM event sequence.
+ */
+const FEATURE = {
+  AUTOMATION_FREQUENCY: 0,
+  PERMISSION_SCOPE: 1,
+  ACTION_COMPLEXITY: 2,
+  RISK_FACTOR_DENSITY: 3,
+  CREATED_HOUR_RISK: 4,
+  TRIGGERED_HOUR_RISK: 5,
+  CROSS_PLATFORM_ACTIVITY: 6,
+  SEQUENCE_HEAD: 7, // 3 columns: action count, event trigger, active status
+  AGE_FACTOR: 10,
+  RECENCY_FACTOR: 11,
+  WORKFLOW_CHAINS: 12, // 3 columns: ai_analysis, external_api, data_processing
+  VELOCITY_DEVIATION: 15,
+  PATTERN_DEVIATION: 16,
+  CONTEXT_DEVIATION: 17
+} as const;
+const FEATURE_COUNT = 18;
+const STRUCTURED_FEATURE_COUNT = 7;
+const SEQUENCE_HEAD_LENGTH = 3;
+
 /**
  * ML Behavioral Inference Service
  * Implements hybrid ML/DL architecture for behavioral pattern recognition
@@ -180,6 +217,171 @@ export class MLBehavioralInferenceService {
     }
   }
 
+  /**
+   * Analyze many automations in one pass
+   *
+   * Features are written into a dense Float32Array matrix (rows x features)
+   * and scored per chunk, instead of one promise per automation.
+   * Explanations are only built for rows scoring above the explanation
+   * threshold; the rest get the normal-pattern summary. Yields to the
+   * event loop between chunks. Results are returned in input order.
+   */
+  async analyzeBehaviorBatch(
+    automations: AutomationEvent[],
+    organizationContext: { organizationId: string; platform: string },
+    options: BatchInferenceOptions = {}
+  ): Promise<BehavioralAnalysisResult[]> {
+    if (!this.isInitialized) {
+      throw new Error('ML Behavioral Engine not initialized. Call initialize() first.');
+    }
+
+    const total = automations.length;
+    const chunkSize = Math.max(1, Math.floor(options.chunkSize ?? DEFAULT_BATCH_CHUNK_SIZE));
+    const explanationThreshold = options.explanationThreshold ?? DEFAULT_EXPLANATION_THRESHOLD;
+    const results = new Array<BehavioralAnalysisResult>(total);
+
+    // Buffers are sized for one chunk and reused across chunks
+    const capacity = Math.min(chunkSize, total);
+    const features = new Float32Array(capacity * FEATURE_COUNT);
+    const riskScores = new Float64Array(capacity);
+    const confidences = new Float64Array(capacity);
+    const failedRows = new Uint8Array(capacity);
+
+    for (let start = 0; start < total; start += chunkSize) {
+      if (start > 0) {
+        await new Promise(resolve => setImmediate(resolve));
+      }
+
+      const chunkStartTime = Date.now();
+      const rows = Math.min(chunkSize, total - start);
+
+      // 1. Extract behavioral features into the matrix
+      for (let row = 0; row < rows; row++) {
+        const offset = row * FEATURE_COUNT;
+        try {
+          this.writeFeatureRow(features, offset, automations[start + row]!, organizationContext);
+          failedRows[row] = 0;
+        } catch (error) {
+          console.error('ML Behavioral analysis failed:', error);
+          features.fill(0, offset, offset + FEATURE_COUNT);
+          failedRows[row] = 1;
+        }
+      }
+
+      // 2. Run hybrid ML inference over the whole chunk
+      this.scoreFeatureMatrix(features, rows, riskScores, confidences);
+
+      // 3. Assemble results, explaining only high-risk rows
+      const processingTimeMs = (Date.now() - chunkStartTime) / rows;
+      for (let row = 0; row < rows; row++) {
+        const automation = automations[start + row]!;
+
+        if (failedRows[row]) {
+          results[start + row] = this.fallbackAnalysis(automation, organizationContext);
+          continue;
+        }
+
+        const offset = row * FEATURE_COUNT;
+        const riskScore = riskScores[row]!;
+        const confidence = confidences[row]!;
+        const explanation: BehavioralExplanation = riskScore > explanationThreshold
+          ? this.buildExplanation(
+              riskScore,
+              confidence,
+              features[offset + FEATURE.AUTOMATION_FREQUENCY]!,
+              features[offset + FEATURE.CROSS_PLATFORM_ACTIVITY]!,
+              features[offset + FEATURE.VELOCITY_DEVIATION]!
+            )
+          : { primaryFactors: [], riskReasoning: '', executiveSummary: NORMAL_PATTERN_SUMMARY };
+
+        results[start + row] = {
+          automationId: automation.id,
+          organizationId: organizationContext.organizationId,
+          behavioralRiskScore: Math.round(riskScore),
+          confidence,
+          explanation,
+          modelMetadata: {
+            modelsUsed: ['xgboost', 'lstm', 'ensemble'],
+            processingTimeMs,
+            accuracy: 0.92 // Simulated high accuracy
+          },
+          timestamp: new Date()
+        };
+      }
+    }
+
+    return results;
+  }
+
+  /**
+   * Write one automation's features into a row of the batch feature matrix
+   */
+  private writeFeatureRow(
+    features: Float32Array,
+    offset: number,
+    automation: AutomationEvent,
+    context: { organizationId: string; platform: string }
+  ): void {
+    const dataPatterns = this.extractDataPatterns(automation);
+    const timeDistribution = this.analyzeTimeDistribution(automation);
+    const sequenceHead = this.extractEventSequenceHead(automation);
+    const temporalPatterns = this.extractTemporalPatterns(automation);
+    const workflowChains = this.extractWorkflowChains(automation);
+    const deviation = this.estimateBaselineDeviation();
+
+    features[offset + FEATURE.AUTOMATION_FREQUENCY] = this.calculateFrequency(automation);
+    features[offset + FEATURE.PERMISSION_SCOPE] = this.analyzePermissionScope(automation);
+    features[offset + FEATURE.ACTION_COMPLEXITY] = dataPatterns[0] ?? 0;
+    features[offset + FEATURE.RISK_FACTOR_DENSITY] = dataPatterns[1] ?? 0;
+    features[offset + FEATURE.CREATED_HOUR_RISK] = timeDistribution[0] ?? 0;
+    features[offset + FEATURE.TRIGGERED_HOUR_RISK] = timeDistribution[1] ?? 0;
+    features[offset + FEATURE.CROSS_PLATFORM_ACTIVITY] = this.assessCrossPlatformActivity(automation, context);
+    for (let i = 0; i < SEQUENCE_HEAD_LENGTH; i++) {
+      features[offset + FEATURE.SEQUENCE_HEAD + i] = sequenceHead[i] ?? 0;
+      features[offset + FEATURE.WORKFLOW_CHAINS + i] = workflowChains[i] ?? 0;
+    }
+    features[offset + FEATURE.AGE_FACTOR] = temporalPatterns[0] ?? 0;
+    features[offset + FEATURE.RECENCY_FACTOR] = temporalPatterns[1] ?? 0;
+    features[offset + FEATURE.VELOCITY_DEVIATION] = deviation.velocityDeviation;
+    features[offset + FEATURE.PATTERN_DEVIATION] = deviation.patternDeviation;
+    features[offset + FEATURE.CONTEXT_DEVIATION] = deviation.contextDeviation;
+  }
+
+  /**
+   * Matrix form of runHybridInference over the first `rows` rows
+   */
+  private scoreFeatureMatrix(
+    features: Float32Array,
+    rows: number,
+    riskScores: Float64Array,
+    confidences: Float64Array
+  ): void {
+    const { xgboostWeight, lstmWeight } = this.config.ensembleConfig;
+    const totalWeight = xgboostWeight + lstmWeight;
+    // Sequence positions past the head are padding and never count towards complexity
+    const sequenceColumns = Math.min(SEQUENCE_HEAD_LENGTH, this.config.lstmConfig.sequenceLength);
+
+    for (let row = 0, offset = 0; row < rows; row++, offset += FEATURE_COUNT) {
+      // XGBoost: sum of structured features
+      let featureSum = 0;
+      for (let col = 0; col < STRUCTURED_FEATURE_COUNT; col++) {
+        featureSum += features[offset + col]!;
+      }
+
+      // LSTM: count of non-zero sequence positions
+      let sequenceComplexity = 0;
+      for (let col = 0; col < sequenceColumns; col++) {
+        if (features[offset + FEATURE.SEQUENCE_HEAD + col]! > 0) sequenceComplexity++;
+      }
+
+      const xgboostRisk = Math.min(featureSum * 20, 100);
+      const lstmRisk = Math.min(sequenceComplexity * 15, 100);
+
+      riskScores[row] = (xgboostRisk * xgboostWeight + lstmRisk * lstmWeight) / totalWeight;
+      confidences[row] = Math.min(0.85 + Math.random() * 0.1, 0.80 + Math.random() * 0.15);
+    }
+  }
+
   /**
    * Extract behavioral features from automation event
    */
@@ -255,29 +457,44 @@ export class MLBehavioralInferenceService {
     riskReasoning: string;
     executiveSummary: string;
   }> {
+    return this.buildExplanation(
+      prediction.riskScore,
+      prediction.confidence,
+      features.structuredFeatures.automationFrequency,
+      features.structuredFeatures.crossPlatformActivity,
+      features.baselineDeviation.velocityDeviation
+    );
+  }
 
+  private buildExplanation(
+    riskScore: number,
+    confidence: number,
+    automationFrequency: number,
+    crossPlatformActivity: number,
+    velocityDeviation: number
+  ): BehavioralExplanation {
     const primaryFactors = [];
     const riskReasons = [];
 
     // Analyze structured feature contributions
-    if (features.structuredFeatures.automationFrequency > 0.8) {
+    if (automationFrequency > 0.8) {
       primaryFactors.push('High automation frequency detected');
       riskReasons.push('Automation activity exceeds typical organizational patterns');
     }
 
-    if (features.structuredFeatures.crossPlatformActivity > 0.7) {
+    if (crossPlatformActivity > 0.7) {
       primaryFactors.push('Cross-platform automation chain detected');
       riskReasons.push('Automation spans multiple platforms indicating sophisticated workflow');
     }
 
-    if (features.baselineDeviation.velocityDeviation > 0.6) {
+    if (velocityDeviation > 0.6) {
       primaryFactors.push('Velocity pattern deviation from organizational baseline');
       riskReasons.push('Activity speed patterns differ significantly from learned normal behavior');
     }
 
-    const executiveSummary = prediction.riskScore > 70
-      ? `High-risk behavioral pattern detected with ${Math.round(prediction.confidence * 100)}% confidence`
-      : `Normal behavioral pattern within organizational baseline`;
+    const executiveSummary = riskScore > 70
+      ? `High-risk behavioral pattern detected with ${Math.round(confidence * 100)}% confidence`
+      : NORMAL_PATTERN_SUMMARY;
 
     return {
       primaryFactors,
@@ -353,12 +570,7 @@ export class MLBehavioralInferenceService {
 
   private extractEventSequence(automation: AutomationEvent): number[] {
     // Extract event sequence for LSTM analysis
-    const sequence = [];
-
-    // Simulate sequence based on automation properties
-    sequence.push(automation.actions?.length || 0); // Action count
-    sequence.push(automation.trigger?.type === 'event' ? 1 : 0); // Event-driven indicator
-    sequence.push(automation.status === 'active' ? 1 : 0); // Activity status
+    const sequence = this.extractEventSequenceHead(automation);
 
     // Pad to sequence length
     while (sequence.length < this.config.lstmConfig.sequenceLength) {
@@ -368,6 +580,15 @@ export class MLBehavioralInferenceService {
     return sequence.slice(0, this.config.lstmConfig.sequenceLength);
   }
 
+  private extractEventSequenceHead(automation: AutomationEvent): number[] {
+    // Simulate sequence based on automation properties
+    return [
+      automation.actions?.length || 0, // Action count
+      automation.trigger?.type === 'event' ? 1 : 0, // Event-driven indicator
+      automation.status === 'active' ? 1 : 0 // Activity status
+    ];
+  }
+
   private extractTemporalPatterns(automation: AutomationEvent): number[] {
     // Extract temporal patterns for sequence analysis
     const patterns = [];
@@ -403,6 +624,14 @@ export class MLBehavioralInferenceService {
     contextDeviation: number;
   }> {
 
+    return this.estimateBaselineDeviation();
+  }
+
+  private estimateBaselineDeviation(): {
+    velocityDeviation: number;
+    patternDeviation: number;
+    contextDeviation: number;
+  } {
     // Simulate baseline deviation calculation
     // TODO: Implement actual organizational baseline comparison
 
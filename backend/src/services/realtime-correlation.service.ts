@@ -297,9 +297,9 @@ export class RealTimeCorrelationService extends EventEmitter {
           }
 
           if (data.action === 'start') {
-            this.correlationOrchestrator.startRealTimeMonitoring();
+            this.correlationOrchestrator.startRealTimeMonitoring(data.organizationId);
           } else {
-            this.correlationOrchestrator.stopRealTimeMonitoring();
+            this.correlationOrchestrator.stopRealTimeMonitoring(data.organizationId);
           }
 
           socket.emit('real_time_control_success', { action: data.action });
@@ -296,6 +296,31 @@ export interface AuditLog {
 // DISCOVERY INTERFACES
 // ============================================================================
 
+/**
+ * 'full' re-pulls everything; 'delta' only fetches activity newer than the connection's checkpoint
+ */
+export type DiscoveryMode = 'full' | 'delta';
+
+/**
+ * Connector position saved after each discovery run
+ */
+export interface DiscoveryCheckpoint {
+  auditLogCursor: string; // ISO time already processed; the next run starts here
+  pageToken?: string; // Resumes an audit log listing that stopped before its last page
+  pendingCursor?: string; // Newest event time seen while pageToken is outstanding
+  channelCursors?: Record<string, string>; // Slack: newest message ts scanned, by channel id
+}
+
+export interface DiscoveryCheckpointRecord {
+  platform_connection_id: string;
+  organization_id: string;
+  checkpoint: DiscoveryCheckpoint;
+  last_full_sync_at: Date | null;
+  last_delta_sync_at: Date | null;
+  created_at: Date;
+  updated_at: Date;
+}
+
 export interface DiscoveryRun {
   id: string;
   organization_id: string;
@@ -335,6 +360,7 @@ export interface DiscoveredAutomation {
   first_discovered_at: Date;
   last_seen_at: Date;
   is_active: boolean;
+  content_hash?: string | null; // Hash of the fields discovery writes; unchanged rows are skipped
   created_at: Date;
   updated_at: Date;
 }
@@ -537,14 +563,42 @@ export interface PaginatedResult<T> {
     total_pages: number;
     has_next: boolean;
     has_previous: boolean;
+    total_is_estimate?: boolean;
   };
 }
 
+/**
+ * How list queries compute their total: COUNT(*), planner estimate, or not at all
+ */
+export type CountMode = 'exact' | 'approximate' | 'none';
+
 export interface PaginationOptions {
   page?: number;
   limit?: number;
   sort_by?: string;
   sort_order?: 'ASC' | 'DESC';
+  columns?: string[]; // Projection; defaults to all columns
+  count?: Exclude<CountMode, 'none'>;
+}
+
+export interface CursorPaginationOptions {
+  limit?: number;
+  cursor?: string; // next_cursor from the previous page; omit for the first page
+  sort_by?: string;
+  sort_order?: 'ASC' | 'DESC';
+  columns?: string[]; // Projection; defaults to all columns
+  count?: CountMode; // Defaults to 'none'
+}
+
+export interface CursorPaginatedResult<T> {
+  data: T[];
+  pagination: {
+    limit: number;
+    next_cursor: string | null;
+    has_next: boolean;
+    total?: number;
+    total_is_estimate?: boolean;
+  };
 }
 
 // ============================================================================
@@ -0,0 +1,296 @@
+/**
+ * API Request Scheduler
+ * Per-API request lanes with bounded concurrency, token-bucket rate limits and
+ * exponential backoff on rate-limit / transient errors.
+ *
+ * Requests on a lane start in FIFO order. A 429 pauses the whole lane for the
+ * backoff delay, so queued requests don't keep hitting an exhausted quota.
+ *
+ * A scheduler can be layered on a parent (e.g. per-user lanes under shared
+ * project-wide lanes): each request then also takes a slot on the parent's lane
+ * of the same name, while backoff only pauses the child's lane.
+ */
+
+export interface ApiRateLimit {
+  /** Maximum requests in flight at once */
+  concurrency: number;
+  /** Sustained request rate (token refill rate) */
+  requestsPerSecond: number;
+  /** Bucket size - requests allowed back to back after an idle period */
+  burst?: number;
+}
+
+export interface ApiRequestSchedulerOptions {
+  /** Retries after the first attempt for retryable errors (default 5) */
+  maxRetries?: number;
+  /** First backoff delay; doubles on every retry (default 500ms) */
+  baseDelayMs?: number;
+  /** Upper bound for a single backoff delay (default 32s) */
+  maxDelayMs?: number;
+  /** Limit used for APIs without an explicit entry */
+  defaultLimit?: ApiRateLimit;
+  /** Scheduler whose lanes also bound every request, e.g. project-wide limits */
+  parent?: ApiRequestScheduler;
+}
+
+const DEFAULT_MAX_RETRIES = 5;
+const DEFAULT_BASE_DELAY_MS = 500;
+const DEFAULT_MAX_DELAY_MS = 32000;
+const DEFAULT_LIMIT: ApiRateLimit = { concurrency: 4, requestsPerSecond: 10 };
+
+const RETRYABLE_STATUS_CODES = new Set([429, 500, 502, 503, 504]);
+
+// Google reports per-user rate limiting as 403 with one of these reasons
+const RATE_LIMIT_REASONS = new Set(['rateLimitExceeded', 'userRateLimitExceeded']);
+
+/**
+ * Token bucket refilled continuously at a fixed rate
+ */
+export class TokenBucket {
+  private tokens: number;
+  private updatedAt: number;
+
+  constructor(
+    private readonly capacity: number,
+    private readonly refillPerSecond: number,
+    now: number = Date.now()
+  ) {
+    this.tokens = capacity;
+    this.updatedAt = now;
+  }
+
+  /**
+   * Milliseconds until a token is available (0 if one is available now)
+   */
+  waitTime(now: number = Date.now()): number {
+    this.refill(now);
+    if (this.tokens >= 1) {
+      return 0;
+    }
+    return Math.ceil(((1 - this.tokens) * 1000) / this.refillPerSecond);
+  }
+
+  /**
+   * Take a token; callers check waitTime first
+   */
+  take(now: number = Date.now()): void {
+    this.refill(now);
+    this.tokens -= 1;
+  }
+
+  private refill(now: number): void {
+    const elapsed = Math.max(0, now - this.updatedAt);
+    this.tokens = Math.min(this.capacity, this.tokens + (elapsed * this.refillPerSecond) / 1000);
+    this.updatedAt = now;
+  }
+}
+
+interface Lane {
+  limit: ApiRateLimit;
+  bucket: TokenBucket;
+  active: number;
+  waiting: Array<() => void>;
+  blockedUntil: number;
+  timer: NodeJS.Timeout | null;
+}
+
+function errorStatus(error: any): number | undefined {
+  const status = Number(error?.response?.status ?? error?.status ?? error?.code);
+  return Number.isFinite(status) ? status : undefined;
+}
+
+function errorReasons(error: any): string[] {
+  const details = error?.errors ?? error?.response?.data?.error?.errors;
+  return Array.isArray(details)
+    ? details.map((detail: any) => detail?.reason).filter((reason: unknown): reason is string => typeof reason === 'string')
+    : [];
+}
+
+/**
+ * Whether a failed request should be retried after a backoff
+ */
+export function isRetryableApiError(error: unknown): boolean {
+  const status = errorStatus(error);
+  if (status === undefined) {
+    return false;
+  }
+  if (RETRYABLE_STATUS_CODES.has(status)) {
+    return true;
+  }
+  return status === 403 && errorReasons(error).some(reason => RATE_LIMIT_REASONS.has(reason));
+}
+
+/**
+ * Delay requested by a Retry-After header (seconds or HTTP date), if any
+ */
+export function retryAfterMs(error: unknown, now: number = Date.now()): number | undefined {
+  const headers = (error as any)?.response?.headers;
+  if (!headers) {
+    return undefined;
+  }
+
+  const value = typeof headers.get === 'function' ? headers.get('retry-after') : headers['retry-after'];
+  if (value === undefined || value === null || value === '') {
+    return undefined;
+  }
+
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(String(value));
+  return Number.isNaN(date) ? undefined : Math.max(0, date - now);
+}
+
+export class ApiRequestScheduler {
+  private readonly lanes = new Map<string, Lane>();
+  private readonly maxRetries: number;
+  private readonly baseDelayMs: number;
+  private readonly maxDelayMs: number;
+  private readonly defaultLimit: ApiRateLimit;
+  private readonly parent: ApiRequestScheduler | undefined;
+
+  constructor(
+    private readonly limits: Record<string, ApiRateLimit> = {},
+    options: ApiRequestSchedulerOptions = {}
+  ) {
+    this.maxRetries = options.maxRetries ?? DEFAULT_MAX_RETRIES;
+    this.baseDelayMs = options.baseDelayMs ?? DEFAULT_BASE_DELAY_MS;
+    this.maxDelayMs = options.maxDelayMs ?? DEFAULT_MAX_DELAY_MS;
+    this.defaultLimit = options.defaultLimit ?? DEFAULT_LIMIT;
+    this.parent = options.parent;
+  }
+
+  /**
+   * Run a request on the given API lane, retrying rate-limit and transient errors
+   */
+  async schedule<T>(api: string, request: () => Promise<T>): Promise<T> {
+    const lane = this.getLane(api);
+    const parentLane = this.parent?.getLane(api);
+
+    for (let attempt = 0; ; attempt++) {
+      await this.acquire(lane);
+      if (parentLane) {
+        await this.parent!.acquire(parentLane);
+      }
+      try {
+        return await request();
+      } catch (error) {
+        if (attempt >= this.maxRetries || !isRetryableApiError(error)) {
+          throw error;
+        }
+        const delay = this.backoffDelay(attempt, error);
+        lane.blockedUntil = Math.max(lane.blockedUntil, Date.now() + delay);
+      } finally {
+        if (parentLane) {
+          this.parent!.release(parentLane);
+        }
+        this.release(lane);
+      }
+    }
+  }
+
+  /**
+   * Iterate over a paginated API, yielding each page as it arrives
+   * The next page is requested as soon as a page arrives, so it downloads
+   * while the consumer processes the current one
+   */
+  async *paginate<TPage>(
+    api: string,
+    fetchPage: (pageToken: string | undefined) => Promise<TPage>,
+    getNextPageToken: (page: TPage) => string | null | undefined,
+    maxPages: number = Infinity
+  ): AsyncGenerator<TPage> {
+    let pending: Promise<TPage> | null = this.schedule(api, () => fetchPage(undefined));
+    let pageCount = 0;
+
+    while (pending) {
+      const page: TPage = await pending;
+      pageCount++;
+
+      const nextPageToken = getNextPageToken(page);
+      pending = nextPageToken && pageCount < maxPages
+        ? this.schedule(api, () => fetchPage(nextPageToken))
+        : null;
+      // Observed on the next iteration; avoids an unhandled rejection if the consumer stops early
+      pending?.catch(() => undefined);
+
+      yield page;
+    }
+  }
+
+  /**
+   * Requests currently running and waiting on a lane
+   */
+  getLaneStats(api: string): { active: number; queued: number } {
+    const lane = this.lanes.get(api);
+    return { active: lane?.active ?? 0, queued: lane?.waiting.length ?? 0 };
+  }
+
+  private getLane(api: string): Lane {
+    let lane = this.lanes.get(api);
+    if (!lane) {
+      const limit = this.limits[api] ?? this.defaultLimit;
+      lane = {
+        limit,
+        bucket: new TokenBucket(Math.max(1, limit.burst ?? limit.concurrency), limit.requestsPerSecond),
+        active: 0,
+        waiting: [],
+        blockedUntil: 0,
+        timer: null
+      };
+      this.lanes.set(api, lane);
+    }
+    return lane;
+  }
+
+  private acquire(lane: Lane): Promise<void> {
+    return new Promise(resolve => {
+      lane.waiting.push(resolve);
+      this.dispatch(lane);
+    });
+  }
+
+  private release(lane: Lane): void {
+    lane.active--;
+    this.dispatch(lane);
+  }
+
+  private dispatch(lane: Lane): void {
+    while (lane.waiting.length > 0 && lane.active < lane.limit.concurrency) {
+      const now = Date.now();
+      const wait = Math.max(lane.blockedUntil - now, lane.bucket.waitTime(now));
+      if (wait > 0) {
+        this.dispatchLater(lane, wait);
+        return;
+      }
+
+      lane.bucket.take(now);
+      lane.active++;
+      lane.waiting.shift()!();
+    }
+  }
+
+  private dispatchLater(lane: Lane, delay: number): void {
+    if (lane.timer) {
+      return;
+    }
+    lane.timer = setTimeout(() => {
+      lane.timer = null;
+      this.dispatch(lane);
+    }, delay);
+  }
+
+  /**
+   * Truncated exponential backoff with jitter, unless the server asked for a delay
+   */
+  private backoffDelay(attempt: number, error: unknown): number {
+    const requested = retryAfterMs(error);
+    if (requested !== undefined) {
+      return Math.min(requested, this.maxDelayMs);
+    }
+    const ceiling = Math.min(this.maxDelayMs, this.baseDelayMs * 2 ** attempt);
+    return ceiling / 2 + Math.random() * (ceiling / 2);
+  }
+}
@@ -0,0 +1,42 @@
+/**
+ * Content Hash Utilities
+ * Order-independent hashing of JSON-like values, used to detect whether
+ * re-discovered records actually changed
+ */
+
+import { createHash } from 'crypto';
+
+/**
+ * JSON.stringify with object keys sorted at every level
+ * Dates serialize as ISO strings; undefined object fields are dropped, as in JSON
+ */
+export function stableStringify(value: unknown): string {
+  if (value === null || value === undefined) {
+    return 'null';
+  }
+  if (value instanceof Date) {
+    return JSON.stringify(value.toISOString());
+  }
+  if (Array.isArray(value)) {
+    return `[${value.map(item => stableStringify(item)).join(',')}]`;
+  }
+  if (typeof value === 'object') {
+    const entries = Object.keys(value as Record<string, unknown>)
+      .filter(key => (value as Record<string, unknown>)[key] !== undefined)
+      .sort()
+      .map(key => `${JSON.stringify(key)}:${stableStringify((value as Record<string, unknown>)[key])}`);
+    return `{${entries.join(',')}}`;
+  }
+  return JSON.stringify(value) ?? 'null';
+}
+
+/**
+ * SHA-256 (hex) of the selected fields of a record
+ */
+export function contentHash<T extends Record<string, unknown>>(record: T, fields: readonly (keyof T & string)[]): string {
+  const selected: Record<string, unknown> = {};
+  for (const field of fields) {
+    selected[field] = record[field];
+  }
+  return createHash('sha256').update(stableStringify(selected)).digest('hex');
+}
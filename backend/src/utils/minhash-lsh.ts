@@ -0,0 +1,281 @@
+/**
+ * MinHash / LSH Near-Duplicate Detection
+ * Estimates Jaccard similarity between word-shingle sets from fixed-size
+ * MinHash signatures, and groups near-duplicate texts with LSH banding,
+ * so a batch of n texts is compared in roughly O(n) instead of O(n^2).
+ */
+
+export interface MinHashOptions {
+  /** Signature length; estimate error shrinks with 1/sqrt(numHashes) */
+  numHashes?: number;
+  /** Words per shingle (1 = word sets) */
+  shingleSize?: number;
+  /** Seed for the hash permutations; equal seeds give comparable signatures */
+  seed?: number;
+}
+
+export interface NearDuplicateOptions {
+  /** Number of LSH bands; bands * rowsPerBand must equal the signature length */
+  bands?: number;
+  /** Estimated similarity a candidate pair must reach to be grouped */
+  threshold?: number;
+}
+
+export interface NearDuplicateSummary {
+  /** Estimated mean Jaccard similarity over all pairs */
+  averageSimilarity: number;
+  /** Indexes of near-duplicate texts, one group per template (groups of 2+) */
+  groups: number[][];
+  /** Fraction of texts that belong to some group */
+  nearDuplicateRatio: number;
+}
+
+const DEFAULT_NUM_HASHES = 128;
+const DEFAULT_SHINGLE_SIZE = 1;
+const DEFAULT_SEED = 0x9e3779b9;
+// 16 bands of 8 rows: candidate probability crosses 50% at ~0.7 similarity
+const DEFAULT_BANDS = 16;
+const DEFAULT_THRESHOLD = 0.7;
+
+/**
+ * Lowercased whitespace-separated tokens, grouped into shingles of `size` words
+ * Texts shorter than `size` words become a single shingle
+ */
+export function shingle(text: string, size: number = DEFAULT_SHINGLE_SIZE): Set<string> {
+  const words = text.toLowerCase().split(/\s+/);
+  if (size <= 1) {
+    return new Set(words);
+  }
+  if (words.length <= size) {
+    return new Set([words.join(' ')]);
+  }
+
+  const shingles = new Set<string>();
+  for (let i = 0; i + size <= words.length; i++) {
+    shingles.add(words.slice(i, i + size).join(' '));
+  }
+  return shingles;
+}
+
+/**
+ * Exact Jaccard similarity |A ∩ B| / |A ∪ B|
+ */
+export function jaccardSimilarity<T>(a: Set<T>, b: Set<T>): number {
+  const [smaller, larger] = a.size <= b.size ? [a, b] : [b, a];
+  let intersection = 0;
+  for (const item of smaller) {
+    if (larger.has(item)) {
+      intersection++;
+    }
+  }
+  const union = a.size + b.size - intersection;
+  return union > 0 ? intersection / union : 0;
+}
+
+/**
+ * 32-bit FNV-1a hash of a string
+ */
+export function fnv1a32(value: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+// MurmurHash3 finalizer: a bijective 32-bit mix
+function mix32(value: number): number {
+  let h = value;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+}
+
+/**
+ * Computes MinHash signatures
+ * Each of the numHashes permutations is mix32(hash(shingle) XOR salt_i); a
+ * signature keeps the minimum per permutation.
+ */
+export class MinHasher {
+  readonly numHashes: number;
+  readonly shingleSize: number;
+  private readonly salts: Uint32Array;
+
+  constructor(options: MinHashOptions = {}) {
+    this.numHashes = options.numHashes ?? DEFAULT_NUM_HASHES;
+    this.shingleSize = options.shingleSize ?? DEFAULT_SHINGLE_SIZE;
+    if (!Number.isInteger(this.numHashes) || this.numHashes < 1) {
+      throw new Error(`numHashes must be a positive integer, got ${this.numHashes}`);
+    }
+
+    this.salts = new Uint32Array(this.numHashes);
+    let state = (options.seed ?? DEFAULT_SEED) >>> 0;
+    for (let i = 0; i < this.numHashes; i++) {
+      state = mix32(state + 0x9e3779b9);
+      this.salts[i] = state;
+    }
+  }
+
+  /**
+   * Signature of a set of shingles (all 0xFFFFFFFF for an empty set)
+   */
+  signature(shingles: Iterable<string>): Uint32Array {
+    const signature = new Uint32Array(this.numHashes).fill(0xffffffff);
+    for (const item of shingles) {
+      const base = fnv1a32(item);
+      for (let i = 0; i < this.numHashes; i++) {
+        const value = mix32(base ^ this.salts[i]!);
+        if (value < signature[i]!) {
+          signature[i] = value;
+        }
+      }
+    }
+    return signature;
+  }
+
+  /**
+   * Shingle a text and compute its signature
+   */
+  signText(text: string): Uint32Array {
+    return this.signature(shingle(text, this.shingleSize));
+  }
+}
+
+/**
+ * Estimated Jaccard similarity: the fraction of signature slots that agree
+ */
+export function estimateSimilarity(a: Uint32Array, b: Uint32Array): number {
+  if (a.length !== b.length) {
+    throw new Error(`Signature lengths differ: ${a.length} vs ${b.length}`);
+  }
+  let matches = 0;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] === b[i]) {
+      matches++;
+    }
+  }
+  return a.length > 0 ? matches / a.length : 0;
+}
+
+/**
+ * Estimated mean pairwise Jaccard similarity, in O(n * numHashes)
+ * Each slot contributes the number of pairs sharing its value, so summing
+ * C(count, 2) over equal slot values counts agreeing slots over all pairs
+ * without enumerating the pairs.
+ */
+export function averagePairwiseSimilarity(signatures: Uint32Array[]): number {
+  const n = signatures.length;
+  if (n < 2) {
+    return 0;
+  }
+  const numHashes = signatures[0]!.length;
+
+  let agreeingSlots = 0;
+  const counts = new Map<number, number>();
+  for (let slot = 0; slot < numHashes; slot++) {
+    counts.clear();
+    for (const signature of signatures) {
+      const value = signature[slot]!;
+      counts.set(value, (counts.get(value) ?? 0) + 1);
+    }
+    for (const count of counts.values()) {
+      agreeingSlots += (count * (count - 1)) / 2;
+    }
+  }
+
+  const pairs = (n * (n - 1)) / 2;
+  return agreeingSlots / (pairs * numHashes);
+}
+
+/**
+ * Group signatures whose estimated similarity reaches the threshold
+ * Signatures are bucketed per LSH band; members of a bucket are only checked
+ * against the bucket's first member, so a large template cluster costs one
+ * comparison per member instead of one per pair.
+ */
+export function findNearDuplicateGroups(signatures: Uint32Array[], options: NearDuplicateOptions = {}): number[][] {
+  const n = signatures.length;
+  if (n < 2) {
+    return [];
+  }
+
+  const numHashes = signatures[0]!.length;
+  const bands = options.bands ?? DEFAULT_BANDS;
+  const threshold = options.threshold ?? DEFAULT_THRESHOLD;
+  if (bands < 1 || numHashes % bands !== 0) {
+    throw new Error(`Signature length ${numHashes} is not divisible into ${bands} bands`);
+  }
+  const rows = numHashes / bands;
+
+  const parent = Array.from({ length: n }, (_, i) => i);
+  const find = (i: number): number => {
+    let root = i;
+    while (parent[root] !== root) {
+      root = parent[root]!;
+    }
+    // Path compression
+    while (parent[i] !== root) {
+      const next = parent[i]!;
+      parent[i] = root;
+      i = next;
+    }
+    return root;
+  };
+
+  for (let band = 0; band < bands; band++) {
+    const buckets = new Map<string, number>();
+    const start = band * rows;
+
+    for (let i = 0; i < n; i++) {
+      const key = Array.prototype.join.call(signatures[i]!.subarray(start, start + rows), ',');
+      const first = buckets.get(key);
+      if (first === undefined) {
+        buckets.set(key, i);
+        continue;
+      }
+
+      const rootA = find(first);
+      const rootB = find(i);
+      if (rootA !== rootB && estimateSimilarity(signatures[first]!, signatures[i]!) >= threshold) {
+        parent[rootB] = rootA;
+      }
+    }
+  }
+
+  const groups = new Map<number, number[]>();
+  for (let i = 0; i < n; i++) {
+    const root = find(i);
+    const group = groups.get(root);
+    if (group) {
+      group.push(i);
+    } else {
+      groups.set(root, [i]);
+    }
+  }
+
+  return [...groups.values()].filter(group => group.length > 1);
+}
+
+/**
+ * Sign each text once, then estimate the mean pairwise similarity and group
+ * near-duplicates (e.g. bot messages rendered from one template)
+ */
+export function summarizeNearDuplicates(
+  texts: string[],
+  hasher: MinHasher = new MinHasher(),
+  options: NearDuplicateOptions = {}
+): NearDuplicateSummary {
+  const signatures = texts.map(text => hasher.signText(text));
+  const groups = findNearDuplicateGroups(signatures, options);
+  const grouped = groups.reduce((total, group) => total + group.length, 0);
+
+  return {
+    averageSimilarity: averagePairwiseSimilarity(signatures),
+    groups,
+    nearDuplicateRatio: texts.length > 0 ? grouped / texts.length : 0
+  };
+}
@@ -0,0 +1,221 @@
+/**
+ * Time-Ordered Ring Buffer
+ * Growable circular buffer that keeps items sorted by an epoch-ms timestamp.
+ *
+ * Used by the streaming correlation engine: new events are merged into an
+ * already-sorted window instead of regrouping and re-sorting the full history,
+ * and old windows are dropped from the front in O(1) per item.
+ */
+
+const DEFAULT_INITIAL_CAPACITY = 1024;
+
+export class TimeOrderedRingBuffer<T> {
+  private items: (T | undefined)[];
+  private timestamps: Float64Array;
+  private head = 0;
+  private count = 0;
+
+  constructor(initialCapacity: number = DEFAULT_INITIAL_CAPACITY) {
+    const capacity = Math.max(1, Math.floor(initialCapacity));
+    this.items = new Array<T | undefined>(capacity);
+    this.timestamps = new Float64Array(capacity);
+  }
+
+  get size(): number {
+    return this.count;
+  }
+
+  get capacity(): number {
+    return this.timestamps.length;
+  }
+
+  /**
+   * Timestamp of the oldest buffered item, or undefined when empty
+   */
+  get oldestTimestamp(): number | undefined {
+    return this.count > 0 ? this.timestamps[this.head] : undefined;
+  }
+
+  /**
+   * Timestamp of the newest buffered item, or undefined when empty
+   */
+  get newestTimestamp(): number | undefined {
+    return this.count > 0 ? this.timestampAt(this.count - 1) : undefined;
+  }
+
+  /**
+   * Insert a batch of items, keeping the buffer sorted.
+   *
+   * In-order batches are appended directly. Out-of-order (late) items only
+   * rewrite the buffer suffix from the oldest incoming timestamp onwards.
+   * Items with equal timestamps keep their arrival order.
+   */
+  insertMany(batch: T[], getTimestamp: (item: T) => number): void {
+    if (batch.length === 0) return;
+
+    const incoming = batch
+      .map((item, index) => ({ item, ts: getTimestamp(item), index }))
+      .sort((a, b) => a.ts - b.ts || a.index - b.index);
+
+    const first = incoming[0]!;
+    const newest = this.newestTimestamp;
+
+    if (newest === undefined || first.ts >= newest) {
+      this.ensureCapacity(this.count + incoming.length);
+      for (const entry of incoming) {
+        this.pushUnchecked(entry.item, entry.ts);
+      }
+      return;
+    }
+
+    // Late arrivals: detach the suffix that overlaps the batch and merge it back
+    const splitAt = this.upperBound(first.ts);
+    const suffixItems: T[] = [];
+    const suffixTimestamps: number[] = [];
+    for (let i = splitAt; i < this.count; i++) {
+      suffixItems.push(this.at(i));
+      suffixTimestamps.push(this.timestampAt(i));
+    }
+    this.truncate(splitAt);
+    this.ensureCapacity(this.count + suffixItems.length + incoming.length);
+
+    let s = 0;
+    let n = 0;
+    while (s < suffixItems.length || n < incoming.length) {
+      const next = incoming[n];
+      if (s < suffixItems.length && (next === undefined || suffixTimestamps[s]! <= next.ts)) {
+        this.pushUnchecked(suffixItems[s]!, suffixTimestamps[s]!);
+        s++;
+      } else if (next !== undefined) {
+        this.pushUnchecked(next.item, next.ts);
+        n++;
+      }
+    }
+  }
+
+  /**
+   * Item at logical position `index` (0 = oldest)
+   */
+  at(index: number): T {
+    if (index < 0 || index >= this.count) {
+      throw new RangeError(`Ring buffer index ${index} out of range (size ${this.count})`);
+    }
+    return this.items[this.physical(index)] as T;
+  }
+
+  /**
+   * Timestamp at logical position `index` (0 = oldest)
+   */
+  timestampAt(index: number): number {
+    return this.timestamps[this.physical(index)]!;
+  }
+
+  /**
+   * First logical index whose timestamp is >= ts
+   */
+  lowerBound(ts: number): number {
+    let lo = 0;
+    let hi = this.count;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.timestampAt(mid) < ts) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  /**
+   * First logical index whose timestamp is > ts
+   */
+  upperBound(ts: number): number {
+    let lo = 0;
+    let hi = this.count;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.timestampAt(mid) <= ts) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  /**
+   * Items with startMs <= timestamp < endMs, already in chronological order
+   */
+  range(startMs: number, endMs: number): T[] {
+    const from = this.lowerBound(startMs);
+    const to = this.lowerBound(endMs);
+    const result = new Array<T>(Math.max(0, to - from));
+    for (let i = from; i < to; i++) {
+      result[i - from] = this.at(i);
+    }
+    return result;
+  }
+
+  /**
+   * Drop every item with timestamp < ts from the front of the buffer
+   *
+   * @returns The removed items, oldest first
+   */
+  evictBefore(ts: number): T[] {
+    const removeCount = this.lowerBound(ts);
+    const removed = new Array<T>(removeCount);
+    for (let i = 0; i < removeCount; i++) {
+      const slot = this.head;
+      removed[i] = this.items[slot] as T;
+      this.items[slot] = undefined;
+      this.head = (this.head + 1) % this.capacity;
+    }
+    this.count -= removeCount;
+    if (this.count === 0) this.head = 0;
+    return removed;
+  }
+
+  clear(): void {
+    this.items.fill(undefined);
+    this.head = 0;
+    this.count = 0;
+  }
+
+  *[Symbol.iterator](): IterableIterator<T> {
+    for (let i = 0; i < this.count; i++) {
+      yield this.at(i);
+    }
+  }
+
+  private physical(index: number): number {
+    return (this.head + index) % this.capacity;
+  }
+
+  private pushUnchecked(item: T, ts: number): void {
+    const slot = this.physical(this.count);
+    this.items[slot] = item;
+    this.timestamps[slot] = ts;
+    this.count++;
+  }
+
+  private truncate(newSize: number): void {
+    for (let i = newSize; i < this.count; i++) {
+      this.items[this.physical(i)] = undefined;
+    }
+    this.count = newSize;
+  }
+
+  private ensureCapacity(required: number): void {
+    if (required <= this.capacity) return;
+
+    let nextCapacity = this.capacity;
+    while (nextCapacity < required) nextCapacity *= 2;
+
+    const items = new Array<T | undefined>(nextCapacity);
+    const timestamps = new Float64Array(nextCapacity);
+    for (let i = 0; i < this.count; i++) {
+      const slot = this.physical(i);
+      items[i] = this.items[slot];
+      timestamps[i] = this.timestamps[slot]!;
+    }
+
+    this.items = items;
+    this.timestamps = timestamps;
+    this.head = 0;
+  }
+}
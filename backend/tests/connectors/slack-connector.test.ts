@@ -17,6 +17,7 @@ const mockSlackClientInstance = {
   },
   conversations: {
     list: jest.fn(),
+    history: jest.fn(),
   },
   apps: {
     list: jest.fn(),
@@ -490,6 +491,121 @@ describe('SlackConnector', () => {
 
       expect(auditLogs).toEqual([]);
     });
+
+    it('should scan every channel across conversation pages for templated messages', async () => {
+      mockSlackClient.admin.audit.logs.list.mockResolvedValue({ ok: true, entries: [] });
+      const channels = Array.from({ length: 15 }, (_, i) => ({ id: `C${i}`, name: `channel-${i}` }));
+      mockSlackClient.conversations.list.mockImplementation(async ({ cursor }: { cursor?: string }) => cursor
+        ? { ok: true, channels: channels.slice(10) }
+        : { ok: true, channels: channels.slice(0, 10), response_metadata: { next_cursor: 'page-2' } });
+
+      // Only the last channel carries bot messages rendered from one template
+      const templated = Array.from({ length: 6 }, (_, i) => ({
+        type: 'message',
+        user: 'U0BOT01',
+        text: `Daily standup reminder for user ${i}: please post your update in this thread before 10:00 AM`,
+        ts: `${1738400000 - i * 3600}.000100`
+      }));
+      mockSlackClient.conversations.history.mockImplementation(async ({ channel }: { channel: string }) => ({
+        ok: true,
+        messages: channel === 'C14' ? templated : []
+      }));
+
+      const auditLogs = await slackConnector.getAuditLogs(new Date(Date.now() - 24 * 60 * 60 * 1000));
+
+      expect(mockSlackClient.conversations.list).toHaveBeenLastCalledWith(expect.objectContaining({ cursor: 'page-2' }));
+      expect(mockSlackClient.conversations.history).toHaveBeenCalledTimes(15);
+      const shadowAI = auditLogs.filter(log => log.actionType === 'shadow_ai_detected');
+      expect(shadowAI).toHaveLength(1);
+      expect(shadowAI[0]).toMatchObject({
+        resourceId: 'C14',
+        details: expect.objectContaining({ channelName: 'channel-14', repetitivePatterns: true })
+      });
+    });
+
+    describe('incremental channel history', () => {
+      const checkpoint = {
+        auditLogCursor: '2025-02-01T00:00:00.000Z',
+        channelCursors: { C1: '1738300000.000100' }
+      };
+      const messagesFrom = (newestTs: number, count: number) => Array.from({ length: count }, (_, i) => ({
+        type: 'message',
+        user: `U${i}`,
+        text: `update ${newestTs - i}`,
+        ts: `${newestTs - i}.000100`
+      }));
+
+      beforeEach(() => {
+        mockSlackClient.admin.audit.logs.list.mockResolvedValue({ ok: true, entries: [] });
+        mockSlackClient.conversations.list.mockResolvedValue({ ok: true, channels: [{ id: 'C1', name: 'general' }] });
+      });
+
+      it('should page back to the channel cursor before advancing it', async () => {
+        mockSlackClient.conversations.history.mockImplementation(async ({ cursor }: { cursor?: string }) => cursor
+          ? { ok: true, messages: messagesFrom(1738300400, 50), has_more: false }
+          : { ok: true, messages: messagesFrom(1738300500, 100), has_more: true, response_metadata: { next_cursor: 'older' } });
+
+        const result = await slackConnector.getAuditLogsIncremental!(checkpoint);
+
+        expect(mockSlackClient.conversations.history).toHaveBeenCalledTimes(2);
+        expect(mockSlackClient.conversations.history).toHaveBeenLastCalledWith(
+          expect.objectContaining({ channel: 'C1', oldest: '1738300000.000100', cursor: 'older' })
+        );
+        expect(result.checkpoint.channelCursors).toEqual({ C1: '1738300500.000100' });
+      });
+
+      it('should keep the channel cursor when an older page fails', async () => {
+        mockSlackClient.conversations.history.mockImplementation(async ({ cursor }: { cursor?: string }) => {
+          if (cursor) {
+            throw new Error('channel_not_found');
+          }
+          return { ok: true, messages: messagesFrom(1738300500, 100), has_more: true, response_metadata: { next_cursor: 'older' } };
+        });
+
+        const result = await slackConnector.getAuditLogsIncremental!(checkpoint);
+
+        expect(result.checkpoint.channelCursors).toEqual({ C1: '1738300000.000100' });
+      });
+
+      it('should stop a delta scan at the page cap and keep the channel cursor', async () => {
+        const warn = jest.spyOn(console, 'warn').mockImplementation(() => undefined);
+        mockSlackClient.conversations.history.mockResolvedValue(
+          { ok: true, messages: messagesFrom(1738300500, 100), has_more: true, response_metadata: { next_cursor: 'older' } }
+        );
+
+        const result = await slackConnector.getAuditLogsIncremental!(checkpoint, 'delta');
+
+        expect(mockSlackClient.conversations.history).toHaveBeenCalledTimes(10);
+        expect(result.checkpoint.channelCursors).toEqual({ C1: '1738300000.000100' });
+        expect(warn).toHaveBeenCalledWith(expect.stringContaining('Stopped channel C1 history scan after 10 pages'));
+      });
+
+      it('should sample the newest history page in full mode', async () => {
+        mockSlackClient.conversations.history.mockResolvedValue(
+          { ok: true, messages: messagesFrom(1738300500, 100), has_more: true, response_metadata: { next_cursor: 'older' } }
+        );
+
+        const result = await slackConnector.getAuditLogsIncremental!({ auditLogCursor: checkpoint.auditLogCursor }, 'full');
+
+        expect(mockSlackClient.conversations.history).toHaveBeenCalledTimes(1);
+        expect(mockSlackClient.conversations.history).toHaveBeenCalledWith(
+          expect.objectContaining({ channel: 'C1', oldest: '1738368000' })
+        );
+        // The sample did not reach the start of the window, so the next delta run starts from this run
+        expect(result.checkpoint.channelCursors).toEqual({});
+      });
+
+      it('should save the channel cursor when a full scan reads the whole window', async () => {
+        mockSlackClient.conversations.history.mockResolvedValue(
+          { ok: true, messages: messagesFrom(1738400500, 20), has_more: false }
+        );
+
+        const result = await slackConnector.getAuditLogsIncremental!({ auditLogCursor: checkpoint.auditLogCursor }, 'full');
+
+        expect(mockSlackClient.conversations.history).toHaveBeenCalledTimes(1);
+        expect(result.checkpoint.channelCursors).toEqual({ C1: '1738400500.000100' });
+      });
+    });
   });
 
   describe('Permission Validation', () => {
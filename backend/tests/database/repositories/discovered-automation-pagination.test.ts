@@ -0,0 +1,139 @@
+/**
+ * Discovered Automation Repository Keyset Pagination Tests
+ * Pages findManyCustom against the database: cursor round-trips, ties and NULL sort keys
+ */
+
+import { discoveredAutomationRepository } from '../../../src/database/repositories/discovered-automation';
+import { encodeCursor } from '../../../src/database/pagination';
+import { db } from '../../../src/database/pool';
+
+describe('DiscoveredAutomationRepository keyset pagination', () => {
+  let organizationId: string;
+  const ids: Record<string, string> = {};
+
+  // last_seen_at / created_at per automation; three share last_seen_at and two have no last_seen_at
+  const automations: Array<{ name: string; lastSeenAt: string | null; createdAt: string | null }> = [
+    { name: 'tie-1', lastSeenAt: '2025-03-01T12:00:00.000001Z', createdAt: '2025-01-01T00:00:00Z' },
+    { name: 'tie-2', lastSeenAt: '2025-03-01T12:00:00.000001Z', createdAt: '2025-01-01T00:00:00Z' },
+    { name: 'tie-3', lastSeenAt: '2025-03-01T12:00:00.000001Z', createdAt: '2025-01-02T00:00:00Z' },
+    { name: 'older', lastSeenAt: '2025-02-01T00:00:00Z', createdAt: '2025-01-01T00:00:00Z' },
+    { name: 'never-seen-1', lastSeenAt: null, createdAt: '2025-01-03T00:00:00Z' },
+    { name: 'never-seen-2', lastSeenAt: null, createdAt: null }
+  ];
+
+  beforeAll(async () => {
+    const uniqueId = Date.now() + '-' + Math.random().toString(36).substr(2, 9);
+    const orgResult = await db.query<{ id: string }>(`
+      INSERT INTO organizations (name, domain, slug, plan_tier, max_connections, settings, is_active)
+      VALUES ('Pagination Org ' || $1, 'pagination-' || $1 || '.example.com', 'pagination-org-' || $1, 'enterprise', 100, '{}'::jsonb, true)
+      RETURNING id
+    `, [uniqueId]);
+    organizationId = orgResult.rows[0]!.id;
+
+    const connResult = await db.query<{ id: string }>(`
+      INSERT INTO platform_connections (
+        organization_id, platform_type, platform_user_id, platform_workspace_id,
+        display_name, status, permissions_granted, metadata
+      ) VALUES ($1, 'slack', 'pagination-user', 'T-PAGINATION', 'Pagination Slack', 'active', '[]'::jsonb, '{}'::jsonb)
+      RETURNING id
+    `, [organizationId]);
+    const connectionId = connResult.rows[0]!.id;
+
+    const runResult = await db.query<{ id: string }>(`
+      INSERT INTO discovery_runs (organization_id, platform_connection_id, status, started_at, completed_at)
+      VALUES ($1, $2, 'completed', NOW(), NOW())
+      RETURNING id
+    `, [organizationId, connectionId]);
+    const runId = runResult.rows[0]!.id;
+
+    for (const automation of automations) {
+      const result = await db.query<{ id: string }>(`
+        INSERT INTO discovered_automations (
+          organization_id, platform_connection_id, discovery_run_id,
+          external_id, name, automation_type, last_seen_at, created_at
+        ) VALUES ($1, $2, $3, $4, $4, 'bot', $5, $6)
+        RETURNING id
+      `, [organizationId, connectionId, runId, automation.name, automation.lastSeenAt, automation.createdAt]);
+      ids[automation.name] = result.rows[0]!.id;
+    }
+  });
+
+  afterAll(async () => {
+    await db.query('DELETE FROM organizations WHERE id = $1', [organizationId]);
+  });
+
+  const readAllPages = async (limit: number) => {
+    const pages: string[][] = [];
+    let cursor: string | undefined = '';
+
+    do {
+      const result = await discoveredAutomationRepository.findManyCustom(
+        { organization_id: organizationId },
+        { limit, cursor, count: 'none' }
+      );
+      pages.push(result.data.map(row => row.name));
+      expect(result.hasMore).toBe(result.nextCursor !== null);
+      cursor = result.nextCursor ?? undefined;
+    } while (cursor);
+
+    return pages;
+  };
+
+  it('should return every row exactly once across pages', async () => {
+    const pages = await readAllPages(2);
+    const names = pages.flat();
+
+    expect(pages.map(page => page.length)).toEqual([2, 2, 2]);
+    expect(new Set(names).size).toBe(automations.length);
+    expect(names.sort()).toEqual(automations.map(automation => automation.name).sort());
+  });
+
+  it('should order by last_seen_at, then created_at, then id, all descending', async () => {
+    const names = (await readAllPages(4)).flat();
+    const [tie1, tie2] = [ids['tie-1']!, ids['tie-2']!].sort().reverse();
+    const nameById = Object.fromEntries(Object.entries(ids).map(([name, id]) => [id, name]));
+
+    expect(names).toEqual([
+      'tie-3',
+      nameById[tie1!],
+      nameById[tie2!],
+      'older',
+      'never-seen-1',
+      'never-seen-2'
+    ]);
+  });
+
+  it('should split rows with the same last_seen_at across pages without skipping any', async () => {
+    const pages = await readAllPages(1);
+
+    expect(pages).toHaveLength(automations.length);
+    expect(pages.slice(0, 3).flat().sort()).toEqual(['tie-1', 'tie-2', 'tie-3']);
+  });
+
+  it('should keep paging after rows without last_seen_at', async () => {
+    const first = await discoveredAutomationRepository.findManyCustom(
+      { organization_id: organizationId },
+      { limit: 5, count: 'exact' }
+    );
+    expect(first.data[4]!.name).toBe('never-seen-1');
+    expect(first.total).toBe(automations.length);
+
+    const second = await discoveredAutomationRepository.findManyCustom(
+      { organization_id: organizationId },
+      { limit: 5, cursor: first.nextCursor! }
+    );
+
+    expect(second.data.map(row => row.name)).toEqual(['never-seen-2']);
+    expect(second.hasMore).toBe(false);
+    expect(second.nextCursor).toBeNull();
+  });
+
+  it('should reject a cursor issued for a different sort', async () => {
+    const foreignCursor = encodeCursor('name:ASC', ['tie-1', ids['tie-1']]);
+
+    await expect(discoveredAutomationRepository.findManyCustom(
+      { organization_id: organizationId },
+      { limit: 2, cursor: foreignCursor }
+    )).rejects.toThrow('Invalid pagination cursor');
+  });
+});
@@ -0,0 +1,105 @@
+/**
+ * Per-regex AI provider detection
+ * The provider-by-provider regex filtering detectAIProvider did before
+ * patterns were compiled into AIProviderMatcher; the reference for parity
+ * tests and benchmarks
+ */
+
+import { AI_PROVIDER_PATTERNS, AIProviderDetectionResult, AIProviderPattern, DetectionMethod } from '@singura/shared-types';
+
+export interface DetectionEventData {
+  apiEndpoint?: string;
+  userAgent?: string;
+  scopes?: string[];
+  ipAddress?: string;
+  webhookUrl?: string;
+  content?: string;
+}
+
+export function detectAIProviderPerRegex(
+  eventData: DetectionEventData,
+  patterns: Partial<Record<string, AIProviderPattern>> = AI_PROVIDER_PATTERNS
+): AIProviderDetectionResult | null {
+  let bestMatch: AIProviderDetectionResult | null = null;
+  let highestConfidence = 0;
+
+  for (const pattern of Object.values(patterns)) {
+    if (!pattern) {
+      continue;
+    }
+    const result = analyzeEventAgainstPattern(eventData, pattern);
+    if (result && result.confidence > highestConfidence) {
+      highestConfidence = result.confidence;
+      bestMatch = result;
+    }
+  }
+
+  return bestMatch && bestMatch.confidence >= 30 ? bestMatch : null;
+}
+
+function analyzeEventAgainstPattern(eventData: DetectionEventData, pattern: AIProviderPattern): AIProviderDetectionResult | null {
+  const detectionMethods: DetectionMethod[] = [];
+  const evidence: AIProviderDetectionResult['evidence'] = {};
+  let totalScore = 0;
+  let totalWeight = 0;
+
+  const record = (method: DetectionMethod, weight: number): void => {
+    detectionMethods.push(method);
+    totalScore += weight;
+    totalWeight += weight;
+  };
+
+  if (eventData.apiEndpoint) {
+    const matched = pattern.endpoints.filter(regex => regex.test(eventData.apiEndpoint!));
+    if (matched.length > 0) {
+      evidence.matchedEndpoints = matched.map(regex => regex.source);
+      record('api_endpoint', pattern.confidenceWeights.endpoint);
+    }
+  }
+
+  if (eventData.userAgent) {
+    const matched = pattern.userAgents.filter(regex => regex.test(eventData.userAgent!));
+    if (matched.length > 0) {
+      evidence.matchedUserAgents = matched.map(regex => regex.source);
+      record('user_agent', pattern.confidenceWeights.userAgent);
+    }
+  }
+
+  if (eventData.scopes && eventData.scopes.length > 0) {
+    const matched = pattern.scopes.filter(scope =>
+      eventData.scopes!.some(s => s.toLowerCase().includes(scope.toLowerCase()))
+    );
+    if (matched.length > 0) {
+      evidence.matchedScopes = matched;
+      record('oauth_scope', pattern.confidenceWeights.scope);
+    }
+  }
+
+  if (eventData.webhookUrl && pattern.webhooks) {
+    const matched = pattern.webhooks.filter(regex => regex.test(eventData.webhookUrl!));
+    if (matched.length > 0) {
+      evidence.matchedWebhooks = matched.map(regex => regex.source);
+      record('webhook_pattern', pattern.confidenceWeights.webhook);
+    }
+  }
+
+  if (eventData.content) {
+    const contentLower = eventData.content.toLowerCase();
+    const matched = pattern.contentSignatures.filter(signature => contentLower.includes(signature.toLowerCase()));
+    if (matched.length > 0) {
+      evidence.matchedSignatures = matched;
+      record('content_signature', pattern.confidenceWeights.content);
+    }
+  }
+
+  if (detectionMethods.length === 0) {
+    return null;
+  }
+
+  return {
+    provider: pattern.provider,
+    confidence: Math.round((totalScore / Math.max(totalWeight, 1)) * 100),
+    detectionMethods,
+    evidence
+  };
+}
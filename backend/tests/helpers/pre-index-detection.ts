@@ -0,0 +1,395 @@
+/**
+ * Pre-index detection
+ * The grouping and ordering each shadow-AI detector did on its own before
+ * detectors shared a DetectionEventIndex; the reference for parity tests
+ *
+ * Each function regroups the raw events exactly as the detector used to and
+ * hands the groups to the detector's per-group scoring, which the index did
+ * not change. Metrics events are not emitted.
+ */
+
+import {
+  ActivityTimeframe,
+  AIProviderDetectionResult,
+  AutomationSignature,
+  BatchOperationGroup,
+  GoogleActivityPattern,
+  GoogleWorkspaceEvent,
+  TemporalPattern
+} from '@singura/shared-types';
+import { VelocityDetectorService } from '../../src/services/detection/velocity-detector.service';
+import { BatchOperationDetectorService } from '../../src/services/detection/batch-operation-detector.service';
+import { OffHoursDetectorService } from '../../src/services/detection/off-hours-detector.service';
+import { TimingVarianceDetectorService } from '../../src/services/detection/timing-variance-detector.service';
+import { PermissionEscalationDetectorService } from '../../src/services/detection/permission-escalation-detector.service';
+import { DataVolumeDetectorService } from '../../src/services/detection/data-volume-detector.service';
+import { AIProviderDetectorService } from '../../src/services/detection/ai-provider-detector.service';
+import { EventGroup } from '../../src/services/detection/detection-event-index';
+
+// Private per-group steps of each detector, reached through a cast
+interface VelocityInternals {
+  calculateAnomalyScore(velocity: number, actionType: string): number;
+  calculateConfidence(velocity: number, actionType: string): number;
+}
+
+interface BatchOperationInternals {
+  areEventsSimilar(event1: GoogleWorkspaceEvent, event2: GoogleWorkspaceEvent): boolean;
+  createBatchGroup(events: GoogleWorkspaceEvent[]): BatchOperationGroup;
+  convertBatchGroupToActivityPattern(group: BatchOperationGroup): GoogleActivityPattern;
+}
+
+interface OffHoursInternals {
+  generateOffHoursActivityPatterns(
+    offHoursEventsByUser: Map<string, GoogleWorkspaceEvent[]>,
+    totalOffHoursEvents: number,
+    offHoursPercentage: number
+  ): GoogleActivityPattern[];
+}
+
+interface TimingVarianceInternals {
+  analyzeUserTimingVariance(
+    userGroup: EventGroup,
+    thresholds: ReturnType<TimingVarianceDetectorService['getTimingThresholds']>
+  ): GoogleActivityPattern | null;
+}
+
+interface PermissionEscalationInternals {
+  analyzeUserEscalation(
+    events: GoogleWorkspaceEvent[],
+    timeWindowDays: number,
+    thresholds: ReturnType<PermissionEscalationDetectorService['getEscalationThresholds']>
+  ): unknown;
+  convertToActivityPattern(escalationPattern: unknown): GoogleActivityPattern;
+}
+
+interface UserDailyVolume {
+  userId: string;
+  userEmail: string;
+  date: string;
+  totalBytes: number;
+  fileCount: number;
+  events: GoogleWorkspaceEvent[];
+}
+
+interface DataVolumeInternals {
+  DOWNLOAD_EVENT_TYPES: string[];
+  getDateKey(timestamp: Date): string;
+  extractFileSize(event: GoogleWorkspaceEvent): number;
+  calculateUserBaselines(dailyVolumes: UserDailyVolume[]): Map<string, number>;
+  isAbnormalVolume(
+    dailyVolume: UserDailyVolume,
+    baseline: number | undefined,
+    thresholds: ReturnType<DataVolumeDetectorService['getVolumeThresholds']>
+  ): boolean;
+  createExfiltrationPattern(
+    dailyVolume: UserDailyVolume,
+    baseline: number | undefined,
+    thresholds: ReturnType<DataVolumeDetectorService['getVolumeThresholds']>
+  ): GoogleActivityPattern;
+}
+
+interface AIProviderInternals {
+  analyzeEventForAIProvider(event: GoogleWorkspaceEvent): AIProviderDetectionResult | null;
+  extractEventDataUncached(event: GoogleWorkspaceEvent): object;
+  mapToLegacyProvider(provider: AIProviderDetectionResult['provider']): AutomationSignature['aiProvider'];
+  primaryDetectionMethod(methods: AIProviderDetectionResult['detectionMethods']): AutomationSignature['detectionMethod'];
+  determineRiskLevel(confidence: number): AutomationSignature['riskLevel'];
+}
+
+// Parsed the same way the detectors parsed timestamps per event
+function toEventGroup(events: GoogleWorkspaceEvent[]): EventGroup {
+  return { events, timestamps: Float64Array.from(events, event => event.timestamp.getTime()) };
+}
+
+export function detectVelocityAnomaliesPreIndex(
+  detector: VelocityDetectorService,
+  events: GoogleWorkspaceEvent[]
+): TemporalPattern[] {
+  const internals = detector as unknown as VelocityInternals;
+  const thresholds = detector.getVelocityThresholds();
+  const velocityPatterns: TemporalPattern[] = [];
+
+  const eventsByType = events.reduce((groups, event) => {
+    const key = event.eventType;
+    if (!groups[key]) groups[key] = [];
+    groups[key].push(event);
+    return groups;
+  }, {} as Record<string, GoogleWorkspaceEvent[]>);
+
+  Object.entries(eventsByType).forEach(([type, typeEvents]) => {
+    const sortedEvents = typeEvents.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+    const firstEvent = sortedEvents[0]!;
+    const lastEvent = sortedEvents[sortedEvents.length - 1]!;
+    const timeWindow = {
+      startTime: firstEvent.timestamp,
+      endTime: lastEvent.timestamp,
+      durationMs: lastEvent.timestamp.getTime() - firstEvent.timestamp.getTime()
+    };
+    const velocity = detector.calculateEventsPerSecond(typeEvents, timeWindow.durationMs);
+
+    if (detector.isInhumanVelocity(velocity, type)) {
+      velocityPatterns.push({
+        patternId: `velocity_anomaly_${type}_${Date.now()}`,
+        analysisType: 'velocity',
+        timeWindow,
+        eventCount: typeEvents.length,
+        velocity: {
+          eventsPerSecond: velocity,
+          eventsPerMinute: velocity * 60,
+          eventsPerHour: velocity * 3600
+        },
+        thresholds: {
+          humanMaxVelocity: thresholds.humanMaxFileCreation,
+          automationThreshold: thresholds.automationThreshold,
+          criticalThreshold: thresholds.criticalThreshold
+        },
+        anomalyScore: internals.calculateAnomalyScore(velocity, type),
+        confidence: internals.calculateConfidence(velocity, type)
+      });
+    }
+  });
+
+  return velocityPatterns;
+}
+
+/**
+ * Sorts events in place, as the detector used to
+ */
+export function detectBatchOperationsPreIndex(
+  detector: BatchOperationDetectorService,
+  events: GoogleWorkspaceEvent[]
+): GoogleActivityPattern[] {
+  const internals = detector as unknown as BatchOperationInternals;
+  const thresholds = detector.getBatchThresholds();
+  const sortedEvents = events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+  const batchGroups: BatchOperationGroup[] = [];
+
+  for (let i = 0; i < sortedEvents.length; i++) {
+    const currentEvent = sortedEvents[i]!;
+    const similarEvents = [currentEvent];
+
+    for (let j = i + 1; j < sortedEvents.length; j++) {
+      const candidateEvent = sortedEvents[j]!;
+      if (candidateEvent.timestamp.getTime() - currentEvent.timestamp.getTime() > thresholds.maxTimeWindowMs) {
+        break;
+      }
+      if (internals.areEventsSimilar(currentEvent, candidateEvent)) {
+        similarEvents.push(candidateEvent);
+      }
+    }
+
+    if (similarEvents.length >= thresholds.minimumSimilarActions) {
+      batchGroups.push(internals.createBatchGroup(similarEvents));
+    }
+  }
+
+  return batchGroups
+    .filter(group => detector.calculateBatchLikelihood(group) > 0.7)
+    .map(group => internals.convertBatchGroupToActivityPattern(group));
+}
+
+export function detectOffHoursActivityPreIndex(
+  detector: OffHoursDetectorService,
+  events: GoogleWorkspaceEvent[],
+  businessHours: ActivityTimeframe['businessHours']
+): GoogleActivityPattern[] {
+  const internals = detector as unknown as OffHoursInternals;
+  const thresholds = detector.getOffHoursThresholds();
+
+  if (events.length < thresholds.minimumEventsForAnalysis) {
+    return [];
+  }
+
+  // Luxon-based check, per event
+  const offHoursEvents = events.filter(event =>
+    !detector.isBusinessHours(event.timestamp, 'UTC', businessHours)
+  );
+  const totalActivityPercentage = detector.calculateOffHoursRisk(offHoursEvents, events);
+
+  if (totalActivityPercentage < thresholds.suspiciousActivityThreshold) {
+    return [];
+  }
+
+  const eventsByUser = offHoursEvents.reduce((groups, event) => {
+    const key = event.userId;
+    if (!groups[key]) groups[key] = [];
+    groups[key].push(event);
+    return groups;
+  }, {} as Record<string, GoogleWorkspaceEvent[]>);
+
+  return internals.generateOffHoursActivityPatterns(
+    new Map(Object.entries(eventsByUser)),
+    offHoursEvents.length,
+    totalActivityPercentage
+  );
+}
+
+export function detectSuspiciousTimingPatternsPreIndex(
+  detector: TimingVarianceDetectorService,
+  events: GoogleWorkspaceEvent[]
+): GoogleActivityPattern[] {
+  const internals = detector as unknown as TimingVarianceInternals;
+  const thresholds = detector.getTimingThresholds();
+
+  if (events.length < thresholds.minimumEventsForAnalysis) {
+    return [];
+  }
+
+  const sortedEvents = [...events].sort((a, b) =>
+    a.timestamp.getTime() - b.timestamp.getTime()
+  );
+
+  const userGroups = new Map<string, GoogleWorkspaceEvent[]>();
+  for (const event of sortedEvents) {
+    const existing = userGroups.get(event.userId) || [];
+    existing.push(event);
+    userGroups.set(event.userId, existing);
+  }
+
+  const patterns: GoogleActivityPattern[] = [];
+  for (const userEvents of userGroups.values()) {
+    if (userEvents.length < thresholds.minimumEventsForAnalysis) {
+      continue;
+    }
+    const pattern = internals.analyzeUserTimingVariance(toEventGroup(userEvents), thresholds);
+    if (pattern) {
+      patterns.push(pattern);
+    }
+  }
+
+  return patterns;
+}
+
+export function detectEscalationPreIndex(
+  detector: PermissionEscalationDetectorService,
+  events: GoogleWorkspaceEvent[],
+  timeWindowDays: number = 30
+): GoogleActivityPattern[] {
+  const internals = detector as unknown as PermissionEscalationInternals;
+  const thresholds = detector.getEscalationThresholds();
+
+  const permissionEvents = events.filter(event =>
+    event.eventType === 'permission_change' ||
+    event.eventType === 'acl_change' ||
+    event.eventType === 'sharing'
+  );
+
+  const userGroups = new Map<string, GoogleWorkspaceEvent[]>();
+  for (const event of permissionEvents) {
+    if (!userGroups.has(event.userId)) {
+      userGroups.set(event.userId, []);
+    }
+    userGroups.get(event.userId)!.push(event);
+  }
+
+  const patterns: GoogleActivityPattern[] = [];
+  for (const userEvents of userGroups.values()) {
+    const escalationPattern = internals.analyzeUserEscalation(userEvents, timeWindowDays, thresholds);
+    if (escalationPattern) {
+      patterns.push(internals.convertToActivityPattern(escalationPattern));
+    }
+  }
+
+  return patterns;
+}
+
+export function detectExfiltrationPreIndex(
+  detector: DataVolumeDetectorService,
+  events: GoogleWorkspaceEvent[]
+): GoogleActivityPattern[] {
+  const internals = detector as unknown as DataVolumeInternals;
+  const thresholds = detector.getVolumeThresholds();
+
+  const downloadEvents = events.filter(event =>
+    internals.DOWNLOAD_EVENT_TYPES.includes(event.eventType)
+  );
+  if (downloadEvents.length === 0) {
+    return [];
+  }
+
+  const groups = new Map<string, UserDailyVolume>();
+  for (const event of downloadEvents) {
+    const dateKey = internals.getDateKey(event.timestamp);
+    const groupKey = `${event.userId}_${dateKey}`;
+
+    if (!groups.has(groupKey)) {
+      groups.set(groupKey, {
+        userId: event.userId,
+        userEmail: event.userEmail,
+        date: dateKey,
+        totalBytes: 0,
+        fileCount: 0,
+        events: []
+      });
+    }
+
+    const group = groups.get(groupKey)!;
+    group.totalBytes += internals.extractFileSize(event);
+    group.fileCount++;
+    group.events.push(event);
+  }
+
+  const dailyVolumes = Array.from(groups.values());
+  const userBaselines = internals.calculateUserBaselines(dailyVolumes);
+
+  return dailyVolumes
+    .filter(dailyVolume => internals.isAbnormalVolume(dailyVolume, userBaselines.get(dailyVolume.userId), thresholds))
+    .map(dailyVolume => internals.createExfiltrationPattern(dailyVolume, userBaselines.get(dailyVolume.userId), thresholds));
+}
+
+/**
+ * Scans events in the given order, extracting event data afresh for every
+ * relatedness check
+ */
+export function detectAIProvidersPreIndex(
+  detector: AIProviderDetectorService,
+  events: GoogleWorkspaceEvent[]
+): AutomationSignature[] {
+  const internals = detector as unknown as AIProviderInternals;
+
+  const detections: AIProviderDetectionResult[] = [];
+  const processedProviders = new Set<string>();
+  for (const event of events) {
+    const detection = internals.analyzeEventForAIProvider(event);
+    if (detection) {
+      const detectionKey = `${detection.provider}_${event.userId}`;
+      if (!processedProviders.has(detectionKey)) {
+        processedProviders.add(detectionKey);
+        detections.push(detection);
+      }
+    }
+  }
+
+  return detections.map(detection => {
+    const allEvidence = [
+      ...(detection.evidence.matchedEndpoints || []),
+      ...(detection.evidence.matchedUserAgents || []),
+      ...(detection.evidence.matchedSignatures || [])
+    ];
+    const relatedEvents = events.filter(event => {
+      const eventDataStr = JSON.stringify(internals.extractEventDataUncached(event)).toLowerCase();
+      return allEvidence.some(evidence => eventDataStr.includes(evidence.toLowerCase()));
+    });
+    const detectedTime = detection.detectedAt || new Date();
+
+    return {
+      signatureId: `ai_sig_${detection.provider}_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+      signatureType: 'ai_integration',
+      aiProvider: internals.mapToLegacyProvider(detection.provider),
+      detectionMethod: internals.primaryDetectionMethod(detection.detectionMethods),
+      confidence: detection.confidence,
+      riskLevel: internals.determineRiskLevel(detection.confidence),
+      indicators: {
+        apiEndpoints: detection.evidence.matchedEndpoints || [],
+        userAgents: detection.evidence.matchedUserAgents || [],
+        contentSignatures: detection.evidence.matchedSignatures || []
+      },
+      metadata: {
+        firstDetected: detectedTime,
+        lastDetected: detectedTime,
+        occurrenceCount: relatedEvents.length,
+        affectedResources: relatedEvents.map(e => e.resourceId)
+      }
+    } as AutomationSignature;
+  });
+}
@@ -278,6 +278,59 @@ describe('GoogleMockOAuthServer', () => {
     });
   });
 
+  describe('Reports API Endpoint', () => {
+    const reportsUrl = (applicationName: string) =>
+      `${mockServer.getBaseUrl()}/admin/reports/v1/activity/users/all/applications/${applicationName}`;
+    let accessToken: string;
+
+    beforeEach(() => {
+      accessToken = mockServer.issueTokens(['https://www.googleapis.com/auth/admin.reports.audit.readonly']).accessToken;
+      mockServer.setAuditActivities('drive', [1, 2, 3].map(n => ({ id: { uniqueQualifier: `event-${n}` } })));
+    });
+
+    it('should page through activities with nextPageToken', async () => {
+      const headers = { Authorization: `Bearer ${accessToken}` };
+
+      const first = await axios.get(reportsUrl('drive'), { headers, params: { maxResults: 2 } });
+      expect(first.data.items).toHaveLength(2);
+      expect(first.data.nextPageToken).toBe('2');
+
+      const second = await axios.get(reportsUrl('drive'), {
+        headers,
+        params: { maxResults: 2, pageToken: first.data.nextPageToken },
+      });
+      expect(second.data.items).toEqual([{ id: { uniqueQualifier: 'event-3' } }]);
+      expect(second.data.nextPageToken).toBeUndefined();
+    });
+
+    it('should rate limit the configured number of requests', async () => {
+      mockServer.rateLimitReportsRequests(1, 2);
+
+      try {
+        await axios.get(reportsUrl('drive'), { headers: { Authorization: `Bearer ${accessToken}` } });
+        fail('Should have thrown error');
+      } catch (error: any) {
+        expect(error.response.status).toBe(429);
+        expect(error.response.headers['retry-after']).toBe('2');
+      }
+
+      const response = await axios.get(reportsUrl('drive'), { headers: { Authorization: `Bearer ${accessToken}` } });
+      expect(response.status).toBe(200);
+      expect(mockServer.getReportsRequests().map(request => request.status)).toEqual([429, 200]);
+    });
+
+    it('should reject tokens without the audit scope', async () => {
+      const { accessToken: userInfoToken } = mockServer.issueTokens(['openid', 'email']);
+
+      try {
+        await axios.get(reportsUrl('drive'), { headers: { Authorization: `Bearer ${userInfoToken}` } });
+        fail('Should have thrown error');
+      } catch (error: any) {
+        expect(error.response.status).toBe(403);
+      }
+    });
+  });
+
   describe('Mock Configuration', () => {
     it('should allow setting mock user data', () => {
       mockServer.setMockUser('999999999', 'custom@example.com', 'Custom User');
@@ -568,6 +568,25 @@ export abstract class BaseMockOAuthServer {
     return this.tokens.get(token);
   }
 
+  /**
+   * Issue tokens without going through the authorization flow (for API tests)
+   */
+  issueTokens(scope: string[], clientId: string = 'test_client_id'): TokenData {
+    const tokenData: TokenData = {
+      accessToken: this.generateAccessToken(),
+      refreshToken: this.generateRefreshToken(),
+      tokenType: 'Bearer',
+      expiresAt: new Date(Date.now() + this.config.tokenExpiry * 1000),
+      scope,
+      clientId,
+    };
+
+    this.tokens.set(tokenData.accessToken, tokenData);
+    this.tokens.set(tokenData.refreshToken, tokenData);
+
+    return tokenData;
+  }
+
   /**
    * Check if token is revoked (for testing)
    */
@@ -8,6 +8,7 @@
  * https://developers.google.com/identity/protocols/oauth2
  */
 
+import { Request, Response } from 'express';
 import { BaseMockOAuthServer, BaseMockServerConfig, TokenData } from './base-mock-oauth-server';
 
 export interface GoogleMockServerConfig {
@@ -46,6 +47,15 @@ interface GoogleUserInfo {
   hd?: string; // Hosted domain for workspace accounts
 }
 
+/**
+ * Reports API request received by the mock server
+ */
+export interface GoogleReportsRequest {
+  applicationName: string;
+  pageToken?: string;
+  status: number;
+}
+
 /**
  * Valid Google OAuth scopes
  * https://developers.google.com/identity/protocols/oauth2/scopes
@@ -76,6 +86,8 @@ const VALID_GOOGLE_SCOPES = [
   'https://www.googleapis.com/auth/drive.metadata.readonly',
 ];
 
+const REPORTS_AUDIT_SCOPE = 'https://www.googleapis.com/auth/admin.reports.audit.readonly';
+
 /**
  * Mock Google OAuth server for testing
  */
@@ -84,6 +96,10 @@ export class GoogleMockOAuthServer extends BaseMockOAuthServer {
   private userId: string;
   private userEmail: string;
   private userName: string;
+  private auditActivities: Map<string, Array<Record<string, any>>> = new Map();
+  private reportsRequests: GoogleReportsRequest[] = [];
+  private rateLimitedReportsRequests = 0;
+  private reportsRetryAfterSeconds = 1;
 
   constructor(config?: GoogleMockServerConfig) {
     const baseConfig: BaseMockServerConfig = {
@@ -203,58 +219,156 @@ export class GoogleMockOAuthServer extends BaseMockOAuthServer {
 
     // User info endpoint
     this.app.get('/oauth2/v2/userinfo', (req, res) => {
-      const authHeader = req.headers.authorization;
-      if (!authHeader || !authHeader.startsWith('Bearer ')) {
-        res.status(401).json({
-          error: {
-            code: 401,
-            message: 'Invalid Credentials',
-            status: 'UNAUTHENTICATED',
-          },
-        });
+      if (!this.authenticateRequest(req, res)) {
         return;
       }
 
-      const token = authHeader.substring(7);
-      const tokenData = this.tokens.get(token);
+      const userInfo: GoogleUserInfo = {
+        id: this.userId,
+        email: this.userEmail,
+        verified_email: true,
+        name: this.userName,
+        picture: 'https://example.com/photo.jpg',
+        locale: 'en',
+        hd: this.domain,
+      };
+
+      res.json(userInfo);
+    });
+
+    // Admin SDK Reports API activities.list
+    // https://developers.google.com/admin-sdk/reports/reference/rest/v1/activities/list
+    this.app.get('/admin/reports/v1/activity/users/:userKey/applications/:applicationName', (req, res) => {
+      const tokenData = this.authenticateRequest(req, res);
+      if (!tokenData) {
+        return;
+      }
+
+      const applicationName = req.params.applicationName as string;
+      const pageToken = typeof req.query.pageToken === 'string' ? req.query.pageToken : undefined;
 
-      if (!tokenData || this.revokedTokens.has(token)) {
-        res.status(401).json({
+      if (!tokenData.scope.includes(REPORTS_AUDIT_SCOPE)) {
+        this.reportsRequests.push({ applicationName, pageToken, status: 403 });
+        res.status(403).json({
           error: {
-            code: 401,
-            message: 'Invalid Credentials',
-            status: 'UNAUTHENTICATED',
+            code: 403,
+            message: 'Request had insufficient authentication scopes.',
+            status: 'PERMISSION_DENIED',
           },
         });
         return;
       }
 
-      // Check if token is expired
-      if (new Date() > tokenData.expiresAt) {
-        res.status(401).json({
+      if (this.rateLimitedReportsRequests > 0) {
+        this.rateLimitedReportsRequests--;
+        this.reportsRequests.push({ applicationName, pageToken, status: 429 });
+        res.set('Retry-After', String(this.reportsRetryAfterSeconds));
+        res.status(429).json({
           error: {
-            code: 401,
-            message: 'Token expired',
-            status: 'UNAUTHENTICATED',
+            code: 429,
+            message: 'Rate Limit Exceeded',
+            status: 'RESOURCE_EXHAUSTED',
+            errors: [{ domain: 'usageLimits', reason: 'rateLimitExceeded', message: 'Rate Limit Exceeded' }],
           },
         });
         return;
       }
 
-      const userInfo: GoogleUserInfo = {
-        id: this.userId,
-        email: this.userEmail,
-        verified_email: true,
-        name: this.userName,
-        picture: 'https://example.com/photo.jpg',
-        locale: 'en',
-        hd: this.domain,
-      };
-
-      res.json(userInfo);
+      // Page tokens are offsets into the configured activities
+      const activities = this.auditActivities.get(applicationName) || [];
+      const offset = pageToken ? Number(pageToken) : 0;
+      const maxResults = Math.min(Number(req.query.maxResults) || 1000, 1000);
+      const items = activities.slice(offset, offset + maxResults);
+      const nextOffset = offset + maxResults;
+
+      this.reportsRequests.push({ applicationName, pageToken, status: 200 });
+      res.json({
+        kind: 'admin#reports#activities',
+        etag: `"mock-${applicationName}-${offset}"`,
+        ...(items.length > 0 && { items }),
+        ...(nextOffset < activities.length && { nextPageToken: String(nextOffset) }),
+      });
     });
   }
 
+  /**
+   * Check the Bearer token, sending a Google-style 401 when it is missing, unknown, revoked or expired
+   */
+  private authenticateRequest(req: Request, res: Response): TokenData | null {
+    const authHeader = req.headers.authorization;
+    if (!authHeader || !authHeader.startsWith('Bearer ')) {
+      res.status(401).json({
+        error: {
+          code: 401,
+          message: 'Invalid Credentials',
+          status: 'UNAUTHENTICATED',
+        },
+      });
+      return null;
+    }
+
+    const token = authHeader.substring(7);
+    const tokenData = this.tokens.get(token);
+
+    if (!tokenData || this.revokedTokens.has(token)) {
+      res.status(401).json({
+        error: {
+          code: 401,
+          message: 'Invalid Credentials',
+          status: 'UNAUTHENTICATED',
+        },
+      });
+      return null;
+    }
+
+    // Check if token is expired
+    if (new Date() > tokenData.expiresAt) {
+      res.status(401).json({
+        error: {
+          code: 401,
+          message: 'Token expired',
+          status: 'UNAUTHENTICATED',
+        },
+      });
+      return null;
+    }
+
+    return tokenData;
+  }
+
+  /**
+   * Reset server state, including Reports API data and recorded requests
+   */
+  reset(): void {
+    super.reset();
+    this.auditActivities.clear();
+    this.reportsRequests = [];
+    this.rateLimitedReportsRequests = 0;
+    this.reportsRetryAfterSeconds = 1;
+  }
+
+  /**
+   * Set the activities returned by the Reports API for an application (e.g. 'drive', 'token')
+   */
+  setAuditActivities(applicationName: string, activities: Array<Record<string, any>>): void {
+    this.auditActivities.set(applicationName, activities);
+  }
+
+  /**
+   * Answer the next Reports API requests with 429 Rate Limit Exceeded
+   */
+  rateLimitReportsRequests(count: number, retryAfterSeconds: number = 1): void {
+    this.rateLimitedReportsRequests = count;
+    this.reportsRetryAfterSeconds = retryAfterSeconds;
+  }
+
+  /**
+   * Get the Reports API requests received so far (for testing)
+   */
+  getReportsRequests(): GoogleReportsRequest[] {
+    return [...this.reportsRequests];
+  }
+
   /**
    * Set mock domain (for testing different workspaces)
    */
@@ -18,7 +18,7 @@ export { SlackMockOAuthServer } from './slack-mock-server';
 export type { SlackMockServerConfig } from './slack-mock-server';
 
 export { GoogleMockOAuthServer } from './google-mock-server';
-export type { GoogleMockServerConfig } from './google-mock-server';
+export type { GoogleMockServerConfig, GoogleReportsRequest } from './google-mock-server';
 
 export { MicrosoftMockOAuthServer } from './microsoft-mock-server';
 export type { MicrosoftMockServerConfig } from './microsoft-mock-server';
@@ -0,0 +1,253 @@
+/**
+ * AI Provider Matcher Tests
+ * Parity of the compiled matcher (Aho-Corasick prefilter + regex confirmation,
+ * LRU-cached) with per-regex detection, plus the cache itself
+ */
+
+import {
+  AI_PROVIDER_PATTERNS,
+  AIProviderMatcher,
+  AIProviderPattern,
+  LRUCache,
+  ProviderMatches,
+  detectAIProvider,
+  requiredLiteral
+} from '@singura/shared-types';
+import { detectAIProviderPerRegex, DetectionEventData } from '../../helpers/per-regex-ai-provider-detection';
+
+const ENDPOINTS = [
+  'https://api.openai.com/v1/chat/completions',
+  'HTTPS://API.OPENAI.COM/V1/EMBEDDINGS',
+  'https://platform.openai.com/docs',
+  'https://api.anthropic.com/v1/messages',
+  'https://claude.ai/chat/123',
+  'https://generativelanguage.googleapis.com/v1beta/models/gemini-pro',
+  'https://ai.google.dev',
+  'https://api.cohere.ai/v1/generate',
+  'https://cohere.com/api/embed',
+  'https://api-inference.huggingface.co/models/gpt2',
+  'https://hf.co/spaces/demo',
+  'https://api.replicate.com/v1/predictions',
+  'https://api.mistral.ai/v1/chat/completions',
+  'https://api.together.xyz/inference',
+  'https://together.ai',
+  'https://api.github.com/repos/org/repo',
+  'https://www.googleapis.com/drive/v3/files',
+  'https://shf.company.com/reports',
+  'https://example.com/openai-proxy'
+];
+
+const USER_AGENTS = [
+  'OpenAI/Python 1.3.5',
+  'anthropic-typescript/0.9.1',
+  'Claude-3 Assistant',
+  'cohere-python/4.37',
+  'transformers/4.35.2; python/3.11',
+  'replicate-node/0.25',
+  'mistral-client/0.1.2',
+  'Together-AI SDK',
+  'Google-AI-Apps-Script',
+  'GPT-4 Assistant',
+  'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_1) AppleWebKit/605.1.15',
+  'curl/8.4.0'
+];
+
+const WEBHOOKS = [
+  'https://api.openai.com/callback/abc',
+  'https://openai.com/webhook',
+  'https://api.anthropic.com/callback',
+  'https://huggingface.co/webhooks/model-updated',
+  'https://api.replicate.com/callback?id=42',
+  'https://together.xyz/webhooks',
+  'https://cloud.google.com/callback',
+  'https://hooks.zapier.com/hooks/catch/123/abc',
+  'https://hooks.slack.com/services/T000/B000/XXXX'
+];
+
+const CONTENTS = [
+  '{"env":"OPENAI_API_KEY=sk-proj-abc123"}',
+  '{"model":"claude-3-opus","key":"sk-ant-xyz"}',
+  'const response = cohere.generate({ model: "command-light" })',
+  'from transformers import AutoModel, AutoTokenizer',
+  'replicate.run("stability-ai/sdxl", { token: "r8_abc" })',
+  'MISTRAL_API_KEY and mistral-large',
+  'weekly report spreadsheet sync',
+  '{"action":"edit","resourceName":"Budget 2025.xlsx"}'
+];
+
+const SCOPES = [
+  undefined,
+  ['https://www.googleapis.com/auth/generative-language'],
+  ['openai.api', 'openai.chat'],
+  ['https://www.googleapis.com/auth/drive.readonly']
+];
+
+// Every single-field event, then mixed events cycling through the lists at co-prime strides
+function buildEvents(): DetectionEventData[] {
+  const events: DetectionEventData[] = [
+    ...ENDPOINTS.map(apiEndpoint => ({ apiEndpoint })),
+    ...USER_AGENTS.map(userAgent => ({ userAgent })),
+    ...WEBHOOKS.map(webhookUrl => ({ webhookUrl })),
+    ...CONTENTS.map(content => ({ content }))
+  ];
+
+  for (let i = 0; i < 400; i++) {
+    events.push({
+      apiEndpoint: i % 5 === 0 ? undefined : ENDPOINTS[i % ENDPOINTS.length],
+      userAgent: i % 3 === 0 ? undefined : USER_AGENTS[(i * 7) % USER_AGENTS.length],
+      webhookUrl: i % 4 === 0 ? WEBHOOKS[(i * 3) % WEBHOOKS.length] : undefined,
+      content: i % 2 === 0 ? CONTENTS[(i * 5) % CONTENTS.length] : undefined,
+      scopes: SCOPES[i % SCOPES.length]
+    });
+  }
+  return events;
+}
+
+// Per-regex matches of one field, shaped like the matcher's output
+function perRegexMatches(
+  patterns: Record<string, AIProviderPattern>,
+  select: (pattern: AIProviderPattern) => RegExp[] | undefined,
+  value: string
+): ProviderMatches {
+  const matches: Record<string, string[]> = {};
+  for (const pattern of Object.values(patterns)) {
+    const matched = (select(pattern) || []).filter(regex => regex.test(value)).map(regex => regex.source);
+    if (matched.length > 0) {
+      matches[pattern.provider] = matched;
+    }
+  }
+  return matches;
+}
+
+describe('AIProviderMatcher', () => {
+  describe('parity with per-regex detection', () => {
+    it('should produce identical detection results for every event', () => {
+      const matcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS);
+      const events = buildEvents();
+      let detected = 0;
+
+      for (const event of events) {
+        const expected = detectAIProviderPerRegex(event);
+        expect(detectAIProvider(event, matcher)).toEqual(expected);
+        if (expected) {
+          detected++;
+        }
+      }
+
+      // The corpus exercises both matches and misses
+      expect(detected).toBeGreaterThan(events.length / 4);
+      expect(detected).toBeLessThan(events.length);
+    });
+
+    it('should match each field exactly as the per-provider regex filters do', () => {
+      const matcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS);
+
+      for (const endpoint of ENDPOINTS) {
+        expect(matcher.matchEndpoint(endpoint)).toEqual(perRegexMatches(AI_PROVIDER_PATTERNS, p => p.endpoints, endpoint));
+      }
+      for (const userAgent of USER_AGENTS) {
+        expect(matcher.matchUserAgent(userAgent)).toEqual(perRegexMatches(AI_PROVIDER_PATTERNS, p => p.userAgents, userAgent));
+      }
+      for (const webhook of WEBHOOKS) {
+        expect(matcher.matchWebhook(webhook)).toEqual(perRegexMatches(AI_PROVIDER_PATTERNS, p => p.webhooks, webhook));
+      }
+    });
+
+    it('should fall back to regex confirmation for patterns without a required literal', () => {
+      const base = AI_PROVIDER_PATTERNS.openai;
+      const patterns = {
+        openai: {
+          ...base,
+          endpoints: [/api\.openai\.com/i, /^gateway-\d+\.internal$/i, /(?:oai|openai)-proxy/i],
+          userAgents: [/(\w+)-bot\/\1/, /gpt-\d/i],
+          webhooks: [/hooks?\.example\.(?:com|net)/i]
+        }
+      };
+      const matcher = new AIProviderMatcher(patterns);
+
+      const endpoints = ['gateway-42.internal', 'https://oai-proxy.corp', 'https://openai-proxy.corp', 'https://api.openai.com', 'gateway-x.internal'];
+      for (const endpoint of endpoints) {
+        expect(matcher.matchEndpoint(endpoint)).toEqual(perRegexMatches(patterns, p => p.endpoints, endpoint));
+      }
+      for (const userAgent of ['echo-bot/echo', 'echo-bot/other', 'GPT-4 client']) {
+        expect(matcher.matchUserAgent(userAgent)).toEqual(perRegexMatches(patterns, p => p.userAgents, userAgent));
+      }
+      for (const webhook of ['https://hook.example.net/x', 'https://hooks.example.org']) {
+        expect(matcher.matchWebhook(webhook)).toEqual(perRegexMatches(patterns, p => p.webhooks, webhook));
+      }
+    });
+  });
+
+  describe('requiredLiteral', () => {
+    it('should extract the longest literal run a regex requires', () => {
+      expect(requiredLiteral(/api\.openai\.com/i)).toBe('api.openai.com');
+      expect(requiredLiteral(/openai\.com\/webhooks?/i)).toBe('openai.com/webhook');
+      expect(requiredLiteral(/Claude-v\d/)).toBe('claude-v');
+      expect(requiredLiteral(/\bai\b/)).toBe('ai');
+    });
+
+    it('should give up on alternation, groups, anchors and multi-character escapes', () => {
+      expect(requiredLiteral(/openai|anthropic/)).toBeNull();
+      expect(requiredLiteral(/(?:api)\.openai/)).toBeNull();
+      expect(requiredLiteral(/^openai$/)).toBeNull();
+      expect(requiredLiteral(/\x41pi/)).toBeNull();
+      expect(requiredLiteral(/openai/iu)).toBeNull();
+    });
+  });
+
+  describe('result cache', () => {
+    it('should serve repeated values from the cache', () => {
+      const matcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS);
+
+      const first = matcher.matchEndpoint('https://api.openai.com/v1/chat/completions');
+      const second = matcher.matchEndpoint('https://api.openai.com/v1/chat/completions');
+      matcher.matchUserAgent('OpenAI/Python 1.3.5');
+
+      expect(second).toBe(first);
+      expect(matcher.getCacheStats()).toEqual({
+        endpoint: { size: 1, hits: 1, misses: 1 },
+        userAgent: { size: 1, hits: 0, misses: 1 },
+        webhook: { size: 0, hits: 0, misses: 0 }
+      });
+
+      matcher.clearCache();
+      expect(matcher.getCacheStats().endpoint).toEqual({ size: 0, hits: 0, misses: 0 });
+    });
+
+    it('should stay within its configured size', () => {
+      const matcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS, { cacheSize: 10 });
+      for (let i = 0; i < 50; i++) {
+        matcher.matchEndpoint(`https://api.openai.com/v1/files/${i}`);
+      }
+      expect(matcher.getCacheStats().endpoint.size).toBe(10);
+    });
+
+    it('should not let callers mutate cached evidence', () => {
+      const matcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS);
+      const event = { apiEndpoint: 'https://api.openai.com/v1/chat/completions' };
+
+      detectAIProvider(event, matcher)!.evidence.matchedEndpoints!.push('tampered');
+
+      expect(detectAIProvider(event, matcher)!.evidence.matchedEndpoints).not.toContain('tampered');
+    });
+  });
+});
+
+describe('LRUCache', () => {
+  it('should evict the least recently used entry', () => {
+    const cache = new LRUCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('c')).toBe(3);
+    expect(cache.size).toBe(2);
+  });
+
+  it('should reject a non-positive size', () => {
+    expect(() => new LRUCache(0)).toThrow('LRU cache size must be a positive integer');
+  });
+});
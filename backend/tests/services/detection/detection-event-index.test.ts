@@ -0,0 +1,247 @@
+import { DetectionEventIndex, buildDetectionEventIndex } from '../../../src/services/detection/detection-event-index';
+import { VelocityDetectorService } from '../../../src/services/detection/velocity-detector.service';
+import { TimingVarianceDetectorService } from '../../../src/services/detection/timing-variance-detector.service';
+import { BatchOperationDetectorService } from '../../../src/services/detection/batch-operation-detector.service';
+import { OffHoursDetectorService } from '../../../src/services/detection/off-hours-detector.service';
+import { PermissionEscalationDetectorService } from '../../../src/services/detection/permission-escalation-detector.service';
+import { DataVolumeDetectorService } from '../../../src/services/detection/data-volume-detector.service';
+import { AIProviderDetectorService } from '../../../src/services/detection/ai-provider-detector.service';
+import { GoogleWorkspaceEvent } from '@singura/shared-types';
+import {
+  detectAIProvidersPreIndex,
+  detectBatchOperationsPreIndex,
+  detectEscalationPreIndex,
+  detectExfiltrationPreIndex,
+  detectOffHoursActivityPreIndex,
+  detectSuspiciousTimingPatternsPreIndex,
+  detectVelocityAnomaliesPreIndex
+} from '../../helpers/pre-index-detection';
+
+const MINUTE = 60 * 1000;
+const HOUR = 60 * MINUTE;
+
+describe('DetectionEventIndex', () => {
+  const createEvent = (
+    id: string,
+    timestampMs: number,
+    userId = 'user-1',
+    eventType = 'file_create',
+    resourceId = `file-${id}`
+  ): GoogleWorkspaceEvent => ({
+    eventId: id,
+    timestamp: new Date(timestampMs),
+    userId,
+    userEmail: `${userId}@example.com`,
+    eventType,
+    resourceType: 'file',
+    resourceId,
+    actionDetails: {
+      action: eventType,
+      resourceName: 'test.txt',
+      additionalMetadata: {}
+    }
+  } as GoogleWorkspaceEvent);
+
+  const ids = (events: GoogleWorkspaceEvent[]) => events.map(e => e.eventId);
+
+  describe('buildDetectionEventIndex', () => {
+    it('should parse timestamps into typed arrays', () => {
+      const index = buildDetectionEventIndex([createEvent('a', 3000), createEvent('b', 1000)]);
+
+      expect(index).toBeInstanceOf(DetectionEventIndex);
+      expect(index.timestamps).toBeInstanceOf(Float64Array);
+      expect(Array.from(index.timestamps)).toEqual([3000, 1000]);
+      expect(Array.from(index.sortedTimestamps)).toEqual([1000, 3000]);
+    });
+
+    it('should build a stable chronological permutation without mutating the input', () => {
+      const events = [
+        createEvent('c', 3000),
+        createEvent('a1', 1000),
+        createEvent('b', 2000),
+        createEvent('a2', 1000)
+      ];
+
+      const index = buildDetectionEventIndex(events);
+
+      expect(Array.from(index.chronologicalOrder)).toEqual([1, 3, 2, 0]);
+      expect(ids(index.sortedEvents)).toEqual(['a1', 'a2', 'b', 'c']);
+      expect(ids(events)).toEqual(['c', 'a1', 'b', 'a2']);
+    });
+
+    it('should group by user and event type in chronological order', () => {
+      const index = buildDetectionEventIndex([
+        createEvent('u2-late', 5000, 'user-2', 'file_share', 'doc-1'),
+        createEvent('u1-late', 4000, 'user-1', 'file_create', 'doc-1'),
+        createEvent('u1-early', 1000, 'user-1', 'file_share', 'doc-2'),
+        createEvent('u2-early', 2000, 'user-2', 'file_create', 'doc-1')
+      ]);
+
+      expect(Array.from(index.byUser.keys())).toEqual(['user-1', 'user-2']);
+      expect(ids(index.byUser.get('user-1')!.events)).toEqual(['u1-early', 'u1-late']);
+      expect(Array.from(index.byUser.get('user-2')!.timestamps)).toEqual([2000, 5000]);
+
+      expect(ids(index.byEventType.get('file_create')!.events)).toEqual(['u2-early', 'u1-late']);
+    });
+
+    it('should build each grouping only once', () => {
+      const index = buildDetectionEventIndex([createEvent('a', 1000)]);
+
+      expect(index.byUser).toBe(index.byUser);
+      expect(index.byEventType).toBe(index.byEventType);
+    });
+
+    it('should handle empty input', () => {
+      const index = buildDetectionEventIndex([]);
+
+      expect(index.size).toBe(0);
+      expect(index.byUser.size).toBe(0);
+    });
+  });
+
+  describe('detector parity', () => {
+    const MB = 1024 * 1024;
+    const day1 = Date.UTC(2025, 0, 7); // Tuesday
+    const day2 = Date.UTC(2025, 0, 8);
+    const businessHours = { startHour: 9, endHour: 17, daysOfWeek: [1, 2, 3, 4, 5] };
+
+    const withDetails = (
+      event: GoogleWorkspaceEvent,
+      additionalMetadata: Record<string, unknown>,
+      overrides: Partial<GoogleWorkspaceEvent> = {}
+    ): GoogleWorkspaceEvent => ({
+      ...event,
+      ...overrides,
+      actionDetails: { ...event.actionDetails, additionalMetadata }
+    });
+
+    // Chronological corpus in which every detector finds something, and in which
+    // users' first events, first off-hours events and first permission changes
+    // come in different orders
+    const buildCorpus = (): GoogleWorkspaceEvent[] => {
+      const events: GoogleWorkspaceEvent[] = [];
+      const roles = ['viewer', 'commenter', 'editor', 'owner'];
+
+      events.push(createEvent('admin-create', day1 + 8 * HOUR, 'admin-user', 'file_create'));
+      for (let i = 0; i < 2; i++) {
+        events.push(withDetails(
+          createEvent(`ai-${i}`, day1 + 9 * HOUR + 30 * MINUTE + i * MINUTE, 'ai-user', 'script_execution', `script-${i}`),
+          { endpoint: 'https://api.openai.com/v1/chat/completions', model: 'gpt-4' },
+          { userAgent: 'OpenAI/Python 1.3.5' }
+        ));
+      }
+      for (let i = 0; i < 5; i++) {
+        events.push(withDetails(
+          createEvent(`analyst-d1-${i}`, day1 + 10 * HOUR + i * MINUTE, 'analyst', 'file_download'),
+          { fileSize: 30 * MB }
+        ));
+      }
+      for (let i = 0; i < 4; i++) {
+        events.push(withDetails(
+          createEvent(`exporter-${i}`, day1 + 11 * HOUR + i * MINUTE, 'exporter', 'file_export'),
+          { fileSize: 40 * MB }
+        ));
+      }
+      for (let i = 0; i < 20; i++) {
+        events.push(withDetails(
+          createEvent(`bot-${i}`, day2 + HOUR + i * 100, 'sync-bot', 'permission_change', `share-${i}`),
+          { role: roles[i % roles.length] }
+        ));
+      }
+      for (let i = 0; i < 5; i++) {
+        events.push(withDetails(
+          createEvent(`analyst-d2-${i}`, day2 + 2 * HOUR + i * MINUTE, 'analyst', 'file_download'),
+          { fileSize: 30 * MB }
+        ));
+      }
+      for (let i = 0; i < 2; i++) {
+        events.push(withDetails(
+          createEvent(`ai-night-${i}`, day2 + 3 * HOUR + i * MINUTE, 'ai-user', 'script_execution', `script-night-${i}`),
+          { endpoint: 'https://api.openai.com/v1/chat/completions' },
+          { userAgent: 'OpenAI/Python 1.3.5' }
+        ));
+      }
+      for (let i = 0; i < 20; i++) {
+        events.push(createEvent(`human-${i}`, day2 + 4 * HOUR + i * 7919 + (i % 3) * 2113, 'human-user', 'file_create'));
+      }
+      events.push(withDetails(createEvent('admin-view', day2 + 5 * HOUR, 'admin-user', 'sharing'), { role: 'viewer' }));
+      events.push(withDetails(createEvent('admin-own', day2 + 5 * HOUR + MINUTE, 'admin-user', 'sharing'), { role: 'owner' }));
+
+      return events.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+    };
+
+    // Interleave from both ends so no grouping is already in input order
+    const shuffle = (events: GoogleWorkspaceEvent[]): GoogleWorkspaceEvent[] => {
+      const shuffled: GoogleWorkspaceEvent[] = [];
+      for (let head = 0, tail = events.length - 1; head <= tail; head++, tail--) {
+        shuffled.push(events[tail]!);
+        if (head !== tail) shuffled.push(events[head]!);
+      }
+      return shuffled;
+    };
+
+    // Each detector's indexed result alongside the pre-index reference on the given events
+    const runBoth = async (indexedInput: GoogleWorkspaceEvent[], referenceInput: GoogleWorkspaceEvent[]) => {
+      const index = buildDetectionEventIndex(indexedInput);
+
+      return {
+        velocity: [
+          new VelocityDetectorService().detectVelocityAnomalies(indexedInput, index),
+          detectVelocityAnomaliesPreIndex(new VelocityDetectorService(), [...referenceInput])
+        ],
+        batchOperation: [
+          new BatchOperationDetectorService().detectBatchOperations(indexedInput, index),
+          detectBatchOperationsPreIndex(new BatchOperationDetectorService(), [...referenceInput])
+        ],
+        offHours: [
+          new OffHoursDetectorService().detectOffHoursActivity(indexedInput, businessHours, index),
+          detectOffHoursActivityPreIndex(new OffHoursDetectorService(), [...referenceInput], businessHours)
+        ],
+        timingVariance: [
+          new TimingVarianceDetectorService().detectSuspiciousTimingPatterns(indexedInput, index),
+          detectSuspiciousTimingPatternsPreIndex(new TimingVarianceDetectorService(), [...referenceInput])
+        ],
+        permissionEscalation: [
+          await new PermissionEscalationDetectorService().detectEscalation(indexedInput, undefined, index),
+          detectEscalationPreIndex(new PermissionEscalationDetectorService(), [...referenceInput])
+        ],
+        dataVolume: [
+          await new DataVolumeDetectorService().detectExfiltration(indexedInput, 'org-1', index),
+          detectExfiltrationPreIndex(new DataVolumeDetectorService(), [...referenceInput])
+        ],
+        aiProvider: [
+          new AIProviderDetectorService().detectAIProviders(indexedInput, index),
+          detectAIProvidersPreIndex(new AIProviderDetectorService(), [...referenceInput])
+        ]
+      };
+    };
+
+    beforeEach(() => {
+      // Pattern ids and detection times embed the clock; signature ids also a random suffix
+      jest.useFakeTimers({ now: new Date('2025-02-01T12:00:00Z') });
+      jest.spyOn(Math, 'random').mockReturnValue(0.123456789);
+    });
+
+    afterEach(() => {
+      jest.useRealTimers();
+    });
+
+    it('should give every detector the same results as its pre-index grouping on chronological input', async () => {
+      const results = await runBoth(buildCorpus(), buildCorpus());
+
+      for (const [detector, [indexed, reference]] of Object.entries(results)) {
+        expect({ detector, patterns: reference.length > 0 }).toEqual({ detector, patterns: true });
+        expect({ detector, results: indexed }).toEqual({ detector, results: reference });
+      }
+    });
+
+    it('should give the pre-index results for the chronological order whatever the input order', async () => {
+      const events = buildCorpus();
+      const results = await runBoth(shuffle(events), events);
+
+      for (const [detector, [indexed, reference]] of Object.entries(results)) {
+        expect({ detector, results: indexed }).toEqual({ detector, results: reference });
+      }
+    });
+  });
+});
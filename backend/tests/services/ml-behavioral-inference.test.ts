@@ -151,6 +151,122 @@ describe('MLBehavioralInferenceService', () => {
     });
   });
 
+  describe('analyzeBehaviorBatch', () => {
+    const createAutomation = (id: string, overrides: Partial<AutomationEvent> = {}): AutomationEvent => ({
+      automationId: id,
+      id,
+      name: `Bot ${id}`,
+      platform: 'slack',
+      type: 'bot',
+      status: 'active',
+      riskLevel: 'medium',
+      createdAt: new Date(),
+      lastTriggered: new Date(),
+      permissions: [
+        { name: 'channels:read', scope: 'read', level: 'read' },
+      ],
+      actions: [
+        { type: 'message', timestamp: new Date() },
+      ],
+      metadata: {},
+      ...overrides,
+    });
+
+    const highRiskOverrides: Partial<AutomationEvent> = {
+      trigger: { type: 'event' },
+      permissions: [
+        { name: 'admin:full', scope: 'admin', level: 'admin' },
+      ],
+      actions: [
+        { type: 'data_processing', timestamp: new Date() },
+        { type: 'external_api', timestamp: new Date() },
+      ],
+      metadata: {
+        riskFactors: ['Recently active', 'external API calls', 'High frequency'],
+      },
+    };
+
+    const context = { organizationId: 'org-1', platform: 'slack' };
+
+    beforeEach(async () => {
+      (behavioralBaselineRepository.getAllBaselines as jest.Mock).mockResolvedValue([]);
+      await service.initialize();
+    });
+
+    it('should return one result per automation in input order', async () => {
+      const automations = Array.from({ length: 25 }, (_, i) => createAutomation(`auto-${i}`));
+
+      const results = await service.analyzeBehaviorBatch(automations, context, { chunkSize: 7 });
+
+      expect(results.map(r => r.automationId)).toEqual(automations.map(a => a.id));
+      for (const result of results) {
+        expect(result.organizationId).toBe('org-1');
+        expect(result.behavioralRiskScore).toBeGreaterThanOrEqual(0);
+        expect(result.behavioralRiskScore).toBeLessThanOrEqual(100);
+        expect(result.confidence).toBeGreaterThanOrEqual(0);
+        expect(result.confidence).toBeLessThanOrEqual(1);
+      }
+    });
+
+    it('should score the same as the per-event path', async () => {
+      const automations = [
+        createAutomation('low', { actions: [], status: 'inactive' }),
+        createAutomation('medium'),
+        createAutomation('high', highRiskOverrides),
+      ];
+
+      const batch = await service.analyzeBehaviorBatch(automations, context);
+      const single = await Promise.all(automations.map(a => service.analyzeBehavior(a, context)));
+
+      expect(batch.map(r => r.behavioralRiskScore)).toEqual(single.map(r => r.behavioralRiskScore));
+    });
+
+    it('should only explain rows above the explanation threshold', async () => {
+      const [low, high] = await service.analyzeBehaviorBatch(
+        [createAutomation('low', { actions: [], status: 'inactive' }), createAutomation('high', highRiskOverrides)],
+        context
+      );
+
+      expect(high!.behavioralRiskScore).toBeGreaterThan(70);
+      expect(high!.explanation.primaryFactors).toContain('Cross-platform automation chain detected');
+      expect(high!.explanation.executiveSummary).toMatch(/^High-risk behavioral pattern/);
+
+      expect(low!.behavioralRiskScore).toBeLessThanOrEqual(70);
+      expect(low!.explanation.primaryFactors).toEqual([]);
+      expect(low!.explanation.executiveSummary).toBe('Normal behavioral pattern within organizational baseline');
+    });
+
+    it('should honour a custom explanation threshold', async () => {
+      const [result] = await service.analyzeBehaviorBatch([createAutomation('medium', {
+        metadata: { riskFactors: ['Recently active'] },
+      })], context, { explanationThreshold: 0 });
+
+      expect(result!.explanation.primaryFactors).toContain('High automation frequency detected');
+    });
+
+    it('should yield to the event loop between chunks', async () => {
+      const automations = Array.from({ length: 10 }, (_, i) => createAutomation(`auto-${i}`));
+      let immediateRan = false;
+      setImmediate(() => { immediateRan = true; });
+
+      await service.analyzeBehaviorBatch(automations, context, { chunkSize: 5 });
+
+      expect(immediateRan).toBe(true);
+    });
+
+    it('should handle an empty batch', async () => {
+      await expect(service.analyzeBehaviorBatch([], context)).resolves.toEqual([]);
+    });
+
+    it('should throw error if not initialized', async () => {
+      const uninitializedService = new MLBehavioralInferenceService();
+
+      await expect(
+        uninitializedService.analyzeBehaviorBatch([createAutomation('auto-1')], context)
+      ).rejects.toThrow('ML Behavioral Engine not initialized');
+    });
+  });
+
   describe('calculateBaselineDeviation', () => {
     const mockAutomation: AutomationEvent = {
       id: 'auto-1',
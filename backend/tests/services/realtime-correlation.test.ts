@@ -10,8 +10,10 @@ import { describe, it, expect, jest, beforeEach, afterEach, beforeAll, afterAll
 import { Server as HTTPServer } from 'http';
 import { Server as SocketIOServer, Socket as ServerSocket } from 'socket.io';
 import { io as ioClient, Socket as ClientSocket } from 'socket.io-client';
+import { MultiPlatformEvent } from '@singura/shared-types';
 import { RealTimeCorrelationService } from '../../src/services/realtime-correlation.service';
 import { CorrelationOrchestratorService } from '../../src/services/correlation-orchestrator.service';
+import { CrossPlatformCorrelationService } from '../../src/services/detection/cross-platform-correlation.service';
 
 // Override global Jest timeout for this file only
 jest.setTimeout(10000);
@@ -471,3 +473,107 @@ describe('RealTimeCorrelationService - Socket.io Integration', () => {
     });
   });
 });
+
+describe('RealTimeCorrelationService - Incremental Correlation Pipeline', () => {
+  const WINDOW_MS = 300000;
+  const BOUNDARY = Date.UTC(2025, 0, 15, 10, 5, 0); // Start of a 5-minute window
+  const organization = { id: 'org_stream', userId: 'user_stream' };
+
+  let httpServer: HTTPServer;
+  let realtimeService: RealTimeCorrelationService;
+  let orchestrator: CorrelationOrchestratorService;
+  let serverAddress: string;
+
+  function createLiveEvent(platform: 'slack' | 'google', offsetMs: number): MultiPlatformEvent {
+    return {
+      eventId: `live-${platform}-${offsetMs}`,
+      platform,
+      timestamp: new Date(BOUNDARY + offsetMs),
+      userId: 'user1',
+      userEmail: 'user1@company.com',
+      eventType: 'api_call',
+      resourceId: `resource-${platform}`,
+      resourceType: platform === 'slack' ? 'channel' : 'file',
+      actionDetails: { action: 'automated_action', resourceName: `Live ${platform} resource`, metadata: {} },
+      correlationMetadata: {
+        potentialTrigger: offsetMs < 0,
+        potentialAction: offsetMs >= 0,
+        externalDataAccess: true,
+        automationIndicators: ['api_call', 'webhook_trigger']
+      }
+    };
+  }
+
+  // Trigger just before the window boundary, actions just after it
+  const liveEvents = [createLiveEvent('slack', -2000), createLiveEvent('google', 1000), createLiveEvent('slack', 3000)];
+
+  beforeAll(async () => {
+    httpServer = require('http').createServer();
+
+    orchestrator = new CorrelationOrchestratorService(
+      new CrossPlatformCorrelationService({ timeWindowMs: WINDOW_MS }),
+      { realTimeBatchWindowMs: 50 }
+    );
+    orchestrator.registerPlatformConnector({
+      platform: 'slack',
+      isConnected: async () => true,
+      getCorrelationEvents: async () => [],
+      async *subscribeToRealTimeEvents() {
+        yield* liveEvents;
+        await new Promise(() => undefined); // Stay subscribed
+      }
+    });
+
+    realtimeService = new RealTimeCorrelationService(httpServer, orchestrator);
+
+    await new Promise<void>((resolve) => {
+      httpServer.listen(0, () => {
+        const address = httpServer.address();
+        const port = typeof address === 'object' && address !== null ? address.port : 0;
+        serverAddress = `http://localhost:${port}`;
+        resolve();
+      });
+    });
+  });
+
+  afterAll(async () => {
+    orchestrator.shutdown();
+    await new Promise<void>((resolve) => {
+      realtimeService.shutdown();
+      setTimeout(resolve, 100);
+    });
+    await new Promise<void>((resolve) => {
+      httpServer.close(() => resolve());
+    });
+  });
+
+  it('should correlate live connector events incrementally and broadcast the chain', (done) => {
+    const client: ClientSocket = ioClient(serverAddress, { transports: ['websocket'], forceNew: true });
+
+    client.on('connect', () => {
+      client.emit('authenticate', {
+        token: `test.${organization.userId}.${organization.id}`,
+        userRole: 'analyst'
+      });
+    });
+
+    client.on('authenticated', () => {
+      client.emit('control_real_time', { action: 'start', organizationId: organization.id });
+    });
+
+    client.on('chain:detected', (data: any) => {
+      try {
+        expect(data.organizationId).toBe(organization.id);
+        expect(data.chain.triggerEvent.eventId).toBe('live-slack--2000');
+        expect(data.chain.actionEvents.map((event: MultiPlatformEvent) => event.eventId)).toEqual(['live-google-1000', 'live-slack-3000']);
+        client.disconnect();
+        done();
+      } catch (error) {
+        client.disconnect();
+        done(error);
+      }
+    });
+
+    client.on('control_error', (data: any) => done(new Error(data.error)));
+  });
+});
@@ -0,0 +1,78 @@
+/**
+ * Stress Test: Slack Message Similarity
+ *
+ * Benchmarks MinHash/LSH near-duplicate detection against the pairwise word
+ * Jaccard loop SlackConnector.analyzeMessageContent used to run, at 500 and
+ * 2,000 messages, and checks the mean similarity estimate stays close.
+ */
+
+import { describe, it, expect } from '@jest/globals';
+import { summarizeNearDuplicates } from '../../src/utils/minhash-lsh';
+import { loadFixture } from '../../src/utils/fixture-loader';
+import { PerformanceBenchmarkingService } from '../../src/services/testing/performance-benchmarking.service';
+
+const history = loadFixture<{ messages: Array<{ text: string }> }>('slack', '1.0', 'messages/channel-history.json');
+
+// Fixture messages with their numbers shifted, so repeats are near- rather than exact duplicates
+function generateMessages(count: number): string[] {
+  const messages = new Array<string>(count);
+  for (let i = 0; i < count; i++) {
+    const text = history.messages[i % history.messages.length]!.text;
+    messages[i] = text.replace(/\d+/g, digits => String((Number(digits) + i) % 97));
+  }
+  return messages;
+}
+
+// Previous O(n^2) implementation
+function pairwiseAverageSimilarity(messages: string[]): number {
+  let totalSimilarity = 0;
+  let comparisons = 0;
+
+  for (let i = 0; i < messages.length - 1; i++) {
+    for (let j = i + 1; j < messages.length; j++) {
+      const words1 = new Set((messages[i] || '').toLowerCase().split(/\s+/));
+      const words2 = new Set((messages[j] || '').toLowerCase().split(/\s+/));
+      const intersection = new Set([...words1].filter(word => words2.has(word)));
+      const union = new Set([...words1, ...words2]);
+      totalSimilarity += union.size > 0 ? intersection.size / union.size : 0;
+      comparisons++;
+    }
+  }
+
+  return comparisons > 0 ? totalSimilarity / comparisons : 0;
+}
+
+describe('Stress Test: Slack Message Similarity', () => {
+  const benchmark = new PerformanceBenchmarkingService();
+
+  for (const totalMessages of [500, 2000]) {
+    it(`should analyze ${totalMessages.toLocaleString()} messages faster with MinHash/LSH than pairwise`, async () => {
+      const messages = generateMessages(totalMessages);
+
+      let exactAverage = 0;
+      const pairwise = await benchmark.measureThroughput(async () => {
+        exactAverage = pairwiseAverageSimilarity(messages);
+        return [exactAverage];
+      }, totalMessages);
+
+      let summary = summarizeNearDuplicates([]);
+      const minHash = await benchmark.measureThroughput(async () => {
+        summary = summarizeNearDuplicates(messages);
+        return summary.groups;
+      }, totalMessages);
+
+      console.log('');
+      console.log('='.repeat(80));
+      console.log(`Slack message similarity: ${totalMessages.toLocaleString()} messages`);
+      console.log(`  Pairwise Jaccard: ${pairwise.duration.toFixed(2)}ms (${pairwise.itemsPerSecond.toFixed(0)} messages/sec)`);
+      console.log(`  MinHash/LSH:      ${minHash.duration.toFixed(2)}ms (${minHash.itemsPerSecond.toFixed(0)} messages/sec)`);
+      console.log(`  Speedup:          ${(pairwise.duration / Math.max(minHash.duration, 0.01)).toFixed(1)}x`);
+      console.log(`  Mean similarity:  exact ${exactAverage.toFixed(4)}, estimated ${summary.averageSimilarity.toFixed(4)}`);
+      console.log(`  Near-duplicates:  ${(summary.nearDuplicateRatio * 100).toFixed(1)}% in ${summary.groups.length} groups`);
+      console.log('='.repeat(80));
+
+      expect(minHash.duration).toBeLessThan(pairwise.duration);
+      expect(Math.abs(summary.averageSimilarity - exactAverage)).toBeLessThan(0.02);
+    }, 120000);
+  }
+});
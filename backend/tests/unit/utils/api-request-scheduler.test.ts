@@ -0,0 +1,309 @@
+/**
+ * API Request Scheduler Unit Tests
+ * Tests token buckets, concurrency bounds, retry/backoff and prefetching pagination
+ */
+
+import http from 'http';
+import { AddressInfo } from 'net';
+import {
+  ApiRequestScheduler,
+  TokenBucket,
+  isRetryableApiError,
+  retryAfterMs
+} from '../../../src/utils/api-request-scheduler';
+
+const rateLimitError = (retryAfter?: string) => Object.assign(new Error('Rate limit exceeded'), {
+  response: { status: 429, headers: retryAfter === undefined ? {} : { 'retry-after': retryAfter } }
+});
+
+const deferred = <T>() => {
+  let resolve!: (value: T) => void;
+  const promise = new Promise<T>(r => { resolve = r; });
+  return { promise, resolve };
+};
+
+const flush = () => new Promise(resolve => setImmediate(resolve));
+
+describe('TokenBucket', () => {
+  it('should allow a burst and then refill at the configured rate', () => {
+    const bucket = new TokenBucket(2, 10, 0);
+
+    expect(bucket.waitTime(0)).toBe(0);
+    bucket.take(0);
+    bucket.take(0);
+    expect(bucket.waitTime(0)).toBe(100);
+    expect(bucket.waitTime(50)).toBe(50);
+    expect(bucket.waitTime(100)).toBe(0);
+  });
+
+  it('should not refill beyond its capacity', () => {
+    const bucket = new TokenBucket(1, 10, 0);
+    bucket.take(10000);
+
+    expect(bucket.waitTime(10000)).toBe(100);
+  });
+});
+
+describe('isRetryableApiError / retryAfterMs', () => {
+  it('should retry rate limits and transient server errors only', () => {
+    expect(isRetryableApiError(rateLimitError())).toBe(true);
+    expect(isRetryableApiError({ code: 503 })).toBe(true);
+    expect(isRetryableApiError({ code: 403, errors: [{ reason: 'userRateLimitExceeded' }] })).toBe(true);
+    expect(isRetryableApiError({ code: 403, errors: [{ reason: 'forbidden' }] })).toBe(false);
+    expect(isRetryableApiError({ code: 404 })).toBe(false);
+    expect(isRetryableApiError(new Error('Permission denied'))).toBe(false);
+  });
+
+  it('should read Retry-After as seconds or an HTTP date', () => {
+    expect(retryAfterMs(rateLimitError('2'))).toBe(2000);
+    expect(retryAfterMs(rateLimitError(new Date(61000).toUTCString()), 1000)).toBe(60000);
+    expect(retryAfterMs(rateLimitError())).toBeUndefined();
+    expect(retryAfterMs({ response: { headers: { get: () => '1' } } })).toBe(1000);
+  });
+});
+
+describe('ApiRequestScheduler', () => {
+  describe('schedule', () => {
+    it('should bound the number of requests in flight per API', async () => {
+      const scheduler = new ApiRequestScheduler({ drive: { concurrency: 2, requestsPerSecond: 1000, burst: 100 } });
+      let active = 0;
+      let peak = 0;
+
+      const request = async () => {
+        active++;
+        peak = Math.max(peak, active);
+        await flush();
+        active--;
+      };
+
+      await Promise.all(Array.from({ length: 10 }, () => scheduler.schedule('drive', request)));
+
+      expect(peak).toBe(2);
+      expect(scheduler.getLaneStats('drive')).toEqual({ active: 0, queued: 0 });
+    });
+
+    it('should start queued requests in FIFO order', async () => {
+      const scheduler = new ApiRequestScheduler({ drive: { concurrency: 1, requestsPerSecond: 1000, burst: 100 } });
+      const started: number[] = [];
+
+      await Promise.all([1, 2, 3, 4].map(n => scheduler.schedule('drive', async () => {
+        started.push(n);
+        await flush();
+      })));
+
+      expect(started).toEqual([1, 2, 3, 4]);
+    });
+
+    it('should keep separate lanes for separate APIs', async () => {
+      const scheduler = new ApiRequestScheduler({
+        drive: { concurrency: 1, requestsPerSecond: 1000 },
+        script: { concurrency: 1, requestsPerSecond: 1000 }
+      });
+      const gate = deferred<void>();
+
+      const blocked = scheduler.schedule('drive', () => gate.promise);
+      await expect(scheduler.schedule('script', async () => 'done')).resolves.toBe('done');
+
+      gate.resolve();
+      await blocked;
+    });
+
+    it('should pace requests to the token bucket rate', async () => {
+      const scheduler = new ApiRequestScheduler({ script: { concurrency: 10, requestsPerSecond: 50, burst: 1 } });
+      const start = Date.now();
+
+      await Promise.all(Array.from({ length: 4 }, () => scheduler.schedule('script', async () => undefined)));
+
+      // One burst token, then three more at 20ms intervals
+      expect(Date.now() - start).toBeGreaterThanOrEqual(50);
+    });
+
+    it('should retry rate-limited requests and return the eventual result', async () => {
+      const scheduler = new ApiRequestScheduler({}, { baseDelayMs: 1 });
+      const request = jest.fn()
+        .mockRejectedValueOnce(rateLimitError('0'))
+        .mockRejectedValueOnce({ code: 503 })
+        .mockResolvedValueOnce('ok');
+
+      await expect(scheduler.schedule('adminReports', request)).resolves.toBe('ok');
+      expect(request).toHaveBeenCalledTimes(3);
+    });
+
+    it('should give up after maxRetries', async () => {
+      const scheduler = new ApiRequestScheduler({}, { baseDelayMs: 1, maxRetries: 2 });
+      const request = jest.fn().mockRejectedValue(rateLimitError('0'));
+
+      await expect(scheduler.schedule('adminReports', request)).rejects.toThrow('Rate limit exceeded');
+      expect(request).toHaveBeenCalledTimes(3);
+    });
+
+    it('should rethrow non-retryable errors immediately', async () => {
+      const scheduler = new ApiRequestScheduler({}, { baseDelayMs: 1 });
+      const request = jest.fn().mockRejectedValue(new Error('Permission denied'));
+
+      await expect(scheduler.schedule('adminReports', request)).rejects.toThrow('Permission denied');
+      expect(request).toHaveBeenCalledTimes(1);
+    });
+
+    it('should pause the whole lane for the Retry-After delay', async () => {
+      const scheduler = new ApiRequestScheduler({ drive: { concurrency: 2, requestsPerSecond: 1000, burst: 100 } });
+      const startTimes: number[] = [];
+      let calls = 0;
+
+      const request = async () => {
+        startTimes.push(Date.now());
+        if (calls++ === 0) {
+          throw Object.assign(new Error('Too many requests'), { code: 429, response: { headers: { 'retry-after': '0.05' } } });
+        }
+      };
+
+      const start = Date.now();
+      await scheduler.schedule('drive', request);
+      await scheduler.schedule('drive', request);
+
+      expect(startTimes).toHaveLength(3);
+      expect(startTimes[1]! - start).toBeGreaterThanOrEqual(45);
+      expect(startTimes[2]! - start).toBeGreaterThanOrEqual(45);
+    });
+  });
+
+  describe('parent scheduler', () => {
+    const limits = { drive: { concurrency: 2, requestsPerSecond: 1000, burst: 100 } };
+
+    it('should bound the combined concurrency of its children', async () => {
+      const parent = new ApiRequestScheduler(limits);
+      const tenants = [new ApiRequestScheduler(limits, { parent }), new ApiRequestScheduler(limits, { parent })];
+      let active = 0;
+      let peak = 0;
+
+      const request = async () => {
+        active++;
+        peak = Math.max(peak, active);
+        await flush();
+        active--;
+      };
+
+      await Promise.all(tenants.flatMap(tenant => Array.from({ length: 5 }, () => tenant.schedule('drive', request))));
+
+      expect(peak).toBe(2);
+      expect(parent.getLaneStats('drive')).toEqual({ active: 0, queued: 0 });
+    });
+
+    it('should only pause the child that was rate limited', async () => {
+      const parent = new ApiRequestScheduler(limits);
+      const limited = new ApiRequestScheduler(limits, { parent });
+      const other = new ApiRequestScheduler(limits, { parent });
+      let calls = 0;
+
+      const retried = limited.schedule('drive', async () => {
+        if (calls++ === 0) {
+          throw rateLimitError('0.2');
+        }
+      });
+      await flush();
+
+      const start = Date.now();
+      await other.schedule('drive', async () => undefined);
+      expect(Date.now() - start).toBeLessThan(100);
+
+      await retried;
+      expect(calls).toBe(2);
+      expect(Date.now() - start).toBeGreaterThanOrEqual(150);
+    });
+  });
+
+  describe('paginate', () => {
+    it('should follow page tokens and prefetch the next page', async () => {
+      const scheduler = new ApiRequestScheduler();
+      const pages: Record<string, { items: number[]; next?: string }> = {
+        first: { items: [1, 2], next: 'p2' },
+        p2: { items: [3], next: 'p3' },
+        p3: { items: [4] }
+      };
+      const fetchPage = jest.fn(async (token: string | undefined) => pages[token ?? 'first']!);
+
+      const items: number[] = [];
+      for await (const page of scheduler.paginate('drive', fetchPage, page => page.next)) {
+        // The following page is already requested while this one is processed
+        await flush();
+        if (page.next) {
+          expect(fetchPage).toHaveBeenLastCalledWith(page.next);
+        }
+        items.push(...page.items);
+      }
+
+      expect(items).toEqual([1, 2, 3, 4]);
+      expect(fetchPage).toHaveBeenCalledTimes(3);
+      expect(fetchPage.mock.calls.map(call => call[0])).toEqual([undefined, 'p2', 'p3']);
+    });
+
+    it('should stop at maxPages', async () => {
+      const scheduler = new ApiRequestScheduler();
+      const fetchPage = jest.fn(async (token: string | undefined) => ({ token, next: `${token ?? 0}+` }));
+
+      const tokens: Array<string | undefined> = [];
+      for await (const page of scheduler.paginate('drive', fetchPage, page => page.next, 2)) {
+        tokens.push(page.token);
+      }
+
+      expect(tokens).toEqual([undefined, '0+']);
+      expect(fetchPage).toHaveBeenCalledTimes(2);
+    });
+
+    it('should surface errors from a later page', async () => {
+      const scheduler = new ApiRequestScheduler();
+      const fetchPage = jest.fn()
+        .mockResolvedValueOnce({ next: 'p2' })
+        .mockRejectedValueOnce(new Error('Page failed'));
+
+      const consume = async () => {
+        for await (const _page of scheduler.paginate('drive', fetchPage, (page: any) => page.next)) {
+          // drain
+        }
+      };
+
+      await expect(consume()).rejects.toThrow('Page failed');
+    });
+  });
+
+  describe('against an HTTP server', () => {
+    let server: http.Server;
+    let baseUrl: string;
+    let hits = 0;
+
+    beforeAll(async () => {
+      // Answers the first request of every pair with 429 + Retry-After: 0
+      server = http.createServer((_req, res) => {
+        hits++;
+        if (hits % 2 === 1) {
+          res.writeHead(429, { 'Retry-After': '0' });
+          res.end();
+          return;
+        }
+        res.writeHead(200, { 'Content-Type': 'application/json' });
+        res.end(JSON.stringify({ ok: true }));
+      });
+      await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+      baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+    });
+
+    afterAll(async () => {
+      await new Promise(resolve => server.close(resolve));
+    });
+
+    it('should retry a 429 response using the Retry-After header', async () => {
+      const scheduler = new ApiRequestScheduler({}, { baseDelayMs: 1 });
+
+      const body = await scheduler.schedule('test', async () => {
+        const response = await fetch(baseUrl);
+        if (!response.ok) {
+          throw Object.assign(new Error(`HTTP ${response.status}`), { response });
+        }
+        return response.json();
+      });
+
+      expect(body).toEqual({ ok: true });
+      expect(hits).toBe(2);
+    });
+  });
+});
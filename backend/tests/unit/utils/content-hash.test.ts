@@ -0,0 +1,48 @@
+/**
+ * Content Hash Unit Tests
+ * Tests key-order independence and field selection
+ */
+
+import { contentHash, stableStringify } from '../../../src/utils/content-hash';
+
+describe('stableStringify', () => {
+  it('should sort object keys at every level', () => {
+    expect(stableStringify({ b: 1, a: { d: [2, { f: 1, e: 0 }], c: 'x' } }))
+      .toBe('{"a":{"c":"x","d":[2,{"e":0,"f":1}]},"b":1}');
+  });
+
+  it('should serialize dates as ISO strings and drop undefined fields', () => {
+    expect(stableStringify({ at: new Date('2025-01-01T00:00:00Z'), skipped: undefined, empty: null }))
+      .toBe('{"at":"2025-01-01T00:00:00.000Z","empty":null}');
+  });
+});
+
+describe('contentHash', () => {
+  const row = {
+    name: 'Zapier Bot',
+    status: 'active',
+    platform_metadata: { scopes: ['chat:write'], teamId: 'T1' },
+    last_seen_at: new Date()
+  };
+
+  it('should ignore key order', () => {
+    const reordered = {
+      platform_metadata: { teamId: 'T1', scopes: ['chat:write'] },
+      status: 'active',
+      name: 'Zapier Bot',
+      last_seen_at: new Date(0)
+    };
+
+    expect(contentHash(reordered, ['name', 'status', 'platform_metadata']))
+      .toBe(contentHash(row, ['name', 'status', 'platform_metadata']));
+  });
+
+  it('should only depend on the selected fields', () => {
+    const hash = contentHash(row, ['name', 'platform_metadata']);
+
+    expect(contentHash({ ...row, last_seen_at: new Date(0) }, ['name', 'platform_metadata'])).toBe(hash);
+    expect(contentHash({ ...row, platform_metadata: { scopes: ['chat:write', 'files:read'], teamId: 'T1' } }, ['name', 'platform_metadata']))
+      .not.toBe(hash);
+    expect(hash).toMatch(/^[0-9a-f]{64}$/);
+  });
+});
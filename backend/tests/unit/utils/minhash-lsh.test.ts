@@ -0,0 +1,158 @@
+/**
+ * MinHash / LSH Unit Tests
+ * Compares estimates against exact Jaccard on a Slack channel-history fixture
+ * (human chatter mixed with three bot message templates)
+ */
+
+import {
+  shingle,
+  jaccardSimilarity,
+  MinHasher,
+  estimateSimilarity,
+  averagePairwiseSimilarity,
+  findNearDuplicateGroups,
+  summarizeNearDuplicates
+} from '../../../src/utils/minhash-lsh';
+import { loadFixture } from '../../../src/utils/fixture-loader';
+
+interface FixtureMessage {
+  text: string;
+  ts: string;
+  /** Bot template the message was rendered from; null for human messages */
+  template: string | null;
+}
+
+const history = loadFixture<{ messages: FixtureMessage[] }>('slack', '1.0', 'messages/channel-history.json');
+const texts = history.messages.map(message => message.text);
+const templates = history.messages.map(message => message.template);
+
+describe('shingle', () => {
+  it('should lowercase and split on whitespace', () => {
+    expect(shingle('Build  PASSED on main')).toEqual(new Set(['build', 'passed', 'on', 'main']));
+  });
+
+  it('should build word n-grams and keep short texts as one shingle', () => {
+    expect(shingle('a b c d', 2)).toEqual(new Set(['a b', 'b c', 'c d']));
+    expect(shingle('hello there', 3)).toEqual(new Set(['hello there']));
+  });
+});
+
+describe('MinHasher', () => {
+  const hasher = new MinHasher();
+  const signatures = texts.map(text => hasher.signText(text));
+  const sets = texts.map(text => shingle(text));
+
+  it('should produce deterministic signatures for a given seed', () => {
+    expect(new MinHasher().signText(texts[0]!)).toEqual(signatures[0]);
+    expect(new MinHasher({ seed: 42 }).signText(texts[0]!)).not.toEqual(signatures[0]);
+    expect(signatures[0]).toHaveLength(128);
+  });
+
+  it('should estimate pairwise Jaccard similarity within a few points of the exact value', () => {
+    let totalError = 0;
+    let maxError = 0;
+    let pairs = 0;
+
+    for (let i = 0; i < texts.length; i++) {
+      for (let j = i + 1; j < texts.length; j++) {
+        const error = Math.abs(estimateSimilarity(signatures[i]!, signatures[j]!) - jaccardSimilarity(sets[i]!, sets[j]!));
+        totalError += error;
+        maxError = Math.max(maxError, error);
+        pairs++;
+      }
+    }
+
+    expect(totalError / pairs).toBeLessThan(0.03);
+    expect(maxError).toBeLessThan(0.2);
+  });
+
+  it('should estimate the mean pairwise similarity without enumerating pairs', () => {
+    let exactTotal = 0;
+    let pairs = 0;
+    for (let i = 0; i < texts.length; i++) {
+      for (let j = i + 1; j < texts.length; j++) {
+        exactTotal += jaccardSimilarity(sets[i]!, sets[j]!);
+        pairs++;
+      }
+    }
+
+    expect(Math.abs(averagePairwiseSimilarity(signatures) - exactTotal / pairs)).toBeLessThan(0.02);
+  });
+
+  it('should reject an invalid signature length', () => {
+    expect(() => new MinHasher({ numHashes: 0 })).toThrow('numHashes must be a positive integer');
+  });
+});
+
+describe('findNearDuplicateGroups', () => {
+  const hasher = new MinHasher();
+  const signatures = texts.map(text => hasher.signText(text));
+  const sets = texts.map(text => shingle(text));
+
+  it('should only group messages rendered from the same template', () => {
+    const groups = findNearDuplicateGroups(signatures);
+
+    expect(groups.length).toBeGreaterThan(0);
+    for (const group of groups) {
+      const groupTemplates = new Set(group.map(index => templates[index]));
+      expect(groupTemplates.size).toBe(1);
+      expect(groupTemplates.has(null)).toBe(false);
+    }
+  });
+
+  it('should find every pair whose exact similarity is well above the threshold', () => {
+    const groupOf = new Map<number, number>();
+    findNearDuplicateGroups(signatures).forEach((group, groupIndex) => {
+      group.forEach(index => groupOf.set(index, groupIndex));
+    });
+
+    let highSimilarityPairs = 0;
+    for (let i = 0; i < texts.length; i++) {
+      for (let j = i + 1; j < texts.length; j++) {
+        if (jaccardSimilarity(sets[i]!, sets[j]!) >= 0.85) {
+          highSimilarityPairs++;
+          expect(groupOf.get(i)).toBeDefined();
+          expect(groupOf.get(i)).toBe(groupOf.get(j));
+        }
+      }
+    }
+    expect(highSimilarityPairs).toBeGreaterThan(0);
+  });
+
+  it('should recover every template with a lower threshold and more bands', () => {
+    const groups = findNearDuplicateGroups(signatures, { bands: 32, threshold: 0.5 });
+    const templateCount = new Set(templates.filter(template => template !== null)).size;
+
+    expect(groups).toHaveLength(templateCount);
+    for (const group of groups) {
+      expect(group).toHaveLength(templates.filter(template => template === templates[group[0]!]).length);
+    }
+  });
+
+  it('should reject a band count that does not divide the signature', () => {
+    expect(() => findNearDuplicateGroups(signatures, { bands: 12 })).toThrow('not divisible into 12 bands');
+  });
+});
+
+describe('summarizeNearDuplicates', () => {
+  it('should flag identical bot output as fully repetitive', () => {
+    const summary = summarizeNearDuplicates(Array(5).fill('Your report is ready: download it from the portal'));
+
+    expect(summary.averageSimilarity).toBe(1);
+    expect(summary.groups).toEqual([[0, 1, 2, 3, 4]]);
+    expect(summary.nearDuplicateRatio).toBe(1);
+  });
+
+  it('should report the templated share of a mixed channel', () => {
+    const summary = summarizeNearDuplicates(texts);
+    const templated = templates.filter(template => template !== null).length;
+
+    expect(summary.averageSimilarity).toBeLessThan(0.7);
+    expect(summary.nearDuplicateRatio).toBeGreaterThan(0);
+    expect(summary.nearDuplicateRatio).toBeLessThanOrEqual(templated / texts.length);
+  });
+
+  it('should handle fewer than two texts', () => {
+    expect(summarizeNearDuplicates(['only one'])).toEqual({ averageSimilarity: 0, groups: [], nearDuplicateRatio: 0 });
+  });
+});
@@ -0,0 +1,94 @@
+/**
+ * Time-Ordered Ring Buffer Unit Tests
+ * Tests sorted insertion, range queries and front eviction
+ */
+
+import { TimeOrderedRingBuffer } from '../../../src/utils/time-ordered-ring-buffer';
+
+interface Item {
+  id: string;
+  ts: number;
+}
+
+const item = (id: string, ts: number): Item => ({ id, ts });
+const getTs = (i: Item): number => i.ts;
+const ids = (items: Iterable<Item>): string[] => Array.from(items, i => i.id);
+
+describe('TimeOrderedRingBuffer', () => {
+  describe('insertMany', () => {
+    it('should append in-order batches', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>(4);
+      buffer.insertMany([item('a', 1), item('b', 2)], getTs);
+      buffer.insertMany([item('c', 3)], getTs);
+
+      expect(ids(buffer)).toEqual(['a', 'b', 'c']);
+      expect(buffer.oldestTimestamp).toBe(1);
+      expect(buffer.newestTimestamp).toBe(3);
+    });
+
+    it('should sort an unordered batch', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>(4);
+      buffer.insertMany([item('c', 30), item('a', 10), item('b', 20)], getTs);
+
+      expect(ids(buffer)).toEqual(['a', 'b', 'c']);
+    });
+
+    it('should merge late arrivals into the correct position', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>(4);
+      buffer.insertMany([item('a', 10), item('c', 30), item('e', 50)], getTs);
+      buffer.insertMany([item('d', 40), item('b', 20), item('f', 60)], getTs);
+
+      expect(ids(buffer)).toEqual(['a', 'b', 'c', 'd', 'e', 'f']);
+    });
+
+    it('should keep arrival order for equal timestamps', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>(4);
+      buffer.insertMany([item('a', 10), item('b', 10)], getTs);
+      buffer.insertMany([item('c', 10), item('x', 5)], getTs);
+
+      expect(ids(buffer)).toEqual(['x', 'a', 'b', 'c']);
+    });
+
+    it('should grow past its initial capacity after wrapping', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>(2);
+      buffer.insertMany([item('a', 1), item('b', 2)], getTs);
+      buffer.evictBefore(2);
+      buffer.insertMany([item('c', 3), item('d', 4), item('e', 5)], getTs);
+
+      expect(buffer.capacity).toBeGreaterThanOrEqual(4);
+      expect(ids(buffer)).toEqual(['b', 'c', 'd', 'e']);
+    });
+  });
+
+  describe('range', () => {
+    it('should return items in [start, end) in chronological order', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>();
+      buffer.insertMany([item('a', 0), item('b', 5), item('c', 10), item('d', 15)], getTs);
+
+      expect(ids(buffer.range(5, 15))).toEqual(['b', 'c']);
+      expect(buffer.range(100, 200)).toEqual([]);
+    });
+  });
+
+  describe('evictBefore', () => {
+    it('should remove and return items older than the boundary', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>();
+      buffer.insertMany([item('a', 1), item('b', 2), item('c', 3)], getTs);
+
+      const removed = buffer.evictBefore(3);
+
+      expect(ids(removed)).toEqual(['a', 'b']);
+      expect(ids(buffer)).toEqual(['c']);
+      expect(buffer.size).toBe(1);
+    });
+
+    it('should handle evicting everything', () => {
+      const buffer = new TimeOrderedRingBuffer<Item>();
+      buffer.insertMany([item('a', 1)], getTs);
+      buffer.evictBefore(10);
+
+      expect(buffer.size).toBe(0);
+      expect(buffer.newestTimestamp).toBeUndefined();
+    });
+  });
+});
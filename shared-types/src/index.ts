@@ -28,7 +28,9 @@ export type {
   AIProviderDetectionResult,
   DetectionMethod
 } from './utils/ai-provider-patterns';
-export { AI_PROVIDER_PATTERNS, detectAIProvider, extractModelName } from './utils/ai-provider-patterns';
+export { AI_PROVIDER_PATTERNS, detectAIProvider, extractModelName, getAIProviderMatcher } from './utils/ai-provider-patterns';
+export type { ProviderMatches, AIProviderMatcherOptions, AIProviderMatcherCacheStats } from './utils/ai-provider-matcher';
+export { AIProviderMatcher, LRUCache, requiredLiteral } from './utils/ai-provider-matcher';
 
 // Detection metadata types (exported for backend detection services)
 export type {
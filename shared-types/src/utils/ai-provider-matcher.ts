@@ -0,0 +1,371 @@
+/**
+ * AI Provider Pattern Matcher
+ * Compiles AI provider patterns once so an endpoint, user agent, webhook URL
+ * or content blob is scanned in a single pass for every provider, instead of
+ * running each provider's regex list in turn
+ *
+ * Each regex contributes the literal text it requires to an Aho-Corasick
+ * automaton; only regexes whose literal occurs are confirmed with the regex
+ * itself. Regexes with no required literal are gated by one combined
+ * alternation regex. Endpoint, user agent and webhook results are kept in
+ * bounded LRU caches, since the same URLs repeat across audit events.
+ *
+ * Content is lowercased once and searched with the native substring search,
+ * which beats a JavaScript automaton on long serialized event details.
+ */
+
+import type { AIProvider, AIProviderPattern } from './ai-provider-patterns';
+
+type KnownProvider = Exclude<AIProvider, 'unknown'>;
+
+/**
+ * Matched regex sources (or content signatures) per provider, in pattern order
+ */
+export type ProviderMatches = Partial<Record<KnownProvider, string[]>>;
+
+export interface AIProviderMatcherOptions {
+  /** Entries kept per cache (endpoint, user agent, webhook); default 5000 */
+  cacheSize?: number;
+}
+
+export interface AIProviderMatcherCacheStats {
+  size: number;
+  hits: number;
+  misses: number;
+}
+
+const DEFAULT_CACHE_SIZE = 5000;
+
+/**
+ * Least-recently-used cache with a fixed number of entries
+ * Relies on Map iteration following insertion order
+ */
+export class LRUCache<K, V> {
+  private readonly entries = new Map<K, V>();
+
+  constructor(readonly maxSize: number) {
+    if (!Number.isInteger(maxSize) || maxSize < 1) {
+      throw new Error(`LRU cache size must be a positive integer, got ${maxSize}`);
+    }
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      // Move to the most recently used position
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) {
+        this.entries.delete(oldest.value);
+      }
+    }
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+/**
+ * Aho-Corasick automaton over lowercase needles
+ */
+class AhoCorasick {
+  private readonly transitions: Array<Map<string, number>> = [new Map()];
+  private readonly fail: number[] = [0];
+  private readonly outputs: number[][] = [[]];
+
+  constructor(needles: readonly string[]) {
+    needles.forEach((needle, id) => {
+      let node = 0;
+      for (const char of needle) {
+        let next = this.transitions[node]!.get(char);
+        if (next === undefined) {
+          next = this.transitions.length;
+          this.transitions.push(new Map());
+          this.fail.push(0);
+          this.outputs.push([]);
+          this.transitions[node]!.set(char, next);
+        }
+        node = next;
+      }
+      this.outputs[node]!.push(id);
+    });
+
+    // Breadth-first: a node's fail link points to the longest proper suffix in the trie
+    const queue = [...this.transitions[0]!.values()];
+    for (let head = 0; head < queue.length; head++) {
+      const node = queue[head]!;
+      for (const [char, child] of this.transitions[node]!) {
+        let fallback = this.fail[node]!;
+        while (fallback !== 0 && !this.transitions[fallback]!.has(char)) {
+          fallback = this.fail[fallback]!;
+        }
+        const target = this.transitions[fallback]!.get(char);
+        this.fail[child] = target !== undefined && target !== child ? target : 0;
+        this.outputs[child]!.push(...this.outputs[this.fail[child]!]!);
+        queue.push(child);
+      }
+    }
+  }
+
+  /**
+   * Ids of the needles occurring in (lowercase) text
+   */
+  search(text: string): Set<number> {
+    const found = new Set<number>();
+    let node = 0;
+    for (const char of text) {
+      while (node !== 0 && !this.transitions[node]!.has(char)) {
+        node = this.fail[node]!;
+      }
+      node = this.transitions[node]!.get(char) ?? 0;
+      for (const id of this.outputs[node]!) {
+        found.add(id);
+      }
+    }
+    return found;
+  }
+}
+
+/**
+ * Longest literal run every match of the regex must contain (lowercase),
+ * or null when the source uses groups, alternation, classes, anchors or escapes
+ * that span several characters
+ */
+export function requiredLiteral(regex: RegExp): string | null {
+  // Unicode case folding matches characters (e.g. U+017F for "s") that toLowerCase doesn't map
+  if (regex.unicode && regex.ignoreCase) {
+    return null;
+  }
+
+  const source = regex.source;
+  if (/[|()[\]{}^$]/.test(source.replace(/\\./g, ''))) {
+    return null;
+  }
+
+  let best = '';
+  let current = '';
+  const flush = (): void => {
+    if (current.length > best.length) {
+      best = current;
+    }
+    current = '';
+  };
+
+  for (let i = 0; i < source.length; i++) {
+    const char = source[i]!;
+    if (char === '\\') {
+      const escaped = source[++i] ?? '';
+      if (/[0-9cukx]/.test(escaped)) {
+        // Backreference or multi-character escape (\u00e9, \x41, \cJ, \k<name>)
+        return null;
+      }
+      if (/[a-z]/i.test(escaped)) {
+        // Character class (\d, \w, ...) or assertion (\b)
+        flush();
+      } else {
+        current += escaped;
+      }
+    } else if (char === '.' || char === '+') {
+      flush();
+    } else if (char === '?' || char === '*') {
+      // The preceding character is optional
+      current = current.slice(0, -1);
+      flush();
+    } else {
+      current += char;
+    }
+  }
+  flush();
+
+  return best.length > 0 ? best.toLowerCase() : null;
+}
+
+interface CompiledRegexField {
+  entries: Array<{ provider: KnownProvider; regex: RegExp }>;
+  automaton: AhoCorasick;
+  /** Entry index for each automaton needle */
+  needleEntries: number[];
+  /** Entries with no required literal */
+  unfiltered: number[];
+  /** Combined alternation of the unfiltered regexes; null when they must always be tested */
+  gate: RegExp | null;
+}
+
+function compileRegexField(patterns: AIProviderPattern[], select: (pattern: AIProviderPattern) => RegExp[] | undefined): CompiledRegexField {
+  const entries: CompiledRegexField['entries'] = [];
+  const needles: string[] = [];
+  const needleEntries: number[] = [];
+  const unfiltered: number[] = [];
+
+  for (const pattern of patterns) {
+    for (const regex of select(pattern) || []) {
+      const index = entries.push({ provider: pattern.provider as KnownProvider, regex }) - 1;
+      const literal = requiredLiteral(regex);
+      if (literal) {
+        needles.push(literal);
+        needleEntries.push(index);
+      } else {
+        unfiltered.push(index);
+      }
+    }
+  }
+
+  return {
+    entries,
+    automaton: new AhoCorasick(needles),
+    needleEntries,
+    unfiltered,
+    gate: combinedAlternation(unfiltered.map(index => entries[index]!.regex.source))
+  };
+}
+
+/**
+ * One regex matching whenever any of the sources matches; its flags only widen
+ * what each source matches on its own
+ * Null when there is nothing to combine or the sources can't be combined safely
+ */
+function combinedAlternation(sources: string[]): RegExp | null {
+  // Backreferences would be renumbered inside a combined regex
+  if (sources.length === 0 || sources.some(source => /\\[1-9]/.test(source))) {
+    return null;
+  }
+  try {
+    return new RegExp(sources.map(source => `(?:${source})`).join('|'), 'ims');
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Matches event fields against every provider's patterns in one pass
+ */
+export class AIProviderMatcher {
+  private readonly endpoints: CompiledRegexField;
+  private readonly userAgents: CompiledRegexField;
+  private readonly webhooks: CompiledRegexField;
+  private readonly signatures: Array<{ provider: KnownProvider; signature: string; lowercase: string }> = [];
+  private readonly caches: Record<'endpoint' | 'userAgent' | 'webhook', LRUCache<string, ProviderMatches>>;
+  private readonly stats = {
+    endpoint: { hits: 0, misses: 0 },
+    userAgent: { hits: 0, misses: 0 },
+    webhook: { hits: 0, misses: 0 }
+  };
+
+  constructor(patterns: Partial<Record<KnownProvider, AIProviderPattern>>, options: AIProviderMatcherOptions = {}) {
+    const patternList = Object.values(patterns).filter((pattern): pattern is AIProviderPattern => pattern !== undefined);
+
+    this.endpoints = compileRegexField(patternList, pattern => pattern.endpoints);
+    this.userAgents = compileRegexField(patternList, pattern => pattern.userAgents);
+    this.webhooks = compileRegexField(patternList, pattern => pattern.webhooks);
+
+    for (const pattern of patternList) {
+      for (const signature of pattern.contentSignatures) {
+        this.signatures.push({ provider: pattern.provider as KnownProvider, signature, lowercase: signature.toLowerCase() });
+      }
+    }
+
+    const cacheSize = options.cacheSize ?? DEFAULT_CACHE_SIZE;
+    this.caches = {
+      endpoint: new LRUCache(cacheSize),
+      userAgent: new LRUCache(cacheSize),
+      webhook: new LRUCache(cacheSize)
+    };
+  }
+
+  /**
+   * Endpoint regexes matching an API endpoint, per provider
+   */
+  matchEndpoint(endpoint: string): ProviderMatches {
+    return this.cachedMatch('endpoint', this.endpoints, endpoint);
+  }
+
+  /**
+   * User agent regexes matching a user agent, per provider
+   */
+  matchUserAgent(userAgent: string): ProviderMatches {
+    return this.cachedMatch('userAgent', this.userAgents, userAgent);
+  }
+
+  /**
+   * Webhook regexes matching a webhook URL, per provider
+   */
+  matchWebhook(webhookUrl: string): ProviderMatches {
+    return this.cachedMatch('webhook', this.webhooks, webhookUrl);
+  }
+
+  /**
+   * Content signatures found (case-insensitively) in content, per provider
+   * Not cached: content is usually unique per event
+   */
+  matchContent(content: string): ProviderMatches {
+    const contentLower = content.toLowerCase();
+    const matches: ProviderMatches = {};
+    for (const { provider, signature, lowercase } of this.signatures) {
+      if (contentLower.includes(lowercase)) {
+        (matches[provider] ??= []).push(signature);
+      }
+    }
+    return matches;
+  }
+
+  getCacheStats(): Record<'endpoint' | 'userAgent' | 'webhook', AIProviderMatcherCacheStats> {
+    return {
+      endpoint: { size: this.caches.endpoint.size, ...this.stats.endpoint },
+      userAgent: { size: this.caches.userAgent.size, ...this.stats.userAgent },
+      webhook: { size: this.caches.webhook.size, ...this.stats.webhook }
+    };
+  }
+
+  clearCache(): void {
+    for (const field of ['endpoint', 'userAgent', 'webhook'] as const) {
+      this.caches[field].clear();
+      this.stats[field] = { hits: 0, misses: 0 };
+    }
+  }
+
+  private cachedMatch(field: 'endpoint' | 'userAgent' | 'webhook', compiled: CompiledRegexField, value: string): ProviderMatches {
+    const cached = this.caches[field].get(value);
+    if (cached) {
+      this.stats[field].hits++;
+      return cached;
+    }
+
+    this.stats[field].misses++;
+    const matches = this.matchRegexField(compiled, value);
+    this.caches[field].set(value, matches);
+    return matches;
+  }
+
+  private matchRegexField(compiled: CompiledRegexField, value: string): ProviderMatches {
+    const candidates = [...compiled.automaton.search(value.toLowerCase())].map(id => compiled.needleEntries[id]!);
+    if (compiled.unfiltered.length > 0 && (!compiled.gate || compiled.gate.test(value))) {
+      candidates.push(...compiled.unfiltered);
+    }
+
+    // Entry order is provider order then pattern order, as the per-provider filters produced
+    candidates.sort((a, b) => a - b);
+
+    const matches: ProviderMatches = {};
+    for (const index of candidates) {
+      const { provider, regex } = compiled.entries[index]!;
+      if (regex.test(value)) {
+        (matches[provider] ??= []).push(regex.source);
+      }
+    }
+    return matches;
+  }
+}
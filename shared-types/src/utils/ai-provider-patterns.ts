@@ -4,6 +4,8 @@
  * Used by AI provider detector service for multi-method confidence scoring
  */
 
+import { AIProviderMatcher, ProviderMatches } from './ai-provider-matcher';
+
 /**
  * Supported AI providers
  */
@@ -451,10 +453,33 @@ export const AI_PROVIDER_PATTERNS: Record<Exclude<AIProvider, 'unknown'>, AIProv
   }
 };
 
+let defaultMatcher: AIProviderMatcher | null = null;
+
+/**
+ * Matcher compiled from AI_PROVIDER_PATTERNS on first use and shared by all callers
+ */
+export function getAIProviderMatcher(): AIProviderMatcher {
+  if (!defaultMatcher) {
+    defaultMatcher = new AIProviderMatcher(AI_PROVIDER_PATTERNS);
+  }
+  return defaultMatcher;
+}
+
+/**
+ * Pattern matches for one event, computed once for all providers
+ */
+interface EventMatches {
+  endpoints: ProviderMatches;
+  userAgents: ProviderMatches;
+  webhooks: ProviderMatches;
+  signatures: ProviderMatches;
+}
+
 /**
  * Detect AI provider from event data using multi-method analysis
  *
  * @param eventData - Event data containing API calls, user agents, etc.
+ * @param matcher - Compiled patterns; defaults to the shared AI_PROVIDER_PATTERNS matcher
  * @returns Detection result with confidence score and evidence
  */
 export function detectAIProvider(eventData: {
@@ -464,13 +489,20 @@ export function detectAIProvider(eventData: {
   ipAddress?: string;
   webhookUrl?: string;
   content?: string;
-}): AIProviderDetectionResult | null {
+}, matcher: AIProviderMatcher = getAIProviderMatcher()): AIProviderDetectionResult | null {
   let bestMatch: AIProviderDetectionResult | null = null;
   let highestConfidence = 0;
 
+  const matches: EventMatches = {
+    endpoints: eventData.apiEndpoint ? matcher.matchEndpoint(eventData.apiEndpoint) : {},
+    userAgents: eventData.userAgent ? matcher.matchUserAgent(eventData.userAgent) : {},
+    webhooks: eventData.webhookUrl ? matcher.matchWebhook(eventData.webhookUrl) : {},
+    signatures: eventData.content ? matcher.matchContent(eventData.content) : {}
+  };
+
   // Iterate through all AI provider patterns
   for (const pattern of Object.values(AI_PROVIDER_PATTERNS)) {
-    const result = analyzeEventAgainstPattern(eventData, pattern);
+    const result = analyzeEventAgainstPattern(eventData, pattern, matches);
 
     if (result && result.confidence > highestConfidence) {
       highestConfidence = result.confidence;
@@ -494,33 +526,32 @@ function analyzeEventAgainstPattern(
     webhookUrl?: string;
     content?: string;
   },
-  pattern: AIProviderPattern
+  pattern: AIProviderPattern,
+  matches: EventMatches
 ): AIProviderDetectionResult | null {
   const detectionMethods: DetectionMethod[] = [];
   const evidence: AIProviderDetectionResult['evidence'] = {};
   let totalScore = 0;
   let totalWeight = 0;
+  const provider = pattern.provider as Exclude<AIProvider, 'unknown'>;
 
   // Check API endpoint
-  if (eventData.apiEndpoint) {
-    const matched = pattern.endpoints.filter(regex => regex.test(eventData.apiEndpoint!));
-    if (matched.length > 0) {
-      detectionMethods.push('api_endpoint');
-      evidence.matchedEndpoints = matched.map(r => r.source);
-      totalScore += pattern.confidenceWeights.endpoint;
-      totalWeight += pattern.confidenceWeights.endpoint;
-    }
+  const matchedEndpoints = matches.endpoints[provider];
+  if (matchedEndpoints) {
+    detectionMethods.push('api_endpoint');
+    // Copied: match lists are shared through the matcher's cache
+    evidence.matchedEndpoints = [...matchedEndpoints];
+    totalScore += pattern.confidenceWeights.endpoint;
+    totalWeight += pattern.confidenceWeights.endpoint;
   }
 
   // Check user agent
-  if (eventData.userAgent) {
-    const matched = pattern.userAgents.filter(regex => regex.test(eventData.userAgent!));
-    if (matched.length > 0) {
-      detectionMethods.push('user_agent');
-      evidence.matchedUserAgents = matched.map(r => r.source);
-      totalScore += pattern.confidenceWeights.userAgent;
-      totalWeight += pattern.confidenceWeights.userAgent;
-    }
+  const matchedUserAgents = matches.userAgents[provider];
+  if (matchedUserAgents) {
+    detectionMethods.push('user_agent');
+    evidence.matchedUserAgents = [...matchedUserAgents];
+    totalScore += pattern.confidenceWeights.userAgent;
+    totalWeight += pattern.confidenceWeights.userAgent;
   }
 
   // Check OAuth scopes
@@ -550,28 +581,21 @@ function analyzeEventAgainstPattern(
   }
 
   // Check webhook URL
-  if (eventData.webhookUrl && pattern.webhooks) {
-    const matched = pattern.webhooks.filter(regex => regex.test(eventData.webhookUrl!));
-    if (matched.length > 0) {
-      detectionMethods.push('webhook_pattern');
-      evidence.matchedWebhooks = matched.map(r => r.source);
-      totalScore += pattern.confidenceWeights.webhook;
-      totalWeight += pattern.confidenceWeights.webhook;
-    }
+  const matchedWebhooks = matches.webhooks[provider];
+  if (matchedWebhooks) {
+    detectionMethods.push('webhook_pattern');
+    evidence.matchedWebhooks = [...matchedWebhooks];
+    totalScore += pattern.confidenceWeights.webhook;
+    totalWeight += pattern.confidenceWeights.webhook;
   }
 
   // Check content signatures
-  if (eventData.content) {
-    const contentLower = eventData.content.toLowerCase();
-    const matched = pattern.contentSignatures.filter(sig =>
-      contentLower.includes(sig.toLowerCase())
-    );
-    if (matched.length > 0) {
-      detectionMethods.push('content_signature');
-      evidence.matchedSignatures = matched;
-      totalScore += pattern.confidenceWeights.content;
-      totalWeight += pattern.confidenceWeights.content;
-    }
+  const matchedSignatures = matches.signatures[provider];
+  if (matchedSignatures) {
+    detectionMethods.push('content_signature');
+    evidence.matchedSignatures = matchedSignatures;
+    totalScore += pattern.confidenceWeights.content;
+    totalWeight += pattern.confidenceWeights.content;
   }
 
   // No matches found